@@ -0,0 +1,82 @@
+"""
+Go High Level API client.
+
+Subpackages and helpers are loaded on first attribute access, so importing
+`api` does no work up front:
+
+    import api
+    contact = await api.contacts.get_contact(contact_id, token)
+"""
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "appointments",
+        "associations",
+        "blogs",
+        "business",
+        "cache",
+        "calendar",
+        "campaigns",
+        "client",
+        "codec",
+        "companies",
+        "contacts",
+        "conversations",
+        "courses",
+        "custom_fieldsv2",
+        "custom_menus",
+        "dispatch",
+        "download",
+        "emails",
+        "endpoints",
+        "forms",
+        "funnels",
+        "invoices",
+        "lc_email",
+        "media_library",
+        "metrics",
+        "objects",
+        "opportunities",
+        "paginate",
+        "payments",
+        "products",
+        "rate_limit",
+        "registry",
+        "retry",
+        "sass",
+        "singleflight",
+        "snapshots",
+        "social_planner",
+        "sub_accounts",
+        "sync",
+        "transport",
+        "trigger_links",
+        "upload",
+        "users",
+        "workflows",
+    ],
+    exports={
+        "GoHighLevelClient": "client",
+        "PoolConfig": "transport",
+        "configure_pool": "transport",
+        "get_http_client": "transport",
+        "pooled_client": "transport",
+        "use_client": "transport",
+        "close_default_client": "transport",
+        "RateLimiter": "rate_limit",
+        "RetryPolicy": "retry",
+        "ResponseCache": "cache",
+        "Metrics": "metrics",
+        "LoopRunner": "sync",
+        "run_sync": "sync",
+        "TokenManager": "_oauth.token_manager",
+        "Endpoint": "registry",
+        "get_endpoint": "registry",
+        "find_endpoint": "registry",
+        "GoHighLevelAPIError": "dispatch",
+        "set_codec": "codec",
+        "raw_json": "codec",
+    },
+)
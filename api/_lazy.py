@@ -0,0 +1,46 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import importlib
+
+
+def attach(
+    package: str,
+    submodules: Iterable[str] = (),
+    exports: Optional[Dict[str, str]] = None
+) -> Tuple[Callable[[str], object], Callable[[], List[str]], List[str]]:
+    """
+    Make a package load its submodules and exported names on first access.
+
+    Nothing is imported until an attribute is used, so `import api` is cheap
+    and `api.contacts.get_contact` only loads `api/contacts/get.py`.
+
+    Usage in a package's `__init__.py`:
+
+        __getattr__, __dir__, __all__ = attach(__name__, ["notes"], {"get_contact": "get"})
+
+    Args:
+        package: The package's `__name__`
+        submodules: Submodule and subpackage names to expose
+        exports: Map of exported name to the submodule that defines it
+
+    Returns:
+        Tuple of `__getattr__`, `__dir__` and `__all__` for the package
+    """
+    submodules = set(submodules)
+    exports = dict(exports or {})
+    names = sorted(submodules | set(exports))
+
+    def __getattr__(name: str) -> object:
+        if name in exports:
+            value = getattr(importlib.import_module(f"{package}.{exports[name]}"), name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache on the package so the next lookup skips __getattr__.
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return names
+
+    return __getattr__, __dir__, list(names)
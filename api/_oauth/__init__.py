@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "index",
+        "token_manager",
+    ],
+    exports={
+        "CachedToken": "token_manager",
+        "InstalledLocationsParams": "index",
+        "LocationTokenRequest": "index",
+        "TokenManager": "token_manager",
+        "get_access_token": "index",
+        "get_headers": "index",
+        "get_installed_locations": "index",
+        "get_location_access_token": "index",
+    },
+)
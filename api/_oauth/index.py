@@ -76,45 +76,46 @@ def get_installed_locations(token: str, params: InstalledLocationsParams) -> Dic
     return response.json()
 
 # Example usage
-client_credentials = {
-    "client_id": "your-client-id",
-    "client_secret": "your-client-secret",
-    "grant_type": "client_credentials"
-}
-
-# Get Access Token
-try:
-    token_response = get_access_token(client_credentials)
-    print(f"Access Token: {token_response}")
-    token = token_response.get("access_token")
-except Exception as e:
-    print(f"Error fetching access token: {e}")
-    token = None
+if __name__ == "__main__":
+    client_credentials = {
+        "client_id": "your-client-id",
+        "client_secret": "your-client-secret",
+        "grant_type": "client_credentials"
+    }
 
-if token:
-    # Get Location Access Token
-    location_token_data = LocationTokenRequest(
-        company_id="your-company-id",
-        location_id="your-location-id"
-    )
-    
+    # Get Access Token
     try:
-        location_token_response = get_location_access_token(token, location_token_data)
-        print(f"Location Access Token: {location_token_response}")
+        token_response = get_access_token(client_credentials)
+        print(f"Access Token: {token_response}")
+        token = token_response.get("access_token")
     except Exception as e:
-        print(f"Error fetching location access token: {e}")
-    
-    # Define installed_locations_params
-    installed_locations_params = InstalledLocationsParams(limit=10)
-    
-    # Fetch Installed Locations
-    async def fetch_installed_locations():
+        print(f"Error fetching access token: {e}")
+        token = None
+
+    if token:
+        # Get Location Access Token
+        location_token_data = LocationTokenRequest(
+            company_id="your-company-id",
+            location_id="your-location-id"
+        )
+
         try:
-            response = get_installed_locations(token, installed_locations_params)
-            print(f"Installed Locations: {response}")
+            location_token_response = get_location_access_token(token, location_token_data)
+            print(f"Location Access Token: {location_token_response}")
         except Exception as e:
-            print(f"Error fetching installed locations: {e}")
-    
-    # Since this is Python, we need to use asyncio to run the async function
-    import asyncio
-    asyncio.run(fetch_installed_locations())
+            print(f"Error fetching location access token: {e}")
+
+        # Define installed_locations_params
+        installed_locations_params = InstalledLocationsParams(limit=10)
+
+        # Fetch Installed Locations
+        async def fetch_installed_locations():
+            try:
+                response = get_installed_locations(token, installed_locations_params)
+                print(f"Installed Locations: {response}")
+            except Exception as e:
+                print(f"Error fetching installed locations: {e}")
+
+        # Since this is Python, we need to use asyncio to run the async function
+        import asyncio
+        asyncio.run(fetch_installed_locations())
@@ -0,0 +1,252 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+from collections import OrderedDict
+import asyncio
+import logging
+import random
+import time
+
+from api.transport import pooled_client
+
+API_BASE_URL = "https://services.leadconnectorhq.com"
+API_VERSION = "2021-07-28"
+
+
+class CachedToken:
+    """
+    An access token plus the times at which it should be refreshed and
+    stops being usable.
+    """
+    __slots__ = ("access_token", "expires_at", "refresh_at", "data")
+
+    def __init__(self, access_token: str, expires_at: float, refresh_at: float, data: Dict[str, Any]):
+        self.access_token = access_token
+        self.expires_at = expires_at
+        self.refresh_at = refresh_at
+        self.data = data
+
+
+class TokenManager:
+    """
+    Async manager for agency and location access tokens.
+
+    Tokens are cached until shortly before they expire. Once a token enters
+    its refresh window (`refresh_margin` seconds before expiry, minus up to
+    `refresh_jitter` seconds so thousands of locations don't refresh at once)
+    callers keep getting the cached token while a refresh runs in the
+    background. Concurrent refreshes for the same key share one request, and
+    location tokens are kept in an LRU bounded by `max_locations`.
+
+    Args:
+        client_id: OAuth app client ID
+        client_secret: OAuth app client secret
+        refresh_token: Agency refresh token; GHL rotates it on every refresh
+        user_type: "Company" or "Location"
+        on_refresh: Optional coroutine called with each new agency token
+            response, e.g. to persist the rotated refresh token
+        refresh_margin: Seconds before expiry at which to start refreshing
+        refresh_jitter: Maximum random extra lead time for a refresh
+        max_locations: Maximum number of location tokens to keep
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        refresh_token: Optional[str] = None,
+        user_type: str = "Company",
+        on_refresh: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        refresh_margin: float = 300.0,
+        refresh_jitter: float = 120.0,
+        max_locations: int = 50_000
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self.user_type = user_type
+        self.on_refresh = on_refresh
+        self.refresh_margin = refresh_margin
+        self.refresh_jitter = refresh_jitter
+        self.max_locations = max_locations
+        self._agency: Optional[CachedToken] = None
+        self._locations: "OrderedDict[str, CachedToken]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    def _cache_entry(self, data: Dict[str, Any]) -> CachedToken:
+        now = time.monotonic()
+        expires_in = float(data.get("expires_in", 86399))
+        # Don't use a token in its last few seconds; it may expire in transit.
+        expires_at = now + expires_in - min(30.0, expires_in / 10)
+        margin = min(self.refresh_margin, expires_in / 2)
+        refresh_at = expires_at - margin - random.uniform(0, min(self.refresh_jitter, margin))
+        return CachedToken(data["access_token"], expires_at, refresh_at, data)
+
+    async def _fetch_agency_token(self) -> CachedToken:
+        form = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "user_type": self.user_type,
+        }
+        if self.refresh_token:
+            form["grant_type"] = "refresh_token"
+            form["refresh_token"] = self.refresh_token
+        else:
+            form["grant_type"] = "client_credentials"
+
+        async with pooled_client(timeout=30) as client:
+            response = await client.post(
+                f"{API_BASE_URL}/oauth/token",
+                data=form,
+                headers={"Accept": "application/json"}
+            )
+        if response.status_code >= 400:
+            raise Exception(f"Error fetching access token: {response.text}")
+
+        data = response.json()
+        if data.get("refresh_token"):
+            self.refresh_token = data["refresh_token"]
+        if self.on_refresh is not None:
+            await self.on_refresh(data)
+        self._agency = self._cache_entry(data)
+        return self._agency
+
+    async def _fetch_location_token(self, company_id: str, location_id: str) -> CachedToken:
+        agency_token = await self.get_agency_token()
+        async with pooled_client(timeout=30) as client:
+            response = await client.post(
+                f"{API_BASE_URL}/oauth/locationToken",
+                data={"companyId": company_id, "locationId": location_id},
+                headers={
+                    "Authorization": f"Bearer {agency_token}",
+                    "Version": API_VERSION,
+                    "Accept": "application/json"
+                }
+            )
+        if response.status_code >= 400:
+            raise Exception(f"Error fetching location access token: {response.text}")
+
+        entry = self._cache_entry(response.json())
+        self._locations[location_id] = entry
+        self._locations.move_to_end(location_id)
+        while len(self._locations) > self.max_locations:
+            self._locations.popitem(last=False)
+        return entry
+
+    def _refresh(self, key: str, fetch: Callable[[], Awaitable[CachedToken]]) -> "asyncio.Task[CachedToken]":
+        # One refresh per key at a time; everyone else waits on the same task.
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._on_refresh_done(key, t))
+        return task
+
+    def _on_refresh_done(self, key: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logging.warning(f"Token refresh for {key} failed: {task.exception()}")
+
+    async def _get(self, key: str, entry: Optional[CachedToken],
+                   fetch: Callable[[], Awaitable[CachedToken]]) -> str:
+        now = time.monotonic()
+        if entry is not None and now < entry.expires_at:
+            if now >= entry.refresh_at:
+                self._refresh(key, fetch)
+            return entry.access_token
+        entry = await asyncio.shield(self._refresh(key, fetch))
+        return entry.access_token
+
+    async def get_agency_token(self) -> str:
+        """
+        Get a valid agency (company) access token.
+
+        Returns:
+            str: Access token
+        """
+        return await self._get("agency", self._agency, self._fetch_agency_token)
+
+    async def get_location_token(self, company_id: str, location_id: str) -> str:
+        """
+        Get a valid access token for a location, minting one from the agency
+        token if none is cached.
+
+        Args:
+            company_id: The agency's company ID
+            location_id: The location to get a token for
+
+        Returns:
+            str: Location access token
+        """
+        entry = self._locations.get(location_id)
+        if entry is not None:
+            self._locations.move_to_end(location_id)
+        return await self._get(
+            f"location:{location_id}", entry,
+            lambda: self._fetch_location_token(company_id, location_id)
+        )
+
+    async def location_headers(self, company_id: str, location_id: str) -> Dict[str, str]:
+        """
+        Build the `headers` argument expected by the endpoint functions for a
+        location-scoped call.
+
+        Returns:
+            Dict[str, str]: Authorization and Version headers
+        """
+        token = await self.get_location_token(company_id, location_id)
+        return {"Authorization": f"Bearer {token}", "Version": API_VERSION}
+
+    async def get_installed_locations(self, company_id: str, app_id: str, limit: Optional[int] = None,
+                                      skip: Optional[int] = None, **filters: Any) -> Dict[str, Any]:
+        """
+        Get locations where the app is installed.
+
+        Args:
+            company_id: The agency's company ID
+            app_id: The app's ID
+            limit: Maximum number of locations to return
+            skip: Number of locations to skip
+            **filters: Other query parameters (e.g. isInstalled, query)
+
+        Returns:
+            A dictionary containing the installed locations response.
+        """
+        params: Dict[str, Any] = {"companyId": company_id, "appId": app_id, **filters}
+        if limit is not None:
+            params["limit"] = limit
+        if skip is not None:
+            params["skip"] = skip
+
+        agency_token = await self.get_agency_token()
+        async with pooled_client(timeout=30) as client:
+            response = await client.get(
+                f"{API_BASE_URL}/oauth/installedLocations",
+                params=params,
+                headers={
+                    "Authorization": f"Bearer {agency_token}",
+                    "Version": API_VERSION,
+                    "Accept": "application/json"
+                }
+            )
+        if response.status_code >= 400:
+            raise Exception(f"Error fetching installed locations: {response.text}")
+        return response.json()
+
+    def invalidate(self, location_id: Optional[str] = None) -> None:
+        """
+        Forget a cached location token, or every cached token when no
+        location is given (e.g. after a 401).
+        """
+        if location_id is not None:
+            self._locations.pop(location_id, None)
+            return
+        self._agency = None
+        self._locations.clear()
+
+    async def aclose(self) -> None:
+        """
+        Cancel any background refreshes still running.
+        """
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
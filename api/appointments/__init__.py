@@ -0,0 +1,8 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get_appointments",
+    ],
+)
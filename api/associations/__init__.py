@@ -0,0 +1,24 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_assoc",
+        "delete",
+        "get_all_assoc_for_sub_acc",
+        "get_assoc_by_id",
+        "get_assoc_key_by_name",
+        "get_associan_object_keys",
+        "relations",
+        "update_assoc_by_id",
+    ],
+    exports={
+        "create_association": "create_assoc",
+        "delete_association": "delete",
+        "get_all_associations_for_sub_account": "get_all_assoc_for_sub_acc",
+        "get_association_by_id": "get_assoc_by_id",
+        "get_association_by_object_key": "get_associan_object_keys",
+        "get_association_key_by_name": "get_assoc_key_by_name",
+        "update_association_by_id": "update_assoc_by_id",
+    },
+)
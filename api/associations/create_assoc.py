@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("associations.create_assoc")
 
 async def create_association(
     token: str,
@@ -16,7 +15,7 @@ async def create_association(
 ) -> Dict[str, Any]:
     """
     Create an association between objects in Go High Level.
-    
+
     Args:
         token: The authorization token
         location_id: The location ID
@@ -25,19 +24,10 @@ async def create_association(
         first_object_key: First object's key
         second_object_label: Second object's association label
         second_object_key: Second object's key
-        
+
     Returns:
         Dictionary containing the created association data
     """
-    url = f"{API_BASE_URL}/associations/"
-    
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Version": API_VERSION,
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     payload = {
         "locationId": location_id,
         "key": key,
@@ -46,12 +36,5 @@ async def create_association(
         "secondObjectLabel": second_object_label,
         "secondObjectKey": second_object_key
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, json=payload)
-        
-        if response.status_code != 201:
-            logging.error(f"Failed to create association: {response.text}")
-            response.raise_for_status()
-            
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, token=token, json=payload)
@@ -0,0 +1,15 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get_all",
+    ],
+    exports={
+        "create_relation": "create",
+        "delete_relation": "delete",
+        "get_all_relations": "get_all",
+    },
+)
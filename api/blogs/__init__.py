@@ -0,0 +1,21 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "check_slug",
+        "create_blog",
+        "get_authors",
+        "get_blogs_by_location_id",
+        "get_categories",
+        "get_posts_by_id",
+        "update",
+    ],
+    exports={
+        "check_url_slug": "check_slug",
+        "create_blog_post": "create_blog",
+        "get_blog_categories": "get_categories",
+        "get_blog_posts_by_id": "get_posts_by_id",
+        "update_blog_post": "update",
+    },
+)
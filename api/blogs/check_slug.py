@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("blogs.check_slug")
 
 async def check_url_slug(
     headers: Dict[str, str],
@@ -26,20 +25,6 @@ async def check_url_slug(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    url = f"{API_BASE_URL}/blogs/posts/url-slug-exists"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id,
         "urlSlug": url_slug
@@ -48,14 +33,4 @@ async def check_url_slug(
     if post_id:
         params["postId"] = post_id
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -1,8 +1,8 @@
-import httpx
 from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("blogs.create_blog")
 
 async def create_blog_post(
     headers: Dict[str, str],
@@ -21,18 +21,6 @@ async def create_blog_post(
     canonical_link: str,
     published_at: str
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/blogs/posts"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Invalid or missing Authorization header")
-    
-    request_headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION),
-        "Authorization": headers["Authorization"]
-    }
-    
     payload = {
         "title": title,
         "locationId": location_id,
@@ -49,9 +37,5 @@ async def create_blog_post(
         "canonicalLink": canonical_link,
         "publishedAt": published_at
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=payload, headers=request_headers)
-    
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=payload)
@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("blogs.get_authors")
 
 async def get_authors(
     location_id: str,
@@ -26,34 +25,10 @@ async def get_authors(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id,
         "limit": limit,
         "offset": offset
     }
 
-    url = f"{API_BASE_URL}/blogs/authors"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=request_headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"Error fetching authors: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
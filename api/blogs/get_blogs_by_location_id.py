@@ -0,0 +1,42 @@
+from typing import Dict, Any, Optional
+import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("blogs.get_blogs_by_location_id")
+
+async def get_blogs_by_location_id(
+    location_id: str,
+    headers: Dict[str, str],
+    limit: int = 4,
+    skip: int = 0,
+    search_term: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get blogs by location ID from the Go High Level API.
+
+    Args:
+        location_id: The ID of the location to get blogs for
+        headers: Dictionary containing Authorization and Version headers
+        limit: Maximum number of blogs to return (default: 4)
+        skip: Number of blogs to skip for pagination (default: 0)
+        search_term: Optional search term to filter blogs by name
+
+    Returns:
+        Dictionary containing the blogs data
+
+    Raises:
+        Exception: If the API request fails or if required headers are missing
+    """
+    params = {
+        "locationId": location_id,
+        "limit": limit,
+        "skip": skip
+    }
+
+    if search_term:
+        params["searchTerm"] = search_term
+
+    logging.info(f"Getting blogs for location: {location_id}")
+
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("blogs.get_categories")
 
 async def get_blog_categories(
     location_id: str,
@@ -26,20 +26,6 @@ async def get_blog_categories(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    url = f"{API_BASE_URL}/blogs/categories"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id,
         "limit": limit,
@@ -48,14 +34,4 @@ async def get_blog_categories(
 
     logging.info(f"Getting blog categories for location: {location_id}")
 
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(url, headers=request_headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
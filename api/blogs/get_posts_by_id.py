@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("blogs.get_posts_by_id")
 
 async def get_blog_posts_by_id(
     headers: Dict[str, str],
@@ -32,18 +31,6 @@ async def get_blog_posts_by_id(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "blogId": blog_id,
         "locationId": location_id,
@@ -56,20 +43,4 @@ async def get_blog_posts_by_id(
     if status:
         params["status"] = status
 
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/blogs/posts/all",
-                headers=request_headers,
-                params=params
-            )
-
-        response.raise_for_status()
-        return response.json()
-
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"API request failed with status {e.response.status_code}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "get_by_location",
+        "update",
+    ],
+    exports={
+        "create_appointment": "create",
+        "delete_business": "delete",
+        "get_business": "get",
+        "get_business_by_location": "get_by_location",
+        "update_business": "update",
+    },
+)
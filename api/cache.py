@@ -0,0 +1,241 @@
+from typing import Iterable, List, Optional, Set, Tuple
+from collections import OrderedDict
+import hashlib
+import logging
+import re
+import threading
+import time
+import httpx
+
+from api.codec import get_codec
+from api.rate_limit import RESOURCE_PARAMS, default_rate_limit_key, token_rate_limit_key
+
+
+class CacheRule:
+    """
+    Marks GET responses for a family of reference endpoints as cacheable.
+
+    Args:
+        family: Name used for invalidation (e.g. "tags")
+        pattern: Regex matched against the request path
+        ttl: Seconds a cached response stays fresh
+    """
+
+    def __init__(self, family: str, pattern: str, ttl: float):
+        self.family = family
+        self.pattern = re.compile(pattern)
+        self.ttl = ttl
+
+
+# Reference data that changes rarely but is fetched constantly.
+DEFAULT_CACHE_RULES = (
+    CacheRule("calendars", r"^/calendars(/(?!events|blocked-slots|groups|resources|appointments)[^/]+)?/?$", 300),
+    CacheRule("custom_fields", r"^/(custom-fields(/object-key)?|locations/[^/]+/customFields)(/[^/]+)?/?$", 600),
+    CacheRule("custom_values", r"^/locations/[^/]+/customValues(/[^/]+)?/?$", 600),
+    CacheRule("tags", r"^/locations/[^/]+/tags(/[^/]+)?/?$", 600),
+    CacheRule("users", r"^/users(/(?!search/?$)[^/]+)?/?$", 300),
+    CacheRule("pipelines", r"^/opportunities/pipelines(/[^/]+)?/?$", 600),
+    CacheRule("workflows", r"^/workflows/?$", 600),
+    CacheRule("timezones", r"^/locations/[^/]+/timezones/?$", 86400),
+)
+
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def _write_locations(request: httpx.Request) -> Set[str]:
+    # Cached GETs are filed under default_rate_limit_key. Writes often name
+    # their location only in the JSON body, and GETs that named none are
+    # filed under the token, so drop both.
+    locations = {token_rate_limit_key(request)}
+    location = default_rate_limit_key(request)
+    if location in locations:
+        try:
+            body = get_codec().loads(request.content) if request.content else None
+        except (httpx.RequestNotRead, ValueError):
+            body = None
+        if isinstance(body, dict):
+            location = next((body[name] for name in RESOURCE_PARAMS if isinstance(body.get(name), str)), location)
+    locations.add(location)
+    return locations
+
+
+class CacheEntry:
+    __slots__ = ("family", "location", "expires_at", "status_code", "headers", "content", "size")
+
+    def __init__(self, family: str, location: str, expires_at: float, status_code: int,
+                 headers: List[Tuple[str, str]], content: bytes):
+        self.family = family
+        self.location = location
+        self.expires_at = expires_at
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.size = len(content) + sum(len(k) + len(v) for k, v in headers)
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache for GET responses from slow-changing reference endpoints.
+
+    Entries are keyed on the full URL (so the location is part of the key),
+    the token scope and the API version, and the cache is bounded by the
+    total size of the stored bodies. A successful POST/PUT/PATCH/DELETE to an
+    endpoint family drops that family's entries for the location it wrote
+    to; `invalidate` and `clear` are available for anything else.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        rules: Iterable[CacheRule] = DEFAULT_CACHE_RULES
+    ):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.rules = list(rules)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, ...], CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def rule_for(self, request: httpx.Request) -> Optional[CacheRule]:
+        path = request.url.path
+        for rule in self.rules:
+            if rule.pattern.match(path):
+                return rule
+        return None
+
+    @staticmethod
+    def key_for(request: httpx.Request) -> Tuple[str, ...]:
+        token_scope = hashlib.sha1(request.headers.get("Authorization", "").encode()).hexdigest()
+        return (str(request.url), token_scope, request.headers.get("Version", ""))
+
+    def get(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """
+        Look up a fresh cached response for `request`.
+
+        Returns:
+            Optional[httpx.Response]: Copy of the cached response, or None on a miss
+        """
+        key = self.key_for(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            extensions={"cache": "hit"},
+            request=request
+        )
+
+    def put(self, request: httpx.Request, rule: CacheRule, status_code: int,
+            headers: List[Tuple[str, str]], content: bytes) -> None:
+        entry = CacheEntry(
+            rule.family, default_rate_limit_key(request), time.monotonic() + rule.ttl,
+            status_code, headers, content
+        )
+        if entry.size > self.max_entry_bytes:
+            return
+        key = self.key_for(request)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Tuple[str, ...]) -> None:
+        self.size -= self._entries.pop(key).size
+
+    def invalidate(self, family: Optional[str] = None, location_id: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            family: Only drop entries for this endpoint family (e.g. "tags")
+            location_id: Only drop entries for this location or company
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            keys = [
+                key for key, entry in self._entries.items()
+                if (family is None or entry.family == family)
+                and (location_id is None or entry.location == location_id)
+            ]
+            for key in keys:
+                self._remove(key)
+        if keys:
+            logging.debug(f"Invalidated {len(keys)} cached responses (family={family}, location={location_id})")
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that serves cacheable GETs from a ResponseCache.
+
+    A request can skip the cache with `extensions={"cache": False}`.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        rule = self.cache.rule_for(request)
+        if rule is None:
+            return await self.transport.handle_async_request(request)
+
+        if request.method != "GET" or request.extensions.get("cache") is False:
+            response = await self.transport.handle_async_request(request)
+            if request.method in MUTATING_METHODS and response.status_code < 400:
+                for location in _write_locations(request):
+                    self.cache.invalidate(family=rule.family, location_id=location)
+            return response
+
+        cached = self.cache.get(request)
+        if cached is not None:
+            return cached
+
+        response = await self.transport.handle_async_request(request)
+        if response.status_code != 200:
+            return response
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        headers = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+        ]
+        self.cache.put(request, rule, response.status_code, headers, content)
+        extensions = {k: v for k, v in response.extensions.items() if k != "network_stream"}
+        extensions["cache"] = "miss"
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            extensions=extensions,
+            request=request
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,23 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_calendar",
+        "createa_block",
+        "delete_calendar",
+        "events",
+        "get_calendar",
+        "get_calendars",
+        "get_free_slots",
+        "groups",
+        "notes",
+        "notifications",
+        "resources",
+        "update",
+    ],
+    exports={
+        "create_block_slot": "createa_block",
+        "update_calendar": "update",
+    },
+)
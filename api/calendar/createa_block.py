@@ -1,6 +1,9 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("calendar.createa_block")
 
 async def create_block_slot(
     block_data: Dict[str, Any],
@@ -8,56 +11,18 @@ async def create_block_slot(
 ) -> Dict[str, Any]:
     """
     Create a block slot in a calendar in Go High Level.
-    
+
     Args:
         block_data: Dictionary containing block slot details (calendarId, locationId, startTime, 
                     endTime, title, assignedUserId)
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the created block slot data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Define API base URL
-    API_BASE_URL = "https://services.leadconnectorhq.com"
-    
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = "2021-04-15"
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
     logging.info("Creating block slot")
-    
-    try:
-        # Make the API request to create block slot
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                f"{API_BASE_URL}/calendars/events/block-slots",
-                headers=request_headers,
-                json=block_data
-            )
-            
-        # Handle the API response
-        if response.status_code != 201:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error creating block slot: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=block_data)
@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_event",
+        "delete",
+        "get_appointment",
+        "get_blocked_slots",
+        "get_calendar_events",
+        "update",
+        "update_block",
+    ],
+    exports={
+        "delete_event": "delete",
+        "update_appointment": "update",
+        "update_block_slot": "update_block",
+    },
+)
@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("calendar.events.create_event")
 
 async def create_event(
     event_data: Dict[str, Any],
@@ -11,53 +11,18 @@ async def create_event(
 ) -> Dict[str, Any]:
     """
     Create an appointment event in Go High Level.
-    
+
     Args:
         event_data: Dictionary containing event details such as calendarId, locationId, 
                    contactId, startTime, endTime, title, etc.
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the created appointment data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
     logging.info("Creating calendar event appointment")
-    
-    try:
-        # Make the API request to create appointment
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                f"{API_BASE_URL}/calendars/events/appointments",
-                headers=request_headers,
-                json=event_data
-            )
-            
-        # Handle the API response
-        if response.status_code != 201:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error creating calendar event: {str(e)}")
-        raise
+
+    return await dispatch(ENDPOINT, headers, json=event_data)
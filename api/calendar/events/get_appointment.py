@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("calendar.events.get_appointment")
 
 async def get_appointment(
     event_id: str,
@@ -11,50 +11,17 @@ async def get_appointment(
 ) -> Dict[str, Any]:
     """
     Get appointment by ID from the Go High Level API.
-    
+
     Args:
         event_id: Event ID or Instance ID. For recurring appointments send masterEventId.
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the appointment event data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     logging.info(f"Making request to get appointment: {event_id}")
-    
-    try:
-        # Make the API request to get appointment
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/calendars/events/appointments/{event_id}",
-                headers=request_headers
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error getting appointment: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"eventId": event_id})
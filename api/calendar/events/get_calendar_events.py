@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("calendar.events.get_calendar_events")
 
 async def get_calendar_events(
     query_params: Dict[str, Any],
@@ -11,51 +11,17 @@ async def get_calendar_events(
 ) -> Dict[str, Any]:
     """
     Get calendar events from the Go High Level API.
-    
+
     Args:
         query_params: Dictionary containing query parameters for filtering events
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the calendar events data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     logging.info("Making request to get calendar events")
-    
-    try:
-        # Make the API request to get calendar events
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/calendars/events",
-                headers=request_headers,
-                params=query_params
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error getting calendar events: {str(e)}")
-        raise
+
+    return await dispatch(ENDPOINT, headers, params=query_params)
@@ -0,0 +1,21 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "disable",
+        "get",
+        "update",
+        "validate",
+    ],
+    exports={
+        "create_calendar_group": "create",
+        "delete_calendar_group": "delete",
+        "disable_calendar_group": "disable",
+        "get_calendar_groups": "get",
+        "update_calendar_group": "update",
+        "validate_group_slug": "validate",
+    },
+)
@@ -1,9 +1,9 @@
-from typing import Dict, Any, List
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("calendar.groups.get")
 
 async def get_calendar_groups(
     location_id: str,
@@ -11,56 +11,22 @@ async def get_calendar_groups(
 ) -> Dict[str, Any]:
     """
     Get all calendar groups in a location from the Go High Level API.
-    
+
     Args:
         location_id: The ID of the location to get calendar groups for
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the calendar groups data with a 'groups' array
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     # Prepare query parameters
     params = {
         "locationId": location_id
     }
-    
+
     logging.info(f"Making request to get calendar groups for location: {location_id}")
-    
-    try:
-        # Make the API request to get calendar groups
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/calendars/groups",
-                headers=request_headers,
-                params=params
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-    
-    except Exception as e:
-        logging.error(f"Error getting calendar groups: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "update",
+    ],
+    exports={
+        "create_note": "create",
+        "delete_note": "delete",
+        "get_notes": "get",
+        "update_note": "update",
+    },
+)
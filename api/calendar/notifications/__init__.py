@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "get_notifcations",
+        "update",
+    ],
+    exports={
+        "create_calendar_notification": "create",
+        "delete_calendar_notification": "delete",
+        "get_calendar_notification": "get",
+        "get_calendar_notifications": "get_notifcations",
+        "update_calendar_notification": "update",
+    },
+)
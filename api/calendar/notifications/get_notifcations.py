@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional, List
-import httpx
+from typing import Dict, Any, Optional
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("calendar.notifications.get_notifcations")
 
 async def get_calendar_notifications(
     calendar_id: str,
@@ -17,7 +17,7 @@ async def get_calendar_notifications(
 ) -> Dict[str, Any]:
     """
     Get calendar notifications from the Go High Level API.
-    
+
     Args:
         calendar_id: The ID of the calendar
         headers: Dictionary containing Authorization and Version headers
@@ -27,28 +27,13 @@ async def get_calendar_notifications(
         is_active: Filter by active status
         limit: Maximum number of records to return (default: 100)
         skip: Number of records to skip (default: 0)
-        
+
     Returns:
         Dictionary containing the calendar notifications data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     # Prepare query parameters
     params = {}
     if alt_id:
@@ -63,26 +48,7 @@ async def get_calendar_notifications(
         params["limit"] = limit
     if skip:
         params["skip"] = skip
-    
+
     logging.info(f"Making request to get calendar notifications for calendar: {calendar_id}")
-    
-    try:
-        # Make the API request to get calendar notifications
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/calendars/{calendar_id}/notifications",
-                headers=request_headers,
-                params=params
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error getting calendar notifications: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"calendarId": calendar_id}, params=params)
@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "list",
+        "update",
+    ],
+    exports={
+        "create_calendar_resource": "create",
+        "delete_calendar_resource": "delete",
+        "get_calendar_resource": "get",
+        "list_calendar_resources": "list",
+        "update_calendar_resource": "update",
+    },
+)
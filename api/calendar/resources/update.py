@@ -1,5 +1,9 @@
 from typing import Dict, Any, List, Optional
-import requests
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+from api.sync import run_sync
+
+ENDPOINT = get_endpoint("calendar.resources.update")
 
 def update_calendar_resource(
     resource_id: str,
@@ -16,7 +20,7 @@ def update_calendar_resource(
 ) -> Dict[str, Any]:
     """
     Update a calendar resource by ID in Go High Level.
-    
+
     Args:
         resource_id: The ID of the resource to update
         resource_type: Resource type ('equipments' or 'rooms')
@@ -29,39 +33,34 @@ def update_calendar_resource(
         capacity: Capacity of the room
         calendar_ids: Service calendar IDs to map with the resource
         is_active: Whether the resource is active
-        
+
     Returns:
         Dict: The updated calendar resource data
     """
-    url = f"https://services.leadconnectorhq.com/calendars/resources/{resource_type}/{resource_id}"
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": "2021-04-15",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     data = {
         "locationId": location_id,
         "name": name,
         "isActive": is_active
     }
-    
+
     if description is not None:
         data["description"] = description
-    
+
     if quantity is not None:
         data["quantity"] = quantity
-    
+
     if out_of_service is not None:
         data["outOfService"] = out_of_service
-    
+
     if capacity is not None:
         data["capacity"] = capacity
-    
+
     if calendar_ids is not None:
         data["calendarIds"] = calendar_ids
-    
-    response = requests.put(url, headers=headers, json=data)
-    return response.json()
\ No newline at end of file
+
+    return run_sync(dispatch(
+        ENDPOINT,
+        token=access_token,
+        path={"resourceType": resource_type, "resourceId": resource_id},
+        json=data
+    ))
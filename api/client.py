@@ -1,21 +1,42 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
 import httpx
-import logging
+
+from api.codec import get_codec
+from api.transport import PoolConfig, _bound_client
 
 class GoHighLevelClient:
     """
     Client for interacting with the Go High Level API.
+
+    The client owns one long-lived connection pool. Use it as an async context
+    manager to also route every endpoint function called inside the block
+    through that pool:
+
+        async with GoHighLevelClient() as ghl:
+            contact = await get_contact(contact_id, token)
     """
 
-    def __init__(self):
+    def __init__(self, api_key: Optional[str] = None, pool_config: Optional[PoolConfig] = None):
         self.api_base_url = "https://services.leadconnectorhq.com"
         self.api_version = "2021-07-28"
-        self.api_key = os.getenv('GO_HIGH_LEVEL_API_KEY')
+        self.api_key = api_key or os.getenv('GO_HIGH_LEVEL_API_KEY')
+        self.pool_config = pool_config or PoolConfig.from_env()
+        self._http: Optional[httpx.AsyncClient] = None
+        self._bind_tokens = []
 
         if not self.api_key:
             raise ValueError("GO_HIGH_LEVEL_API_KEY environment variable is not set")
 
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """
+        The pooled httpx client owned by this instance, created on first use.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = self.pool_config.build_client()
+        return self._http
+
     def get_headers(self) -> Dict[str, str]:
         """
         Get the headers required for API requests.
@@ -43,7 +64,22 @@ class GoHighLevelClient:
         url = f"{self.api_base_url}/{endpoint}"
         headers = self.get_headers()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(method, url, headers=headers, **kwargs)
-            response.raise_for_status()
-            return response.json()
\ No newline at end of file
+        response = await self.http.request(method, url, headers=headers, **kwargs)
+        response.raise_for_status()
+        return get_codec().loads(response.content)
+
+    async def aclose(self) -> None:
+        """
+        Close the connection pool.
+        """
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "GoHighLevelClient":
+        self._bind_tokens.append(_bound_client.set(self.http))
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _bound_client.reset(self._bind_tokens.pop())
+        await self.aclose()
@@ -0,0 +1,129 @@
+from typing import Any, Callable, Optional, Union
+import contextlib
+import contextvars
+import functools
+import importlib.util
+import json
+import logging
+import os
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    Args:
+        name: Backend name, e.g. "orjson"
+        dumps: Serialize an object to compact UTF-8 JSON bytes
+        loads: Parse JSON from bytes
+    """
+    __slots__ = ("name", "dumps", "loads")
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JSONCodec({self.name!r})"
+
+
+def _stdlib() -> JSONCodec:
+    # Same output as httpx's own `json=` encoding.
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return JSONCodec("json", lambda obj: encoder.encode(obj).encode(), json.loads)
+
+
+def _orjson() -> JSONCodec:
+    import orjson
+    # The stdlib encoder turns int keys into strings; keep that working.
+    return JSONCodec("orjson", functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS), orjson.loads)
+
+
+def _msgspec() -> JSONCodec:
+    import msgspec
+    return JSONCodec("msgspec", msgspec.json.Encoder().encode, msgspec.json.Decoder().decode)
+
+
+BACKENDS = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+_codec: Optional[JSONCodec] = None
+
+# Set by `raw_json()`: endpoint functions return the undecoded body.
+_raw: contextvars.ContextVar[bool] = contextvars.ContextVar("ghl_raw_json", default=False)
+
+
+def load_codec(name: str = "auto") -> JSONCodec:
+    """
+    Build a codec by backend name.
+
+    "auto" picks the fastest installed backend: orjson, then msgspec, then
+    the stdlib. A named backend that isn't installed falls back to the stdlib.
+
+    Args:
+        name: "auto", "orjson", "msgspec" or "json"
+
+    Returns:
+        JSONCodec: The codec
+
+    Raises:
+        ValueError: If the name is not a known backend
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            if importlib.util.find_spec(candidate) is not None:
+                return BACKENDS[candidate]()
+        return _stdlib()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON codec {name!r}, expected one of: auto, {', '.join(BACKENDS)}")
+    if name != "json" and importlib.util.find_spec(name) is None:
+        logging.debug(f"{name} is not installed, using the stdlib json codec")
+        return _stdlib()
+    return BACKENDS[name]()
+
+
+def get_codec() -> JSONCodec:
+    """
+    Get the codec used for request and response bodies.
+
+    Chosen from the GHL_JSON_CODEC environment variable on first use
+    ("auto" by default).
+
+    Returns:
+        JSONCodec: The active codec
+    """
+    global _codec
+    if _codec is None:
+        _codec = load_codec(os.getenv("GHL_JSON_CODEC", "auto"))
+    return _codec
+
+
+def set_codec(codec: Union[str, JSONCodec]) -> None:
+    """
+    Set the codec used for request and response bodies.
+
+    Args:
+        codec: A backend name accepted by `load_codec`, or a JSONCodec
+    """
+    global _codec
+    _codec = load_codec(codec) if isinstance(codec, str) else codec
+
+
+@contextlib.contextmanager
+def raw_json():
+    """
+    Make endpoint functions called inside this block return the raw response
+    bytes instead of decoded JSON, e.g. to write an export straight to disk:
+
+        with raw_json():
+            body = await list_invoices(headers, location_id, limit=100)
+    """
+    token = _raw.set(True)
+    try:
+        yield
+    finally:
+        _raw.reset(token)
+
+
+def raw_requested() -> bool:
+    return _raw.get()
@@ -0,0 +1,34 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "appointments",
+        "bulk",
+        "campaigns",
+        "create",
+        "delete",
+        "followers",
+        "get",
+        "get_contacts_by_id",
+        "mirror",
+        "notes",
+        "search",
+        "tags",
+        "tasks",
+        "update",
+        "upsert",
+        "workflow",
+    ],
+    exports={
+        "ContactMirror": "mirror",
+        "DndSetting": "update",
+        "UpdateCustomField": "update",
+        "create_contact": "create",
+        "delete_contact": "delete",
+        "get_contact": "get",
+        "get_contacts_by_business_id": "get_contacts_by_id",
+        "update_contact": "update",
+        "upsert_contact": "upsert",
+    },
+)
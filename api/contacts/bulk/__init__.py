@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "add_remove",
+        "update",
+        "upsert",
+    ],
+    exports={
+        "BulkStats": "upsert",
+        "bulk_update_contacts_business": "add_remove",
+        "bulk_upsert_contacts": "upsert",
+        "update_all_contacts_tags": "update",
+        "update_contacts_tags": "update",
+    },
+)
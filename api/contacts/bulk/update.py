@@ -1,9 +1,15 @@
-from typing import Dict, Any, List, Optional
-import httpx
+from typing import Dict, Any, Iterable, List, Tuple
+import asyncio
 import logging
+import httpx
+from api.dispatch import GoHighLevelAPIError, dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("contacts.bulk.update")
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+# Largest contact and tag lists the API accepts in one request.
+MAX_CONTACTS = 500
+MAX_TAGS = 50
 
 async def update_contacts_tags(
     operation_type: str,
@@ -15,7 +21,7 @@ async def update_contacts_tags(
 ) -> Dict[str, Any]:
     """
     Update tags for multiple contacts at once.
-    
+
     Args:
         operation_type: Type of operation ('add' or 'remove')
         contacts: List of contact IDs to process (max 500)
@@ -23,53 +29,126 @@ async def update_contacts_tags(
         location_id: Location ID where the bulk request is executed
         headers: Dictionary containing Authorization and Version headers
         remove_all_tags: Option to remove all tags (only for 'remove' operation)
-        
+
     Returns:
         Dictionary containing operation results
-        
+
     Raises:
         ValueError: If invalid operation type is provided
         Exception: If API request fails or if required headers are missing
     """
     if operation_type not in ["add", "remove"]:
         raise ValueError("Operation type must be either 'add' or 'remove'")
-    
+
     if remove_all_tags and operation_type != "remove":
         raise ValueError("remove_all_tags can only be used with 'remove' operation type")
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-    
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
+
     payload = {
         "contacts": contacts,
         "tags": tags,
         "locationId": location_id
     }
-    
+
     if operation_type == "remove" and remove_all_tags:
         payload["removeAllTags"] = True
-    
+
     logging.info(f"Making bulk request to {operation_type} tags for {len(contacts)} contacts")
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{API_BASE_URL}/contacts/bulk/tags/update/{operation_type}",
-                headers=request_headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-    except Exception as e:
-        logging.error(f"Error updating tags for contacts: {str(e)}")
-        raise
+
+    return await dispatch(ENDPOINT, headers, path={"operationType": operation_type}, json=payload)
+
+
+def _batches(contacts: List[str], tags: List[str]) -> List[Tuple[List[str], List[str]]]:
+    contact_batches = [contacts[i:i + MAX_CONTACTS] for i in range(0, len(contacts), MAX_CONTACTS)]
+    tag_batches = [tags[i:i + MAX_TAGS] for i in range(0, len(tags), MAX_TAGS)] or [[]]
+    return [(batch, tag_batch) for batch in contact_batches for tag_batch in tag_batches]
+
+
+def _retryable(error: Exception) -> bool:
+    if isinstance(error, GoHighLevelAPIError):
+        return error.retryable
+    return isinstance(error, httpx.TransportError)
+
+
+async def update_all_contacts_tags(
+    operation_type: str,
+    contacts: Iterable[str],
+    tags: Iterable[str],
+    location_id: str,
+    headers: Dict[str, str],
+    remove_all_tags: bool = False,
+    concurrency: int = 4,
+    retries: int = 2
+) -> Dict[str, Any]:
+    """
+    Update tags for any number of contacts and tags.
+
+    The contacts and tags are de-duplicated and split into requests of at most
+    MAX_CONTACTS contacts and MAX_TAGS tags, which run with at most
+    `concurrency` in flight. A request that fails with a 429, a 5xx or a
+    network error is sent again on its own, up to `retries` more times, after
+    the others have finished. One failed request doesn't stop the others.
+
+    Args:
+        operation_type: Type of operation ('add' or 'remove')
+        contacts: Contact IDs to process
+        tags: Tags to add or remove
+        location_id: Location ID where the bulk request is executed
+        headers: Dictionary containing Authorization and Version headers
+        remove_all_tags: Option to remove all tags (only for 'remove' operation)
+        concurrency: Maximum requests in flight
+        retries: Times a failed request is sent again
+
+    Returns:
+        Dictionary with the merged results: 'succeeded' (whether every request
+        succeeded), 'errorCount', 'responses', 'batches' (number of requests)
+        and 'failed' (contacts, tags and error of each request that still
+        failed)
+
+    Raises:
+        ValueError: If invalid operation type is provided
+    """
+    if operation_type not in ["add", "remove"]:
+        raise ValueError("Operation type must be either 'add' or 'remove'")
+
+    if remove_all_tags and operation_type != "remove":
+        raise ValueError("remove_all_tags can only be used with 'remove' operation type")
+
+    batches = _batches(list(dict.fromkeys(contacts)), list(dict.fromkeys(tags)))
+    results: List[Any] = [None] * len(batches)
+
+    async def send(pending: List[int]) -> None:
+        queue = iter(pending)
+
+        async def worker() -> None:
+            for index in queue:
+                batch, tag_batch = batches[index]
+                try:
+                    results[index] = await update_contacts_tags(
+                        operation_type, batch, tag_batch, location_id, headers, remove_all_tags
+                    )
+                except Exception as e:
+                    logging.error(f"Bulk tag request {index + 1}/{len(batches)} failed: {e!r}")
+                    results[index] = e
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(pending)))))
+
+    await send(list(range(len(batches))))
+    for attempt in range(1, retries + 1):
+        pending = [i for i, result in enumerate(results) if isinstance(result, Exception) and _retryable(result)]
+        if not pending:
+            break
+        logging.warning(f"Retrying {len(pending)} failed bulk tag requests")
+        await asyncio.sleep(min(0.5 * 2 ** attempt, 10.0))
+        await send(pending)
+
+    merged: Dict[str, Any] = {"succeeded": True, "errorCount": 0, "responses": [], "batches": len(batches), "failed": []}
+    for (batch, tag_batch), result in zip(batches, results):
+        if isinstance(result, Exception):
+            merged["succeeded"] = False
+            merged["failed"].append({"contacts": batch, "tags": tag_batch, "error": result})
+            continue
+        if result.get("succeeded") is False:
+            merged["succeeded"] = False
+        merged["errorCount"] += result.get("errorCount", 0) or 0
+        merged["responses"].extend(result.get("responses") or [])
+    return merged
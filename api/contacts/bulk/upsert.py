@@ -0,0 +1,327 @@
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Mapping, Optional, Set, Union
+import asyncio
+import re
+import time
+import httpx
+
+from api.dispatch import GoHighLevelAPIError, dispatch
+from api.rate_limit import TokenBucket
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("contacts.upsert")
+
+# upsert_contact's keyword arguments and the API fields they map to. Input
+# records may use either spelling.
+CONTACT_FIELDS = {
+    "first_name": "firstName",
+    "last_name": "lastName",
+    "name": "name",
+    "email": "email",
+    "gender": "gender",
+    "phone": "phone",
+    "address1": "address1",
+    "city": "city",
+    "state": "state",
+    "postal_code": "postalCode",
+    "website": "website",
+    "timezone": "timezone",
+    "dnd": "dnd",
+    "dnd_settings": "dndSettings",
+    "inbound_dnd_settings": "inboundDndSettings",
+    "tags": "tags",
+    "custom_fields": "customFields",
+    "source": "source",
+    "country": "country",
+    "company_name": "companyName",
+    "assigned_to": "assignedTo",
+}
+
+# Error classes reported in UpsertResult.error_class.
+INVALID = "invalid"            # rejected locally or with a 400/422
+AUTH = "auth"                  # 401/403
+RATE_LIMITED = "rate_limited"  # still 429 after retries
+SERVER = "server"              # 5xx
+NETWORK = "network"            # connection or timeout errors
+OTHER = "other"
+
+_PHONE_JUNK = re.compile(r"[\s().\-]")
+
+
+def normalize_phone(phone: str) -> str:
+    """Strip spaces, dots, dashes and parentheses from a phone number."""
+    return _PHONE_JUNK.sub("", phone)
+
+
+def normalize_contact(record: Mapping[str, Any], location_id: str) -> Dict[str, Any]:
+    """
+    Turn an input record into an upsert payload.
+
+    Accepts snake_case or camelCase keys, trims strings and drops empty
+    values, lowercases the email, strips formatting from the phone number and
+    de-duplicates tags, which may be a list or a comma-separated string.
+    Unknown keys are passed through unchanged.
+
+    Args:
+        record: Contact fields
+        location_id: Location to upsert into, unless the record has its own locationId
+
+    Returns:
+        Dict[str, Any]: The request body
+
+    Raises:
+        ValueError: If the record has neither an email nor a phone number, or a tag isn't a string
+    """
+    payload: Dict[str, Any] = {"locationId": location_id}
+    for key, value in record.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == "":
+            continue
+        payload[CONTACT_FIELDS.get(key, key)] = value
+
+    if "email" in payload:
+        payload["email"] = str(payload["email"]).lower()
+    if "phone" in payload:
+        payload["phone"] = normalize_phone(str(payload["phone"]))
+    if "tags" in payload:
+        tags = payload["tags"]
+        if isinstance(tags, str):
+            tags = tags.split(",")
+        elif not isinstance(tags, (list, tuple, set, frozenset)):
+            raise ValueError(f"Contact tags must be a list or a comma-separated string, not {type(tags).__name__}")
+        for tag in tags:
+            if tag is not None and not isinstance(tag, str):
+                raise ValueError(f"Contact tags must be strings, got {tag!r}")
+        payload["tags"] = list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
+
+    if "email" not in payload and "phone" not in payload:
+        raise ValueError("Contact needs an email or a phone number to be upserted")
+    return payload
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Sort an upsert failure into one of INVALID, AUTH, RATE_LIMITED, SERVER,
+    NETWORK or OTHER, so callers can decide what to re-queue.
+    """
+    if isinstance(error, ValueError):
+        return INVALID
+    if isinstance(error, GoHighLevelAPIError):
+        if error.status_code in (400, 422):
+            return INVALID
+        if error.status_code in (401, 403):
+            return AUTH
+        if error.status_code == 429:
+            return RATE_LIMITED
+        if error.status_code >= 500:
+            return SERVER
+    if isinstance(error, httpx.TransportError):
+        return NETWORK
+    return OTHER
+
+
+class UpsertResult:
+    """
+    Outcome of one record.
+
+    Attributes:
+        index: Position of the record in the input
+        payload: The normalized request body, or the raw record if it was invalid
+        contact_id: ID of the created or updated contact
+        created: Whether a new contact was created
+        error: The exception, if the upsert failed
+        error_class: One of the error classes, if the upsert failed
+        elapsed: Seconds the request took
+    """
+    __slots__ = ("index", "payload", "contact_id", "created", "error", "error_class", "elapsed")
+
+    def __init__(self, index: int, payload: Mapping[str, Any]):
+        self.index = index
+        self.payload = payload
+        self.contact_id: Optional[str] = None
+        self.created = False
+        self.error: Optional[BaseException] = None
+        self.error_class: Optional[str] = None
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"UpsertResult({self.index}, {self.contact_id!r}, created={self.created})"
+        return f"UpsertResult({self.index}, error_class={self.error_class!r})"
+
+
+class BulkStats:
+    """
+    Running totals for a bulk upsert; read them while it runs or at the end.
+    """
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.submitted = 0
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: Dict[str, int] = {}
+        self.request_seconds = 0.0
+
+    def record(self, result: UpsertResult) -> None:
+        self.request_seconds += result.elapsed
+        if result.ok:
+            if result.created:
+                self.created += 1
+            else:
+                self.updated += 1
+        else:
+            self.failed += 1
+            self.errors[result.error_class] = self.errors.get(result.error_class, 0) + 1
+
+    @property
+    def done(self) -> int:
+        return self.created + self.updated + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def per_second(self) -> float:
+        return self.done / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "done": self.done,
+            "created": self.created,
+            "updated": self.updated,
+            "failed": self.failed,
+            "errors": dict(self.errors),
+            "elapsed": self.elapsed,
+            "per_second": self.per_second,
+            "mean_latency": self.request_seconds / self.done if self.done else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkStats(done={self.done}, created={self.created}, updated={self.updated}, "
+            f"failed={self.failed}, {self.per_second:.1f}/s)"
+        )
+
+
+async def _records(contacts: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]]):
+    if hasattr(contacts, "__aiter__"):
+        async for record in contacts:
+            yield record
+    else:
+        for record in contacts:
+            yield record
+
+
+async def bulk_upsert_contacts(
+    headers: Dict[str, str],
+    location_id: str,
+    contacts: Union[Iterable[Mapping[str, Any]], AsyncIterable[Mapping[str, Any]]],
+    concurrency: int = 16,
+    rate: Optional[float] = None,
+    stats: Optional[BulkStats] = None
+) -> AsyncIterator[UpsertResult]:
+    """
+    Upsert many contacts, yielding each record's result as it completes.
+
+    Records are pulled from `contacts` (a list, generator or async iterator,
+    e.g. rows streamed from a CSV) only as capacity frees up, so memory stays
+    bounded however long the input is. At most `concurrency` requests are in
+    flight and at most `rate` are started per second, on top of the client's
+    per-location rate limiter. Records sharing an email or phone number are
+    never sent at the same time, so they can't race into duplicate contacts.
+
+    A failed record doesn't stop the run: its result carries the error and an
+    error class (INVALID, AUTH, RATE_LIMITED, SERVER, NETWORK or OTHER).
+
+        stats = BulkStats()
+        async for result in bulk_upsert_contacts(headers, location_id, rows, stats=stats):
+            if not result.ok:
+                failed.append(result)
+        print(stats.as_dict())
+
+    Args:
+        headers: Dictionary containing Authorization and Version headers
+        location_id: Location to upsert into
+        contacts: Contact records, with snake_case or camelCase keys
+        concurrency: Maximum requests in flight
+        rate: Maximum requests started per second; unlimited if None
+        stats: BulkStats to update as results come in
+
+    Yields:
+        UpsertResult: One per input record, in completion order
+    """
+    stats = stats if stats is not None else BulkStats()
+    bucket = TokenBucket(1, rate) if rate else None
+    in_flight: Dict[str, asyncio.Future] = {}
+    tasks: Set[asyncio.Future] = set()
+
+    async def upsert(index: int, record: Mapping[str, Any]) -> UpsertResult:
+        try:
+            payload = normalize_contact(record, location_id)
+        except Exception as e:
+            # Any malformed record (wrong types, not a mapping) is that record's failure only.
+            result = UpsertResult(index, record)
+            result.error, result.error_class = e, INVALID
+            return result
+
+        result = UpsertResult(index, payload)
+        keys = [key for key in (payload.get("email"), payload.get("phone")) if key]
+        while any(key in in_flight for key in keys):
+            await asyncio.wait([in_flight[key] for key in keys if key in in_flight])
+        done = asyncio.get_running_loop().create_future()
+        for key in keys:
+            in_flight[key] = done
+
+        try:
+            if bucket is not None:
+                await asyncio.sleep(bucket.reserve(time.monotonic()))
+            started = time.perf_counter()
+            try:
+                response = await dispatch(ENDPOINT, headers, json=payload)
+                contact = response.get("contact") or {}
+                result.contact_id = contact.get("id")
+                result.created = bool(response.get("new"))
+            except Exception as e:
+                result.error, result.error_class = e, classify_error(e)
+            result.elapsed = time.perf_counter() - started
+        finally:
+            for key in keys:
+                if in_flight.get(key) is done:
+                    del in_flight[key]
+            done.set_result(None)
+        return result
+
+    records = _records(contacts)
+    index = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(tasks) < concurrency:
+                try:
+                    record = await records.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                tasks.add(asyncio.ensure_future(upsert(index, record)))
+                index += 1
+                stats.submitted += 1
+            if not tasks:
+                break
+            finished, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                result = task.result()
+                stats.record(result)
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        stats.finished_at = time.monotonic()
@@ -0,0 +1,14 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "add",
+        "remove_all",
+        "remove_from_campaign",
+    ],
+    exports={
+        "add_contact_to_campaign": "add",
+        "remove_all_campaigns": "remove_all",
+    },
+)
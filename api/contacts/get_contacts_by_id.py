@@ -1,9 +1,8 @@
-from typing import Dict, Any, List, Optional
-import httpx
-import logging
+from typing import Dict, Any, Optional
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("contacts.get_contacts_by_id")
 
 async def get_contacts_by_business_id(
     business_id: str,
@@ -15,7 +14,7 @@ async def get_contacts_by_business_id(
 ) -> Dict[str, Any]:
     """
     Get contacts by business ID.
-    
+
     Args:
         business_id: The ID of the business
         location_id: The ID of the location
@@ -23,41 +22,17 @@ async def get_contacts_by_business_id(
         limit: Maximum number of results to return (default: 25)
         query: Optional search query for contact name
         skip: Number of results to skip (default: 0)
-        
+
     Returns:
         Dict containing contacts and count
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     params = {
         "locationId": location_id,
         "limit": limit,
         "skip": skip
     }
-    
+
     if query:
         params["query"] = query
-    
-    url = f"{API_BASE_URL}/contacts/business/{business_id}"
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=request_headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"Error fetching contacts by business ID: {e}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"businessId": business_id}, params=params)
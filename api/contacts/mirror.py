@@ -0,0 +1,321 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+from api.codec import get_codec
+from api.contacts.bulk.upsert import normalize_phone
+from api.paginate import fan_out, pages
+
+# Webhook types that carry the contact's current fields.
+UPSERT_EVENTS = frozenset({"ContactCreate", "ContactUpdate", "ContactTagUpdate", "ContactDndUpdate"})
+DELETE_EVENTS = frozenset({"ContactDelete"})
+
+# Webhook fields that describe the event rather than the contact.
+_EVENT_FIELDS = ("type", "webhookId", "timestamp")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id TEXT PRIMARY KEY,
+    location_id TEXT,
+    email TEXT,
+    phone TEXT,
+    data BLOB NOT NULL,
+    version REAL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS contacts_email ON contacts (email, location_id);
+CREATE INDEX IF NOT EXISTS contacts_phone ON contacts (phone, location_id);
+CREATE TABLE IF NOT EXISTS contact_tags (
+    tag TEXT NOT NULL,
+    contact_id TEXT NOT NULL,
+    PRIMARY KEY (tag, contact_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS contact_tags_contact ON contact_tags (contact_id);
+"""
+
+# Columns added since the first schema, for mirrors created before them.
+_COLUMNS = {"version": "REAL", "deleted": "INTEGER NOT NULL DEFAULT 0"}
+
+
+def _version(record: Mapping[str, Any]) -> Optional[float]:
+    # When the contact last changed, in epoch seconds: its dateUpdated, or the
+    # webhook's timestamp. ISO strings and epoch seconds or milliseconds.
+    for field in ("dateUpdated", "timestamp"):
+        value = record.get(field)
+        if value is None or isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            return value / 1000 if value > 1e11 else float(value)
+        try:
+            at = datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=datetime.timezone.utc)
+        return at.timestamp()
+    return None
+
+
+class ContactMirror:
+    """
+    Local copy of a location's contacts in SQLite, for lookups by id, email,
+    phone number or tag without an API call.
+
+    Seed it once with `seed()`, then keep it current by passing every contact
+    webhook to `apply()`. Emails are matched case-insensitively and phone
+    numbers without formatting. Contacts are returned as the API's dicts.
+
+    Writes are ordered by the contact's `dateUpdated` (or the webhook's
+    `timestamp`): an event older than what the mirror holds is skipped, so
+    late or redelivered webhooks and a `seed()` running alongside them
+    can't overwrite newer data. Deleted contacts are kept as tombstones, so
+    an update arriving after the delete doesn't bring them back; drop old
+    tombstones with `prune_tombstones()`. The mirror can be shared between
+    threads.
+
+        mirror = ContactMirror("contacts.db")
+        await mirror.seed(headers, location_id)
+        ...
+        mirror.apply(webhook_payload)
+        matches = mirror.by_email("jane@example.com", location_id)
+
+    Args:
+        path: Database file, or ":memory:" for an in-process mirror
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"] = ":memory:"):
+        self.path = os.fspath(path)
+        self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(contacts)")}
+        for column, definition in _COLUMNS.items():
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE contacts ADD COLUMN {column} {definition}")
+        self._codec = get_codec()
+        # One connection, explicit transactions: threads take turns.
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "ContactMirror":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM contacts WHERE deleted = 0").fetchone()[0]
+
+    # Writes
+
+    def _put(self, contact: Mapping[str, Any]) -> bool:
+        contact_id = contact["id"]
+        version = _version(contact)
+        row = self._db.execute(
+            "SELECT data, version, deleted FROM contacts WHERE id = ?", (contact_id,)
+        ).fetchone()
+        if row is not None:
+            current = row[1]
+            if row[2]:
+                # Only a change made after the delete brings a contact back.
+                if version is None or current is None or version <= current:
+                    return False
+            elif version is not None and current is not None and version < current:
+                return False
+
+        # Update webhooks can leave out unchanged fields, so merge into what we have.
+        data = self._codec.loads(row[0]) if row and not row[2] else {}
+        data.update((key, value) for key, value in contact.items() if key not in _EVENT_FIELDS)
+        if row is not None and row[1] is not None:
+            version = row[1] if version is None else max(version, row[1])
+
+        email = data.get("email")
+        phone = data.get("phone")
+        self._db.execute(
+            "INSERT OR REPLACE INTO contacts (id, location_id, email, phone, data, version, deleted) "
+            "VALUES (?, ?, ?, ?, ?, ?, 0)",
+            (
+                contact_id,
+                data.get("locationId"),
+                email.strip().lower() if email else None,
+                normalize_phone(phone) if phone else None,
+                self._codec.dumps(data),
+                version,
+            ),
+        )
+        if "tags" in contact:
+            self._db.execute("DELETE FROM contact_tags WHERE contact_id = ?", (contact_id,))
+            self._db.executemany(
+                "INSERT OR IGNORE INTO contact_tags (tag, contact_id) VALUES (?, ?)",
+                [(tag, contact_id) for tag in contact["tags"] or ()],
+            )
+        return True
+
+    def put(self, contact: Mapping[str, Any]) -> bool:
+        """
+        Insert or update one contact; fields not in `contact` are kept.
+        Returns False if the mirror already holds a newer version or a later delete.
+        """
+        return self.put_many((contact,)) == 1
+
+    def put_many(self, contacts: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Insert or update contacts in one transaction, skipping any older than
+        what the mirror holds. Returns how many were written.
+        """
+        count = 0
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            for contact in contacts:
+                count += self._put(contact)
+        return count
+
+    def delete(self, contact_id: str, version: Optional[float] = None) -> bool:
+        """
+        Remove a contact, leaving a tombstone so older updates arriving later
+        are ignored. Skipped if the mirror holds a change made after `version`
+        (epoch seconds); without one, the delete is taken as the latest change.
+
+        Returns:
+            bool: Whether the contact was in the mirror
+        """
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            row = self._db.execute("SELECT version, deleted FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+            current = row[0] if row is not None and row[0] is not None else None
+            if version is None:
+                version = time.time() if current is None else max(time.time(), current)
+            elif current is not None and current > version:
+                return False
+            self._db.execute("DELETE FROM contact_tags WHERE contact_id = ?", (contact_id,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO contacts (id, data, version, deleted) VALUES (?, ?, ?, 1)",
+                (contact_id, b"{}", version),
+            )
+            return row is not None and not row[1]
+
+    def prune_tombstones(self, before: float) -> int:
+        """
+        Forget contacts deleted before `before` (epoch seconds), once no
+        webhook older than that can still arrive. Returns how many were dropped.
+        """
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            return self._db.execute("DELETE FROM contacts WHERE deleted = 1 AND version < ?", (before,)).rowcount
+
+    def apply(self, event: Mapping[str, Any]) -> bool:
+        """
+        Apply a contact webhook (ContactCreate, ContactUpdate, ContactDelete,
+        ContactTagUpdate or ContactDndUpdate) to the mirror.
+
+        Returns:
+            bool: Whether the event was a contact event
+        """
+        event_type = event.get("type")
+        if event_type in UPSERT_EVENTS:
+            self.put(event)
+            return True
+        if event_type in DELETE_EVENTS:
+            self.delete(event["id"], _version(event))
+            return True
+        return False
+
+    async def seed(
+        self,
+        headers: Mapping[str, str],
+        location_id: str,
+        parallel: bool = True,
+        limit: int = 100,
+        **kwargs
+    ) -> int:
+        """
+        Load every contact of a location through the contact search endpoint,
+        writing each page as it arrives.
+
+        Args:
+            headers: Dictionary containing Authorization and Version headers
+            location_id: Location to export
+            parallel: Fetch pages concurrently once the total is known
+            limit: Page size
+            **kwargs: Passed on to `fan_out` or `pages`, e.g. concurrency or rate
+
+        Returns:
+            int: Number of contacts written
+        """
+        iterate = fan_out if parallel else pages
+        count = 0
+        async for page in iterate(
+            "contacts.search.search", headers, json={"locationId": location_id}, limit=limit, **kwargs
+        ):
+            count += self.put_many({**contact, "locationId": contact.get("locationId") or location_id}
+                                   for contact in page.items)
+        return count
+
+    # Reads
+
+    def get(self, contact_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT data FROM contacts WHERE id = ? AND deleted = 0", (contact_id,)).fetchone()
+        return self._codec.loads(row[0]) if row else None
+
+    def query(
+        self,
+        location_id: Optional[str] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        tags: Sequence[str] = (),
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Find contacts matching every given criterion.
+
+        Args:
+            location_id: Only contacts of this location
+            email: Email address, matched case-insensitively
+            phone: Phone number, matched ignoring formatting
+            tags: Tags the contact must all have
+            limit: Maximum contacts to return
+            offset: Matching contacts to skip
+
+        Returns:
+            List[Dict[str, Any]]: The matching contacts
+        """
+        where, args = ["deleted = 0"], []
+        if location_id is not None:
+            where.append("location_id = ?")
+            args.append(location_id)
+        if email is not None:
+            where.append("email = ?")
+            args.append(email.strip().lower())
+        if phone is not None:
+            where.append("phone = ?")
+            args.append(normalize_phone(phone))
+        for tag in dict.fromkeys(tags):
+            where.append("id IN (SELECT contact_id FROM contact_tags WHERE tag = ?)")
+            args.append(tag)
+
+        sql = "SELECT data FROM contacts WHERE " + " AND ".join(where)
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            args.extend((-1 if limit is None else limit, offset))
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [self._codec.loads(data) for data, in rows]
+
+    def by_email(self, email: str, location_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self.query(location_id, email=email)
+
+    def by_phone(self, phone: str, location_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self.query(location_id, phone=phone)
+
+    def with_tags(self, *tags: str, location_id: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.query(location_id, tags=tags, limit=limit)
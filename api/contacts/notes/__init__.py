@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "crate",
+        "delete",
+        "get",
+        "get_all",
+        "update",
+    ],
+    exports={
+        "create_note": "crate",
+        "delete_note": "delete",
+        "get_all_notes": "get_all",
+        "get_note": "get",
+        "update_note": "update",
+    },
+)
@@ -1,9 +1,9 @@
 from typing import Dict, Any
-import httpx
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("contacts.notes.update")
 
 async def update_note(
     contact_id: str,
@@ -13,54 +13,24 @@ async def update_note(
 ) -> Dict[str, Any]:
     """
     Update a note for a contact in Go High Level.
-    
+
     Args:
         contact_id: The ID of the contact
         note_id: The ID of the note to update
         note_data: Dictionary containing note details (userId, body)
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the updated note data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
     logging.info(f"Updating note {note_id} for contact {contact_id}")
-    
-    try:
-        # Make the API request to update note
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.put(
-                f"{API_BASE_URL}/contacts/{contact_id}/notes/{note_id}",
-                headers=request_headers,
-                json=note_data
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-    
-    except Exception as e:
-        logging.error(f"Error updating note: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"contactId": contact_id, "noteId": note_id},
+        json=note_data
+    )
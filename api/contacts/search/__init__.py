@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get_duplicates",
+        "search",
+    ],
+    exports={
+        "get_duplicate_contact": "get_duplicates",
+        "search_contacts": "search",
+    },
+)
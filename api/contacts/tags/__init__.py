@@ -0,0 +1,16 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "add",
+        "batch",
+        "remove",
+    ],
+    exports={
+        "TagBatchError": "batch",
+        "TagBatcher": "batch",
+        "add_tags_to_contact": "add",
+        "remove_contact_tags": "remove",
+    },
+)
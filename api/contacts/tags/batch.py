@@ -0,0 +1,187 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import asyncio
+import logging
+
+from api.contacts.bulk.update import MAX_CONTACTS, update_all_contacts_tags
+
+# (operation type, tags) — contacts getting the same change share a bulk request.
+_Key = Tuple[str, Tuple[str, ...]]
+
+_OPPOSITE = {"add": "remove", "remove": "add"}
+
+
+class TagBatchError(RuntimeError):
+    """Raised to a TagBatcher caller whose contact the bulk response reports as failed."""
+
+
+def _reported_failures(result: Dict[str, Any], contacts: Iterable[str]) -> Dict[str, BaseException]:
+    # Failed requests carry their exception; successful ones may still report
+    # per-contact errors in their responses, or only an error count.
+    contacts = set(contacts)
+    errors: Dict[str, BaseException] = {
+        contact: failed["error"] for failed in result["failed"] for contact in failed["contacts"]
+    }
+    named = 0
+    for response in result.get("responses") or ():
+        if not isinstance(response, dict):
+            continue
+        contact = response.get("contactId") or response.get("id")
+        if contact not in contacts or contact in errors:
+            continue
+        if response.get("succeeded") is False or response.get("success") is False or response.get("error"):
+            message = response.get("error") or response.get("message") or "reported as failed"
+            errors[contact] = TagBatchError(f"Bulk tag update failed for contact {contact}: {message}")
+            named += 1
+
+    reported = result.get("errorCount") or 0
+    unexplained = reported > named or (result.get("succeeded") is False and not errors)
+    if unexplained and len(errors) < len(contacts):
+        # The response doesn't say which contacts failed, so none can be trusted.
+        error = TagBatchError(
+            f"Bulk tag update reported {reported} errors without naming the contacts"
+        )
+        for contact in contacts:
+            errors.setdefault(contact, error)
+    return errors
+
+
+class TagBatcher:
+    """
+    Collects single-contact tag adds and removes and sends them as bulk
+    requests.
+
+    Calls that add (or remove) the same set of tags within `window` seconds
+    are sent together through the bulk tags endpoint, which takes one tag
+    list for up to MAX_CONTACTS contacts; a group is sent early once it
+    reaches `max_contacts`. Each caller waits for its group's request and
+    gets `{"tags": [...]}` back, or the error of the request its contact was
+    part of; contacts the bulk response reports as failed get a
+    TagBatchError.
+
+    Changes to one contact are applied in the order they were made: a call
+    that conflicts with a buffered opposite change (adding a tag that is
+    waiting to be removed, or the reverse) sends that change first, and a
+    contact's requests never run at the same time.
+
+        async with TagBatcher(location_id, headers) as batcher:
+            await add_tags_to_contact(contact_id, ["lead"], headers, batcher=batcher)
+
+    Args:
+        location_id: Location the contacts belong to
+        headers: Dictionary containing Authorization and Version headers
+        window: Seconds to wait for more contacts before sending a group
+        max_contacts: Contacts per group that trigger an immediate send
+        concurrency: Maximum bulk requests in flight
+    """
+
+    def __init__(
+        self,
+        location_id: str,
+        headers: Dict[str, str],
+        window: float = 0.25,
+        max_contacts: int = MAX_CONTACTS,
+        concurrency: int = 4
+    ):
+        self.location_id = location_id
+        self.headers = headers
+        self.window = window
+        self.max_contacts = min(max_contacts, MAX_CONTACTS)
+        self.concurrency = concurrency
+        self.requests = 0
+        self.batches = 0
+        self._pending: Dict[_Key, Dict[str, List[asyncio.Future]]] = {}
+        self._timers: Dict[_Key, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._last: Dict[str, asyncio.Task] = {}
+        self._limit: Optional[asyncio.Semaphore] = None
+
+    async def add(self, contact_id: str, tags: List[str]) -> Dict[str, Any]:
+        """Add tags to a contact as part of the next bulk request."""
+        return await self._submit("add", contact_id, tags)
+
+    async def remove(self, contact_id: str, tags: List[str]) -> Dict[str, Any]:
+        """Remove tags from a contact as part of the next bulk request."""
+        return await self._submit("remove", contact_id, tags)
+
+    async def _submit(self, operation_type: str, contact_id: str, tags: List[str]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        key = (operation_type, tuple(sorted(set(tags))))
+        for other, waiting in list(self._pending.items()):
+            if other[0] == _OPPOSITE[operation_type] and contact_id in waiting and set(other[1]) & set(key[1]):
+                self._send(other)
+        group = self._pending.setdefault(key, {})
+        future = loop.create_future()
+        group.setdefault(contact_id, []).append(future)
+        self.requests += 1
+
+        if len(group) >= self.max_contacts:
+            self._send(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._send, key)
+        return await future
+
+    def _send(self, key: _Key) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._pending.pop(key, None)
+        if not group:
+            return
+        # Wait for earlier requests touching the same contacts.
+        earlier = {self._last[contact] for contact in group if contact in self._last}
+        task = asyncio.ensure_future(self._flush(key, group, earlier))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda task: self._forget(task, group))
+        for contact in group:
+            self._last[contact] = task
+
+    def _forget(self, task: asyncio.Task, contacts: Iterable[str]) -> None:
+        for contact in contacts:
+            if self._last.get(contact) is task:
+                del self._last[contact]
+
+    async def _flush(
+        self,
+        key: _Key,
+        group: Dict[str, List[asyncio.Future]],
+        earlier: Set[asyncio.Task]
+    ) -> None:
+        if earlier:
+            await asyncio.wait(earlier)
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.concurrency)
+        operation_type, tags = key
+        self.batches += 1
+        try:
+            async with self._limit:
+                result = await update_all_contacts_tags(
+                    operation_type, list(group), list(tags), self.location_id, self.headers
+                )
+            errors = _reported_failures(result, group)
+        except Exception as e:
+            errors = dict.fromkeys(group, e)
+        if errors:
+            logging.error(f"Batched tag {operation_type} failed for {len(errors)} of {len(group)} contacts")
+
+        for contact_id, futures in group.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if contact_id in errors:
+                    future.set_exception(errors[contact_id])
+                else:
+                    future.set_result({"tags": list(tags)})
+
+    async def flush(self) -> None:
+        """Send every buffered group now and wait for all bulk requests to finish."""
+        for key in list(self._pending):
+            self._send(key)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def __aenter__(self) -> "TagBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.flush()
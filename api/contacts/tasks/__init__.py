@@ -0,0 +1,21 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "get_all",
+        "update",
+        "update_to_complete",
+    ],
+    exports={
+        "create_task": "create",
+        "delete_task": "delete",
+        "get_all_tasks": "get_all",
+        "get_task": "get",
+        "update_task": "update",
+        "update_task_to_complete": "update_to_complete",
+    },
+)
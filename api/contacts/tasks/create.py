@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("contacts.tasks.create")
 
 async def create_task(
     contact_id: str,
@@ -16,7 +15,7 @@ async def create_task(
 ) -> Dict[str, Any]:
     """
     Create a task for a contact in Go High Level.
-    
+
     Args:
         contact_id: ID of the contact
         headers: Dictionary containing Authorization and Version headers
@@ -25,46 +24,20 @@ async def create_task(
         completed: Whether the task is completed
         body: Optional body/description of the task
         assigned_to: Optional ID of user assigned to the task
-        
+
     Returns:
         Dict containing the created task data
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Content-Type": "application/json"
-    }
-    
     payload = {
         "title": title,
         "dueDate": due_date,
         "completed": completed
     }
-    
+
     if body:
         payload["body"] = body
-    
+
     if assigned_to:
         payload["assignedTo"] = assigned_to
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{API_BASE_URL}/contacts/{contact_id}/tasks",
-                json=payload,
-                headers=request_headers
-            )
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"contactId": contact_id}, json=payload)
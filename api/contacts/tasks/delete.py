@@ -1,9 +1,9 @@
-from typing import Dict, Any
-import httpx
+from typing import Dict
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("contacts.tasks.delete")
 
 async def delete_task(
     contact_id: str,
@@ -12,51 +12,18 @@ async def delete_task(
 ) -> Dict[str, bool]:
     """
     Delete a task for a contact from the Go High Level API.
-    
+
     Args:
         contact_id: The ID of the contact
         task_id: The ID of the task to delete
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing success status
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     logging.info(f"Making request to delete task {task_id} for contact: {contact_id}")
-    
-    try:
-        # Make the API request to delete task
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.delete(
-                f"{API_BASE_URL}/contacts/{contact_id}/tasks/{task_id}",
-                headers=request_headers
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-    
-    except httpx.RequestError as e:
-        logging.error(f"Request error occurred: {str(e)}")
-        raise Exception(f"Request error occurred: {str(e)}")
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"contactId": contact_id, "taskId": task_id})
@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("contacts.tasks.update")
 
 async def update_task(
     contact_id: str,
@@ -17,7 +16,7 @@ async def update_task(
 ) -> Dict[str, Any]:
     """
     Update a task for a contact in Go High Level.
-    
+
     Args:
         contact_id: ID of the contact
         task_id: ID of the task to update
@@ -27,18 +26,10 @@ async def update_task(
         due_date: Optional new due date in ISO format (e.g. "2020-10-25T11:00:00Z")
         completed: Optional new completed status
         assigned_to: Optional new ID of user assigned to the task
-        
+
     Returns:
         Dict containing the updated task data
     """
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if "Version" not in headers:
-        headers["Version"] = API_VERSION
-
-    headers["Content-Type"] = "application/json"
-    
     payload = {}
     if title is not None:
         payload["title"] = title
@@ -50,16 +41,5 @@ async def update_task(
         payload["completed"] = completed
     if assigned_to is not None:
         payload["assignedTo"] = assigned_to
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{API_BASE_URL}/contacts/{contact_id}/tasks/{task_id}",
-                json=payload,
-                headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"Error updating task: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"contactId": contact_id, "taskId": task_id}, json=payload)
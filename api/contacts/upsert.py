@@ -1,9 +1,8 @@
 from typing import Dict, Any, List, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("contacts.upsert")
 
 async def upsert_contact(
     headers: Dict[str, str],
@@ -32,30 +31,15 @@ async def upsert_contact(
 ) -> Dict[str, Any]:
     """
     Upsert a contact in Go High Level.
-    
+
     If Allow Duplicate Contact is disabled under Settings, the global unique identifier 
     will be used for de-duplication. If the setting is enabled, a new contact will 
     get created with the shared details.
     """
-    url = f"{API_BASE_URL}/contacts/upsert"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     payload = {
         "locationId": location_id
     }
-    
+
     optional_fields = {
         "firstName": first_name,
         "lastName": last_name,
@@ -79,17 +63,7 @@ async def upsert_contact(
         "companyName": company_name,
         "assignedTo": assigned_to
     }
-    
+
     payload.update({k: v for k, v in optional_fields.items() if v is not None})
-    
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=request_headers, json=payload)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=payload)
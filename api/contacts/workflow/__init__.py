@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "add",
+        "delete",
+    ],
+    exports={
+        "add_contact_to_workflow": "add",
+        "delete_contact_from_workflow": "delete",
+    },
+)
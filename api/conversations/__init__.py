@@ -0,0 +1,21 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "email",
+        "get",
+        "messages",
+        "provider",
+        "search",
+        "update",
+    ],
+    exports={
+        "create_conversation": "create",
+        "delete_conversation": "delete",
+        "get_conversation": "get",
+        "update_conversation": "update",
+    },
+)
@@ -1,9 +1,9 @@
-from typing import Dict, Any
-import httpx
+from typing import Dict
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("conversations.delete")
 
 async def delete_conversation(
     conversation_id: str,
@@ -11,50 +11,18 @@ async def delete_conversation(
 ) -> Dict[str, bool]:
     """
     Delete a conversation by ID from the Go High Level API.
-    
+
     Args:
         conversation_id: The ID of the conversation to delete
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing success status
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     logging.info(f"Making request to delete conversation: {conversation_id}")
-    
-    try:
-        # Make the API request to delete conversation
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.delete(
-                f"{API_BASE_URL}/conversations/{conversation_id}",
-                headers=request_headers
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return {"success": True}
-        
-    except Exception as e:
-        logging.error(f"Error deleting conversation: {str(e)}")
-        raise
\ No newline at end of file
+
+    await dispatch(ENDPOINT, headers, path={"conversationId": conversation_id})
+    return {"success": True}
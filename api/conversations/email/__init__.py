@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "cancel",
+        "get",
+    ],
+    exports={
+        "cancel_scheduled_email": "cancel",
+        "get_email": "get",
+    },
+)
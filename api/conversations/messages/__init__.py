@@ -0,0 +1,27 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "add_external_call",
+        "add_inbound_message",
+        "cancel_scheduled_message",
+        "download_transcription",
+        "get_messages_by_conversation_id",
+        "get_messages_by_id",
+        "get_recording",
+        "get_transcription",
+        "send_recording_by_i",
+        "update_status",
+        "upload_files",
+    ],
+    exports={
+        "download_recordings": "get_recording",
+        "download_transcriptions": "download_transcription",
+        "get_message_by_id": "get_messages_by_id",
+        "send_new_message": "send_recording_by_i",
+        "stream_recording": "get_recording",
+        "stream_transcription": "download_transcription",
+        "update_message_status": "update_status",
+    },
+)
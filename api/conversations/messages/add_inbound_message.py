@@ -1,9 +1,8 @@
 from typing import Dict, Any, List, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("conversations.messages.add_inbound_message")
 
 async def add_inbound_message(
     headers: Dict[str, str],
@@ -29,7 +28,7 @@ async def add_inbound_message(
 ) -> Dict[str, Any]:
     """
     Add an inbound message to a conversation.
-    
+
     Args:
         headers: Dictionary containing Authorization and Version headers
         type: Message type (SMS, Email, WhatsApp, GMB, IG, FB, Custom, WebChat, Live_Chat, Call)
@@ -51,28 +50,13 @@ async def add_inbound_message(
         to: Phone number of the receiver
         from_: Phone number of the dialer
         status: Call status
-        
+
     Returns:
         Dictionary containing response data with conversation and message details
-        
+
     Raises:
         Exception: If the API request fails
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-    
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     # Prepare request payload
     payload = {
         "type": type,
@@ -80,7 +64,7 @@ async def add_inbound_message(
         "conversationProviderId": conversation_provider_id,
         "direction": direction
     }
-    
+
     # Add optional fields to payload
     if message is not None:
         payload["message"] = message
@@ -104,7 +88,7 @@ async def add_inbound_message(
         payload["altId"] = alt_id
     if date is not None:
         payload["date"] = date
-    
+
     # Add call information if provided
     if call is not None:
         payload["call"] = call
@@ -113,18 +97,5 @@ async def add_inbound_message(
         payload["from"] = from_
         if status is not None:
             payload["status"] = status
-    
-    # Make API request
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{API_BASE_URL}/conversations/messages/inbound",
-            headers=request_headers,
-            json=payload
-        )
-    
-    # Check for successful response
-    if response.status_code != 200:
-        logging.error(f"Failed to add inbound message: {response.text}")
-        raise Exception(f"Failed to add inbound message: {response.status_code} - {response.text}")
-    
-    return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=payload)
@@ -1,9 +1,11 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Iterable, Union
 import logging
+import os
+from api.dispatch import dispatch
+from api.download import Destination, download, download_all
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("conversations.messages.download_transcription")
 
 async def download_transcription(
     location_id: str,
@@ -12,51 +14,83 @@ async def download_transcription(
 ) -> bytes:
     """
     Download a message transcription from the Go High Level API.
-    
+
     Args:
         location_id: The ID of the location
         message_id: The ID of the message
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Raw bytes content of the transcription file
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     logging.info(f"Downloading transcription for message: {message_id}")
-    
-    try:
-        # Make the API request to download transcription
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/conversations/locations/{location_id}/messages/{message_id}/transcription/download",
-                headers=request_headers
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.content
-        
-    except Exception as e:
-        logging.error(f"Error downloading transcription: {str(e)}")
-        raise Exception(f"Error downloading transcription: {str(e)}")
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id, "messageId": message_id})
+
+
+async def stream_transcription(
+    location_id: str,
+    message_id: str,
+    headers: Dict[str, str],
+    destination: Destination
+) -> int:
+    """
+    Stream a message transcription to a file or async sink without holding
+    it in memory. An interrupted download to a file resumes where it stopped.
+
+    Args:
+        location_id: The ID of the location
+        message_id: The ID of the message
+        headers: Dictionary containing Authorization and Version headers
+        destination: File path, or an async callable that receives each chunk
+
+    Returns:
+        int: Size of the transcription file in bytes
+
+    Raises:
+        Exception: If the API request fails or if required headers are missing
+    """
+    logging.info(f"Streaming transcription for message: {message_id}")
+
+    return await download(ENDPOINT, destination, headers, path={"locationId": location_id, "messageId": message_id})
+
+
+async def download_transcriptions(
+    location_id: str,
+    message_ids: Iterable[str],
+    directory: str,
+    headers: Dict[str, str],
+    concurrency: int = 8,
+    filename: str = "{message_id}.txt"
+) -> Dict[str, Union[int, Exception]]:
+    """
+    Download the transcriptions for many messages into a directory, with at
+    most `concurrency` downloads in flight. Files already on disk are skipped.
+
+    Args:
+        location_id: The ID of the location
+        message_ids: IDs of the messages
+        directory: Directory to write the transcriptions to
+        headers: Dictionary containing Authorization and Version headers
+        concurrency: Maximum simultaneous downloads
+        filename: File name template, formatted with `message_id`
+
+    Returns:
+        Dict[str, Union[int, Exception]]: Size in bytes, or the error, per message ID
+    """
+    message_ids = list(message_ids)
+    os.makedirs(directory, exist_ok=True)
+    results = await download_all(
+        ENDPOINT,
+        (
+            ({"locationId": location_id, "messageId": message_id},
+             os.path.join(directory, filename.format(message_id=message_id)))
+            for message_id in message_ids
+        ),
+        headers,
+        concurrency=concurrency
+    )
+    return dict(zip(message_ids, results))
@@ -0,0 +1,98 @@
+from typing import Dict, Iterable, Union
+import logging
+import os
+from api.dispatch import dispatch
+from api.download import Destination, download, download_all
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("conversations.messages.get_recording")
+
+async def get_recording(
+    message_id: str,
+    location_id: str,
+    headers: Dict[str, str]
+) -> bytes:
+    """
+    Get the recording for a message by message ID.
+
+    Args:
+        message_id: The ID of the message
+        location_id: The ID of the location
+        headers: Dictionary containing Authorization and Version headers
+
+    Returns:
+        Binary content of the recording file
+
+    Raises:
+        Exception: If the API request fails or if required headers are missing
+    """
+    logging.info(f"Fetching recording for message: {message_id} in location: {location_id}")
+
+    return await dispatch(ENDPOINT, headers, path={"messageId": message_id, "locationId": location_id})
+
+
+async def stream_recording(
+    message_id: str,
+    location_id: str,
+    headers: Dict[str, str],
+    destination: Destination
+) -> int:
+    """
+    Stream the recording for a message to a file or async sink without
+    holding it in memory. An interrupted download to a file resumes where
+    it stopped.
+
+    Args:
+        message_id: The ID of the message
+        location_id: The ID of the location
+        headers: Dictionary containing Authorization and Version headers
+        destination: File path, or an async callable that receives each chunk
+
+    Returns:
+        int: Size of the recording in bytes
+
+    Raises:
+        Exception: If the API request fails or if required headers are missing
+    """
+    logging.info(f"Streaming recording for message: {message_id} in location: {location_id}")
+
+    return await download(ENDPOINT, destination, headers, path={"messageId": message_id, "locationId": location_id})
+
+
+async def download_recordings(
+    location_id: str,
+    message_ids: Iterable[str],
+    directory: str,
+    headers: Dict[str, str],
+    concurrency: int = 8,
+    filename: str = "{message_id}.wav"
+) -> Dict[str, Union[int, Exception]]:
+    """
+    Download the recordings for many messages into a directory, with at
+    most `concurrency` downloads in flight. Recordings already on disk are
+    skipped, so an interrupted run can simply be started again.
+
+    Args:
+        location_id: The ID of the location
+        message_ids: IDs of the messages
+        directory: Directory to write the recordings to
+        headers: Dictionary containing Authorization and Version headers
+        concurrency: Maximum simultaneous downloads
+        filename: File name template, formatted with `message_id`
+
+    Returns:
+        Dict[str, Union[int, Exception]]: Size in bytes, or the error, per message ID
+    """
+    message_ids = list(message_ids)
+    os.makedirs(directory, exist_ok=True)
+    results = await download_all(
+        ENDPOINT,
+        (
+            ({"messageId": message_id, "locationId": location_id},
+             os.path.join(directory, filename.format(message_id=message_id)))
+            for message_id in message_ids
+        ),
+        headers,
+        concurrency=concurrency
+    )
+    return dict(zip(message_ids, results))
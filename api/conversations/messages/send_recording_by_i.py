@@ -1,9 +1,9 @@
 from typing import Dict, Any, List, Optional
-import httpx
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("conversations.messages.send_recording_by_i")
 
 async def send_new_message(
     conversation_id: str,
@@ -30,7 +30,7 @@ async def send_new_message(
 ) -> Dict[str, Any]:
     """
     Send a new message in a conversation.
-    
+
     Args:
         conversation_id: ID of the conversation
         message_type: Type of message (SMS, Email, WhatsApp, IG, FB, Custom, Live_Chat)
@@ -53,35 +53,19 @@ async def send_new_message(
         conversation_provider_id: ID of conversation provider
         from_number: Phone number used as the sender
         to_number: Recipient phone number
-        
+
     Returns:
         Dictionary containing the created message data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
     # Prepare request payload
     payload = {
         "type": message_type,
         "contactId": contact_id 
     }
-    
+
     # Add optional fields if provided
     if message:
         payload["message"] = message
@@ -117,25 +101,7 @@ async def send_new_message(
         payload["fromNumber"] = from_number
     if to_number:
         payload["toNumber"] = to_number
-    
+
     logging.info(f"Sending new message in conversation: {conversation_id}")
-    
-    try:
-        # Make the API request to send message
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                f"{API_BASE_URL}/conversations/messages",
-                headers=request_headers,
-                json=payload
-            )
-            
-            # Check if request was successful
-            response.raise_for_status()
-            return response.json()
-            
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred while sending message: {e}")
-        raise Exception(f"Failed to send message: {e}")
-    except Exception as e:
-        logging.error(f"Error occurred while sending message: {e}")
-        raise Exception(f"Failed to send message: {e}")
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=payload)
@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional, List
-import httpx
+from typing import Dict, Any, Optional
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("conversations.search.search")
 
 async def search_conversations(
     location_id: str,
@@ -29,7 +29,7 @@ async def search_conversations(
 ) -> Dict[str, Any]:
     """
     Search conversations based on various filters.
-    
+
     Args:
         location_id: Location ID (required)
         headers: Dictionary containing Authorization and Version headers
@@ -51,33 +51,18 @@ async def search_conversations(
         sort_score_profile: ID of score profile for sorting
         start_after_date: Search to begin after the specified date
         status: Status filter (all/read/unread/starred/recents)
-        
+
     Returns:
         Dictionary containing conversations and total count
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     # Prepare query parameters
     params = {
         "locationId": location_id
     }
-    
+
     # Add optional parameters if provided
     if assigned_to:
         params["assignedTo"] = assigned_to
@@ -115,26 +100,7 @@ async def search_conversations(
         params["startAfterDate"] = start_after_date
     if status:
         params["status"] = status
-    
+
     logging.info(f"Searching conversations with parameters: {params}")
-    
-    try:
-        # Make the API request
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/conversations/search",
-                headers=request_headers,
-                params=params
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error searching conversations: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
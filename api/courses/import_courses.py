@@ -0,0 +1,35 @@
+from typing import Dict, Any, List
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("courses.import_courses")
+
+async def import_courses(
+    location_id: str,
+    user_id: str,
+    products: List[Dict[str, Any]],
+    headers: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Import courses through public channels.
+
+    Args:
+        location_id: The ID of the location
+        user_id: The ID of the user
+        products: List of product objects to import
+        headers: Dictionary containing Authorization header
+
+    Returns:
+        Dictionary containing the response data
+
+    Raises:
+        Exception: If the API request fails or if required headers are missing
+    """
+    # Prepare request payload
+    payload = {
+        "locationId": location_id,
+        "userId": user_id,
+        "products": products
+    }
+
+    return await dispatch(ENDPOINT, headers, json=payload)
@@ -0,0 +1,21 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_custom_field",
+        "create_folder",
+        "delete",
+        "delete_field_folder",
+        "get_custom_by_id",
+        "get_fields_by_obj_key",
+        "update_field_by_id",
+        "update_field_folder_name",
+    ],
+    exports={
+        "create_custom_field_folder": "create_folder",
+        "delete_custom_field": "delete",
+        "get_custom_field_by_id": "get_custom_by_id",
+        "update_custom_field_by_id": "update_field_by_id",
+    },
+)
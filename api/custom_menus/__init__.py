@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "get_links",
+        "update",
+    ],
+    exports={
+        "create_custom_menu": "create",
+        "get_custom_menu": "get",
+        "get_custom_menu_links": "get_links",
+    },
+)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, List
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("custom_menus.create")
 
 async def create_custom_menu(
     headers: Dict[str, str],
@@ -19,16 +19,6 @@ async def create_custom_menu(
     allow_camera: bool = False,
     allow_microphone: bool = False
 ) -> Dict[str, Any]:
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION)
-    }
-
     data = {
         "title": title,
         "url": url,
@@ -46,7 +36,4 @@ async def create_custom_menu(
         "allowMicrophone": allow_microphone
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f"{API_BASE_URL}/custom-menus/", headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, json=data)
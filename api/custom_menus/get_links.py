@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("custom_menus.get_links")
 
 async def get_custom_menu_links(
     headers: Dict[str, str],
@@ -30,20 +29,6 @@ async def get_custom_menu_links(
     Raises:
         Exception: If the API request fails or if required headers are missing.
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    url = f"{API_BASE_URL}/custom-menus/"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "limit": limit,
         "locationId": location_id,
@@ -54,14 +39,4 @@ async def get_custom_menu_links(
 
     params = {k: v for k, v in params.items() if v is not None}
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=request_headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"API request failed with status {e.response.status_code}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("custom_menus.update")
 
 async def delete_custom_menu(headers: Dict[str, str], custom_menu_id: str) -> Dict[str, Any]:
     """
@@ -20,25 +19,4 @@ async def delete_custom_menu(headers: Dict[str, str], custom_menu_id: str) -> Di
         ValueError: If the Authorization header is missing or invalid.
         httpx.HTTPStatusError: If the API request fails.
     """
-    url = f"{API_BASE_URL}/custom-menus/{custom_menu_id}"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=request_headers)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"customMenuId": custom_menu_id})
@@ -0,0 +1,162 @@
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import logging
+import time
+import httpx
+
+from api.codec import get_codec, raw_requested
+from api.registry import Endpoint
+from api.transport import get_http_client
+
+AUTH_ERROR = "Missing or invalid Authorization header. Must be in format: 'Bearer {token}'"
+
+
+class GoHighLevelAPIError(httpx.HTTPStatusError):
+    """
+    Raised when the API answers with a 4xx or 5xx status.
+
+    Subclasses httpx.HTTPStatusError, so existing `except httpx.HTTPStatusError`
+    handlers keep working, and carries the endpoint name and the status code
+    so callers can decide whether to retry.
+    """
+
+    def __init__(self, endpoint: Endpoint, response: httpx.Response):
+        super().__init__(
+            f"{endpoint.name} failed with status {response.status_code}: {response.text}",
+            request=response.request,
+            response=response
+        )
+        self.endpoint = endpoint
+        self.status_code = response.status_code
+
+    @property
+    def retryable(self) -> bool:
+        return self.status_code == 429 or self.status_code >= 500
+
+
+def _authorization(headers: Optional[Mapping[str, str]], token: Optional[str]) -> str:
+    if token is not None:
+        return f"Bearer {token}"
+    authorization = headers.get("Authorization") if headers else None
+    if not authorization or not authorization.startswith("Bearer "):
+        raise ValueError(AUTH_ERROR)
+    return authorization
+
+
+def build_headers(
+    endpoint: Endpoint,
+    headers: Optional[Mapping[str, str]] = None,
+    token: Optional[str] = None,
+    version: Optional[str] = None
+) -> List[Tuple[str, str]]:
+    """
+    Build the request headers for an endpoint call, as `dispatch` sends them.
+
+    The Version header is `version`, else the caller's Version header, else
+    the endpoint's; pinned endpoints always send their own.
+
+    Raises:
+        ValueError: If the Authorization header is missing or malformed
+    """
+    if endpoint.pinned:
+        version = endpoint.version
+    return [
+        ("Authorization", _authorization(headers, token)),
+        ("Version", version or (headers.get("Version") if headers else None) or endpoint.version),
+        *endpoint.static_headers,
+    ]
+
+
+async def dispatch(
+    endpoint: Endpoint,
+    headers: Optional[Mapping[str, str]] = None,
+    *,
+    token: Optional[str] = None,
+    version: Optional[str] = None,
+    path: Optional[Mapping[str, Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    json: Any = None,
+    data: Optional[Mapping[str, Any]] = None,
+    files: Any = None,
+    extensions: Optional[Dict[str, Any]] = None,
+    stream: Optional[httpx.AsyncByteStream] = None,
+    raw: bool = False
+) -> Any:
+    """
+    Send a request for a registered endpoint and decode the response.
+
+    All endpoint functions are thin wrappers around this call. The caller's
+    `headers` mapping is only read, never modified.
+
+    Args:
+        endpoint: The endpoint to call
+        headers: Caller headers; Authorization is required unless `token` is given,
+            Version falls back to the endpoint's default
+        token: Bearer token, as an alternative to `headers`
+        version: Version header override
+        path: Values for the path template placeholders
+        params: Query parameters
+        json: JSON body
+        data: Form fields
+        files: Multipart files
+        extensions: Extra httpx request extensions (e.g. {"cache": False})
+        stream: Streamed request body, e.g. an `api.upload.MultipartStream`;
+            its `headers` are sent with it
+        raw: Return the response body as bytes without decoding it; also
+            enabled by `api.codec.raw_json()`
+
+    Returns:
+        The decoded response: parsed JSON, bytes or text depending on the endpoint
+
+    Raises:
+        ValueError: If the Authorization header is missing or malformed
+        GoHighLevelAPIError: If the API responds with an error status
+    """
+    request_headers = build_headers(endpoint, headers, token, version)
+    codec = get_codec()
+    content = None
+    if json is not None:
+        content = codec.dumps(json)
+        request_headers.append(("Content-Type", "application/json"))
+    if extensions:
+        extensions = {**endpoint.extensions, **extensions}
+    else:
+        extensions = endpoint.extensions
+
+    if stream is not None:
+        request_headers.extend(stream.headers)
+
+    client = get_http_client()
+    request = client.build_request(
+        endpoint.method,
+        endpoint.url(path),
+        headers=request_headers,
+        params=params,
+        content=stream if stream is not None else content,
+        data=data,
+        files=files,
+        timeout=endpoint.timeout,
+        extensions=extensions
+    )
+    if stream is not None:
+        # httpx wraps iterables; send the stream itself so retries can see
+        # whether it is replayable.
+        request.stream = stream
+    response = await client.send(request)
+
+    timing = response.extensions.get("timing")
+    started = time.perf_counter()
+    try:
+        if response.is_error:
+            logging.error(f"{endpoint.name} failed with status {response.status_code}: {response.text}")
+            raise GoHighLevelAPIError(endpoint, response)
+
+        if raw or endpoint.response == "bytes" or raw_requested():
+            return response.content
+        if endpoint.response == "text":
+            return response.text
+        if not response.content:
+            return {}
+        return codec.loads(response.content)
+    finally:
+        if timing is not None:
+            timing.finish(decode=time.perf_counter() - started)
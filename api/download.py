@@ -0,0 +1,179 @@
+from typing import Any, Awaitable, Callable, Iterable, List, Mapping, Optional, Tuple, Union
+import asyncio
+import logging
+import os
+import httpx
+
+from api.dispatch import GoHighLevelAPIError, build_headers
+from api.registry import Endpoint
+from api.transport import get_http_client
+
+# An async callable that receives each chunk, e.g. an aiofiles or S3 writer.
+Sink = Callable[[bytes], Awaitable[Any]]
+Destination = Union[str, "os.PathLike[str]", Sink]
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def download(
+    endpoint: Endpoint,
+    destination: Destination,
+    headers: Optional[Mapping[str, str]] = None,
+    *,
+    token: Optional[str] = None,
+    version: Optional[str] = None,
+    path: Optional[Mapping[str, Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    chunk_size: int = CHUNK_SIZE,
+    retries: int = 3
+) -> int:
+    """
+    Stream an endpoint's response body to a file or async sink in chunks,
+    so only `chunk_size` bytes are held in memory at a time.
+
+    A file is written to `<destination>.part` and renamed when complete. A
+    `.part` file left by an earlier run is resumed with a Range request, and
+    so is a download interrupted by a network error. Servers that ignore the
+    Range header are handled by skipping the bytes already written.
+
+    Args:
+        endpoint: The endpoint to call
+        destination: File path, or an async callable that receives each chunk
+        headers: Caller headers, as for `dispatch`
+        token: Bearer token, as an alternative to `headers`
+        version: Version header override
+        path: Values for the path template placeholders
+        params: Query parameters
+        chunk_size: Bytes per chunk
+        retries: Times to resume after a network error
+
+    Returns:
+        int: Size of the downloaded body in bytes
+
+    Raises:
+        ValueError: If the Authorization header is missing or malformed
+        GoHighLevelAPIError: If the API responds with an error status
+        httpx.TransportError: If the download keeps failing after `retries` resumes
+    """
+    request = (
+        endpoint,
+        endpoint.url(path),
+        # Ranges refer to the encoded body, so ask for it unencoded.
+        build_headers(endpoint, headers, token, version) + [("Accept-Encoding", "identity")],
+        params,
+    )
+    if callable(destination):
+        return await _stream(request, destination, 0, chunk_size, retries)
+
+    target = os.fspath(destination)
+    partial = target + ".part"
+    offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+    with open(partial, "ab") as f:
+        async def write(chunk: bytes) -> None:
+            f.write(chunk)
+
+        size = await _stream(request, write, offset, chunk_size, retries)
+    os.replace(partial, target)
+    return size
+
+
+async def _stream(
+    request: Tuple[Endpoint, str, List[Tuple[str, str]], Optional[Mapping[str, Any]]],
+    write: Sink,
+    written: int,
+    chunk_size: int,
+    retries: int
+) -> int:
+    endpoint, url, headers, params = request
+    # Never buffer the body for request coalescing or the response cache.
+    extensions = {**endpoint.extensions, "singleflight": False, "cache": False}
+    client = get_http_client()
+    attempt = 0
+
+    while True:
+        range_headers = headers + [("Range", f"bytes={written}-")] if written else headers
+        try:
+            async with client.stream(
+                endpoint.method,
+                url,
+                headers=range_headers,
+                params=params,
+                timeout=endpoint.timeout,
+                extensions=extensions
+            ) as response:
+                timing = response.extensions.get("timing")
+                try:
+                    if response.status_code == 416 and written:
+                        # Nothing left past what we already have.
+                        return written
+                    if response.is_error:
+                        await response.aread()
+                        logging.error(f"{endpoint.name} failed with status {response.status_code}: {response.text}")
+                        raise GoHighLevelAPIError(endpoint, response)
+
+                    skip = 0 if response.status_code == 206 else written
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        if skip:
+                            if len(chunk) <= skip:
+                                skip -= len(chunk)
+                                continue
+                            chunk, skip = chunk[skip:], 0
+                        await write(chunk)
+                        written += len(chunk)
+                    return written
+                finally:
+                    if timing is not None:
+                        timing.finish()
+        except httpx.TransportError as e:
+            attempt += 1
+            if attempt > retries:
+                raise
+            logging.warning(f"{endpoint.name} download interrupted after {written} bytes ({e!r}), resuming")
+            await asyncio.sleep(min(0.5 * 2 ** attempt, 10.0))
+
+
+async def download_all(
+    endpoint: Endpoint,
+    items: Iterable[Tuple[Mapping[str, Any], Destination]],
+    headers: Optional[Mapping[str, str]] = None,
+    *,
+    token: Optional[str] = None,
+    concurrency: int = 8,
+    skip_existing: bool = True,
+    **kwargs
+) -> List[Union[int, Exception]]:
+    """
+    Download many bodies of one endpoint with at most `concurrency` in flight.
+
+    One failed download doesn't stop the others: its slot in the result
+    holds the exception instead of the size.
+
+    Args:
+        endpoint: The endpoint to call
+        items: (path params, destination) pairs
+        headers: Caller headers, as for `dispatch`
+        token: Bearer token, as an alternative to `headers`
+        concurrency: Maximum simultaneous downloads
+        skip_existing: Don't download to file paths that already exist
+        **kwargs: Passed on to `download`
+
+    Returns:
+        List[Union[int, Exception]]: Size or exception per item, in order
+    """
+    items = list(items)
+    results: List[Union[int, Exception]] = [0] * len(items)
+    queue = iter(enumerate(items))
+
+    async def worker() -> None:
+        for index, (path, destination) in queue:
+            if skip_existing and not callable(destination) and os.path.exists(destination):
+                results[index] = os.path.getsize(destination)
+                continue
+            try:
+                results[index] = await download(endpoint, destination, headers, token=token, path=path, **kwargs)
+            except Exception as e:
+                logging.error(f"{endpoint.name} download to {destination!r} failed: {e!r}")
+                results[index] = e
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(items)))))
+    return results
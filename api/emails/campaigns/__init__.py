@@ -0,0 +1,11 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get",
+    ],
+    exports={
+        "get_email_campaigns": "get",
+    },
+)
@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional, List
-import httpx
+from typing import Dict, Any, Optional
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("emails.campaigns.get")
 
 async def get_email_campaigns(
     location_id: str,
@@ -21,7 +21,7 @@ async def get_email_campaigns(
 ) -> Dict[str, Any]:
     """
     Get email campaigns from the Go High Level API.
-    
+
     Args:
         location_id: Location ID to fetch campaigns from
         headers: Dictionary containing Authorization and Version headers
@@ -35,28 +35,13 @@ async def get_email_campaigns(
         parent_id: Filter campaigns by parent folder ID
         show_stats: When true, returns campaign statistics
         status: Filter by schedule status
-        
+
     Returns:
         Dictionary containing the email campaigns data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     # Prepare query parameters
     params = {"locationId": location_id}
     if archived is not None:
@@ -79,26 +64,7 @@ async def get_email_campaigns(
         params["showStats"] = show_stats
     if status:
         params["status"] = status
-    
+
     logging.info(f"Making request to get email campaigns for location: {location_id}")
-    
-    try:
-        # Make the API request to get email campaigns
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/emails/schedule",
-                headers=request_headers,
-                params=params
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error getting email campaigns: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
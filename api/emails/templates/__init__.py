@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "fetch",
+        "update",
+    ],
+    exports={
+        "create_email_template": "create",
+        "delete_email_template": "delete",
+        "fetch_email_templates": "fetch",
+        "update_email_template": "update",
+    },
+)
@@ -1,9 +1,9 @@
 from typing import Dict, Any, Optional
-import httpx
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("emails.templates.create")
 
 async def create_email_template(
     location_id: str,
@@ -22,7 +22,7 @@ async def create_email_template(
 ) -> Dict[str, Any]:
     """
     Create a new email template in Go High Level.
-    
+
     Args:
         location_id: The ID of the location
         template_type: Template type (html, folder, import, builder, blank)
@@ -37,29 +37,13 @@ async def create_email_template(
         import_url: URL to import template from
         template_source: Source of the template
         is_plain_text: Whether the template is plain text
-        
+
     Returns:
         Dictionary containing the created template data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
     # Prepare request payload
     template_data = {
         "locationId": location_id,
@@ -69,7 +53,7 @@ async def create_email_template(
         "templateDataUrl": template_data_url,
         "isPlainText": is_plain_text
     }
-    
+
     # Add optional fields if provided
     if title:
         template_data["title"] = title
@@ -83,26 +67,7 @@ async def create_email_template(
         template_data["importURL"] = import_url
     if template_source:
         template_data["templateSource"] = template_source
-    
+
     logging.info("Creating email template")
-    
-    try:
-        # Make the API request to create email template
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                f"{API_BASE_URL}/emails/builder",
-                headers=request_headers,
-                json=template_data
-            )
-            
-        # Handle the API response
-        if response.status_code != 201:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-        
-        return response.json()
-    
-    except Exception as e:
-        logging.error(f"Error creating email template: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=template_data)
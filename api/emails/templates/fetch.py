@@ -1,9 +1,9 @@
 from typing import Dict, Any, Optional
-import httpx
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("emails.templates.fetch")
 
 async def fetch_email_templates(
     location_id: str,
@@ -21,7 +21,7 @@ async def fetch_email_templates(
 ) -> Dict[str, Any]:
     """
     Fetch email templates from Go High Level.
-    
+
     Args:
         location_id: The ID of the location
         headers: Dictionary containing Authorization and Version headers
@@ -35,28 +35,13 @@ async def fetch_email_templates(
         search: Search term for templates
         sort_by_date: Sort order for templates by date
         templates_only: Return only templates, excluding folders
-        
+
     Returns:
         Dictionary containing the email templates data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     # Prepare query parameters
     params = {
         "locationId": location_id,
@@ -67,7 +52,7 @@ async def fetch_email_templates(
         "sortByDate": sort_by_date,
         "templatesOnly": str(templates_only).lower()
     }
-    
+
     # Add optional parameters if provided
     if name:
         params["name"] = name
@@ -77,26 +62,7 @@ async def fetch_email_templates(
         params["parentId"] = parent_id
     if search:
         params["search"] = search
-    
+
     logging.info(f"Fetching email templates for location: {location_id}")
-    
-    try:
-        # Make the API request to fetch email templates
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/emails/builder",
-                headers=request_headers,
-                params=params
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error fetching email templates: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -0,0 +1,1177 @@
+"""
+Every endpoint wrapped by this package, keyed by its dotted module name.
+
+The endpoint functions under `api/` look their entry up here and hand it to
+`api.dispatch.dispatch`, so the method, path template, default Version header,
+accepted parameters and pagination style of each call live in one place.
+"""
+from api.registry import CURSOR, OFFSET, PAGE, SKIP, Endpoint
+
+ENDPOINTS = {endpoint.name: endpoint for endpoint in (
+    # appointments
+    Endpoint("appointments.get_appointments", "GET", "/contacts/{contactId}/appointments"),
+
+    # associations
+    Endpoint(
+        "associations.create_assoc", "POST", "/associations/",
+        body=(
+            "locationId", "key", "firstObjectLabel", "firstObjectKey", "secondObjectLabel",
+            "secondObjectKey",
+        ),
+    ),
+    Endpoint("associations.delete", "DELETE", "/associations/{associationId}"),
+    Endpoint(
+        "associations.get_all_assoc_for_sub_acc", "GET", "/associations/",
+        query=("locationId", "limit", "skip"),
+        pagination=SKIP,
+    ),
+    Endpoint("associations.get_assoc_by_id", "GET", "/associations/{associationId}"),
+    Endpoint(
+        "associations.get_assoc_key_by_name", "GET", "/associations/key/{keyName}",
+        query=("locationId",),
+    ),
+    Endpoint(
+        "associations.get_associan_object_keys", "GET", "/associations/objectKey/{objectKey}",
+        pinned=True,
+        query=("locationId",),
+    ),
+    Endpoint(
+        "associations.relations.create", "POST", "/associations/relations",
+        body=("locationId", "associationId", "firstRecordId", "secondRecordId"),
+    ),
+    Endpoint(
+        "associations.relations.delete", "DELETE", "/associations/relations/{relationId}",
+        query=("locationId",),
+    ),
+    Endpoint(
+        "associations.relations.get_all", "GET", "/associations/relations/{recordId}",
+        query=("locationId", "limit", "skip", "associationIds"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "associations.update_assoc_by_id", "PUT", "/associations/{associationId}",
+        body=("firstObjectLabel", "secondObjectLabel"),
+    ),
+
+    # blogs
+    Endpoint(
+        "blogs.check_slug", "GET", "/blogs/posts/url-slug-exists",
+        query=("locationId", "urlSlug", "postId"),
+    ),
+    Endpoint(
+        "blogs.create_blog", "POST", "/blogs/posts",
+        body=(
+            "title", "locationId", "blogId", "imageUrl", "description", "rawHTML", "status",
+            "imageAltText", "categories", "tags", "author", "urlSlug", "canonicalLink",
+            "publishedAt",
+        ),
+    ),
+    Endpoint(
+        "blogs.get_authors", "GET", "/blogs/authors",
+        query=("locationId", "limit", "offset"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "blogs.get_blogs_by_location_id", "GET", "/blogs/site/all",
+        query=("locationId", "limit", "skip", "searchTerm"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "blogs.get_categories", "GET", "/blogs/categories",
+        query=("locationId", "limit", "offset"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "blogs.get_posts_by_id", "GET", "/blogs/posts/all",
+        query=("blogId", "locationId", "limit", "offset", "searchTerm", "status"),
+        pagination=OFFSET,
+    ),
+    Endpoint("blogs.update", "PUT", "/blogs/posts/{postId}"),
+
+    # business
+    Endpoint("business.create", "POST", "/contacts/{contactId}/appointments"),
+    Endpoint("business.delete", "DELETE", "/businesses/{businessId}"),
+    Endpoint("business.get", "GET", "/businesses/{businessId}"),
+    Endpoint("business.get_by_location", "GET", "/businesses/", query=("locationId",)),
+    Endpoint("business.update", "PUT", "/businesses/{businessId}"),
+
+    # calendar
+    Endpoint("calendar.create_calendar", "POST", "/calendars/", version="2021-04-15"),
+    Endpoint("calendar.createa_block", "POST", "/calendars/events/block-slots", version="2021-04-15"),
+    Endpoint("calendar.delete_calendar", "DELETE", "/calendars/{calendarId}", version="2021-04-15"),
+    Endpoint("calendar.events.create_event", "POST", "/calendars/events/appointments", version="2021-04-15"),
+    Endpoint("calendar.events.delete", "DELETE", "/calendars/events/{eventId}", version="2021-04-15"),
+    Endpoint(
+        "calendar.events.get_appointment", "GET", "/calendars/events/appointments/{eventId}",
+        version="2021-04-15",
+    ),
+    Endpoint("calendar.events.get_blocked_slots", "GET", "/calendars/blocked-slots", version="2021-04-15"),
+    Endpoint("calendar.events.get_calendar_events", "GET", "/calendars/events", version="2021-04-15"),
+    Endpoint(
+        "calendar.events.update", "PUT", "/calendars/events/appointments/{eventId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.events.update_block", "PUT", "/calendars/events/block-slots/{eventId}",
+        version="2021-04-15",
+    ),
+    Endpoint("calendar.get_calendar", "GET", "/calendars/{calendarId}", version="2021-04-15"),
+    Endpoint(
+        "calendar.get_calendars", "GET", "/calendars/",
+        version="2021-04-15",
+        query=("locationId", "groupId", "showDrafted"),
+    ),
+    Endpoint(
+        "calendar.get_free_slots", "GET", "/calendars/{calendarId}/free-slots",
+        version="2021-04-15",
+        query=("startDate", "endDate", "enableLookBusy", "timezone", "userId", "userIds"),
+    ),
+    Endpoint("calendar.groups.create", "POST", "/calendars/groups", version="2021-04-15"),
+    Endpoint("calendar.groups.delete", "DELETE", "/calendars/groups/{groupId}", version="2021-04-15"),
+    Endpoint(
+        "calendar.groups.disable", "PUT", "/calendars/groups/{groupId}/status",
+        version="2021-04-15",
+        body=("isActive",),
+    ),
+    Endpoint("calendar.groups.get", "GET", "/calendars/groups", version="2021-04-15", query=("locationId",)),
+    Endpoint("calendar.groups.update", "PUT", "/calendars/groups/{groupId}", version="2021-04-15"),
+    Endpoint(
+        "calendar.groups.validate", "POST", "/calendars/groups/validate-slug",
+        version="2021-04-15",
+        body=("locationId", "slug"),
+        idempotent=True,
+    ),
+    Endpoint(
+        "calendar.notes.create", "POST", "/calendars/appointments/{appointmentId}/notes",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.notes.delete", "DELETE", "/calendars/appointments/{appointmentId}/notes/{noteId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.notes.get", "GET", "/calendars/appointments/{appointmentId}/notes",
+        version="2021-04-15",
+        query=("limit", "offset"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "calendar.notes.update", "PUT", "/calendars/appointments/{appointmentId}/notes/{noteId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.notifications.create", "POST", "/calendars/{calendarId}/notifications",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.notifications.delete", "DELETE", "/calendars/{calendarId}/notifications/{notificationId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.notifications.get", "GET", "/calendars/{calendarId}/notifications/{notificationId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.notifications.get_notifcations", "GET", "/calendars/{calendarId}/notifications",
+        version="2021-04-15",
+        query=("altId", "altType", "deleted", "isActive", "limit", "skip"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "calendar.notifications.update", "PUT", "/calendars/{calendarId}/notifications/{notificationId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.resources.create", "POST", "/calendars/resources/{resourceType}",
+        version="2021-04-15",
+        body=(
+            "locationId", "name", "description", "quantity", "outOfService", "capacity",
+            "calendarIds",
+        ),
+    ),
+    Endpoint(
+        "calendar.resources.delete", "DELETE", "/calendars/resources/{resourceType}/{resourceId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.resources.get", "GET", "/calendars/resources/{resourceType}/{resourceId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "calendar.resources.list", "GET", "/calendars/resources/{resourceType}",
+        version="2021-04-15",
+        query=("locationId", "limit", "skip"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "calendar.resources.update", "PUT", "/calendars/resources/{resourceType}/{resourceId}",
+        version="2021-04-15",
+        body=(
+            "locationId", "name", "isActive", "description", "quantity", "outOfService", "capacity",
+            "calendarIds",
+        ),
+    ),
+    Endpoint("calendar.update", "PUT", "/calendars/{calendarId}", version="2021-04-15"),
+
+    # campaigns
+    Endpoint("campaigns.get", "GET", "/campaigns/", query=("locationId", "status")),
+
+    # companies
+    Endpoint("companies.get", "GET", "/companies/{companyId}", pinned=True),
+
+    # contacts
+    Endpoint("contacts.appointments.get_all", "GET", "/contacts/{contactId}/appointments"),
+    Endpoint(
+        "contacts.bulk.add_remove", "POST", "/contacts/bulk/business",
+        body=("locationId", "ids", "businessId"),
+    ),
+    Endpoint(
+        "contacts.bulk.update", "POST", "/contacts/bulk/tags/update/{operationType}",
+        body=("contacts", "tags", "locationId", "removeAllTags"),
+    ),
+    Endpoint("contacts.campaigns.add", "POST", "/contacts/{contactId}/campaigns/{campaignId}"),
+    Endpoint("contacts.campaigns.remove_all", "DELETE", "/contacts/{contactId}/campaigns/removeAll"),
+    Endpoint(
+        "contacts.campaigns.remove_from_campaign", "DELETE", "/contacts/{contactId}/campaigns/{campaignId}",
+    ),
+    Endpoint("contacts.create", "POST", "/contacts/"),
+    Endpoint("contacts.delete", "DELETE", "/contacts/{contactId}"),
+    Endpoint("contacts.followers.add", "POST", "/contacts/{contactId}/followers", body=("followers",)),
+    Endpoint("contacts.followers.remove", "DELETE", "/contacts/{contactId}/followers", body=("followers",)),
+    Endpoint("contacts.get", "GET", "/contacts/{contactId}"),
+    Endpoint(
+        "contacts.get_contacts_by_id", "GET", "/contacts/business/{businessId}",
+        query=("locationId", "limit", "skip", "query"),
+        pagination=SKIP,
+    ),
+    Endpoint("contacts.notes.crate", "POST", "/contacts/{contactId}/notes", body=("body", "userId")),
+    Endpoint("contacts.notes.delete", "DELETE", "/contacts/{contactId}/notes/{noteId}"),
+    Endpoint("contacts.notes.get", "GET", "/contacts/{contactId}/notes/{noteId}"),
+    Endpoint("contacts.notes.get_all", "GET", "/contacts/{contactId}/notes"),
+    Endpoint("contacts.notes.update", "PUT", "/contacts/{contactId}/notes/{noteId}"),
+    Endpoint(
+        "contacts.search.get_duplicates", "GET", "/contacts/search/duplicate",
+        query=("locationId", "email", "number"),
+    ),
+    Endpoint(
+        "contacts.search.search", "POST", "/contacts/search",
+        body=("limit", "offset", "filters", "locationId"),
+        pagination=OFFSET,
+        idempotent=True,
+    ),
+    Endpoint("contacts.tags.add", "POST", "/contacts/{contactId}/tags", body=("tags",)),
+    Endpoint("contacts.tags.remove", "DELETE", "/contacts/{contactId}/tags", body=("tags",)),
+    Endpoint(
+        "contacts.tasks.create", "POST", "/contacts/{contactId}/tasks",
+        body=("title", "dueDate", "completed", "body", "assignedTo"),
+    ),
+    Endpoint("contacts.tasks.delete", "DELETE", "/contacts/{contactId}/tasks/{taskId}"),
+    Endpoint("contacts.tasks.get", "GET", "/contacts/{contactId}/tasks/{taskId}"),
+    Endpoint("contacts.tasks.get_all", "GET", "/contacts/{contactId}/tasks"),
+    Endpoint(
+        "contacts.tasks.update", "PUT", "/contacts/{contactId}/tasks/{taskId}",
+        body=("title", "body", "dueDate", "completed", "assignedTo"),
+    ),
+    Endpoint(
+        "contacts.tasks.update_to_complete", "PUT", "/contacts/{contactId}/tasks/{taskId}/completed",
+        body=("completed",),
+    ),
+    Endpoint("contacts.update", "PUT", "/contacts/{contactId}"),
+    Endpoint(
+        "contacts.upsert", "POST", "/contacts/upsert",
+        body=(
+            "locationId", "firstName", "lastName", "name", "email", "gender", "phone", "address1",
+            "city", "state", "postalCode", "website", "timezone", "dnd", "dndSettings",
+            "inboundDndSettings", "tags", "customFields", "source", "country", "companyName",
+            "assignedTo",
+        ),
+    ),
+    Endpoint(
+        "contacts.workflow.add", "POST", "/contacts/{contactId}/workflow/{workflowId}",
+        body=("eventStartTime",),
+    ),
+    Endpoint(
+        "contacts.workflow.delete", "DELETE", "/contacts/{contactId}/workflow/{workflowId}",
+        body=("eventStartTime",),
+    ),
+
+    # conversations
+    Endpoint(
+        "conversations.create", "POST", "/conversations/",
+        version="2021-04-15",
+        body=("locationId", "contactId"),
+    ),
+    Endpoint("conversations.delete", "DELETE", "/conversations/{conversationId}", version="2021-04-15"),
+    Endpoint(
+        "conversations.email.cancel", "DELETE", "/conversations/messages/email/{emailMessageId}/schedule",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "conversations.email.get", "GET", "/conversations/messages/email/{emailId}",
+        version="2021-04-15",
+    ),
+    Endpoint("conversations.get", "GET", "/conversations/{conversationId}", version="2021-04-15"),
+    Endpoint(
+        "conversations.messages.add_external_call", "POST", "/conversations/messages/outbound",
+        version="2021-04-15",
+        body=(
+            "type", "conversationId", "conversationProviderId", "call", "attachments", "altId",
+            "date",
+        ),
+    ),
+    Endpoint(
+        "conversations.messages.add_inbound_message", "POST", "/conversations/messages/inbound",
+        version="2021-04-15",
+        body=(
+            "type", "conversationId", "conversationProviderId", "direction", "message",
+            "attachments", "html", "subject", "emailFrom", "emailTo", "emailCc", "emailBcc",
+            "emailMessageId", "altId", "date", "call", "to", "from", "status",
+        ),
+    ),
+    Endpoint(
+        "conversations.messages.cancel_scheduled_message", "DELETE", "/conversations/messages/{messageId}/schedule",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "conversations.messages.download_transcription", "GET", "/conversations/locations/{locationId}/messages/{messageId}/transcription/download",
+        version="2021-04-15",
+        response="bytes",
+    ),
+    Endpoint(
+        "conversations.messages.get_messages_by_conversation_id", "GET", "/conversations/{conversationId}/messages",
+        version="2021-04-15",
+        query=("lastMessageId", "limit", "type"),
+        pagination=CURSOR,
+        cursor="lastMessageId",
+    ),
+    Endpoint(
+        "conversations.messages.get_messages_by_id", "GET", "/conversations/messages/{messageId}",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "conversations.messages.get_recording", "GET", "/conversations/messages/{messageId}/locations/{locationId}/recording",
+        version="2021-04-15",
+        response="bytes",
+    ),
+    Endpoint(
+        "conversations.messages.get_transcription", "GET", "/conversations/locations/{locationId}/messages/{messageId}/transcription",
+        version="2021-04-15",
+    ),
+    Endpoint(
+        "conversations.messages.send_recording_by_i", "POST", "/conversations/messages",
+        version="2021-04-15",
+        body=(
+            "type", "contactId", "message", "html", "subject", "appointmentId", "attachments",
+            "emailFrom", "emailTo", "emailCc", "emailBcc", "emailReplyMode", "replyMessageId",
+            "templateId", "threadId", "scheduledTimestamp", "conversationProviderId", "fromNumber",
+            "toNumber",
+        ),
+    ),
+    Endpoint(
+        "conversations.messages.update_status", "PUT", "/conversations/messages/{messageId}/status",
+        version="2021-04-15",
+        body=("status", "error", "emailMessageId", "recipients"),
+    ),
+    Endpoint(
+        "conversations.messages.upload_files", "POST", "/conversations/messages/upload",
+        version="2021-04-15",
+        timeout=60,
+    ),
+    Endpoint(
+        "conversations.provider.provider", "POST", "/conversations/providers/live-chat/typing",
+        version="2021-04-15",
+        body=("locationId", "isTyping", "visitorId", "conversationId"),
+    ),
+    Endpoint(
+        "conversations.search.search", "GET", "/conversations/search",
+        version="2021-04-15",
+        query=(
+            "locationId", "assignedTo", "contactId", "followers", "id", "lastMessageAction",
+            "lastMessageDirection", "lastMessageType", "limit", "mentions", "query", "scoreProfile",
+            "scoreProfileMax", "scoreProfileMin", "sort", "sortBy", "sortScoreProfile",
+            "startAfterDate", "status",
+        ),
+        pagination=CURSOR,
+        cursor="startAfterDate",
+    ),
+    Endpoint("conversations.update", "PUT", "/conversations/{conversationId}", version="2021-04-15"),
+
+    # courses
+    Endpoint(
+        "courses.import_courses", "POST", "/courses/courses-exporter/public/import",
+        body=("locationId", "userId", "products"),
+    ),
+
+    # custom_fieldsv2
+    Endpoint("custom_fieldsv2.create_custom_field", "POST", "/custom-fields/"),
+    Endpoint("custom_fieldsv2.create_folder", "POST", "/custom-fields/folder"),
+    Endpoint("custom_fieldsv2.delete", "DELETE", "/custom-fields/{fieldId}"),
+    Endpoint(
+        "custom_fieldsv2.delete_field_folder", "DELETE", "/custom-fields/folder/{folderId}",
+        query=("locationId",),
+    ),
+    Endpoint("custom_fieldsv2.get_custom_by_id", "GET", "/custom-fields/{fieldId}"),
+    Endpoint(
+        "custom_fieldsv2.get_fields_by_obj_key", "GET", "/custom-fields/object-key/{objectKey}",
+        query=("locationId",),
+    ),
+    Endpoint("custom_fieldsv2.update_field_by_id", "PUT", "/custom-fields/{fieldId}"),
+    Endpoint("custom_fieldsv2.update_field_folder_name", "PUT", "/custom-fields/folder/{folderId}"),
+
+    # custom_menus
+    Endpoint(
+        "custom_menus.create", "POST", "/custom-menus/",
+        body=(
+            "title", "url", "icon", "showOnCompany", "showOnLocation", "showToAllLocations",
+            "openMode", "locations", "userRole", "allowCamera", "allowMicrophone",
+        ),
+    ),
+    Endpoint("custom_menus.delete", "DELETE", "/custom-menus/{customMenuId}"),
+    Endpoint("custom_menus.get", "GET", "/custom-menus/{customMenuId}"),
+    Endpoint(
+        "custom_menus.get_links", "GET", "/custom-menus/",
+        query=("limit", "locationId", "query", "showOnCompany", "skip"),
+        pagination=SKIP,
+    ),
+    Endpoint("custom_menus.update", "DELETE", "/custom-menus/{customMenuId}"),
+
+    # emails
+    Endpoint(
+        "emails.campaigns.get", "GET", "/emails/schedule",
+        query=(
+            "locationId", "archived", "campaignsOnly", "emailStatus", "limit", "limitedFields",
+            "name", "offset", "parentId", "showStats", "status",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "emails.templates.create", "POST", "/emails/builder",
+        body=(
+            "locationId", "type", "importProvider", "builderVersion", "templateDataUrl",
+            "isPlainText", "title", "updatedBy", "name", "parentId", "importURL", "templateSource",
+        ),
+    ),
+    Endpoint("emails.templates.delete", "DELETE", "/emails/builder/{locationId}/{templateId}"),
+    Endpoint(
+        "emails.templates.fetch", "GET", "/emails/builder",
+        query=(
+            "locationId", "archived", "builderVersion", "limit", "offset", "sortByDate",
+            "templatesOnly", "name", "originId", "parentId", "search",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "emails.templates.update", "POST", "/emails/builder/data",
+        body=(
+            "locationId", "templateId", "updatedBy", "dnd", "html", "editorType", "isPlainText",
+            "previewText",
+        ),
+    ),
+
+    # forms
+    Endpoint("forms.get", "GET", "/forms/", query=("locationId", "limit", "skip", "type"), pagination=SKIP),
+    Endpoint(
+        "forms.get_submission", "GET", "/forms/submissions",
+        query=("locationId", "formId", "startAt", "endAt", "q", "limit", "page"),
+        pagination=PAGE,
+    ),
+    Endpoint(
+        "forms.upload_files_custom_fields", "POST", "/forms/upload-custom-files",
+        query=("contactId", "locationId"),
+        timeout=60,
+    ),
+
+    # funnels
+    Endpoint(
+        "funnels.funnel.fetch", "GET", "/funnels/funnel/list",
+        query=("locationId", "category", "limit", "name", "offset", "parentId", "type"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "funnels.funnel.fetch_count", "GET", "/funnels/page/count",
+        query=("funnelId", "locationId", "name"),
+    ),
+    Endpoint(
+        "funnels.funnel.fetch_pages", "GET", "/funnels/page",
+        query=("funnelId", "locationId", "limit", "offset", "name"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "funnels.redirect.create", "POST", "/funnels/lookup/redirect",
+        body=("locationId", "domain", "path", "target", "action"),
+    ),
+    Endpoint(
+        "funnels.redirect.delete", "DELETE", "/funnels/lookup/redirect/{redirectId}",
+        query=("locationId",),
+    ),
+    Endpoint(
+        "funnels.redirect.fetch", "GET", "/funnels/lookup/redirect/list",
+        query=("locationId", "limit", "offset", "search"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "funnels.redirect.update", "PATCH", "/funnels/lookup/redirect/{redirectId}",
+        pinned=True,
+        body=("target", "action", "locationId"),
+    ),
+
+    # invoices
+    Endpoint(
+        "invoices.create", "POST", "/invoices/",
+        body=(
+            "altId", "altType", "name", "currency", "items", "contactDetails", "issueDate", "title",
+            "liveMode", "businessDetails", "discount", "termsNotes", "invoiceNumber", "dueDate",
+            "sentTo", "automaticTaxesEnabled", "paymentSchedule", "lateFeesConfiguration",
+            "tipsConfiguration", "invoiceNumberPrefix", "paymentMethods", "attachments",
+        ),
+    ),
+    Endpoint("invoices.delete", "DELETE", "/invoices/{invoiceId}", query=("altId", "altType")),
+    Endpoint(
+        "invoices.estimate.create_invoice_from_estimate", "POST", "/invoices/estimate/{estimateId}/invoice",
+        body=("altId", "altType", "markAsInvoiced", "version"),
+    ),
+    Endpoint("invoices.estimate.create_new", "POST", "/invoices/estimate"),
+    Endpoint(
+        "invoices.estimate.delete", "DELETE", "/invoices/estimate/{estimateId}",
+        query=("altId", "altType"),
+    ),
+    Endpoint(
+        "invoices.estimate.generate_estimate_number", "GET", "/invoices/estimate/number/generate",
+        pinned=True,
+        query=("altId", "altType"),
+    ),
+    Endpoint(
+        "invoices.estimate.list_templates", "GET", "/invoices/estimate/list",
+        query=(
+            "altId", "altType", "limit", "offset", "contactId", "endAt", "search", "startAt",
+            "status",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "invoices.estimate.send", "POST", "/invoices/estimate/{estimateId}/send",
+        body=("altId", "altType", "action", "liveMode", "userId", "sentFrom", "estimateName"),
+    ),
+    Endpoint(
+        "invoices.estimate.templates.create_estimate_template", "POST", "/invoices/estimate/template",
+        body=(
+            "altId", "altType", "name", "businessDetails", "currency", "items", "liveMode",
+            "discount", "termsNotes", "title", "automaticTaxesEnabled", "meta",
+            "sendEstimateDetails", "estimateNumberPrefix", "attachments",
+        ),
+    ),
+    Endpoint(
+        "invoices.estimate.templates.delete_estimate_template", "DELETE", "/invoices/estimate/template/{templateId}",
+        query=("altId", "altType"),
+    ),
+    Endpoint(
+        "invoices.estimate.templates.list_estimate_templates", "GET", "/invoices/estimate/template",
+        query=("altId", "altType", "limit", "offset", "search"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "invoices.estimate.templates.preview_estimate_template", "GET", "/invoices/estimate/template/preview",
+        query=("altId", "altType", "templateId"),
+    ),
+    Endpoint(
+        "invoices.estimate.templates.update_estimate_template", "PUT", "/invoices/estimate/template/{templateId}",
+    ),
+    Endpoint("invoices.estimate.update", "PUT", "/invoices/estimate/{estimateId}"),
+    Endpoint(
+        "invoices.estimate.update_estimate_last_visit", "PATCH", "/invoices/estimate/stats/last-visited-at",
+        body=("estimateId",),
+    ),
+    Endpoint(
+        "invoices.generate_number", "GET", "/invoices/generate-invoice-number",
+        query=("altId", "altType"),
+    ),
+    Endpoint("invoices.get", "GET", "/invoices/{invoiceId}", query=("altId", "altType")),
+    Endpoint(
+        "invoices.list", "GET", "/invoices/",
+        query=(
+            "altId", "altType", "limit", "offset", "contactId", "endAt", "paymentMode", "search",
+            "sortField", "sortOrder", "startAt", "status",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "invoices.record_manual_payment", "POST", "/invoices/{invoiceId}/send",
+        body=("altId", "altType", "userId", "action", "liveMode", "sentFrom", "autoPayment"),
+    ),
+    Endpoint(
+        "invoices.schedule.cancel", "POST", "/invoices/schedule/{scheduleId}/auto-payment",
+        body=("altId", "altType", "id", "autoPayment"),
+    ),
+    Endpoint(
+        "invoices.schedule.create", "POST", "/invoices/schedule",
+        body=(
+            "altId", "altType", "name", "contactDetails", "schedule", "liveMode", "businessDetails",
+            "currency", "items", "automaticTaxesEnabled", "discount", "termsNotes", "title",
+            "tipsConfiguration", "lateFeesConfiguration", "invoiceNumberPrefix", "paymentMethods",
+            "attachments",
+        ),
+    ),
+    Endpoint(
+        "invoices.schedule.delete", "DELETE", "/invoices/schedule/{scheduleId}",
+        query=("altId", "altType"),
+    ),
+    Endpoint("invoices.schedule.get", "GET", "/invoices/schedule/{scheduleId}", query=("altId", "altType")),
+    Endpoint(
+        "invoices.schedule.list", "POST", "/invoices/schedule",
+        body=(
+            "altId", "altType", "name", "contactDetails", "schedule", "liveMode", "businessDetails",
+            "currency", "items", "automaticTaxesEnabled", "discount", "termsNotes", "title",
+            "tipsConfiguration", "lateFeesConfiguration", "invoiceNumberPrefix", "paymentMethods",
+            "attachments",
+        ),
+    ),
+    Endpoint(
+        "invoices.schedule.manage_auto_payment", "POST", "/invoices/schedule/{scheduleId}/auto-payment",
+        body=("altId", "altType", "id", "autoPayment"),
+    ),
+    Endpoint(
+        "invoices.schedule.schedule_and_schedule", "POST", "/invoices/schedule/{scheduleId}/schedule",
+        body=("altId", "altType", "liveMode", "autoPayment"),
+    ),
+    Endpoint(
+        "invoices.schedule.update", "PUT", "/invoices/schedule/{scheduleId}",
+        body=(
+            "altId", "altType", "name", "contactDetails", "schedule", "liveMode", "businessDetails",
+            "currency", "items", "discount", "termsNotes", "title", "attachments",
+        ),
+    ),
+    Endpoint(
+        "invoices.schedule.update_scheduled", "POST", "/invoices/schedule/{scheduleId}/updateAndSchedule",
+    ),
+    Endpoint(
+        "invoices.send", "POST", "/invoices/{invoiceId}/send",
+        body=("altId", "altType", "userId", "action", "liveMode", "sentFrom", "autoPayment"),
+    ),
+    Endpoint(
+        "invoices.template.create", "POST", "/invoices/template",
+        body=(
+            "altId", "altType", "internal", "name", "businessDetails", "currency", "items",
+            "automaticTaxesEnabled", "discount", "termsNotes", "title", "tipsConfiguration",
+            "lateFeesConfiguration", "invoiceNumberPrefix", "paymentMethods", "attachments",
+        ),
+    ),
+    Endpoint(
+        "invoices.template.delete", "DELETE", "/invoices/template/{templateId}",
+        query=("altId", "altType"),
+    ),
+    Endpoint(
+        "invoices.template.get", "GET", "/invoices/template",
+        query=(
+            "altId", "altType", "limit", "offset", "endAt", "paymentMode", "search", "startAt",
+            "status",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "invoices.template.list", "GET", "/invoices/template",
+        query=(
+            "altId", "altType", "limit", "offset", "endAt", "paymentMode", "search", "startAt",
+            "status",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint("invoices.template.update", "PUT", "/invoices/template/{templateId}"),
+    Endpoint(
+        "invoices.template.update_template_late_fees_config", "PATCH", "/invoices/template/{templateId}/late-fees-configuration",
+        body=("altId", "altType", "lateFeesConfiguration"),
+    ),
+    Endpoint(
+        "invoices.template.update_template_payment_method_config", "PATCH", "/invoices/template/{templateId}/payment-methods-configuration",
+        body=("altId", "altType", "paymentMethods"),
+    ),
+    Endpoint("invoices.text2pay.create_send", "POST", "/invoices/text2pay"),
+    Endpoint("invoices.update", "PUT", "/invoices/{invoiceId}"),
+    Endpoint(
+        "invoices.update_invocie_last_visited", "PATCH", "/invoices/stats/last-visited-at",
+        body=("invoiceId",),
+    ),
+    Endpoint("invoices.voice", "POST", "/invoices/{invoiceId}/void", body=("altId", "altType")),
+
+    # lc_email
+    Endpoint(
+        "lc_email.email_verifications", "POST", "/email/verify",
+        query=("locationId",),
+        body=("type", "verify"),
+    ),
+
+    # media_library
+    Endpoint("media_library.delete", "DELETE", "/medias/{mediaId}", query=("altId", "altType")),
+    Endpoint(
+        "media_library.get", "GET", "/medias/files",
+        query=(
+            "altId", "altType", "sortBy", "sortOrder", "limit", "offset", "parentId", "query",
+            "type",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint("media_library.upload", "POST", "/medias/upload-file"),
+
+    # objects
+    Endpoint("objects.create_custom", "POST", "/objects/"),
+    Endpoint("objects.get", "GET", "/objects/", query=("locationId",)),
+    Endpoint("objects.get_all", "GET", "/objects/", query=("locationId",)),
+    Endpoint("objects.records.create", "POST", "/objects/{schemaKey}/records"),
+    Endpoint("objects.records.delete", "DELETE", "/objects/{schemaKey}/records/{recordId}"),
+    Endpoint("objects.records.get_by_id", "GET", "/objects/{schemaKey}/records/{recordId}"),
+    Endpoint(
+        "objects.records.update", "PUT", "/objects/{schemaKey}/records/{recordId}",
+        query=("locationId",),
+        body=("properties", "owner", "followers"),
+    ),
+    Endpoint(
+        "objects.search_object_record.index", "POST", "/objects/{schemaKey}/records/search",
+        body=("locationId", "page", "pageLimit", "query", "searchAfter"),
+        pagination=CURSOR,
+        cursor="searchAfter",
+        idempotent=True,
+    ),
+    Endpoint("objects.update", "PUT", "/objects/{key}"),
+
+    # opportunities
+    Endpoint(
+        "opportunities.create", "POST", "/opportunities/",
+        body=(
+            "pipelineId", "locationId", "name", "status", "contactId", "pipelineStageId",
+            "monetaryValue", "assignedTo", "customFields",
+        ),
+    ),
+    Endpoint("opportunities.delete", "DELETE", "/opportunities/{opportunityId}"),
+    Endpoint(
+        "opportunities.followers.add", "POST", "/opportunities/{opportunityId}/followers",
+        body=("followers",),
+    ),
+    Endpoint(
+        "opportunities.followers.remove", "DELETE", "/opportunities/{opportunityId}/followers",
+        body=("followers",),
+    ),
+    Endpoint("opportunities.get", "GET", "/opportunities/{opportunityId}"),
+    Endpoint(
+        "opportunities.search.search", "GET", "/opportunities/search",
+        query=(
+            "location_id", "assigned_to", "campaignId", "contact_id", "country", "date", "endDate",
+            "getCalendarEvents", "getNotes", "getTasks", "id", "limit", "order", "page",
+            "pipeline_id", "pipeline_stage_id", "q", "startAfter", "startAfterId", "status",
+        ),
+        pagination=CURSOR,
+        cursor=("startAfterId", "startAfter"),
+    ),
+    Endpoint(
+        "opportunities.update", "PUT", "/opportunities/{opportunityId}",
+        body=(
+            "pipelineId", "name", "pipelineStageId", "status", "monetaryValue", "assignedTo",
+            "customFields",
+        ),
+    ),
+    Endpoint("opportunities.update_status", "PUT", "/opportunities/{opportunityId}/status", body=("status",)),
+    Endpoint(
+        "opportunities.upsert", "POST", "/opportunities/upsert",
+        body=(
+            "pipelineId", "locationId", "contactId", "name", "status", "pipelineStageId",
+            "monetaryValue", "assignedTo",
+        ),
+    ),
+
+    # payments
+    Endpoint(
+        "payments.custom_provider.create", "POST", "/payments/custom-provider/provider",
+        pinned=True,
+        query=("locationId",),
+        body=("name", "description", "paymentsUrl", "queryUrl", "imageUrl"),
+    ),
+    Endpoint(
+        "payments.custom_provider.create_config", "POST", "/payments/custom-provider/connect",
+        pinned=True,
+        query=("locationId",),
+        body=("live", "test"),
+    ),
+    Endpoint(
+        "payments.custom_provider.delete", "DELETE", "/payments/custom-provider/provider",
+        query=("locationId",),
+    ),
+    Endpoint(
+        "payments.custom_provider.disconnect", "POST", "/payments/custom-provider/disconnect",
+        pinned=True,
+        query=("locationId",),
+        body=("liveMode",),
+    ),
+    Endpoint(
+        "payments.custom_provider.fetch", "GET", "/payments/custom-provider/connect",
+        pinned=True,
+        query=("locationId",),
+    ),
+    Endpoint(
+        "payments.integrations.create_white_label", "POST", "/payments/integrations/provider/whitelabel",
+        body=("altId", "altType", "uniqueName", "title", "provider", "description", "imageUrl"),
+    ),
+    Endpoint(
+        "payments.integrations.list", "GET", "/payments/integrations/provider/whitelabel",
+        query=("altId", "altType", "limit", "offset"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "payments.order_fufillment.create", "POST", "/payments/orders/{orderId}/fulfillments",
+        body=("altId", "altType", "trackings", "items", "notifyCustomer"),
+    ),
+    Endpoint(
+        "payments.order_fufillment.list_fufillment", "GET", "/payments/orders/{orderId}/fulfillments",
+        query=("altId", "altType"),
+    ),
+    Endpoint(
+        "payments.orders.get_by_id", "GET", "/payments/orders/{orderId}",
+        query=("altId", "altType", "locationId"),
+    ),
+    Endpoint(
+        "payments.orders.list", "GET", "/payments/orders",
+        query=(
+            "altId", "altType", "contactId", "endAt", "funnelProductIds", "limit", "locationId",
+            "offset", "paymentMode", "search", "startAt", "status",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "payments.subscriptions.get", "GET", "/payments/subscriptions/{subscriptionId}",
+        query=("altId", "altType"),
+    ),
+    Endpoint(
+        "payments.subscriptions.list", "GET", "/payments/subscriptions",
+        query=(
+            "altId", "altType", "contactId", "endAt", "entityId", "entitySourceType", "id", "limit",
+            "offset", "paymentMode", "search", "startAt",
+        ),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "payments.transactions.get", "GET", "/payments/transactions/{transactionId}",
+        query=("altId", "altType", "locationId"),
+    ),
+    Endpoint(
+        "payments.transactions.list", "GET", "/payments/transactions",
+        query=(
+            "altId", "altType", "contactId", "endAt", "entityId", "entitySourceSubType",
+            "entitySourceType", "limit", "locationId", "offset", "paymentMode", "search", "startAt",
+            "subscriptionId",
+        ),
+        pagination=OFFSET,
+    ),
+
+    # products
+    Endpoint(
+        "products.create", "POST", "/products/",
+        body=(
+            "name", "locationId", "productType", "description", "image", "statementDescriptor",
+            "availableInStore", "medias", "variants",
+        ),
+    ),
+    Endpoint("products.delete", "DELETE", "/products/{productId}", query=("locationId",)),
+    Endpoint("products.get", "GET", "/products/{productId}", query=("locationId",)),
+    Endpoint(
+        "products.list", "GET", "/products/",
+        query=("locationId", "limit", "offset", "search"),
+        pagination=OFFSET,
+    ),
+    Endpoint(
+        "products.prices.create", "POST", "/products/{productId}/price",
+        body=(
+            "name", "type", "currency", "amount", "locationId", "recurring", "description",
+            "membershipOffers", "trialPeriod", "totalCycles", "setupFee", "variantOptionIds",
+            "compareAtPrice", "userId", "meta", "trackInventory", "availableQuantity",
+            "allowOutOfStockPurchases",
+        ),
+    ),
+    Endpoint(
+        "products.prices.delete", "DELETE", "/products/{productId}/price/{priceId}",
+        query=("locationId",),
+    ),
+    Endpoint("products.prices.get", "GET", "/products/{productId}/price/{priceId}", query=("locationId",)),
+    Endpoint(
+        "products.prices.list", "GET", "/products/{productId}/price",
+        query=("locationId", "limit", "offset", "ids"),
+        pagination=OFFSET,
+    ),
+    Endpoint("products.prices.update", "PUT", "/products/{productId}/price/{priceId}"),
+    Endpoint("products.update", "PUT", "/products/{productId}"),
+
+    # sass
+    Endpoint(
+        "sass.disable", "POST", "/saas-api/public-api/bulk-disable-saas/{companyId}",
+        version="2021-04-15",
+        body=("locationIds",),
+    ),
+    Endpoint(
+        "sass.enable", "POST", "/saas-api/public-api/enable-saas/{locationId}",
+        version="2021-04-15",
+        body=(
+            "companyId", "isSaaSV2", "stripeAccountId", "name", "email", "stripeCustomerId",
+            "contactId", "providerLocationId", "description", "saasPlanId", "priceId",
+        ),
+    ),
+    Endpoint(
+        "sass.get_location_stripe_id", "GET", "/saas-api/public-api/locations",
+        version="2021-04-15",
+        pinned=True,
+        query=("companyId", "customerId", "subscriptionId"),
+    ),
+    Endpoint(
+        "sass.pause", "POST", "/saas-api/public-api/pause/{locationId}",
+        version="2021-04-15",
+        pinned=True,
+        body=("paused", "companyId"),
+    ),
+    Endpoint(
+        "sass.update", "PUT", "/saas-api/public-api/update-saas-subscription/{locationId}",
+        version="2021-04-15",
+        pinned=True,
+        body=("subscriptionId", "customerId", "companyId"),
+    ),
+    Endpoint(
+        "sass.update_rebilling", "POST", "/saas-api/public-api/update-rebilling/{companyId}",
+        version="2021-04-15",
+        body=("product", "locationIds", "config"),
+    ),
+
+    # snapshots
+    Endpoint(
+        "snapshots.create", "POST", "/snapshots/share/link",
+        query=("companyId",),
+        body=("snapshot_id", "share_type", "relationship_number", "share_location_id"),
+    ),
+    Endpoint("snapshots.get", "GET", "/snapshots/", query=("companyId",)),
+    Endpoint(
+        "snapshots.get_last_push", "GET", "/snapshots/snapshot-status/{snapshotId}/location/{locationId}",
+        query=("companyId",),
+    ),
+    Endpoint(
+        "snapshots.get_push_between_dates", "GET", "/snapshots/snapshot-status/{snapshotId}",
+        query=("companyId", "from", "to", "limit", "lastDoc"),
+        pagination=CURSOR,
+        cursor="lastDoc",
+    ),
+
+    # social_planner
+    Endpoint(
+        "social_planner.account.delete", "DELETE", "/social-media-posting/{locationId}/accounts/{accountId}",
+        query=("companyId", "userId"),
+    ),
+    Endpoint("social_planner.account.get", "GET", "/social-media-posting/{locationId}/accounts"),
+    Endpoint(
+        "social_planner.category.get_by_id", "GET", "/social-media-posting/{locationId}/categories",
+        query=("limit", "searchText", "skip"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "social_planner.category.get_categories", "GET", "/social-media-posting/{locationId}/categories/{categoryId}",
+    ),
+    Endpoint("social_planner.csv.delete", "DELETE", "/social-media-posting/{locationId}/csv/{csvId}"),
+    Endpoint(
+        "social_planner.csv.delete_csv_post", "DELETE", "/social-media-posting/{locationId}/csv/{csvId}/post/{postId}",
+    ),
+    Endpoint(
+        "social_planner.csv.get_csv", "GET", "/social-media-posting/{locationId}/csv/{csvId}",
+        query=("limit", "skip"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "social_planner.csv.get_upload_status", "GET", "/social-media-posting/{locationId}/csv",
+        query=("limit", "skip", "includeUsers", "userId"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "social_planner.csv.set_accounts", "POST", "/social-media-posting/{locationId}/set-accounts",
+        body=("accountIds", "filePath", "rowsCount", "fileName", "approver", "userId"),
+    ),
+    Endpoint(
+        "social_planner.csv.start_csv", "PATCH", "/social-media-posting/{locationId}/csv/{csvId}",
+        body=("userId",),
+    ),
+    Endpoint("social_planner.csv.upload", "POST", "/social-media-posting/{locationId}/csv"),
+    Endpoint(
+        "social_planner.oauth.facebook.attatch_facebook", "POST", "/social-media-posting/oauth/{locationId}/facebook/accounts/{accountId}",
+        body=("type", "originId", "name", "avatar", "companyId"),
+    ),
+    Endpoint(
+        "social_planner.oauth.facebook.get_pages", "GET", "/social-media-posting/oauth/{locationId}/facebook/accounts/{accountId}",
+    ),
+    Endpoint(
+        "social_planner.oauth.facebook.start_oauth", "GET", "/social-media-posting/oauth/facebook/start",
+        query=("locationId", "userId", "page", "reconnect"),
+    ),
+    Endpoint(
+        "social_planner.oauth.google.get_locations", "GET", "/social-media-posting/oauth/{locationId}/google/locations/{accountId}",
+    ),
+    Endpoint(
+        "social_planner.oauth.google.set_locations", "POST", "/social-media-posting/oauth/{locationId}/google/locations/{accountId}",
+        body=("location", "account", "companyId"),
+    ),
+    Endpoint(
+        "social_planner.oauth.google.start_oauth", "GET", "/social-media-posting/oauth/google/start",
+        query=("locationId", "userId", "page", "reconnect"),
+    ),
+    Endpoint(
+        "social_planner.oauth.instagram.attatch_proffesional_account", "POST", "/social-media-posting/oauth/{locationId}/instagram/accounts/{accountId}",
+        body=("originId", "name", "avatar", "pageId", "companyId"),
+    ),
+    Endpoint(
+        "social_planner.oauth.instagram.get_proffestional_acc", "GET", "/social-media-posting/oauth/{locationId}/instagram/accounts/{accountId}",
+    ),
+    Endpoint(
+        "social_planner.oauth.instagram.start_oauth", "GET", "/social-media-posting/oauth/instagram/start",
+        query=("locationId", "userId", "page", "reconnect"),
+    ),
+    Endpoint(
+        "social_planner.oauth.linkedIn.attatch_linekdIn", "POST", "/social-media-posting/oauth/{locationId}/linkedin/accounts/{accountId}",
+        body=("type", "originId", "name", "avatar", "urn", "companyId"),
+    ),
+    Endpoint(
+        "social_planner.oauth.linkedIn.get_linkedin_pages_profiles", "GET", "/social-media-posting/oauth/{locationId}/linkedin/accounts/{accountId}",
+    ),
+    Endpoint(
+        "social_planner.oauth.linkedIn.start_oauth", "GET", "/social-media-posting/oauth/linkedin/start",
+        query=("locationId", "userId", "page", "reconnect"),
+    ),
+    Endpoint(
+        "social_planner.oauth.tiktok.attatch_profile", "POST", "/social-media-posting/oauth/{locationId}/tiktok/accounts/{accountId}",
+        body=("type", "originId", "name", "avatar", "verified", "username", "companyId"),
+    ),
+    Endpoint(
+        "social_planner.oauth.tiktok.get_business_profile", "GET", "/social-media-posting/oauth/{locationId}/tiktok-business/accounts/{accountId}",
+    ),
+    Endpoint(
+        "social_planner.oauth.tiktok.get_profile", "GET", "/social-media-posting/oauth/{locationId}/tiktok/accounts/{accountId}",
+    ),
+    Endpoint(
+        "social_planner.oauth.tiktok.start_oauth", "GET", "/social-media-posting/oauth/tiktok/start",
+        query=("locationId", "userId", "page", "reconnect"),
+    ),
+    Endpoint(
+        "social_planner.oauth.tiktok.start_oauth_for_business", "GET", "/social-media-posting/oauth/tiktok-business/start",
+        query=("locationId", "userId", "page", "reconnect"),
+    ),
+    Endpoint(
+        "social_planner.posts.bulk_delete", "POST", "/social-media-posting/{locationId}/posts/bulk-delete",
+        body=("postIds",),
+    ),
+    Endpoint(
+        "social_planner.posts.create", "POST", "/social-media-posting/{locationId}/posts",
+        body=(
+            "accountIds", "summary", "media", "status", "type", "scheduleTimeUpdated",
+            "scheduleDate", "createdBy", "followUpComment", "ogTagsDetails", "postApprovalDetails",
+            "tags", "categoryId", "tiktokPostDetails", "gmbPostDetails", "userId",
+        ),
+    ),
+    Endpoint("social_planner.posts.delete", "DELETE", "/social-media-posting/{locationId}/posts/{postId}"),
+    Endpoint("social_planner.posts.edit", "PUT", "/social-media-posting/{locationId}/posts/{postId}", pinned=True),
+    Endpoint("social_planner.posts.get", "GET", "/social-media-posting/{locationId}/posts/{postId}"),
+    Endpoint(
+        "social_planner.posts.get_posts", "POST", "/social-media-posting/{locationId}/posts/list",
+        body=("type", "skip", "limit", "includeUsers", "postType", "accounts", "fromDate", "toDate"),
+    ),
+    Endpoint(
+        "social_planner.surveys.get_submissions", "GET", "/surveys/submissions",
+        query=("locationId", "limit", "page", "endAt", "q", "startAt", "surveyId"),
+        pagination=PAGE,
+    ),
+    Endpoint(
+        "social_planner.surveys.get_surveys", "GET", "/surveys/",
+        query=("locationId", "limit", "skip", "type"),
+        pagination=SKIP,
+    ),
+    Endpoint(
+        "social_planner.tag.get_tags_by_id", "POST", "/social-media-posting/{locationId}/tags/details",
+        body=("tagIds",),
+    ),
+    Endpoint(
+        "social_planner.tag.get_tags_by_location", "GET", "/social-media-posting/{locationId}/tags",
+        query=("limit", "searchText", "skip"),
+        pagination=SKIP,
+    ),
+
+    # sub_accounts
+    Endpoint(
+        "sub_accounts.custom_field.create", "POST", "/locations/{locationId}/customFields",
+        body=(
+            "name", "dataType", "placeholder", "acceptedFormat", "isMultipleFile",
+            "maxNumberOfFiles", "textBoxListOptions", "position", "model",
+        ),
+    ),
+    Endpoint(
+        "sub_accounts.custom_field.delete", "DELETE", "/locations/{locationId}/customFields/{customFieldId}",
+    ),
+    Endpoint("sub_accounts.custom_field.get", "GET", "/locations/{locationId}/customFields/{customFieldId}"),
+    Endpoint("sub_accounts.custom_field.get_fields", "GET", "/locations/{locationId}/customFields"),
+    Endpoint(
+        "sub_accounts.custom_field.update", "PUT", "/locations/{locationId}/customFields/{customFieldId}",
+    ),
+    Endpoint(
+        "sub_accounts.custom_field.upload_file_to_custom_fields", "POST", "/locations/{locationId}/customFields/upload",
+    ),
+    Endpoint("sub_accounts.custom_value.create", "GET", "/locations/{locationId}/customValues"),
+    Endpoint(
+        "sub_accounts.custom_value.delete", "DELETE", "/locations/{locationId}/customValues/{customValueId}",
+    ),
+    Endpoint("sub_accounts.custom_value.get", "GET", "/locations/{locationId}/customValues/{customValueId}"),
+    Endpoint("sub_accounts.custom_value.get_values", "GET", "/locations/{locationId}/customValues"),
+    Endpoint(
+        "sub_accounts.custom_value.update", "PUT", "/locations/{locationId}/customValues/{customValueId}",
+        body=("name", "value"),
+    ),
+    Endpoint(
+        "sub_accounts.search.search", "GET", "/locations/search",
+        pinned=True,
+        query=("companyId", "email", "limit", "order", "skip"),
+        pagination=SKIP,
+    ),
+    Endpoint("sub_accounts.sub_account.create", "PUT", "/locations/{locationId}"),
+    Endpoint(
+        "sub_accounts.sub_account.delete", "DELETE", "/locations/{locationId}",
+        query=("deleteTwilioAccount",),
+    ),
+    Endpoint("sub_accounts.sub_account.get", "GET", "/locations/{locationId}"),
+    Endpoint("sub_accounts.sub_account.put", "PUT", "/locations/{locationId}"),
+    Endpoint("sub_accounts.tags.create", "POST", "/locations/{locationId}/tags", body=("name",)),
+    Endpoint("sub_accounts.tags.delete", "DELETE", "/locations/{locationId}/tags/{tagId}"),
+    Endpoint("sub_accounts.tags.get", "GET", "/locations/{locationId}/tags"),
+    Endpoint("sub_accounts.tags.get_tag", "GET", "/locations/{locationId}/tags/{tagId}"),
+    Endpoint("sub_accounts.tags.update", "PUT", "/locations/{locationId}/tags/{tagId}", body=("name",)),
+    Endpoint(
+        "sub_accounts.tasks_search.search_filter", "POST", "/locations/{locationId}/tasks/search",
+        body=("contactId", "completed", "assignedTo", "query", "limit", "skip", "businessId"),
+        pagination=SKIP,
+        idempotent=True,
+    ),
+    Endpoint("sub_accounts.tempalte.delete", "DELETE", "/locations/{locationId}/templates/{templateId}"),
+    Endpoint(
+        "sub_accounts.tempalte.get", "GET", "/locations/{locationId}/templates",
+        query=("originId", "deleted", "limit", "skip", "type"),
+        pagination=SKIP,
+    ),
+    Endpoint("sub_accounts.time_zone.fetch", "GET", "/locations/{locationId}/timezones"),
+
+    # trigger_links
+    Endpoint("trigger_links.create", "POST", "/links/", body=("locationId", "name", "redirectTo")),
+    Endpoint("trigger_links.delete", "DELETE", "/links/{linkId}"),
+    Endpoint("trigger_links.get", "GET", "/links/", query=("locationId",)),
+    Endpoint("trigger_links.update", "PUT", "/links/{linkId}", body=("name", "redirectTo")),
+
+    # users
+    Endpoint("users.create_user", "POST", "/users/", pinned=True),
+    Endpoint("users.delete", "DELETE", "/users/{userId}"),
+    Endpoint("users.get", "GET", "/users/{userId}"),
+    Endpoint("users.get_user_by_location", "GET", "/users/", query=("locationId",)),
+    Endpoint(
+        "users.search.search", "GET", "/users/search",
+        query=(
+            "companyId", "enabled2waySync", "ids", "limit", "locationId", "query", "role", "skip",
+            "sort", "sortDirection", "type",
+        ),
+        pagination=SKIP,
+    ),
+    Endpoint("users.update", "PUT", "/users/{userId}"),
+
+    # workflows
+    Endpoint("workflows.get", "GET", "/workflows/", query=("locationId",)),
+)}
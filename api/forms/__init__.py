@@ -0,0 +1,14 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get",
+        "get_submission",
+        "upload_files_custom_fields",
+    ],
+    exports={
+        "get_form_submissions": "get_submission",
+        "get_forms": "get",
+    },
+)
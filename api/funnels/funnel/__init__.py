@@ -0,0 +1,15 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "fetch",
+        "fetch_count",
+        "fetch_pages",
+    ],
+    exports={
+        "fetch_funnel_page_count": "fetch_count",
+        "fetch_funnel_pages": "fetch_pages",
+        "fetch_funnels": "fetch",
+    },
+)
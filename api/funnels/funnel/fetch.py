@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("funnels.funnel.fetch")
 
 async def fetch_funnels(
     headers: Dict[str, str],
@@ -34,18 +33,6 @@ async def fetch_funnels(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id,
         "category": category,
@@ -58,18 +45,4 @@ async def fetch_funnels(
 
     params = {k: v for k, v in params.items() if v is not None}
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/funnels/funnel/list",
-                headers=request_headers,
-                params=params
-            )
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to fetch funnels: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while fetching funnels: {e}")
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("funnels.funnel.fetch_count")
 
 async def fetch_funnel_page_count(
     headers: Dict[str, str],
@@ -26,16 +26,6 @@ async def fetch_funnel_page_count(
         httpx.HTTPStatusError: If the API request fails
         ValueError: If required headers are missing
     """
-    url = f"{API_BASE_URL}/funnels/page/count"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    if "Version" not in headers:
-        headers["Version"] = API_VERSION
-
-    headers["Accept"] = "application/json"
-
     params = {
         "funnelId": funnel_id,
         "locationId": location_id
@@ -44,7 +34,4 @@ async def fetch_funnel_page_count(
     if name:
         params["name"] = name
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
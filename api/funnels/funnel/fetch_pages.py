@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("funnels.funnel.fetch_pages")
 
 async def fetch_funnel_pages(
     headers: Dict[str, str],
@@ -29,18 +29,6 @@ async def fetch_funnel_pages(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "funnelId": funnel_id,
         "locationId": location_id,
@@ -51,11 +39,4 @@ async def fetch_funnel_pages(
     if name:
         params["name"] = name
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{API_BASE_URL}/funnels/page",
-            headers=request_headers,
-            params=params
-        )
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
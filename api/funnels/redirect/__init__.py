@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "fetch",
+        "update",
+    ],
+    exports={
+        "create_redirect": "create",
+        "delete_redirect_by_id": "delete",
+        "fetch_redirect_list": "fetch",
+        "update_redirect_by_id": "update",
+    },
+)
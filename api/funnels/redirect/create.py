@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("funnels.redirect.create")
 
 async def create_redirect(
     headers: Dict[str, str],
@@ -30,21 +30,6 @@ async def create_redirect(
         httpx.HTTPStatusError: If the API request fails
         Exception: If required headers are missing
     """
-    url = f"{API_BASE_URL}/funnels/lookup/redirect"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     data = {
         "locationId": location_id,
         "domain": domain,
@@ -53,7 +38,4 @@ async def create_redirect(
         "action": action
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, json=data)
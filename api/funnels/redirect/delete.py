@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("funnels.redirect.delete")
 
 async def delete_redirect_by_id(
     redirect_id: str,
@@ -20,25 +20,8 @@ async def delete_redirect_by_id(
     Returns:
         A dictionary containing the status of the delete operation
     """
-    url = f"{API_BASE_URL}/funnels/lookup/redirect/{redirect_id}"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     params = {
         "locationId": location_id
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"redirectId": redirect_id}, params=params)
@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("funnels.redirect.fetch")
 
 async def fetch_redirect_list(
     headers: Dict[str, str],
@@ -28,20 +27,6 @@ async def fetch_redirect_list(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    url = f"{API_BASE_URL}/funnels/lookup/redirect/list"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id,
         "limit": limit,
@@ -51,11 +36,4 @@ async def fetch_redirect_list(
     if search:
         params["search"] = search
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=request_headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"API request failed: {str(e)}")
-        raise Exception(f"API request failed: {str(e)}")
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
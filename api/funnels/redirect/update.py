@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("funnels.redirect.update")
 
 async def update_redirect_by_id(
     redirect_id: str,
@@ -29,28 +28,11 @@ async def update_redirect_by_id(
         httpx.HTTPStatusError: If the API request fails
         ValueError: If Authorization header is missing or invalid
     """
-    url = f"{API_BASE_URL}/funnels/lookup/redirect/{redirect_id}"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    headers.update({
-        "Version": API_VERSION,
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    })
-
     data = {
         "target": target,
         "action": action,
         "locationId": location_id
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.patch(url, headers=headers, json=data)
-        
-        if response.status_code != 200:
-            logging.error(f"Failed to update redirect: {response.text}")
-            response.raise_for_status()
-
-        return response.json()["data"]
\ No newline at end of file
+    response = await dispatch(ENDPOINT, headers, path={"redirectId": redirect_id}, json=data)
+    return response["data"]
@@ -0,0 +1,31 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "estimate",
+        "generate_number",
+        "get",
+        "list",
+        "record_manual_payment",
+        "schedule",
+        "send",
+        "template",
+        "text2pay",
+        "update",
+        "update_invocie_last_visited",
+        "voice",
+    ],
+    exports={
+        "create_invoice": "create",
+        "delete_invoice": "delete",
+        "generate_invoice_number": "generate_number",
+        "get_invoice": "get",
+        "list_invoices": "list",
+        "update_invoice": "update",
+        "update_invoice_last_visited": "update_invocie_last_visited",
+        "void_invoice": "voice",
+    },
+)
@@ -1,5 +1,8 @@
-import httpx
 from typing import Dict, List, Any, Optional
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("invoices.create")
 
 async def create_invoice(
     headers: Dict[str, str],
@@ -30,7 +33,7 @@ async def create_invoice(
 ) -> Dict[str, Any]:
     """
     Create an invoice using GoHighLevel API
-    
+
     Args:
         headers: Dictionary containing Authorization and Version headers
         alt_id: Location ID or company ID
@@ -57,28 +60,13 @@ async def create_invoice(
         invoice_number_prefix: Prefix for invoice number
         payment_methods: Payment methods configuration
         attachments: List of attachments
-    
+
     Returns:
         API response as dictionary
     """
-    url = "https://services.leadconnectorhq.com/invoices/"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = "2021-07-28"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     if contact_details is None:
         contact_details = {"id": contact_id, "name": contact_name}
-    
+
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -90,7 +78,7 @@ async def create_invoice(
         "title": title,
         "liveMode": live_mode
     }
-    
+
     optional_fields = {
         "businessDetails": business_details,
         "discount": discount,
@@ -106,10 +94,7 @@ async def create_invoice(
         "paymentMethods": payment_methods,
         "attachments": attachments
     }
-    
+
     payload.update({k: v for k, v in optional_fields.items() if v is not None})
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=payload)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=payload)
@@ -0,0 +1,24 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_invoice_from_estimate",
+        "create_new",
+        "delete",
+        "generate_estimate_number",
+        "list_templates",
+        "send",
+        "templates",
+        "update",
+        "update_estimate_last_visit",
+    ],
+    exports={
+        "create_invoice_estimate": "create_new",
+        "delete_invoice_estimate": "delete",
+        "list_estimates": "list_templates",
+        "send_estimate": "send",
+        "update_estimate": "update",
+        "update_estimate_last_visited": "update_estimate_last_visit",
+    },
+)
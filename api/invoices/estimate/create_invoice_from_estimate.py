@@ -1,8 +1,8 @@
-import httpx
 from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.estimate.create_invoice_from_estimate")
 
 async def create_invoice_from_estimate(
     headers: Dict[str, str],
@@ -12,17 +12,6 @@ async def create_invoice_from_estimate(
     mark_as_invoiced: bool = True,
     version: str = "v1"
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/invoices/estimate/{estimate_id}/invoice"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Content-Type": "application/json"
-    }
-    
     data = {
         "altId": alt_id,
         "altType": alt_type,
@@ -30,7 +19,4 @@ async def create_invoice_from_estimate(
         "version": version
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"estimateId": estimate_id}, json=data)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.estimate.list_templates")
 
 async def list_estimates(
     headers: Dict[str, str],
@@ -16,24 +16,13 @@ async def list_estimates(
     start_at: Optional[str] = None,
     status: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/invoices/estimate/list"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION)
-    }
-    
     params = {
         "altId": alt_id,
         "altType": alt_type,
         "limit": limit,
         "offset": offset
     }
-    
+
     if contact_id:
         params["contactId"] = contact_id
     if end_at:
@@ -44,8 +33,5 @@ async def list_estimates(
         params["startAt"] = start_at
     if status:
         params["status"] = status
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
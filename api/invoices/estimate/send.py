@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.estimate.send")
 
 async def send_estimate(
     headers: Dict[str, str],
@@ -16,18 +16,6 @@ async def send_estimate(
     from_email: str = None,
     estimate_name: str = "Estimate"
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/invoices/estimate/{estimate_id}/send"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION)
-    }
-
     data = {
         "altId": alt_id,
         "altType": alt_type,
@@ -41,7 +29,4 @@ async def send_estimate(
         "estimateName": estimate_name
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"estimateId": estimate_id}, json=data)
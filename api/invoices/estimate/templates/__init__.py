@@ -0,0 +1,12 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_estimate_template",
+        "delete_estimate_template",
+        "list_estimate_templates",
+        "preview_estimate_template",
+        "update_estimate_template",
+    ],
+)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional, List
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.estimate.templates.create_estimate_template")
 
 async def create_estimate_template(
     headers: Dict[str, str],
@@ -21,18 +21,6 @@ async def create_estimate_template(
     estimate_number_prefix: Optional[str] = None,
     attachments: Optional[List[Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/invoices/estimate/template"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-    
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     payload = {
         "altId": alt_id,
         "altType": "location",
@@ -42,7 +30,7 @@ async def create_estimate_template(
         "items": items,
         "liveMode": live_mode
     }
-    
+
     if discount:
         payload["discount"] = discount
     if terms_notes:
@@ -59,9 +47,5 @@ async def create_estimate_template(
         payload["estimateNumberPrefix"] = estimate_number_prefix
     if attachments:
         payload["attachments"] = attachments
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=payload, headers=request_headers)
-    
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=payload)
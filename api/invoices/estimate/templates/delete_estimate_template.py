@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.estimate.templates.delete_estimate_template")
 
 async def delete_estimate_template(
     headers: Dict[str, str],
@@ -10,23 +10,9 @@ async def delete_estimate_template(
     alt_id: str,
     alt_type: str = "location"
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/invoices/estimate/template/{template_id}"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-    
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION)
-    }
-    
     params = {
         "altId": alt_id,
         "altType": alt_type
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"templateId": template_id}, params=params)
@@ -1,19 +1,7 @@
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-async def update_estimate_template(headers: dict, template_id: str, payload: dict):
-    url = f"https://services.leadconnectorhq.com/invoices/estimate/template/{template_id}"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
+ENDPOINT = get_endpoint("invoices.estimate.templates.update_estimate_template")
 
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", "2021-07-28")
-    }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.put(url, headers=request_headers, json=payload)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+async def update_estimate_template(headers: dict, template_id: str, payload: dict):
+    return await dispatch(ENDPOINT, headers, path={"templateId": template_id}, json=payload)
@@ -1,8 +1,8 @@
-import httpx
 from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.estimate.update")
 
 async def update_estimate(
     estimate_id: str,
@@ -24,22 +24,4 @@ async def update_estimate(
         httpx.HTTPStatusError: If the API request fails
         Exception: If required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    url = f"{API_BASE_URL}/invoices/estimate/{estimate_id}"
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": headers["Version"]
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.put(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"estimateId": estimate_id}, json=data)
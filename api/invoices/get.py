@@ -1,9 +1,9 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.get")
 
 async def get_invoice(
     invoice_id: str,
@@ -26,20 +26,6 @@ async def get_invoice(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     # Prepare query parameters
     params = {
         "altId": alt_id,
@@ -48,24 +34,4 @@ async def get_invoice(
 
     logging.info(f"Getting invoice with ID: {invoice_id}")
 
-    try:
-        # Make the API request
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(
-                f"{API_BASE_URL}/invoices/{invoice_id}",
-                headers=request_headers,
-                params=params
-            )
-
-        # Handle the API response
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_message = f"Failed to get invoice. Status code: {response.status_code}. Response: {response.text}"
-            logging.error(error_message)
-            raise Exception(error_message)
-
-    except httpx.RequestError as e:
-        error_message = f"An error occurred while making the request: {str(e)}"
-        logging.error(error_message)
-        raise Exception(error_message)
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"invoiceId": invoice_id}, params=params)
@@ -1,9 +1,8 @@
-from typing import Dict, Any, List, Optional
-import httpx
-import logging
+from typing import Dict, Any, Optional
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.list")
 
 async def list_invoices(
     headers: Dict[str, str],
@@ -22,7 +21,7 @@ async def list_invoices(
 ) -> Dict[str, Any]:
     """
     Get list of invoices.
-    
+
     Args:
         headers: Dictionary containing Authorization and Version headers
         alt_id: Location ID / company ID based on altType
@@ -37,27 +36,13 @@ async def list_invoices(
         sort_order: The order of sort (ascend/descend)
         start_at: Start date in YYYY-MM-DD format
         status: Status to be filtered
-        
+
     Returns:
         Dictionary containing the invoices and total count
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-    
     # Prepare query parameters
     params = {
         "altId": alt_id,
@@ -65,7 +50,7 @@ async def list_invoices(
         "limit": limit,
         "offset": offset
     }
-    
+
     # Add optional parameters if they exist
     if contact_id:
         params["contactId"] = contact_id
@@ -83,20 +68,5 @@ async def list_invoices(
         params["startAt"] = start_at
     if status:
         params["status"] = status
-    
-    # Make the API request
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API_BASE_URL}/invoices/",
-                headers=request_headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to fetch invoices: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while fetching invoices: {e}")
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
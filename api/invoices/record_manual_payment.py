@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.record_manual_payment")
 
 async def send_invoice(
     invoice_id: str,
@@ -18,7 +17,7 @@ async def send_invoice(
 ) -> Dict[str, Any]:
     """
     Send an invoice using GoHighLevel API
-    
+
     Args:
         invoice_id: The ID of the invoice to send
         alt_id: Location ID or company ID
@@ -29,26 +28,13 @@ async def send_invoice(
         live_mode: Live mode flag
         sent_from: Sender details for invoice
         auto_payment: Auto-payment configuration
-    
+
     Returns:
         Dictionary containing the sent invoice data
-    
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -63,16 +49,4 @@ async def send_invoice(
     if auto_payment:
         payload["autoPayment"] = auto_payment
 
-    url = f"{API_BASE_URL}/invoices/{invoice_id}/send"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=request_headers, json=payload)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"invoiceId": invoice_id}, json=payload)
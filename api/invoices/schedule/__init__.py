@@ -0,0 +1,23 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "cancel",
+        "create",
+        "delete",
+        "get",
+        "list",
+        "manage_auto_payment",
+        "schedule_and_schedule",
+        "update",
+        "update_scheduled",
+    ],
+    exports={
+        "delete_invoice_schedule": "delete",
+        "get_invoice_schedule": "get",
+        "schedule_invoice": "schedule_and_schedule",
+        "update_schedule": "update",
+        "update_scheduled_invoice": "update_scheduled",
+    },
+)
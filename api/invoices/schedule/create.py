@@ -1,6 +1,9 @@
-import requests
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import List, Dict
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+from api.sync import run_sync
+
+ENDPOINT = get_endpoint("invoices.schedule.create")
 
 def create_invoice_schedule(
     headers: Dict[str, str],
@@ -23,13 +26,6 @@ def create_invoice_schedule(
     payment_methods: Dict,
     attachments: List[Dict]
 ) -> Dict:
-    url = "https://services.leadconnectorhq.com/invoices/schedule"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Invalid or missing Authorization header")
-    
-    headers.setdefault("Version", "2021-07-28")
-    
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -50,7 +46,5 @@ def create_invoice_schedule(
         "paymentMethods": payment_methods,
         "attachments": attachments
     }
-    
-    response = requests.post(url, headers=headers, json=payload)
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+
+    return run_sync(dispatch(ENDPOINT, headers, json=payload))
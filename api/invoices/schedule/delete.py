@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.schedule.delete")
 
 async def delete_invoice_schedule(
     schedule_id: str,
@@ -26,33 +25,9 @@ async def delete_invoice_schedule(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    auth_token = headers.get("Authorization")
-    if not auth_token or not auth_token.startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    version = headers.get("Version", API_VERSION)
-
-    request_headers = {
-        "Authorization": auth_token,
-        "Version": version,
-        "Accept": "application/json"
-    }
-
     params = {
         "altId": alt_id,
         "altType": alt_type
     }
 
-    url = f"{API_BASE_URL}/invoices/schedule/{schedule_id}"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=request_headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"scheduleId": schedule_id}, params=params)
@@ -1,6 +1,8 @@
-import httpx
 from typing import Dict, List, Optional
-from datetime import datetime
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("invoices.schedule.list")
 
 async def create_invoice_schedule(
     headers: Dict[str, str],
@@ -23,14 +25,6 @@ async def create_invoice_schedule(
     payment_methods: Dict,
     attachments: Optional[List[Dict]] = None
 ) -> Dict:
-    url = "https://services.leadconnectorhq.com/invoices/schedule"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-    
-    if not headers.get("Version"):
-        raise ValueError("Missing Version header")
-    
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -50,12 +44,8 @@ async def create_invoice_schedule(
         "invoiceNumberPrefix": invoice_number_prefix,
         "paymentMethods": payment_methods
     }
-    
+
     if attachments:
         payload["attachments"] = attachments
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-    
-    return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, json=payload)
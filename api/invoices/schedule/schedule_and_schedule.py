@@ -1,8 +1,8 @@
-import httpx
 from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.schedule.schedule_and_schedule")
 
 async def schedule_invoice(
     schedule_id: str,
@@ -30,21 +30,6 @@ async def schedule_invoice(
         httpx.HTTPStatusError: If the API request fails
         Exception: If required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    url = f"{API_BASE_URL}/invoices/schedule/{schedule_id}/schedule"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -54,7 +39,4 @@ async def schedule_invoice(
     if auto_payment:
         payload["autoPayment"] = auto_payment
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=payload)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"scheduleId": schedule_id}, json=payload)
@@ -1,8 +1,8 @@
-import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.schedule.update_scheduled")
 
 async def update_scheduled_invoice(
     schedule_id: str,
@@ -24,19 +24,4 @@ async def update_scheduled_invoice(
         httpx.HTTPStatusError: If the API request fails
         ValueError: If Authorization header is missing or invalid
     """
-    url = f"{API_BASE_URL}/invoices/schedule/{schedule_id}/updateAndSchedule"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    default_headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Version": API_VERSION
-    }
-    default_headers.update(headers)
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=default_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"scheduleId": schedule_id}, json=data)
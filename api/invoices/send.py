@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("invoices.send")
 
 async def send_invoice(
     invoice_id: str,
@@ -35,19 +35,6 @@ async def send_invoice(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -62,9 +49,4 @@ async def send_invoice(
     if auto_payment:
         payload["autoPayment"] = auto_payment
 
-    url = f"{API_BASE_URL}/invoices/{invoice_id}/send"
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=payload)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"invoiceId": invoice_id}, json=payload)
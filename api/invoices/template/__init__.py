@@ -0,0 +1,21 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "list",
+        "update",
+        "update_template_late_fees_config",
+        "update_template_payment_method_config",
+    ],
+    exports={
+        "create_invoice_template": "create",
+        "delete_invoice_template": "delete",
+        "get_invoice_templates": "get",
+        "list_invoice_templates": "list",
+        "update_invoice_template": "update",
+    },
+)
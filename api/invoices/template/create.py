@@ -1,6 +1,8 @@
-import aiohttp
-import json
 from typing import Dict, Any, Optional, List
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("invoices.template.create")
 
 async def create_invoice_template(
     headers: Dict[str, str],
@@ -21,8 +23,6 @@ async def create_invoice_template(
     payment_methods: Optional[Dict[str, Any]] = None,
     attachments: Optional[List[str]] = None
 ) -> Dict[str, Any]:
-    url = "https://services.leadconnectorhq.com/invoices/template"
-    
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -42,9 +42,4 @@ async def create_invoice_template(
         "attachments": attachments or []
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=payload) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                response.raise_for_status()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, json=payload)
@@ -0,0 +1,20 @@
+from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("invoices.template.update_template_late_fees_config")
+
+async def update_template_late_fees_config(
+    template_id: str,
+    alt_id: str,
+    alt_type: str,
+    late_fees_config: Dict[str, Any],
+    headers: Dict[str, str]
+) -> Dict[str, Any]:
+    payload = {
+        "altId": alt_id,
+        "altType": alt_type,
+        "lateFeesConfiguration": late_fees_config
+    }
+
+    return await dispatch(ENDPOINT, headers, path={"templateId": template_id}, json=payload)
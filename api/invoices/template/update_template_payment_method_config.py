@@ -0,0 +1,24 @@
+from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("invoices.template.update_template_payment_method_config")
+
+async def update_template_payment_method_config(
+    template_id: str,
+    alt_id: str,
+    alt_type: str,
+    enable_bank_debit_only: bool,
+    headers: Dict[str, str]
+) -> Dict[str, Any]:
+    payload = {
+        "altId": alt_id,
+        "altType": alt_type,
+        "paymentMethods": {
+            "stripe": {
+                "enableBankDebitOnly": enable_bank_debit_only
+            }
+        }
+    }
+
+    return await dispatch(ENDPOINT, headers, path={"templateId": template_id}, json=payload)
@@ -1,6 +1,9 @@
-import httpx
 import logging
 from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("lc_email.email_verifications")
 
 async def verify_email(
     headers: Dict[str, str],
@@ -21,42 +24,9 @@ async def verify_email(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    API_BASE_URL = "https://services.leadconnectorhq.com"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = "2021-07-28"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     params = {"locationId": location_id}
     payload = {"type": "email", "verify": email}
 
     logging.info(f"Verifying email: {email}")
 
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                f"{API_BASE_URL}/email/verify",
-                headers=request_headers,
-                params=params,
-                json=payload
-            )
-
-        response.raise_for_status()
-        return response.json()
-
-    except httpx.HTTPStatusError as e:
-        logging.error(f"API request failed with status {e.response.status_code}: {e.response.text}")
-        raise Exception(f"API request failed: {str(e)}")
-
-    except Exception as e:
-        logging.error(f"An error occurred: {str(e)}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params, json=payload)
@@ -0,0 +1,16 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "delete",
+        "get",
+        "upload",
+    ],
+    exports={
+        "delete_media": "delete",
+        "get_media_files": "get",
+        "upload_media_file": "upload",
+        "upload_media_files": "upload",
+    },
+)
@@ -1,9 +1,9 @@
 from typing import Dict, Any
-import httpx
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("media_library.delete")
 
 async def delete_media(
     headers: Dict[str, str],
@@ -27,18 +27,6 @@ async def delete_media(
         ValueError: If required headers are missing
         Exception: If the API request fails
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "altId": alt_id,
         "altType": alt_type
@@ -46,18 +34,4 @@ async def delete_media(
 
     logging.info(f"Deleting media with ID: {media_id}")
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{API_BASE_URL}/medias/{media_id}",
-                headers=request_headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to delete media: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while deleting media: {e}")
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"mediaId": media_id}, params=params)
@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("media_library.get")
 
 async def get_media_files(
     headers: Dict[str, str],
@@ -38,14 +37,6 @@ async def get_media_files(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    headers["Accept"] = "application/json"
-
     params = {
         "altId": alt_id,
         "altType": alt_type,
@@ -64,13 +55,4 @@ async def get_media_files(
     if file_type:
         params["type"] = file_type
 
-    url = f"{API_BASE_URL}/medias/files"
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-
-    if response.status_code != 200:
-        logging.error(f"Error fetching media files: {response.text}")
-        raise Exception(f"Error fetching media files: {response.status_code}")
-
-    return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
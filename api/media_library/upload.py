@@ -1,28 +1,31 @@
-from typing import Dict, Optional
-import httpx
-import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+from api.upload import MultipartStream, Progress, UploadFile, UploadSource, upload_all
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("media_library.upload")
 
 async def upload_media_file(
     headers: Dict[str, str],
-    file: Optional[bytes] = None,
+    file: Optional[UploadSource] = None,
     hosted: Optional[bool] = None,
     file_url: Optional[str] = None,
     name: Optional[str] = None,
-    parent_id: Optional[str] = None
+    parent_id: Optional[str] = None,
+    progress: Optional[Progress] = None
 ) -> dict:
     """
     Upload a file to the Media Library.
 
     Args:
         headers: Dictionary containing Authorization and Version headers
-        file: The file to upload (max 25MB)
+        file: The file to upload (max 25MB): bytes, a file path, a binary file
+            object or an async iterable of chunks. It is streamed, not read into memory.
         hosted: Boolean indicating if the file is hosted externally
         file_url: URL of the hosted file (required if hosted is True)
         name: Name of the file
         parent_id: ID of the parent folder
+        progress: Called as progress(bytes_sent, total_bytes) while the file is sent
 
     Returns:
         Dictionary containing the uploaded file data
@@ -30,23 +33,12 @@ async def upload_media_file(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    headers["Accept"] = "application/json"
-
     data = {}
-    files = {}
 
     if hosted:
         data["hosted"] = "true"
         data["fileUrl"] = file_url
-    elif file:
-        files["file"] = file
-    else:
+    elif not file:
         raise ValueError("Either 'file' or 'hosted' with 'file_url' must be provided")
 
     if name:
@@ -54,16 +46,38 @@ async def upload_media_file(
     if parent_id:
         data["parentId"] = parent_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{API_BASE_URL}/medias/upload-file",
-            headers=headers,
-            data=data,
-            files=files
-        )
+    if hosted:
+        return await dispatch(ENDPOINT, headers, data=data)
+    return await dispatch(ENDPOINT, headers, stream=MultipartStream(data, [UploadFile("file", file)], progress=progress))
 
-    if response.status_code != 200:
-        logging.error(f"Error uploading file: {response.text}")
-        raise Exception(f"Failed to upload file: {response.status_code}")
 
-    return response.json()
\ No newline at end of file
+async def upload_media_files(
+    headers: Dict[str, str],
+    files: Iterable[UploadSource],
+    parent_id: Optional[str] = None,
+    concurrency: int = 4,
+    progress: Optional[Callable[[int, int, Optional[int]], Any]] = None
+) -> List[Any]:
+    """
+    Upload many files to the Media Library, streaming each one and sending
+    at most `concurrency` at a time.
+
+    Args:
+        headers: Dictionary containing Authorization and Version headers
+        files: Files to upload, each as bytes, a file path, a binary file object
+            or an async iterable of chunks
+        parent_id: ID of the parent folder
+        concurrency: Maximum simultaneous uploads
+        progress: Called as progress(index, bytes_sent, total_bytes) for the file at `index`
+
+    Returns:
+        List with the uploaded file data, or the exception, per file in order
+    """
+    data = {"parentId": parent_id} if parent_id else None
+    return await upload_all(
+        ENDPOINT,
+        ((data, [UploadFile("file", file)]) for file in files),
+        headers,
+        concurrency=concurrency,
+        progress=progress
+    )
@@ -0,0 +1,432 @@
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+from bisect import bisect_left
+import logging
+import threading
+import time
+import weakref
+import httpx
+
+# Upper bounds in seconds, roughly log-spaced from a warm keep-alive GET to a
+# slow export page.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Where each request's time goes. "connect" includes the DNS lookup, which
+# httpcore does as part of opening the TCP connection; "queue" is everything
+# outside the network phases (rate limiter and pool waits, retry backoff);
+# "decode" is JSON decoding in the dispatcher.
+PHASES = ("queue", "connect", "tls", "send", "wait", "receive", "decode")
+
+_TRACE_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+    "http11.send_request_headers": "send",
+    "http11.send_request_body": "send",
+    "http11.receive_response_headers": "wait",
+    "http11.receive_response_body": "receive",
+    "http2.send_request_headers": "send",
+    "http2.send_request_body": "send",
+    "http2.receive_response_headers": "wait",
+    "http2.receive_response_body": "receive",
+}
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with Prometheus semantics.
+    """
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        total, result = 0, []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, seen in zip(self.buckets, self.cumulative()):
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class RequestTiming:
+    """
+    Timings and counters for one logical request, passed to every hook once
+    the request finishes.
+
+    `phases` maps each name in PHASES to seconds; retried requests add up the
+    phases of every attempt.
+    """
+    __slots__ = (
+        "endpoint", "method", "path", "status", "error", "retries", "throttled", "cache",
+        "bytes_out", "bytes_in", "connections_opened", "phases", "total", "deferred",
+        "_metrics", "_started", "_marks", "_finished"
+    )
+
+    def __init__(self, metrics: "Metrics", request: httpx.Request):
+        self.endpoint: Optional[str] = request.extensions.get("endpoint")
+        self.method = request.method
+        self.path = request.url.path
+        self.status: Optional[int] = None
+        self.error: Optional[str] = None
+        self.retries = 0
+        self.throttled = 0
+        self.cache: Optional[str] = None
+        self.bytes_out = int(request.headers.get("content-length") or 0)
+        self.bytes_in = 0
+        self.connections_opened = 0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.total = 0.0
+        # Requests sent by the dispatcher are finished there, after decoding.
+        self.deferred = self.endpoint is not None
+        self._metrics = metrics
+        self._started = time.perf_counter()
+        self._marks: Dict[str, float] = {}
+        self._finished = False
+
+    async def trace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpcore `trace` extension callback that accumulates phase timings."""
+        step, _, event = name.rpartition(".")
+        phase = _TRACE_PHASES.get(step)
+        if phase is None:
+            return
+        if event == "started":
+            self._marks[step] = time.perf_counter()
+            return
+        started = self._marks.pop(step, None)
+        if started is not None:
+            self.phases[phase] += time.perf_counter() - started
+        if step == "connection.connect_tcp" and event == "complete":
+            self.connections_opened += 1
+
+    def finish(self, decode: float = 0.0) -> None:
+        """
+        Close the record and hand it to the Metrics that created it.
+
+        Args:
+            decode: Seconds spent decoding the response body
+        """
+        if self._finished:
+            return
+        self._finished = True
+        self.phases["decode"] += decode
+        self.total = time.perf_counter() - self._started
+        network = sum(self.phases[phase] for phase in PHASES if phase not in ("queue", "decode"))
+        self.phases["queue"] = max(0.0, self.total - network - self.phases["decode"])
+        self._metrics.record(self)
+
+
+class EndpointStats:
+    """
+    Aggregated metrics for one endpoint.
+    """
+    __slots__ = (
+        "latency", "phases", "statuses", "errors", "requests", "retries", "throttled",
+        "cache_hits", "bytes_out", "bytes_in"
+    )
+
+    def __init__(self, buckets: Sequence[float]):
+        self.latency = Histogram(buckets)
+        self.phases = {phase: Histogram(buckets) for phase in PHASES}
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.cache_hits = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+
+class Metrics:
+    """
+    Per-endpoint latency histograms and counters for every request sent
+    through the shared client, plus connection pool utilization.
+
+    Enable it with `PoolConfig(metrics=Metrics())` or GHL_METRICS=1, then
+    export with `snapshot()` or `prometheus()`. Hooks added with `add_hook`
+    get a RequestTiming for each finished request:
+
+        metrics = Metrics()
+        configure_pool(PoolConfig(metrics=metrics))
+        metrics.add_hook(lambda t: t.total > 2 and logging.warning(f"slow {t.endpoint}: {t.phases}"))
+
+    Endpoints are labelled with their registry name (e.g. "contacts.search.search").
+
+    Args:
+        buckets: Histogram bucket upper bounds in seconds
+        trace_phases: Collect per-phase timings through httpcore's trace
+            extension; disable to save a few microseconds per request
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, trace_phases: bool = True):
+        self.buckets = tuple(buckets)
+        self.trace_phases = trace_phases
+        self.connections_opened = 0
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._hooks: List[Callable[[RequestTiming], Any]] = []
+        self._pools: "weakref.WeakSet[httpx.AsyncHTTPTransport]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[RequestTiming], Any]) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestTiming], Any]) -> None:
+        self._hooks.remove(hook)
+
+    def watch_pool(self, transport: httpx.AsyncHTTPTransport) -> None:
+        """Include a connection pool in the utilization gauges."""
+        self._pools.add(transport)
+
+    def _label(self, timing: RequestTiming) -> str:
+        if timing.endpoint is None:
+            from api.registry import find_endpoint
+            endpoint = find_endpoint(timing.method, timing.path)
+            timing.endpoint = endpoint.name if endpoint is not None else "other"
+        return timing.endpoint
+
+    def record(self, timing: RequestTiming) -> None:
+        """Fold a finished request into the aggregates and run the hooks."""
+        name = self._label(timing)
+        with self._lock:
+            stats = self._endpoints.get(name)
+            if stats is None:
+                stats = self._endpoints[name] = EndpointStats(self.buckets)
+            stats.requests += 1
+            stats.latency.observe(timing.total)
+            for phase, seconds in timing.phases.items():
+                if seconds:
+                    stats.phases[phase].observe(seconds)
+            if timing.status is not None:
+                stats.statuses[timing.status] = stats.statuses.get(timing.status, 0) + 1
+            if timing.error is not None:
+                stats.errors[timing.error] = stats.errors.get(timing.error, 0) + 1
+            stats.retries += timing.retries
+            stats.throttled += timing.throttled + (timing.status == 429)
+            stats.cache_hits += timing.cache == "hit"
+            stats.bytes_out += timing.bytes_out
+            stats.bytes_in += timing.bytes_in
+            self.connections_opened += timing.connections_opened
+
+        for hook in self._hooks:
+            try:
+                hook(timing)
+            except Exception as e:
+                logging.warning(f"Metrics hook {hook!r} failed: {e!r}")
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Current connection pool utilization across watched pools.
+
+        Reads httpcore internals, so it reports zeros if they change.
+        """
+        active = idle = queued = 0
+        for transport in list(self._pools):
+            try:
+                pool = transport._pool
+                for connection in pool.connections:
+                    if connection.is_idle():
+                        idle += 1
+                    elif not connection.is_closed():
+                        active += 1
+                queued += sum(1 for request in pool._requests if request.is_queued())
+            except AttributeError:
+                continue
+        return {"active": active, "idle": idle, "queued": queued}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: Plain-data copy of all metrics, e.g. for JSON logging
+        """
+        with self._lock:
+            endpoints = {
+                name: {
+                    "requests": stats.requests,
+                    "statuses": dict(stats.statuses),
+                    "errors": dict(stats.errors),
+                    "retries": stats.retries,
+                    "throttled": stats.throttled,
+                    "cache_hits": stats.cache_hits,
+                    "bytes_out": stats.bytes_out,
+                    "bytes_in": stats.bytes_in,
+                    "latency": stats.latency.to_dict(),
+                    "phases": {
+                        phase: {"count": h.count, "sum": h.sum, "mean": h.sum / h.count if h.count else 0.0}
+                        for phase, h in stats.phases.items()
+                    },
+                }
+                for name, stats in self._endpoints.items()
+            }
+            connections_opened = self.connections_opened
+        return {"endpoints": endpoints, "connections_opened": connections_opened, "pool": self.pool_stats()}
+
+    def prometheus(self, prefix: str = "ghl") -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            str: Text to serve from a /metrics endpoint
+        """
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        def histogram(metric: str, labels: str, h: Histogram) -> None:
+            for bound, count in zip(self.buckets + (float("inf"),), h.cumulative()):
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{metric}_sum{{{labels}}} {h.sum}")
+            lines.append(f"{metric}_count{{{labels}}} {h.count}")
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+
+            metric = header("request_duration_seconds", "histogram", "Request latency by endpoint")
+            for name, stats in endpoints:
+                histogram(metric, f'endpoint="{name}"', stats.latency)
+
+            metric = header("request_phase_seconds", "histogram", "Time per request phase by endpoint")
+            for name, stats in endpoints:
+                for phase, h in stats.phases.items():
+                    if h.count:
+                        histogram(metric, f'endpoint="{name}",phase="{phase}"', h)
+
+            metric = header("requests_total", "counter", "Responses by endpoint and status code")
+            for name, stats in endpoints:
+                for status, count in sorted(stats.statuses.items()):
+                    lines.append(f'{metric}{{endpoint="{name}",status="{status}"}} {count}')
+
+            metric = header("request_errors_total", "counter", "Requests that failed without a response")
+            for name, stats in endpoints:
+                for error, count in sorted(stats.errors.items()):
+                    lines.append(f'{metric}{{endpoint="{name}",error="{error}"}} {count}')
+
+            for key, help_text in (
+                ("retries", "Retries made"),
+                ("throttled", "429 responses, including retried ones"),
+                ("cache_hits", "Responses served from the response cache"),
+                ("bytes_out", "Request body bytes sent"),
+                ("bytes_in", "Response body bytes received"),
+            ):
+                metric = header(f"{key}_total", "counter", help_text)
+                for name, stats in endpoints:
+                    lines.append(f'{metric}{{endpoint="{name}"}} {getattr(stats, key)}')
+
+            metric = header("connections_opened_total", "counter", "New connections opened")
+            lines.append(f"{metric} {self.connections_opened}")
+
+        pool = self.pool_stats()
+        metric = header("pool_connections", "gauge", "Pooled connections by state")
+        lines.append(f'{metric}{{state="active"}} {pool["active"]}')
+        lines.append(f'{metric}{{state="idle"}} {pool["idle"]}')
+        metric = header("pool_queued_requests", "gauge", "Requests waiting for a pooled connection")
+        lines.append(f"{metric} {pool['queued']}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self.connections_opened = 0
+
+
+class _MeteredStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, timing: RequestTiming):
+        self.stream = stream
+        self.timing = timing
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.stream:
+            self.timing.bytes_in += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.stream.aclose()
+        finally:
+            if not self.timing.deferred:
+                self.timing.finish()
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """
+    Outermost transport wrapper that times every request and feeds Metrics.
+
+    A `trace` extension already set on the request still gets every event.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: Metrics):
+        self.transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timing = RequestTiming(self.metrics, request)
+        if self.metrics.trace_phases:
+            user_trace = request.extensions.get("trace")
+            if user_trace is None:
+                trace = timing.trace
+            else:
+                async def trace(name: str, info: Dict[str, Any]) -> None:
+                    await timing.trace(name, info)
+                    await user_trace(name, info)
+            # Copy rather than update: dispatch passes the endpoint's shared dict.
+            request.extensions = {**request.extensions, "trace": trace}
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception as e:
+            timing.error = type(e).__name__
+            timing.finish()
+            raise
+
+        timing.status = response.status_code
+        timing.retries = response.extensions.get("retries", 0)
+        timing.throttled = response.extensions.get("throttled", 0)
+        timing.cache = response.extensions.get("cache")
+        response.extensions["timing"] = timing
+        try:
+            # Cached and coalesced responses arrive already read.
+            timing.bytes_in = len(response.content)
+        except httpx.ResponseNotRead:
+            response.stream = _MeteredStream(response.stream, timing)
+        else:
+            if not timing.deferred:
+                timing.finish()
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
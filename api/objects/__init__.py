@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_custom",
+        "get",
+        "get_all",
+        "records",
+        "search_object_record",
+        "update",
+    ],
+    exports={
+        "create_custom_object": "create_custom",
+        "get_all_objects": "get_all",
+        "get_objects": "get",
+        "update_object_schema": "update",
+    },
+)
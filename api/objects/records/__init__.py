@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get_by_id",
+        "update",
+    ],
+    exports={
+        "create_record": "create",
+        "delete_record": "delete",
+        "get_record_by_id": "get_by_id",
+        "update_record": "update",
+    },
+)
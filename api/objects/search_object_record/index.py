@@ -1,9 +1,9 @@
-from typing import Dict, Any, List, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("objects.search_object_record.index")
 
 async def search_object_records(
     schema_key: str,
@@ -12,54 +12,19 @@ async def search_object_records(
 ) -> Dict[str, Any]:
     """
     Search object records in Go High Level.
-    
+
     Args:
         schema_key: Custom object key (e.g., "632c34b4c9b7da3358ac9891")
         search_data: Dictionary containing search parameters like locationId, page, 
                      pageLimit, query, searchAfter
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the search results
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
     logging.info(f"Searching object records for schema key: {schema_key}")
-    
-    try:
-        # Make the API request to search object records
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                f"{API_BASE_URL}/objects/{schema_key}/records/search",
-                headers=request_headers,
-                json=search_data
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Error searching object records: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"schemaKey": schema_key}, json=search_data)
@@ -1,9 +1,9 @@
-from typing import Dict, Any, List, Optional
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("objects.update")
 
 async def update_object_schema(
     key: str,
@@ -12,53 +12,18 @@ async def update_object_schema(
 ) -> Dict[str, Any]:
     """
     Update a custom or standard object schema in Go High Level.
-    
+
     Args:
         key: Key of the custom or standard object. For custom objects, includes 'custom_objects.' prefix.
         object_data: Dictionary containing object details like labels, description, locationId, searchableProperties.
         headers: Dictionary containing Authorization and Version headers
-        
+
     Returns:
         Dictionary containing the updated object schema data
-        
+
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    # Validate required headers
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        # Set default version if not provided
-        headers["Version"] = API_VERSION
-    
-    # Prepare request headers
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-    
     logging.info(f"Updating object schema with key: {key}")
-    
-    try:
-        # Make the API request to update object schema
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.put(
-                f"{API_BASE_URL}/objects/{key}",
-                headers=request_headers,
-                json=object_data
-            )
-            
-        # Handle the API response
-        if response.status_code != 200:
-            error_detail = response.text
-            logging.error(f"API request failed with status {response.status_code}: {error_detail}")
-            raise Exception(f"API request failed with status {response.status_code}: {error_detail}")
-            
-        return response.json()
-        
-    except Exception as e:
-        logging.error(f"Failed to update object schema: {str(e)}")
-        raise
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"key": key}, json=object_data)
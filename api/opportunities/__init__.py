@@ -0,0 +1,23 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "followers",
+        "get",
+        "search",
+        "update",
+        "update_status",
+        "upsert",
+    ],
+    exports={
+        "create_opportunity": "create",
+        "delete_opportunity": "delete",
+        "get_opportunity": "get",
+        "update_opportunity": "update",
+        "update_opportunity_status": "update_status",
+        "upsert_opportunity": "upsert",
+    },
+)
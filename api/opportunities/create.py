@@ -1,9 +1,8 @@
 from typing import Dict, Any, List
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("opportunities.create")
 
 async def create_opportunity(
     headers: Dict[str, str],
@@ -38,19 +37,6 @@ async def create_opportunity(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     data = {
         "pipelineId": pipeline_id,
         "locationId": location_id,
@@ -68,18 +54,4 @@ async def create_opportunity(
     if custom_fields:
         data["customFields"] = custom_fields
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{API_BASE_URL}/opportunities/",
-                headers=request_headers,
-                json=data
-            )
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to create opportunity: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while creating opportunity: {e}")
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, json=data)
@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "add",
+        "remove",
+    ],
+    exports={
+        "add_followers": "add",
+        "remove_opportunity_followers": "remove",
+    },
+)
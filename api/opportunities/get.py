@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("opportunities.get")
 
 async def get_opportunity(opportunity_id: str, headers: Dict[str, str]) -> Dict[str, Any]:
     """
@@ -19,18 +19,4 @@ async def get_opportunity(opportunity_id: str, headers: Dict[str, str]) -> Dict[
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the Authorization header is missing or invalid.
     """
-    url = f"{API_BASE_URL}/opportunities/{opportunity_id}"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-    
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION)
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"opportunityId": opportunity_id})
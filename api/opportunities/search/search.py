@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("opportunities.search.search")
 
 async def search_opportunities(
     headers: Dict[str, str],
@@ -27,17 +27,6 @@ async def search_opportunities(
     start_after_id: Optional[str] = None,
     status: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/opportunities/search"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-    
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-    
     params = {
         "location_id": location_id,
         "assigned_to": assigned_to,
@@ -60,10 +49,7 @@ async def search_opportunities(
         "startAfterId": start_after_id,
         "status": status
     }
-    
+
     params = {k: v for k, v in params.items() if v is not None}
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional, List
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("opportunities.update")
 
 async def update_opportunity(
     headers: Dict[str, str],
@@ -16,18 +15,6 @@ async def update_opportunity(
     assigned_to: Optional[str] = None,
     custom_fields: Optional[List[Dict[str, str]]] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/opportunities/{opportunity_id}"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-    
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     payload = {}
     if pipeline_id:
         payload["pipelineId"] = pipeline_id
@@ -43,9 +30,5 @@ async def update_opportunity(
         payload["assignedTo"] = assigned_to
     if custom_fields:
         payload["customFields"] = custom_fields
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.put(url, headers=request_headers, json=payload)
-    
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"opportunityId": opportunity_id}, json=payload)
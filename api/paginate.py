@@ -0,0 +1,457 @@
+from typing import Any, AsyncIterator, Awaitable, Deque, Dict, List, Mapping, Optional, Tuple, Union
+from collections import deque
+import asyncio
+import time
+
+from api.dispatch import dispatch
+from api.rate_limit import TokenBucket
+from api.registry import CURSOR, PAGE, Endpoint, get_endpoint
+
+# Keys list responses use for the total number of items.
+_TOTAL_KEYS = ("total", "totalCount")
+
+
+class Page:
+    """
+    One page of a paginated endpoint.
+
+    Attributes:
+        number: Index of the page in this iteration, from 0
+        items: The page's items
+        total: Total number of items, if the response says
+        cursor: Cursor parameters for the next page (CURSOR endpoints)
+        response: The whole decoded response
+    """
+    __slots__ = ("number", "items", "total", "cursor", "response")
+
+    def __init__(
+        self,
+        number: int,
+        items: List[Any],
+        total: Optional[int],
+        cursor: Optional[Dict[str, Any]],
+        response: Any
+    ):
+        self.number = number
+        self.items = items
+        self.total = total
+        self.cursor = cursor
+        self.response = response
+
+    def __repr__(self) -> str:
+        return f"Page({self.number}, items={len(self.items)}, total={self.total})"
+
+
+def _find_items(response: Mapping[str, Any]) -> Optional[Tuple[str, ...]]:
+    # The first list of objects, at the top level or one level down
+    # ({"messages": {"messages": [...]}}); otherwise the first list at all.
+    fallback = None
+    for key, value in response.items():
+        if isinstance(value, list):
+            if value and isinstance(value[0], Mapping):
+                return (key,)
+            fallback = fallback or (key,)
+    for key, value in response.items():
+        if isinstance(value, Mapping):
+            for inner, nested in value.items():
+                if isinstance(nested, list) and nested and isinstance(nested[0], Mapping):
+                    return (key, inner)
+    return fallback
+
+
+def _lookup(sources: Tuple[Mapping[str, Any], ...], name: str) -> Any:
+    for source in sources:
+        value = source.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+class _Pages:
+    """Turns responses into Pages for one endpoint and one iteration."""
+
+    def __init__(self, endpoint: Endpoint, items_key: Optional[str]):
+        self.endpoint = endpoint
+        self.path: Optional[Tuple[str, ...]] = tuple(items_key.split(".")) if items_key else None
+        # Settled once a page shows a non-empty item list.
+        self.settled = items_key is not None
+
+    def parse(self, number: int, response: Any) -> Page:
+        if isinstance(response, list):
+            return Page(number, response, None, None, response)
+        if not isinstance(response, Mapping):
+            return Page(number, [], None, None, response)
+
+        if not self.settled:
+            self.path = _find_items(response) or self.path
+        container: Mapping[str, Any] = response
+        items: Any = None
+        if self.path:
+            for key in self.path[:-1]:
+                nested = container.get(key)
+                container = nested if isinstance(nested, Mapping) else {}
+            items = container.get(self.path[-1])
+        if not isinstance(items, list):
+            items = []
+        self.settled = self.settled or bool(items)
+
+        meta = response.get("meta")
+        sources = tuple(source for source in (container, response, meta) if isinstance(source, Mapping))
+        total = None
+        for key in _TOTAL_KEYS:
+            value = _lookup(sources, key)
+            if isinstance(value, int):
+                total = value
+                break
+        return Page(number, items, total, self.next_cursor(sources, items), response)
+
+    def next_cursor(self, sources: Tuple[Mapping[str, Any], ...], items: List[Any]) -> Optional[Dict[str, Any]]:
+        if self.endpoint.pagination != CURSOR or not items:
+            return None
+        # Messages and opportunities say when there is nothing after this page.
+        for source in sources:
+            if "nextPage" in source and not source["nextPage"]:
+                return None
+
+        last = items[-1] if isinstance(items[-1], Mapping) else {}
+        cursor = {}
+        for name in self.endpoint.cursor:
+            value = _lookup(sources + (last,), name)
+            if value is None and last.get("sort") is not None:
+                # Search endpoints expect the sort key of the last document.
+                value = last["sort"]
+                if self.endpoint.method == "GET" and isinstance(value, list) and len(value) == 1:
+                    value = value[0]
+            if value is not None:
+                cursor[name] = value
+        return cursor if self.endpoint.cursor and self.endpoint.cursor[0] in cursor else None
+
+
+def _resolve(endpoint: Union[str, Endpoint]) -> Endpoint:
+    endpoint = get_endpoint(endpoint) if isinstance(endpoint, str) else endpoint
+    if endpoint.pagination is None:
+        raise ValueError(f"{endpoint.name} is not a paginated endpoint")
+    return endpoint
+
+
+class _Query:
+    """The fixed part of a paginated request, and where each page starts."""
+
+    def __init__(
+        self,
+        endpoint: Endpoint,
+        headers: Optional[Mapping[str, str]],
+        token: Optional[str],
+        path: Optional[Mapping[str, Any]],
+        params: Optional[Mapping[str, Any]],
+        json: Optional[Mapping[str, Any]],
+        limit: int,
+        start: Optional[int]
+    ):
+        self.endpoint = endpoint
+        self.headers = headers
+        self.token = token
+        self.path = path
+        self.params = params
+        self.json = json
+        self.limit = limit
+        fields = endpoint.query if endpoint.method == "GET" else endpoint.body
+        self.limit_param = "pageLimit" if "pageLimit" in fields else "limit"
+        self.style = endpoint.pagination
+        self.first = start if start is not None else (1 if self.style == PAGE else 0)
+
+    async def fetch(self, paging: Mapping[str, Any]) -> Any:
+        endpoint = self.endpoint
+        paging = {self.limit_param: self.limit, **paging}
+        if endpoint.method == "GET":
+            params = {**(self.params or {}), **paging}
+            return await dispatch(endpoint, self.headers, token=self.token, path=self.path, params=params)
+        json = {**(self.json or {}), **paging}
+        return await dispatch(endpoint, self.headers, token=self.token, path=self.path, params=self.params, json=json)
+
+    def fetch_page(self, number: int) -> Awaitable[Any]:
+        return self.fetch({self.style: self.position(number)})
+
+    def position(self, number: int) -> int:
+        return self.first + number if self.style == PAGE else self.first + number * self.limit
+
+    def skipped(self, number: int) -> int:
+        """Items before page `number`, to compare with the total."""
+        return (self.position(number) - 1) * self.limit if self.style == PAGE else self.position(number)
+
+    def is_last(self, page: Page, total: Optional[int]) -> bool:
+        return len(page.items) < self.limit or (total is not None and self.skipped(page.number) + len(page.items) >= total)
+
+
+async def pages(
+    endpoint: Union[str, Endpoint],
+    headers: Optional[Mapping[str, str]] = None,
+    *,
+    token: Optional[str] = None,
+    path: Optional[Mapping[str, Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    json: Optional[Mapping[str, Any]] = None,
+    limit: int = 100,
+    start: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    prefetch: int = 1,
+    items_key: Optional[str] = None
+) -> AsyncIterator[Page]:
+    """
+    Iterate over the pages of a list endpoint, using the pagination style
+    declared for it in the registry (offset, skip, page or cursor).
+
+    The next page is requested as soon as it is known, before the current one
+    is yielded, so fetching overlaps with the caller's work on the page.
+    Offset, skip and page endpoints can have up to `prefetch` pages in flight;
+    cursor endpoints only know the next cursor once a page has arrived, so
+    they fetch one page ahead. Iteration stops on an empty or short page, once
+    the reported total is reached, or when there is no next cursor.
+
+    Keep `limit` at or below the endpoint's maximum page size (100 for most
+    endpoints): a page shorter than `limit` is taken to be the last one.
+
+    Args:
+        endpoint: Endpoint name or Endpoint
+        headers: Caller headers, as for `dispatch`
+        token: Bearer token, as an alternative to `headers`
+        path: Values for the path template placeholders
+        params: Query parameters other than the paging ones
+        json: Body fields other than the paging ones, for POST search endpoints
+        limit: Page size
+        start: First offset/skip/page number; defaults to 0, or 1 for page numbers
+        max_pages: Stop after this many pages
+        prefetch: Pages to keep in flight ahead of the caller
+        items_key: Response key of the item list, dotted for nested keys;
+            found automatically when not given
+
+    Yields:
+        Page: Each page in order
+    """
+    endpoint = _resolve(endpoint)
+    parser = _Pages(endpoint, items_key)
+    query = _Query(endpoint, headers, token, path, params, json, limit, start)
+
+    if endpoint.pagination == CURSOR:
+        async for page in _cursor_pages(parser, query, max_pages):
+            yield page
+        return
+
+    pending: Deque[asyncio.Future] = deque()
+    scheduled = 0
+    total: Optional[int] = None
+
+    def schedule(window: int) -> None:
+        nonlocal scheduled
+        while len(pending) < window:
+            if max_pages is not None and scheduled >= max_pages:
+                return
+            if total is not None and query.skipped(scheduled) >= total:
+                return
+            pending.append(asyncio.ensure_future(query.fetch_page(scheduled)))
+            scheduled += 1
+
+    try:
+        # Only the first page until we know there is more than one.
+        schedule(1)
+        number = 0
+        while pending:
+            page = parser.parse(number, await pending.popleft())
+            if page.total is not None:
+                total = page.total
+            if query.is_last(page, total):
+                yield page
+                return
+            schedule(max(1, prefetch))
+            yield page
+            number += 1
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _cursor_pages(parser: _Pages, query: _Query, max_pages: Optional[int]) -> AsyncIterator[Page]:
+    task: Optional[asyncio.Future] = asyncio.ensure_future(query.fetch({}))
+    previous: Optional[Dict[str, Any]] = None
+    number = seen = 0
+    try:
+        while task is not None:
+            page = parser.parse(number, await task)
+            task = None
+            number += 1
+            seen += len(page.items)
+            more = page.cursor and page.cursor != previous and (page.total is None or seen < page.total)
+            if more and (max_pages is None or number < max_pages):
+                previous = page.cursor
+                task = asyncio.ensure_future(query.fetch(page.cursor))
+            yield page
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+async def fan_out(
+    endpoint: Union[str, Endpoint],
+    headers: Optional[Mapping[str, str]] = None,
+    *,
+    token: Optional[str] = None,
+    path: Optional[Mapping[str, Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    json: Optional[Mapping[str, Any]] = None,
+    limit: int = 100,
+    start: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    concurrency: int = 8,
+    rate: Optional[float] = None,
+    ordered: bool = True,
+    items_key: Optional[str] = None
+) -> AsyncIterator[Page]:
+    """
+    Fetch the pages of an offset, skip or page endpoint concurrently.
+
+    The first page is read on its own; once it reports the total, every
+    remaining page is requested with at most `concurrency` in flight and at
+    most `rate` requests started per second. Pages past the total seen on the
+    first page are not fetched, so items added during the export are missed.
+    Without a total (or for cursor endpoints) this falls back to `pages()`.
+
+    The shared client's per-location rate limiter still applies underneath;
+    `rate` is for leaving headroom for other work against the same location.
+
+    Args:
+        endpoint: Endpoint name or Endpoint
+        headers: Caller headers, as for `dispatch`
+        token: Bearer token, as an alternative to `headers`
+        path: Values for the path template placeholders
+        params: Query parameters other than the paging ones
+        json: Body fields other than the paging ones, for POST search endpoints
+        limit: Page size
+        start: First offset/skip/page number; defaults to 0, or 1 for page numbers
+        max_pages: Stop after this many pages
+        concurrency: Maximum requests in flight
+        rate: Maximum requests started per second; unlimited if None
+        ordered: Yield pages in order; otherwise as each one completes
+        items_key: Response key of the item list, as for `pages`
+
+    Yields:
+        Page: Each page, with `number` giving its position
+    """
+    endpoint = _resolve(endpoint)
+    kwargs = dict(token=token, path=path, params=params, json=json, limit=limit, items_key=items_key)
+    if endpoint.pagination == CURSOR:
+        async for page in pages(endpoint, headers, start=start, max_pages=max_pages, **kwargs):
+            yield page
+        return
+
+    parser = _Pages(endpoint, items_key)
+    query = _Query(endpoint, headers, token, path, params, json, limit, start)
+    first = parser.parse(0, await query.fetch_page(0))
+    yield first
+    if query.is_last(first, first.total) or max_pages == 1:
+        return
+
+    if first.total is None:
+        rest = pages(
+            endpoint, headers, start=query.position(1),
+            max_pages=max_pages - 1 if max_pages is not None else None, **kwargs
+        )
+        async for page in rest:
+            page.number += 1
+            yield page
+        return
+
+    count = -(-(first.total - query.skipped(0)) // limit)
+    if max_pages is not None:
+        count = min(count, max_pages)
+    numbers = iter(range(1, count))
+    bucket = TokenBucket(1, rate) if rate else None
+
+    async def fetch(number: int) -> Page:
+        if bucket is not None:
+            await asyncio.sleep(bucket.reserve(time.monotonic()))
+        return parser.parse(number, await query.fetch_page(number))
+
+    in_flight: Deque[asyncio.Future] = deque()
+
+    def refill() -> None:
+        while len(in_flight) < concurrency:
+            number = next(numbers, None)
+            if number is None:
+                return
+            in_flight.append(asyncio.ensure_future(fetch(number)))
+
+    try:
+        refill()
+        while in_flight:
+            if ordered:
+                task = in_flight.popleft()
+                page = await task
+            else:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                task = done.pop()
+                in_flight.remove(task)
+                page = task.result()
+            refill()
+            yield page
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+async def paginate(
+    endpoint: Union[str, Endpoint],
+    headers: Optional[Mapping[str, str]] = None,
+    *,
+    max_items: Optional[int] = None,
+    parallel: bool = False,
+    **kwargs
+) -> AsyncIterator[Any]:
+    """
+    Iterate over every item of a list endpoint across all its pages:
+
+        async for invoice in paginate("invoices.list", headers, params={"altId": location_id, "altType": "location"}):
+            ...
+
+    To stop early without leaving a prefetched request running, break out
+    inside `contextlib.aclosing(paginate(...))` or pass `max_items`.
+
+    Args:
+        endpoint: Endpoint name or Endpoint
+        headers: Caller headers, as for `dispatch`
+        max_items: Stop after this many items
+        parallel: Fetch pages concurrently with `fan_out` instead of `pages`
+        **kwargs: Passed on to `pages` or `fan_out`
+
+    Yields:
+        Each item, in order
+    """
+    seen = 0
+    iterator = (fan_out if parallel else pages)(endpoint, headers, **kwargs)
+    try:
+        async for page in iterator:
+            for item in page.items:
+                yield item
+                seen += 1
+                if max_items is not None and seen >= max_items:
+                    return
+    finally:
+        await iterator.aclose()
+
+
+async def collect(
+    endpoint: Union[str, Endpoint],
+    headers: Optional[Mapping[str, str]] = None,
+    **kwargs
+) -> List[Any]:
+    """
+    Fetch every item of a list endpoint into a list.
+
+    Args:
+        endpoint: Endpoint name or Endpoint
+        headers: Caller headers, as for `dispatch`
+        **kwargs: Passed on to `paginate`
+
+    Returns:
+        List[Any]: All items, in order
+    """
+    return [item async for item in paginate(endpoint, headers, **kwargs)]
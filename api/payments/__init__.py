@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "custom_provider",
+        "integrations",
+        "order_fufillment",
+        "orders",
+        "subscriptions",
+        "transactions",
+    ],
+)
@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "create_config",
+        "delete",
+        "disconnect",
+        "fetch",
+    ],
+    exports={
+        "create_custom_provider": "create",
+        "create_custom_provider_config": "create_config",
+        "delete_custom_provider": "delete",
+        "disconnect_custom_provider": "disconnect",
+        "fetch_custom_provider": "fetch",
+    },
+)
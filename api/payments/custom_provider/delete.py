@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.custom_provider.delete")
 
 async def delete_custom_provider(headers: Dict[str, str], location_id: str) -> Dict[str, Any]:
     """
@@ -19,22 +19,8 @@ async def delete_custom_provider(headers: Dict[str, str], location_id: str) -> D
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the Authorization header is missing or invalid.
     """
-    url = f"{API_BASE_URL}/payments/custom-provider/provider"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
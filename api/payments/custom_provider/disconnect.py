@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.custom_provider.disconnect")
 
 async def disconnect_custom_provider(headers: Dict[str, str], location_id: str, live_mode: bool) -> Dict[str, Any]:
     """
@@ -20,18 +20,6 @@ async def disconnect_custom_provider(headers: Dict[str, str], location_id: str,
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the Authorization header is missing or invalid.
     """
-    url = f"{API_BASE_URL}/payments/custom-provider/disconnect"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": API_VERSION,
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     params = {
         "locationId": location_id
     }
@@ -40,7 +28,4 @@ async def disconnect_custom_provider(headers: Dict[str, str], location_id: str,
         "liveMode": live_mode
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, params=params, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params, json=data)
@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_white_label",
+        "list",
+    ],
+    exports={
+        "create_white_label_integration_provider": "create_white_label",
+        "list_white_label_integration_providers": "list",
+    },
+)
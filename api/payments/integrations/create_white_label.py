@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.integrations.create_white_label")
 
 async def create_white_label_integration_provider(
     access_token: str,
@@ -33,15 +33,6 @@ async def create_white_label_integration_provider(
     Raises:
         httpx.HTTPStatusError: If the API request fails.
     """
-    url = f"{API_BASE_URL}/payments/integrations/provider/whitelabel"
-
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION,
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -52,7 +43,4 @@ async def create_white_label_integration_provider(
         "imageUrl": image_url
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, json=payload)
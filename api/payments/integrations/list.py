@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.integrations.list")
 
 async def list_white_label_integration_providers(
     access_token: str,
@@ -27,26 +27,14 @@ async def list_white_label_integration_providers(
     Raises:
         httpx.HTTPStatusError: If the API request fails.
     """
-    url = f"{API_BASE_URL}/payments/integrations/provider/whitelabel"
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION,
-        "Accept": "application/json"
-    }
-    
     params = {
         "altId": alt_id,
         "altType": alt_type
     }
-    
+
     if limit is not None:
         params["limit"] = limit
     if offset is not None:
         params["offset"] = offset
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        
-    return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, token=access_token, params=params)
@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "list_fufillment",
+    ],
+    exports={
+        "create_order_fulfillment": "create",
+        "list_fulfillment": "list_fufillment",
+    },
+)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, List
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.order_fufillment.create")
 
 async def create_order_fulfillment(
     order_id: str,
@@ -13,15 +13,6 @@ async def create_order_fulfillment(
     items: List[Dict[str, Any]],
     notify_customer: bool
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/payments/orders/{order_id}/fulfillments"
-
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-        "Version": API_VERSION
-    }
-
     payload = {
         "altId": alt_id,
         "altType": alt_type,
@@ -30,7 +21,4 @@ async def create_order_fulfillment(
         "notifyCustomer": notify_customer
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, path={"orderId": order_id}, json=payload)
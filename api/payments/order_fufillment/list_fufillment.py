@@ -1,8 +1,8 @@
-from typing import Dict, Any, Optional
-import httpx
+from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.order_fufillment.list_fufillment")
 
 async def list_fulfillment(
     order_id: str,
@@ -25,20 +25,9 @@ async def list_fulfillment(
     Raises:
         httpx.HTTPStatusError: If the API request fails
     """
-    url = f"{API_BASE_URL}/payments/orders/{order_id}/fulfillments"
-
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION
-    }
-
     params = {
         "altId": alt_id,
         "altType": alt_type
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, path={"orderId": order_id}, params=params)
@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get_by_id",
+        "list",
+    ],
+    exports={
+        "get_order_by_id": "get_by_id",
+        "list_orders": "list",
+    },
+)
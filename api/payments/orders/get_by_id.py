@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.orders.get_by_id")
 
 async def get_order_by_id(
     order_id: str,
@@ -30,14 +29,6 @@ async def get_order_by_id(
     Raises:
         httpx.HTTPStatusError: If the API request fails
     """
-    url = f"{API_BASE_URL}/payments/orders/{order_id}"
-
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION
-    }
-
     params = {
         "altId": alt_id,
         "altType": alt_type
@@ -46,14 +37,4 @@ async def get_order_by_id(
     if location_id:
         params["locationId"] = location_id
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, path={"orderId": order_id}, params=params)
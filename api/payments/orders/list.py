@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.orders.list")
 
 async def list_orders(
     access_token: str,
@@ -19,14 +19,6 @@ async def list_orders(
     start_at: Optional[str] = None,
     status: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/payments/orders"
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION,
-        "Accept": "application/json"
-    }
-    
     params = {
         "altId": alt_id,
         "altType": alt_type,
@@ -41,8 +33,5 @@ async def list_orders(
         "startAt": start_at,
         "status": status
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, token=access_token, params=params)
@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.subscriptions.get")
 
 async def get_subscription(
     subscription_id: str,
@@ -27,20 +27,14 @@ async def get_subscription(
     Raises:
         httpx.HTTPStatusError: If the API request fails.
     """
-    url = f"{API_BASE_URL}/payments/subscriptions/{subscription_id}"
-    
     params = {
         "altId": alt_id,
         "altType": alt_type
     }
-    
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION,
-        "Accept": "application/json"
-    }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        token=access_token,
+        path={"subscriptionId": subscription_id},
+        params=params
+    )
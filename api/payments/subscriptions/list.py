@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.subscriptions.list")
 
 async def list_subscriptions(
     access_token: str,
@@ -43,14 +43,6 @@ async def list_subscriptions(
     Raises:
         httpx.HTTPStatusError: If the API request fails
     """
-    url = f"{API_BASE_URL}/payments/subscriptions"
-
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION,
-        "Accept": "application/json"
-    }
-
     params = {
         "altId": alt_id,
         "altType": alt_type,
@@ -66,7 +58,4 @@ async def list_subscriptions(
         "startAt": start_at
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, params=params)
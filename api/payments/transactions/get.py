@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.transactions.get")
 
 async def get_transaction_by_id(
     transaction_id: str,
@@ -29,14 +29,6 @@ async def get_transaction_by_id(
     Raises:
         httpx.HTTPStatusError: If the API request fails
     """
-    url = f"{API_BASE_URL}/payments/transactions/{transaction_id}"
-
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION
-    }
-
     params = {
         "altId": alt_id,
         "altType": alt_type
@@ -45,7 +37,4 @@ async def get_transaction_by_id(
     if location_id:
         params["locationId"] = location_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, path={"transactionId": transaction_id}, params=params)
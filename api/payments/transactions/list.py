@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("payments.transactions.list")
 
 async def list_transactions(
     access_token: str,
@@ -46,14 +46,6 @@ async def list_transactions(
     Returns:
         Dict[str, Any]: A dictionary containing the list of transactions and total count.
     """
-    url = f"{API_BASE_URL}/payments/transactions"
-
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION,
-        "Accept": "application/json"
-    }
-
     params = {
         "altId": alt_id,
         "altType": alt_type,
@@ -74,7 +66,4 @@ async def list_transactions(
     # Remove None values from params
     params = {k: v for k, v in params.items() if v is not None}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, params=params)
@@ -0,0 +1,20 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "list",
+        "prices",
+        "update",
+    ],
+    exports={
+        "create_product": "create",
+        "delete_product": "delete",
+        "get_product_by_id": "get",
+        "list_products": "list",
+        "update_product": "update",
+    },
+)
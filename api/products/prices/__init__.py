@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "list",
+        "update",
+    ],
+    exports={
+        "create_price_for_product": "create",
+        "delete_product_price": "delete",
+        "get_price_by_id": "get",
+        "list_product_prices": "list",
+        "update_product_price": "update",
+    },
+)
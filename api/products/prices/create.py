@@ -1,6 +1,8 @@
-import aiohttp
-import json
 from typing import Dict, Any, Optional
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("products.prices.create")
 
 async def create_price_for_product(
     product_id: str,
@@ -24,18 +26,6 @@ async def create_price_for_product(
     available_quantity: Optional[int] = None,
     allow_out_of_stock_purchases: Optional[bool] = None
 ) -> Dict[str, Any]:
-    url = f"https://services.leadconnectorhq.com/products/{product_id}/price"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-    
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", "2021-07-28"),
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
-    
     payload = {
         "name": name,
         "type": price_type,
@@ -62,9 +52,4 @@ async def create_price_for_product(
 
     payload.update({k: v for k, v in optional_fields.items() if v is not None})
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=request_headers, json=payload) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                response.raise_for_status()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"productId": product_id}, json=payload)
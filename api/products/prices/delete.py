@@ -1,9 +1,8 @@
-from typing import Dict, Any
-import httpx
-import logging
+from typing import Dict
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("products.prices.delete")
 
 async def delete_product_price(
     product_id: str,
@@ -26,32 +25,13 @@ async def delete_product_price(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    url = f"{API_BASE_URL}/products/{product_id}/price/{price_id}"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id
     }
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=request_headers, params=params)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to delete product price: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while deleting product price: {e}")
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"productId": product_id, "priceId": price_id},
+        params=params
+    )
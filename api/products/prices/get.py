@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("products.prices.get")
 
 async def get_price_by_id(
     headers: Dict[str, str],
@@ -26,25 +26,13 @@ async def get_price_by_id(
         httpx.HTTPStatusError: If the API request fails
         Exception: If required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    url = f"{API_BASE_URL}/products/{product_id}/price/{price_id}"
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"]
-    }
-
     params = {
         "locationId": location_id
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"productId": product_id, "priceId": price_id},
+        params=params
+    )
@@ -0,0 +1,227 @@
+from typing import Callable, Dict, Optional
+from collections import OrderedDict
+from urllib.parse import parse_qs
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+import httpx
+
+# GHL allows 100 requests per 10 seconds and 200,000 requests per day for
+# each app per location (or company).
+DEFAULT_BURST = 100
+DEFAULT_INTERVAL = 10.0
+DEFAULT_DAILY_LIMIT = 200_000
+
+RESOURCE_PARAMS = ("locationId", "companyId", "altId")
+RESOURCE_PATH_SEGMENTS = ("locations", "companies")
+
+
+class TokenBucket:
+    """
+    Token bucket that lets callers reserve capacity ahead of time.
+
+    Tokens may go negative: each caller takes its token immediately and then
+    waits until the refill would have covered it, so queued callers are
+    served in arrival order without holding a lock across the wait.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token.
+
+        Returns:
+            float: Seconds the caller must wait before using the token
+        """
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_per_second
+
+    def sync(self, now: float, remaining: float, capacity: Optional[float] = None,
+             refill_per_second: Optional[float] = None) -> None:
+        """
+        Re-sync with the server's view of the remaining quota.
+
+        Only ever lowers the local token count, so a stale or out-of-order
+        response can't let a burst through.
+        """
+        self._refill(now)
+        if capacity is not None:
+            self.capacity = capacity
+        if refill_per_second is not None:
+            self.refill_per_second = refill_per_second
+        self.tokens = min(self.tokens, remaining)
+
+    @property
+    def idle(self) -> bool:
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity
+
+
+def default_rate_limit_key(request: httpx.Request) -> str:
+    """
+    Work out which location or company a request is billed against.
+
+    Looks at the locationId/companyId/altId query parameters, then at
+    /locations/{id} or /companies/{id} path segments, and finally falls back
+    to a hash of the bearer token, which GHL scopes to a single location or
+    company.
+
+    Args:
+        request: Outgoing request
+
+    Returns:
+        str: Bucket key
+    """
+    if request.url.query:
+        query = parse_qs(request.url.query.decode())
+        for name in RESOURCE_PARAMS:
+            if query.get(name):
+                return query[name][0]
+
+    segments = request.url.path.strip("/").split("/")
+    for i, segment in enumerate(segments[:-1]):
+        if segment in RESOURCE_PATH_SEGMENTS and segments[i + 1]:
+            return segments[i + 1]
+
+    return token_rate_limit_key(request)
+
+
+def token_rate_limit_key(request: httpx.Request) -> str:
+    """Bucket key for a request that names no location or company: a hash of its bearer token."""
+    authorization = request.headers.get("Authorization", "")
+    return "token:" + hashlib.sha1(authorization.encode()).hexdigest()[:16]
+
+
+class RateLimiter:
+    """
+    Client-side scheduler that keeps one burst bucket and one daily bucket
+    per location/company key.
+
+    Requests over the limit are delayed rather than rejected. Buckets are
+    re-synced from the X-RateLimit-* response headers and kept in an LRU
+    bounded by `max_keys`.
+    """
+
+    def __init__(
+        self,
+        burst: int = DEFAULT_BURST,
+        interval: float = DEFAULT_INTERVAL,
+        daily_limit: int = DEFAULT_DAILY_LIMIT,
+        max_keys: int = 10_000,
+        key_func: Callable[[httpx.Request], str] = default_rate_limit_key
+    ):
+        self.burst = burst
+        self.interval = interval
+        self.daily_limit = daily_limit
+        self.max_keys = max_keys
+        self.key_func = key_func
+        self._buckets: "OrderedDict[str, Dict[str, TokenBucket]]" = OrderedDict()
+        # Bookkeeping never awaits, so a plain lock is enough and it works the
+        # same whichever event loop or thread the request comes from.
+        self._lock = threading.Lock()
+
+    def _get_buckets(self, key: str) -> Dict[str, TokenBucket]:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = {
+                "burst": TokenBucket(self.burst, self.burst / self.interval),
+                "daily": TokenBucket(self.daily_limit, self.daily_limit / 86400.0)
+            }
+            self._buckets[key] = buckets
+            if len(self._buckets) > self.max_keys:
+                self._evict()
+        else:
+            self._buckets.move_to_end(key)
+        return buckets
+
+    def _evict(self) -> None:
+        # Drop the least recently used buckets that are back at full capacity;
+        # evicting one that is still draining would forget its debt.
+        for key in list(self._buckets):
+            if len(self._buckets) <= self.max_keys:
+                break
+            if all(bucket.idle for bucket in self._buckets[key].values()):
+                del self._buckets[key]
+
+    async def acquire(self, key: str) -> None:
+        """
+        Wait until a request for `key` may be sent.
+
+        Args:
+            key: Location/company key
+        """
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._get_buckets(key)
+            delay = max(bucket.reserve(now) for bucket in buckets.values())
+        if delay > 0:
+            logging.debug(f"Rate limit reached for {key}, waiting {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def update(self, key: str, response: httpx.Response) -> None:
+        """
+        Re-sync the buckets for `key` from the rate-limit headers on `response`.
+
+        Args:
+            key: Location/company key
+            response: Response received for that key
+        """
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        daily_remaining = headers.get("X-RateLimit-Daily-Remaining")
+        if remaining is None and daily_remaining is None and response.status_code != 429:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._get_buckets(key)
+            try:
+                if remaining is not None:
+                    capacity = float(headers.get("X-RateLimit-Max", buckets["burst"].capacity))
+                    interval_ms = headers.get("X-RateLimit-Interval-Milliseconds")
+                    refill = capacity / (float(interval_ms) / 1000) if interval_ms else None
+                    buckets["burst"].sync(now, float(remaining), capacity, refill)
+                if daily_remaining is not None:
+                    daily_capacity = headers.get("X-RateLimit-Limit-Daily")
+                    buckets["daily"].sync(
+                        now, float(daily_remaining),
+                        float(daily_capacity) if daily_capacity else None
+                    )
+            except ValueError:
+                logging.warning(f"Ignoring malformed rate limit headers for {key}")
+            if response.status_code == 429:
+                buckets["burst"].sync(now, 0)
+
+
+class RateLimitTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that schedules every request through a RateLimiter.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.limiter.key_func(request)
+        await self.limiter.acquire(key)
+        response = await self.transport.handle_async_request(request)
+        self.limiter.update(key, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
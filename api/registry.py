@@ -0,0 +1,171 @@
+from typing import Any, Dict, Iterable, Mapping, Optional, Pattern, Tuple, Union
+from urllib.parse import quote
+import os
+import re
+
+# GHL_API_BASE_URL points every endpoint at another host, e.g. a mock server.
+API_BASE_URL = os.getenv("GHL_API_BASE_URL", "https://services.leadconnectorhq.com").rstrip("/")
+DEFAULT_API_VERSION = "2021-07-28"
+
+# Pagination styles used by the list endpoints.
+OFFSET = "offset"   # offset/limit
+SKIP = "skip"       # skip/limit
+PAGE = "page"       # page/limit
+CURSOR = "cursor"   # startAfter/startAfterId, lastMessageId, lastDoc, searchAfter
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+class Endpoint:
+    """
+    Declarative description of one Go High Level API endpoint.
+
+    Args:
+        name: Dotted name matching the module path under `api/` (e.g. "contacts.get")
+        method: HTTP method
+        path: Path template, with `{name}` placeholders for path parameters
+        version: Default value for the Version header
+        pinned: Always send `version`, ignoring any Version the caller passes,
+            for endpoints that only work with that version
+        query: Names of the query parameters the endpoint accepts
+        body: Names of the top-level body fields the endpoint accepts
+        pagination: One of OFFSET, SKIP, PAGE or CURSOR for list endpoints
+        cursor: Query/body parameter that carries the cursor for CURSOR pagination,
+            or several when the API takes a compound cursor (startAfterId, startAfter)
+        idempotent: Override whether the request is safe to retry; None uses the method
+        response: How to decode the response: "json", "bytes" or "text"
+        timeout: Request timeout in seconds
+    """
+
+    __slots__ = (
+        "name", "method", "path", "version", "pinned", "query", "body", "pagination", "cursor",
+        "idempotent", "response", "timeout", "static_headers", "extensions", "_formatter", "_pattern"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        path: str,
+        version: str = DEFAULT_API_VERSION,
+        pinned: bool = False,
+        query: Iterable[str] = (),
+        body: Iterable[str] = (),
+        pagination: Optional[str] = None,
+        cursor: Union[str, Tuple[str, ...], None] = None,
+        idempotent: Optional[bool] = None,
+        response: str = "json",
+        timeout: float = 30.0
+    ):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.version = version
+        self.pinned = pinned
+        self.query = tuple(query)
+        self.body = tuple(body)
+        self.pagination = pagination
+        self.cursor: Tuple[str, ...] = (cursor,) if isinstance(cursor, str) else tuple(cursor or ())
+        self.idempotent = idempotent
+        self.response = response
+        self.timeout = timeout
+
+        # Everything that doesn't depend on the caller is built once here.
+        accept = "application/json" if response == "json" else "*/*"
+        self.static_headers: Tuple[Tuple[str, str], ...] = (("Accept", accept),)
+        self.extensions: Dict[str, Any] = {"endpoint": name}
+        if idempotent is not None:
+            self.extensions["retry"] = idempotent
+        self._formatter = API_BASE_URL + path if not _PLACEHOLDER.search(path) else None
+        self._pattern: Optional[Pattern[str]] = None
+
+    def url(self, path_params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Build the full URL, percent-encoding each path parameter.
+
+        Args:
+            path_params: Values for the placeholders in the path template
+
+        Returns:
+            str: Absolute request URL
+        """
+        if self._formatter is not None:
+            return self._formatter
+        try:
+            return API_BASE_URL + _PLACEHOLDER.sub(
+                lambda m: quote(str(path_params[m.group(1)]), safe=""), self.path
+            )
+        except (KeyError, TypeError):
+            missing = [name for name in _PLACEHOLDER.findall(self.path) if name not in (path_params or {})]
+            raise ValueError(f"Missing path parameters for {self.name}: {', '.join(missing)}") from None
+
+    def matches(self, method: str, path: str) -> bool:
+        """
+        Check whether a concrete request path belongs to this endpoint.
+        """
+        if method != self.method:
+            return False
+        if self._pattern is None:
+            parts = _PLACEHOLDER.split(self.path.rstrip("/"))
+            # split() puts the placeholder names at the odd indexes.
+            self._pattern = re.compile(
+                "^" + "".join(re.escape(part) if i % 2 == 0 else "[^/]+" for i, part in enumerate(parts)) + "/?$"
+            )
+        return self._pattern.match(path) is not None
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.name!r}, {self.method!r}, {self.path!r})"
+
+
+def get_endpoint(name: str) -> Endpoint:
+    """
+    Look up an endpoint by name.
+
+    Args:
+        name: Dotted endpoint name, e.g. "invoices.list"
+
+    Returns:
+        Endpoint: The registered endpoint
+    """
+    from api.endpoints import ENDPOINTS
+    try:
+        return ENDPOINTS[name]
+    except KeyError:
+        raise KeyError(f"Unknown endpoint: {name}") from None
+
+
+_index: Optional[Dict[Tuple[str, str], Tuple[Endpoint, ...]]] = None
+
+
+def _first_segment(path: str) -> str:
+    return path.lstrip("/").split("/", 1)[0]
+
+
+def find_endpoint(method: str, path: str) -> Optional[Endpoint]:
+    """
+    Find the registered endpoint for a concrete method and request path.
+
+    Literal path segments win over placeholders, so "/users/search" matches
+    the search endpoint rather than "/users/{userId}".
+
+    Args:
+        method: HTTP method
+        path: Request path, e.g. "/contacts/abc123"
+
+    Returns:
+        Optional[Endpoint]: The matching endpoint, or None
+    """
+    global _index
+    if _index is None:
+        from api.endpoints import ENDPOINTS
+        index: Dict[Tuple[str, str], list] = {}
+        for endpoint in ENDPOINTS.values():
+            index.setdefault((endpoint.method, _first_segment(endpoint.path)), []).append(endpoint)
+        _index = {
+            key: tuple(sorted(endpoints, key=lambda e: len(_PLACEHOLDER.findall(e.path))))
+            for key, endpoints in index.items()
+        }
+    for endpoint in _index.get((method, _first_segment(path)), ()):
+        if endpoint.matches(method, path):
+            return endpoint
+    return None
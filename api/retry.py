@@ -0,0 +1,193 @@
+from typing import Iterable, Optional
+from email.utils import parsedate_to_datetime
+import asyncio
+import datetime
+import logging
+import random
+import re
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# POST endpoints that only read data and are safe to send twice.
+SAFE_POST_PATTERNS = (
+    r"/search/?$",
+    r"/contacts/search/duplicate/?$",
+    r"/objects/[^/]+/records/search/?$",
+)
+
+# Errors raised before the request could reach the server.
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Errors where the server may or may not have acted on the request.
+TRANSIENT_ERRORS = (httpx.ReadTimeout, httpx.ReadError, httpx.WriteError, httpx.RemoteProtocolError)
+
+
+class RetryPolicy:
+    """
+    Decides which requests are retried and how long to wait between attempts.
+
+    Only idempotent methods are retried after the request may have reached
+    the server, plus POSTs whose path matches `safe_post_patterns`. A single
+    request can opt in or out with `extensions={"retry": True/False}`.
+    Connection failures and 429s are retried for any method, since the
+    request was never processed. Waits honor Retry-After and otherwise use
+    capped exponential backoff with full jitter.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_retry_after: float = 120.0,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        safe_post_patterns: Iterable[str] = SAFE_POST_PATTERNS
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.safe_post_patterns = [re.compile(pattern) for pattern in safe_post_patterns]
+
+    def is_idempotent(self, request: httpx.Request) -> bool:
+        """
+        Check whether `request` can safely be sent more than once.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            bool: True if the request may be retried after reaching the server
+        """
+        override = request.extensions.get("retry")
+        if override is not None:
+            return bool(override)
+        if request.method in IDEMPOTENT_METHODS:
+            return True
+        if request.method == "POST":
+            return any(pattern.search(request.url.path) for pattern in self.safe_post_patterns)
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt (1-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    def retry_after(self, response: httpx.Response) -> Optional[float]:
+        """
+        Parse the Retry-After header as seconds or an HTTP date.
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the header is missing or invalid
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def delay_for(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        """
+        How long to wait before retry `attempt`, or None to give up.
+        """
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                return retry_after + random.uniform(0, self.backoff_base)
+        return self.backoff(attempt)
+
+
+def _is_replayable(request: httpx.Request) -> bool:
+    # Streamed uploads can only be read once, unless they can reopen their source.
+    return isinstance(request.stream, httpx.ByteStream) or getattr(request.stream, "replayable", False)
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that retries transient failures according to a RetryPolicy.
+
+    When retries run out the last response (or error) is passed through
+    unchanged, so endpoint error handling behaves as before. The number of
+    retries made is recorded in `response.extensions["retries"]`, and how
+    many of them followed a 429 in `response.extensions["throttled"]`.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy):
+        self.transport = transport
+        self.policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        policy = self.policy
+        idempotent = policy.is_idempotent(request) and _is_replayable(request)
+        attempt = 0
+        throttled = 0
+
+        while True:
+            try:
+                response = await self.transport.handle_async_request(request)
+            except CONNECT_ERRORS as e:
+                if not _is_replayable(request):
+                    raise
+                delay = self._next_delay(attempt + 1)
+                if delay is None:
+                    raise
+                logging.warning(
+                    f"{request.method} {request.url.path} failed to connect ({e!r}), retrying in {delay:.2f}s"
+                )
+            except TRANSIENT_ERRORS as e:
+                if not idempotent:
+                    raise
+                delay = self._next_delay(attempt + 1)
+                if delay is None:
+                    raise
+                logging.warning(f"{request.method} {request.url.path} failed ({e!r}), retrying in {delay:.2f}s")
+            else:
+                # A 429 means the request was rejected before being processed,
+                # so it is safe to resend whatever the method.
+                if response.status_code not in policy.retry_statuses or not (
+                    idempotent or (response.status_code == 429 and _is_replayable(request))
+                ):
+                    response.extensions["retries"] = attempt
+                    response.extensions["throttled"] = throttled
+                    return response
+                delay = self._next_delay(attempt + 1, response)
+                if delay is None:
+                    response.extensions["retries"] = attempt
+                    response.extensions["throttled"] = throttled
+                    return response
+                logging.warning(
+                    f"{request.method} {request.url.path} returned {response.status_code}, "
+                    f"retrying in {delay:.2f}s"
+                )
+                if response.status_code == 429:
+                    throttled += 1
+                # Drain the (small) error body so the connection goes back to
+                # the pool instead of being dropped.
+                try:
+                    await response.aread()
+                except httpx.TransportError:
+                    pass
+                await response.aclose()
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _next_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        if attempt > self.policy.max_retries:
+            return None
+        return self.policy.delay_for(attempt, response)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
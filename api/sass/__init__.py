@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "disable",
+        "enable",
+        "get_location_stripe_id",
+        "pause",
+        "update",
+        "update_rebilling",
+    ],
+    exports={
+        "disable_saas_for_locations": "disable",
+        "enable_saas_for_sub_account": "enable",
+        "pause_sub_account": "pause",
+        "update_saas_subscription": "update",
+    },
+)
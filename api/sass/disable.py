@@ -1,9 +1,8 @@
 from typing import Dict, Any, List
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("sass.disable")
 
 async def disable_saas_for_locations(
     headers: Dict[str, str],
@@ -24,22 +23,6 @@ async def disable_saas_for_locations(
     Raises:
         Exception: If the Authorization header is missing or invalid
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    url = f"{API_BASE_URL}/saas-api/public-api/bulk-disable-saas/{company_id}"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION),
-        "channel": "OAUTH",
-        "source": "INTEGRATION"
-    }
-
     data = {"locationIds": location_ids}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"companyId": company_id}, json=data)
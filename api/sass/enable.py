@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("sass.enable")
 
 async def enable_saas_for_sub_account(
     location_id: str,
@@ -20,17 +19,6 @@ async def enable_saas_for_sub_account(
     saas_plan_id: Optional[str] = None,
     price_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Invalid or missing Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "channel": "OAUTH",
-        "source": "INTEGRATION",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "companyId": company_id,
         "isSaaSV2": is_saas_v2
@@ -50,9 +38,4 @@ async def enable_saas_for_sub_account(
 
     payload.update({k: v for k, v in optional_fields.items() if v is not None})
 
-    url = f"{API_BASE_URL}/saas-api/public-api/enable-saas/{location_id}"
-
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=payload, headers=request_headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=payload)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("sass.get_location_stripe_id")
 
 async def get_location_stripe_id(
     headers: Dict[str, str],
@@ -25,27 +25,10 @@ async def get_location_stripe_id(
     Raises:
         httpx.HTTPStatusError: If the API request fails.
     """
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Invalid or missing Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": API_VERSION,
-        "channel": "OAUTH",
-        "source": "INTEGRATION"
-    }
-
     params = {"companyId": company_id}
     if customer_id:
         params["customerId"] = customer_id
     if subscription_id:
         params["subscriptionId"] = subscription_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{API_BASE_URL}/saas-api/public-api/locations",
-            headers=request_headers,
-            params=params
-        )
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
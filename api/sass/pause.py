@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("sass.pause")
 
 async def pause_sub_account(location_id: str, headers: Dict[str, str], paused: bool, company_id: str) -> Dict[str, Any]:
     """
@@ -21,25 +21,9 @@ async def pause_sub_account(location_id: str, headers: Dict[str, str], paused: b
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the Authorization header is missing or invalid.
     """
-    url = f"{API_BASE_URL}/saas-api/public-api/pause/{location_id}"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": API_VERSION,
-        "channel": "OAUTH",
-        "source": "INTEGRATION",
-        "Content-Type": "application/json"
-    }
-    
     data = {
         "paused": paused,
         "companyId": company_id
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=data)
@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("sass.update")
 
 async def update_saas_subscription(
     location_id: str,
@@ -28,26 +28,10 @@ async def update_saas_subscription(
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the Authorization header is missing or invalid.
     """
-    url = f"{API_BASE_URL}/saas-api/public-api/update-saas-subscription/{location_id}"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": API_VERSION,
-        "channel": "OAUTH",
-        "source": "INTEGRATION"
-    }
-
     data = {
         "subscriptionId": subscription_id,
         "customerId": customer_id,
         "companyId": company_id
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.put(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=data)
@@ -1,9 +1,9 @@
 from typing import Dict, Any, List
-import httpx
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-04-15"
+ENDPOINT = get_endpoint("sass.update_rebilling")
 
 async def update_rebilling(
     company_id: str,
@@ -28,22 +28,6 @@ async def update_rebilling(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    url = f"{API_BASE_URL}/saas-api/public-api/update-rebilling/{company_id}"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": headers["Version"],
-        "channel": "OAUTH",
-        "source": "INTEGRATION"
-    }
-
     data = {
         "product": product,
         "locationIds": location_ids,
@@ -52,12 +36,4 @@ async def update_rebilling(
 
     logging.info(f"Updating rebilling for company: {company_id}")
 
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(url, headers=request_headers, json=data)
-
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"API request failed with status {e.response.status_code}: {e.response.text}")
-        raise Exception(f"Failed to update rebilling: {e}")
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"companyId": company_id}, json=data)
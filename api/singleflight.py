@@ -0,0 +1,80 @@
+from typing import Dict, Tuple
+import asyncio
+import httpx
+
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+def request_key(request: httpx.Request) -> Tuple[str, ...]:
+    """
+    Identify requests that would get the same response.
+
+    The token and API version are part of the key, since they change what
+    the caller is allowed to see and how it is rendered.
+    """
+    return (
+        request.method,
+        str(request.url),
+        request.headers.get("Authorization", ""),
+        request.headers.get("Version", ""),
+    )
+
+
+class SingleFlightTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper that collapses concurrent identical GETs into one
+    upstream call.
+
+    The first caller for a key sends the request; callers that arrive while
+    it is in flight wait for it and each get their own copy of the buffered
+    response. A request can opt out with `extensions={"singleflight": False}`;
+    requests with a Range header are never coalesced.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+        self._in_flight: Dict[Tuple[str, ...], asyncio.Future] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if (
+            request.method not in COALESCED_METHODS
+            or request.extensions.get("singleflight") is False
+            or "Range" in request.headers
+        ):
+            return await self.transport.handle_async_request(request)
+
+        key = request_key(request)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(request))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield the shared call so one caller being cancelled doesn't cancel
+        # it for everyone else waiting on it.
+        status_code, headers, content, extensions = await asyncio.shield(task)
+        return httpx.Response(
+            status_code,
+            headers=headers,
+            content=content,
+            extensions=dict(extensions),
+            request=request
+        )
+
+    async def _fetch(self, request: httpx.Request):
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        # The body has been decoded already, so don't pass on the original
+        # encoding headers with it.
+        headers = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+        ]
+        extensions = {k: v for k, v in response.extensions.items() if k != "network_stream"}
+        return response.status_code, headers, content, extensions
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
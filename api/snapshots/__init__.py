@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "get",
+        "get_last_push",
+        "get_push_between_dates",
+    ],
+    exports={
+        "create_snapshot_share_link": "create",
+        "get_last_snapshot_push": "get_last_push",
+        "get_snapshot_push_between_dates": "get_push_between_dates",
+        "get_snapshots": "get",
+    },
+)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, List
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("snapshots.get")
 
 async def get_snapshots(headers: Dict[str, str], company_id: str) -> List[Dict[str, Any]]:
     """
@@ -19,22 +19,9 @@ async def get_snapshots(headers: Dict[str, str], company_id: str) -> List[Dict[s
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the Authorization header is missing or invalid.
     """
-    url = f"{API_BASE_URL}/snapshots/"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION)
-    }
-    
     params = {
         "companyId": company_id
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()["snapshots"]
\ No newline at end of file
+    response = await dispatch(ENDPOINT, headers, params=params)
+    return response["snapshots"]
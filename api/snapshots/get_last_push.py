@@ -1,8 +1,8 @@
-import httpx
 from typing import Dict, Any
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("snapshots.get_last_push")
 
 async def get_last_snapshot_push(
     headers: Dict[str, str],
@@ -26,20 +26,11 @@ async def get_last_snapshot_push(
         httpx.HTTPStatusError: If the API request fails.
         Exception: If the Authorization header is missing or invalid.
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    url = f"{API_BASE_URL}/snapshots/snapshot-status/{snapshot_id}/location/{location_id}"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
     params = {"companyId": company_id}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"snapshotId": snapshot_id, "locationId": location_id},
+        params=params
+    )
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("snapshots.get_push_between_dates")
 
 async def get_snapshot_push_between_dates(
     snapshot_id: str,
@@ -32,17 +32,6 @@ async def get_snapshot_push_between_dates(
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If Authorization header is missing or invalid.
     """
-    url = f"{API_BASE_URL}/snapshots/snapshot-status/{snapshot_id}"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
     params = {
         "companyId": company_id,
         "from": from_date,
@@ -53,8 +42,4 @@ async def get_snapshot_push_between_dates(
     if last_doc:
         params["lastDoc"] = last_doc
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-
-    return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"snapshotId": snapshot_id}, params=params)
@@ -0,0 +1,14 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "account",
+        "category",
+        "csv",
+        "oauth",
+        "posts",
+        "surveys",
+        "tag",
+    ],
+)
@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "delete",
+        "get",
+    ],
+    exports={
+        "delete_social_media_account": "delete",
+        "get_social_media_accounts": "get",
+    },
+)
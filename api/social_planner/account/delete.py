@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.account.delete")
 
 async def delete_social_media_account(
     headers: Dict[str, str],
@@ -28,24 +28,15 @@ async def delete_social_media_account(
         httpx.HTTPStatusError: If the API request fails
         Exception: If required headers are missing
     """
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/accounts/{account_id}"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
     params = {}
     if company_id:
         params["companyId"] = company_id
     if user_id:
         params["userId"] = user_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"locationId": location_id, "accountId": account_id},
+        params=params
+    )
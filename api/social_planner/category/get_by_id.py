@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.category.get_by_id")
 
 async def get_categories_by_location_id(
     headers: Dict[str, str],
@@ -11,17 +11,6 @@ async def get_categories_by_location_id(
     search_text: Optional[str] = None,
     skip: Optional[int] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/categories"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
     params = {}
     if limit:
         params["limit"] = limit
@@ -30,7 +19,4 @@ async def get_categories_by_location_id(
     if skip:
         params["skip"] = skip
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, params=params)
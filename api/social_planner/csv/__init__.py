@@ -0,0 +1,20 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "delete",
+        "delete_csv_post",
+        "get_csv",
+        "get_upload_status",
+        "set_accounts",
+        "start_csv",
+        "upload",
+    ],
+    exports={
+        "delete_csv": "delete",
+        "get_csv_post": "get_csv",
+        "start_csv_finalize": "start_csv",
+        "upload_csv": "upload",
+    },
+)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.csv.get_csv")
 
 async def get_csv_post(
     access_token: str,
@@ -11,21 +11,15 @@ async def get_csv_post(
     limit: Optional[int] = None,
     skip: Optional[int] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/csv/{csv_id}"
-    
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION
-    }
-    
     params = {}
     if limit is not None:
         params["limit"] = str(limit)
     if skip is not None:
         params["skip"] = str(skip)
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(
+        ENDPOINT,
+        token=access_token,
+        path={"locationId": location_id, "csvId": csv_id},
+        params=params
+    )
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.csv.get_upload_status")
 
 async def get_upload_status(
     headers: Dict[str, str],
@@ -12,17 +12,6 @@ async def get_upload_status(
     skip: int = 0,
     user_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/csv"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Invalid or missing Authorization header")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION)
-    }
-
     params = {
         "limit": str(limit),
         "skip": str(skip)
@@ -33,7 +22,4 @@ async def get_upload_status(
     if user_id:
         params["userId"] = user_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, params=params)
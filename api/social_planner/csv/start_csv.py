@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.csv.start_csv")
 
 async def start_csv_finalize(
     headers: Dict[str, str],
@@ -26,21 +26,6 @@ async def start_csv_finalize(
         httpx.HTTPStatusError: If the API request fails
         ValueError: If required headers are missing
     """
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/csv/{csv_id}"
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     data = {"userId": user_id}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.patch(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id, "csvId": csv_id}, json=data)
@@ -0,0 +1,15 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "attatch_facebook",
+        "get_pages",
+        "start_oauth",
+    ],
+    exports={
+        "attach_facebook_page": "attatch_facebook",
+        "get_facebook_pages": "get_pages",
+        "start_facebook_oauth": "start_oauth",
+    },
+)
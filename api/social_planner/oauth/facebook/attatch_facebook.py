@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.oauth.facebook.attatch_facebook")
 
 async def attach_facebook_page(
     headers: Dict[str, str],
@@ -14,18 +14,6 @@ async def attach_facebook_page(
     avatar: str,
     company_id: str
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/oauth/{location_id}/facebook/accounts/{account_id}"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-    
-    request_headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION),
-        **headers
-    }
-    
     data = {
         "type": page_type,
         "originId": origin_id,
@@ -33,8 +21,10 @@ async def attach_facebook_page(
         "avatar": avatar,
         "companyId": company_id
     }
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"locationId": location_id, "accountId": account_id},
+        json=data
+    )
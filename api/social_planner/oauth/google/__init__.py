@@ -0,0 +1,15 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get_locations",
+        "set_locations",
+        "start_oauth",
+    ],
+    exports={
+        "get_google_business_locations": "get_locations",
+        "set_google_business_locations": "set_locations",
+        "start_google_oauth": "start_oauth",
+    },
+)
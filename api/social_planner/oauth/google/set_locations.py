@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.oauth.google.set_locations")
 
 async def set_google_business_locations(
     access_token: str,
@@ -10,22 +10,15 @@ async def set_google_business_locations(
     account_id: str,
     company_id: str
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/oauth/{location_id}/google/locations/{account_id}"
-
-    headers = {
-        "Accept": "application/json",
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-        "Version": API_VERSION
-    }
-
     payload = {
         "location": {},
         "account": {},
         "companyId": company_id
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        token=access_token,
+        path={"locationId": location_id, "accountId": account_id},
+        json=payload
+    )
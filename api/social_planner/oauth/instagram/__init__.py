@@ -0,0 +1,15 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "attatch_proffesional_account",
+        "get_proffestional_acc",
+        "start_oauth",
+    ],
+    exports={
+        "attach_instagram_professional_account": "attatch_proffesional_account",
+        "get_instagram_professional_accounts": "get_proffestional_acc",
+        "start_instagram_oauth": "start_oauth",
+    },
+)
@@ -0,0 +1,14 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "attatch_linekdIn",
+        "get_linkedin_pages_profiles",
+        "start_oauth",
+    ],
+    exports={
+        "attach_linkedin_account": "attatch_linekdIn",
+        "start_linkedin_oauth": "start_oauth",
+    },
+)
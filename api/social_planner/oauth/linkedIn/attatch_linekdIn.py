@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.oauth.linkedIn.attatch_linekdIn")
 
 async def attach_linkedin_account(
     headers: Dict[str, str],
@@ -15,18 +15,6 @@ async def attach_linkedin_account(
     urn: str,
     company_id: str
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/oauth/{location_id}/linkedin/accounts/{account_id}"
-
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION),
-        **headers
-    }
-
     data = {
         "type": account_type,
         "originId": origin_id,
@@ -36,7 +24,9 @@ async def attach_linkedin_account(
         "companyId": company_id
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"locationId": location_id, "accountId": account_id},
+        json=data
+    )
@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.oauth.linkedIn.start_oauth")
 
 async def start_linkedin_oauth(
     headers: Dict[str, str],
@@ -11,15 +11,6 @@ async def start_linkedin_oauth(
     page: str = "integration",
     reconnect: str = "true"
 ) -> Dict[str, Any]:
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
     params = {
         "locationId": location_id,
         "userId": user_id,
@@ -27,9 +18,4 @@ async def start_linkedin_oauth(
         "reconnect": reconnect
     }
 
-    url = f"{API_BASE_URL}/social-media-posting/oauth/linkedin/start"
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -0,0 +1,19 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "attatch_profile",
+        "get_business_profile",
+        "get_profile",
+        "start_oauth",
+        "start_oauth_for_business",
+    ],
+    exports={
+        "attach_tiktok_profile": "attatch_profile",
+        "get_tiktok_business_profile": "get_business_profile",
+        "get_tiktok_profile": "get_profile",
+        "start_tiktok_business_oauth": "start_oauth_for_business",
+        "start_tiktok_oauth": "start_oauth",
+    },
+)
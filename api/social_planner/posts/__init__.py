@@ -0,0 +1,20 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "bulk_delete",
+        "create",
+        "delete",
+        "edit",
+        "get",
+        "get_posts",
+    ],
+    exports={
+        "bulk_delete_social_planner_posts": "bulk_delete",
+        "create_social_media_post": "create",
+        "delete_social_media_post": "delete",
+        "edit_post": "edit",
+        "get_post": "get",
+    },
+)
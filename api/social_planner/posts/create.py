@@ -1,8 +1,8 @@
-import httpx
 from typing import Dict, Any, List, Optional
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.posts.create")
 
 async def create_social_media_post(
     headers: Dict[str, str],
@@ -24,18 +24,6 @@ async def create_social_media_post(
     gmb_post_details: Optional[Dict[str, Any]] = None,
     user_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/posts"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION),
-        **headers
-    }
-
     payload = {
         "accountIds": account_ids,
         "summary": summary,
@@ -66,8 +54,4 @@ async def create_social_media_post(
     if user_id:
         payload["userId"] = user_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=payload, headers=request_headers)
-
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=payload)
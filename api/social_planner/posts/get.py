@@ -1,8 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.posts.get")
 
 async def get_post(headers: Dict[str, str], location_id: str, post_id: str) -> Dict[str, Any]:
     """
@@ -20,18 +20,4 @@ async def get_post(headers: Dict[str, str], location_id: str, post_id: str) -> D
         httpx.HTTPStatusError: If the API request fails
         ValueError: If required headers are missing
     """
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/posts/{post_id}"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id, "postId": post_id})
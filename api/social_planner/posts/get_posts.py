@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import json
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.posts.get_posts")
 
 async def get_posts(
     location_id: str,
@@ -17,18 +16,6 @@ async def get_posts(
     include_users: bool = True,
     post_type_filter: str = "post"
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/posts/list"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-    
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION)
-    }
-    
     params = {
         "type": post_type,
         "skip": str(skip),
@@ -36,16 +23,12 @@ async def get_posts(
         "includeUsers": str(include_users).lower(),
         "postType": post_type_filter
     }
-    
+
     if accounts:
         params["accounts"] = accounts
     if from_date:
         params["fromDate"] = from_date
     if to_date:
         params["toDate"] = to_date
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=params)
-    
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=params)
@@ -0,0 +1,12 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get_submissions",
+        "get_surveys",
+    ],
+    exports={
+        "get_survey_submissions": "get_submissions",
+    },
+)
@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.surveys.get_submissions")
 
 async def get_survey_submissions(
     headers: Dict[str, str],
@@ -15,23 +14,12 @@ async def get_survey_submissions(
     start_at: Optional[str] = None,
     survey_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/surveys/submissions"
-    
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Accept": "application/json",
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION)
-    }
-    
     params = {
         "locationId": location_id,
         "limit": str(limit),
         "page": str(page)
     }
-    
+
     if end_at:
         params["endAt"] = end_at
     if q:
@@ -41,8 +29,4 @@ async def get_survey_submissions(
     if survey_id:
         params["surveyId"] = survey_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-    
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
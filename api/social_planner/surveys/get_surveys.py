@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.surveys.get_surveys")
 
 async def get_surveys(
     headers: Dict[str, str],
@@ -11,27 +11,13 @@ async def get_surveys(
     skip: Optional[int] = 0,
     survey_type: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/surveys/"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-    
     params = {
         "locationId": location_id,
         "limit": limit,
         "skip": skip
     }
-    
+
     if survey_type:
         params["type"] = survey_type
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -0,0 +1,12 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "get_tags_by_id",
+        "get_tags_by_location",
+    ],
+    exports={
+        "get_tags_by_ids": "get_tags_by_id",
+    },
+)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, List
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("social_planner.tag.get_tags_by_id")
 
 async def get_tags_by_ids(headers: Dict[str, str], location_id: str, tag_ids: List[str]) -> Dict[str, Any]:
     """
@@ -20,21 +20,6 @@ async def get_tags_by_ids(headers: Dict[str, str], location_id: str, tag_ids: Li
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the required headers are missing.
     """
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    url = f"{API_BASE_URL}/social-media-posting/{location_id}/tags/details"
-
-    request_headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "Version": headers.get("Version", API_VERSION),
-        "Authorization": headers["Authorization"]
-    }
-
     data = {"tagIds": tag_ids}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=data)
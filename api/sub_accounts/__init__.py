@@ -0,0 +1,15 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "custom_field",
+        "custom_value",
+        "search",
+        "sub_account",
+        "tags",
+        "tasks_search",
+        "tempalte",
+        "time_zone",
+    ],
+)
@@ -0,0 +1,20 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "get_fields",
+        "update",
+        "upload_file_to_custom_fields",
+    ],
+    exports={
+        "create_custom_field": "create",
+        "delete_custom_field": "delete",
+        "get_custom_field": "get",
+        "get_custom_fields": "get_fields",
+        "update_custom_field": "update",
+    },
+)
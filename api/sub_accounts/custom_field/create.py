@@ -1,9 +1,8 @@
 from typing import Dict, Any, Optional, List
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("sub_accounts.custom_field.create")
 
 async def create_custom_field(
     location_id: str,
@@ -18,18 +17,6 @@ async def create_custom_field(
     position: Optional[int] = None,
     model: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/locations/{location_id}/customFields"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     payload = {
         "name": name,
         "dataType": data_type
@@ -50,14 +37,4 @@ async def create_custom_field(
     if model:
         payload["model"] = model
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=request_headers, json=payload)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=payload)
@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("sub_accounts.custom_field.get")
 
 async def get_custom_field(location_id: str, custom_field_id: str, headers: Dict[str, str]) -> Dict[str, Any]:
     """
@@ -20,25 +19,8 @@ async def get_custom_field(location_id: str, custom_field_id: str, headers: Dict
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
-    url = f"{API_BASE_URL}/locations/{location_id}/customFields/{custom_field_id}"
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=request_headers)
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to get custom field: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while getting custom field: {e}")
\ No newline at end of file
+    return await dispatch(
+        ENDPOINT,
+        headers,
+        path={"locationId": location_id, "customFieldId": custom_field_id}
+    )
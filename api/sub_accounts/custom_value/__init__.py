@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "get_values",
+        "update",
+    ],
+    exports={
+        "delete_custom_value": "delete",
+        "get_custom_value": "get",
+        "update_custom_value": "update",
+    },
+)
@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("sub_accounts.custom_value.get_values")
 
 async def get_custom_values(location_id: str, headers: Dict[str, str]) -> Dict[str, Any]:
     """
@@ -19,25 +18,4 @@ async def get_custom_values(location_id: str, headers: Dict[str, str]) -> Dict[s
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization"):
-        raise Exception("Missing Authorization header")
-
-    url = f"{API_BASE_URL}/locations/{location_id}/customValues"
-
-    request_headers = {
-        "Version": API_VERSION,
-        "Accept": "application/json",
-        **headers
-    }
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=request_headers)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to get custom values: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while getting custom values: {e}")
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id})
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("sub_accounts.search.search")
 
 async def search_sub_accounts(
     headers: Dict[str, str],
@@ -26,16 +26,6 @@ async def search_sub_accounts(
     Returns:
         Dict containing the search results
     """
-    url = f"{API_BASE_URL}/locations/search"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Invalid or missing Authorization header")
-
-    headers.update({
-        "Accept": "application/json",
-        "Version": API_VERSION
-    })
-
     params = {
         "companyId": company_id,
         "email": email,
@@ -46,7 +36,4 @@ async def search_sub_accounts(
 
     params = {k: v for k, v in params.items() if v is not None}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -0,0 +1,15 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "put",
+    ],
+    exports={
+        "delete_sub_account": "delete",
+        "get_sub_account": "get",
+    },
+)
@@ -1,5 +1,8 @@
 from typing import Dict, Any
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("sub_accounts.sub_account.create")
 
 async def update_sub_account(
     location_id: str,
@@ -23,19 +26,4 @@ async def update_sub_account(
         ValueError: If the Authorization header is missing or invalid.
         httpx.HTTPStatusError: If the API request fails.
     """
-    url = f"https://services.leadconnectorhq.com/locations/{location_id}"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": api_version,
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.put(url, json=data, headers=request_headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, version=api_version, path={"locationId": location_id}, json=data)
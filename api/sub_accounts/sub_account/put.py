@@ -1,6 +1,8 @@
 from typing import Dict, Any
-import httpx
-import json
+from api.dispatch import dispatch
+from api.registry import get_endpoint
+
+ENDPOINT = get_endpoint("sub_accounts.sub_account.put")
 
 async def update_sub_account(
     location_id: str,
@@ -22,20 +24,4 @@ async def update_sub_account(
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If required headers are missing.
     """
-    url = f"https://services.leadconnectorhq.com/locations/{location_id}"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-    
-    if "Version" not in headers:
-        headers["Version"] = "2021-07-28"
-    
-    headers.update({
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    })
-
-    async with httpx.AsyncClient() as client:
-        response = await client.put(url, headers=headers, json=sub_account_data)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=sub_account_data)
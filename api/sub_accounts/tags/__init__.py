@@ -0,0 +1,18 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "get_tag",
+        "update",
+    ],
+    exports={
+        "create_tag": "create",
+        "delete_tag": "delete",
+        "get_tags": "get",
+        "update_tag": "update",
+    },
+)
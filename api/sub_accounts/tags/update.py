@@ -1,9 +1,8 @@
 from typing import Dict, Any
-import httpx
-import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("sub_accounts.tags.update")
 
 async def update_tag(
     location_id: str,
@@ -26,33 +25,8 @@ async def update_tag(
     Raises:
         Exception: If the API request fails or if required headers are missing
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise Exception("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    if not headers.get("Version"):
-        headers["Version"] = API_VERSION
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers["Version"],
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
-    url = f"{API_BASE_URL}/locations/{location_id}/tags/{tag_id}"
-
     data = {
         "name": name
     }
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(url, headers=request_headers, json=data)
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error occurred: {e}")
-        raise Exception(f"Failed to update tag: {e}")
-    except Exception as e:
-        logging.error(f"An error occurred: {e}")
-        raise Exception(f"An error occurred while updating tag: {e}")
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id, "tagId": tag_id}, json=data)
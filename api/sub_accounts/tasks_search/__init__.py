@@ -0,0 +1,11 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "search_filter",
+    ],
+    exports={
+        "search_tasks": "search_filter",
+    },
+)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, List, Optional
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("sub_accounts.tasks_search.search_filter")
 
 async def search_tasks(
     location_id: str,
@@ -15,18 +15,6 @@ async def search_tasks(
     skip: int = 0,
     business_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/locations/{location_id}/tasks/search"
-
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json",
-        "Content-Type": "application/json"
-    }
-
     payload = {}
     if contact_ids:
         payload["contactId"] = contact_ids
@@ -43,7 +31,4 @@ async def search_tasks(
     if business_id:
         payload["businessId"] = business_id
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=request_headers, json=payload)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"locationId": location_id}, json=payload)
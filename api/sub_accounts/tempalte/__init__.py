@@ -0,0 +1,13 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "delete",
+        "get",
+    ],
+    exports={
+        "delete_template": "delete",
+        "get_templates": "get",
+    },
+)
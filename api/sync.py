@@ -0,0 +1,190 @@
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import importlib.util
+import logging
+import os
+import threading
+
+from api.transport import close_default_client, use_client
+
+T = TypeVar("T")
+
+
+class LoopRunner:
+    """
+    Runs coroutines from synchronous code on one long-lived background loop.
+
+    Every call made through the runner shares the loop, and with it the
+    pooled HTTP client, so sync callers (Django views, scripts, Celery tasks)
+    get connection reuse without paying for a new loop and pool per call.
+
+    Args:
+        client: Optional GoHighLevelClient whose pool endpoint functions should use
+        use_uvloop: Use uvloop if installed; defaults to the GHL_USE_UVLOOP env variable
+    """
+
+    def __init__(self, client: Optional[Any] = None, use_uvloop: Optional[bool] = None):
+        if use_uvloop is None:
+            use_uvloop = os.getenv("GHL_USE_UVLOOP", "0").lower() in ("1", "true", "yes")
+        self.client = client
+        self.use_uvloop = use_uvloop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _new_loop(self) -> asyncio.AbstractEventLoop:
+        if self.use_uvloop:
+            if importlib.util.find_spec("uvloop") is not None:
+                import uvloop
+                return uvloop.new_event_loop()
+            logging.debug("uvloop is not installed, using the default event loop")
+        return asyncio.new_event_loop()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        The background loop, started on first use.
+
+        A forked child process can't use the parent's loop thread, so a new
+        one is started if the process id has changed.
+        """
+        if self._loop is None or self._pid != os.getpid():
+            with self._lock:
+                if self._loop is None or self._pid != os.getpid():
+                    self._start()
+        return self._loop
+
+    def _start(self) -> None:
+        loop = self._new_loop()
+        ready = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="ghl-loop-runner", daemon=True)
+        self._thread.start()
+        ready.wait()
+        self._loop = loop
+        self._pid = os.getpid()
+
+    async def _bind(self, coro: Awaitable[T]) -> T:
+        if self.client is None:
+            return await coro
+        with use_client(self.client.http):
+            return await coro
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule a coroutine on the background loop without waiting for it.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future: Future resolved with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(self._bind(coro), self.loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait before raising TimeoutError
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from code running on the background loop,
+                which would wait on itself forever; await the coroutine instead
+        """
+        thread = self._thread
+        if thread is not None and self._pid == os.getpid() and threading.get_ident() == thread.ident:
+            if asyncio.iscoroutine(coro):
+                coro.close()
+            raise RuntimeError(
+                "LoopRunner.run() was called from a coroutine on the runner's own loop, "
+                "which would deadlock; await the coroutine instead of using the sync wrapper"
+            )
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Close the pooled connections and stop the background loop.
+        """
+        if self._loop is None or self._pid != os.getpid() or self._loop.is_closed():
+            return
+        loop = self._loop
+        try:
+            if self.client is not None:
+                self.run(self.client.aclose(), timeout)
+            self.run(close_default_client(), timeout)
+        except Exception as e:
+            logging.warning(f"Error closing pooled connections: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout)
+        loop.close()
+        self._loop = None
+        self._thread = None
+
+
+_default_runner: Optional[LoopRunner] = None
+_default_runner_lock = threading.Lock()
+
+
+def get_runner() -> LoopRunner:
+    """
+    Get the process-wide runner used by `run_sync` and `sync`.
+    """
+    global _default_runner
+    if _default_runner is None:
+        with _default_runner_lock:
+            if _default_runner is None:
+                _default_runner = LoopRunner()
+                atexit.register(_default_runner.close)
+    return _default_runner
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run an endpoint coroutine from synchronous code.
+
+    Example:
+        contact = run_sync(get_contact(contact_id, token))
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before raising TimeoutError
+
+    Returns:
+        The coroutine's result
+    """
+    return get_runner().run(coro, timeout)
+
+
+def sync(func: Callable[..., Awaitable[T]]) -> Callable[..., T]:
+    """
+    Wrap an async endpoint function so it can be called synchronously.
+
+    Example:
+        get_contact_sync = sync(get_contact)
+        contact = get_contact_sync(contact_id, token)
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        return get_runner().run(func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,282 @@
+from typing import Any, Dict, Optional
+import contextlib
+import contextvars
+import asyncio
+import importlib.util
+import logging
+import os
+import weakref
+import httpx
+
+from api.cache import ResponseCache, CacheTransport
+from api.metrics import Metrics, MetricsTransport
+from api.rate_limit import RateLimiter, RateLimitTransport
+from api.retry import RetryPolicy, RetryTransport
+from api.singleflight import SingleFlightTransport
+
+API_BASE_URL = "https://services.leadconnectorhq.com"
+
+
+class PoolConfig:
+    """
+    Connection pool settings for the shared Go High Level HTTP client.
+
+    Every endpoint function sends its request through one long-lived
+    httpx.AsyncClient built from this config, so DNS, TCP and TLS setup
+    against services.leadconnectorhq.com is paid once per connection instead
+    of once per call.
+
+    Requests are scheduled through a per-location/company RateLimiter unless
+    `rate_limit` is False. Clients built from the same config share it.
+    Transient failures are retried according to `retry_policy`; pass
+    `retries=False` to disable retries. Concurrent identical GETs share one
+    upstream call unless `coalesce` is False. Pass a ResponseCache as
+    `cache` to serve reference endpoints from memory, and a Metrics as
+    `metrics` to record per-endpoint latency histograms and counters.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        timeout: float = 30.0,
+        connect_timeout: Optional[float] = 10.0,
+        rate_limit: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retries: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce: bool = True,
+        cache: Optional[ResponseCache] = None,
+        metrics: Optional[Metrics] = None
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.rate_limit = rate_limit
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+        self.retry_policy = retry_policy
+        self.coalesce = coalesce
+        self.cache = cache
+        self.metrics = metrics
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """
+        Build a config from GHL_POOL_* environment variables.
+
+        Returns:
+            PoolConfig: Config with any environment overrides applied
+        """
+        config = cls()
+        config.max_connections = int(os.getenv("GHL_POOL_MAX_CONNECTIONS", config.max_connections))
+        max_keepalive = os.getenv("GHL_POOL_MAX_KEEPALIVE")
+        if max_keepalive:
+            config.max_keepalive_connections = int(max_keepalive)
+        config.keepalive_expiry = float(os.getenv("GHL_POOL_KEEPALIVE_EXPIRY", config.keepalive_expiry))
+        config.http2 = os.getenv("GHL_POOL_HTTP2", "1").lower() not in ("0", "false", "no")
+        config.timeout = float(os.getenv("GHL_POOL_TIMEOUT", config.timeout))
+        config.rate_limit = os.getenv("GHL_RATE_LIMIT", "1").lower() not in ("0", "false", "no")
+        max_retries = os.getenv("GHL_MAX_RETRIES")
+        if max_retries is not None:
+            config.retries = int(max_retries) > 0
+            config.retry_policy = RetryPolicy(max_retries=int(max_retries))
+        config.coalesce = os.getenv("GHL_COALESCE", "1").lower() not in ("0", "false", "no")
+        cache_bytes = os.getenv("GHL_CACHE_MAX_BYTES")
+        if cache_bytes:
+            config.cache = ResponseCache(max_bytes=int(cache_bytes))
+        if os.getenv("GHL_METRICS", "0").lower() not in ("0", "false", "no"):
+            config.metrics = Metrics()
+        return config
+
+    @property
+    def limits(self) -> httpx.Limits:
+        # Keep every connection the pool may open; a lower idle cap closes
+        # (and later reopens) whatever exceeds it whenever concurrency is high.
+        max_keepalive = self.max_keepalive_connections
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections if max_keepalive is None else max_keepalive,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    @property
+    def http2_enabled(self) -> bool:
+        """HTTP/2 needs the optional `h2` package; fall back to HTTP/1.1 without it."""
+        if not self.http2:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logging.debug("h2 is not installed, using HTTP/1.1 for the connection pool")
+            return False
+        return True
+
+    def build_transport(self) -> httpx.AsyncBaseTransport:
+        """
+        Build the network transport that owns the pooled connections.
+
+        Returns:
+            httpx.AsyncBaseTransport: Transport used by clients built from this config
+        """
+        transport = httpx.AsyncHTTPTransport(http2=self.http2_enabled, limits=self.limits)
+        if self.metrics is not None:
+            self.metrics.watch_pool(transport)
+        if self.rate_limit:
+            if self.rate_limiter is None:
+                self.rate_limiter = RateLimiter()
+            transport = RateLimitTransport(transport, self.rate_limiter)
+        if self.retries:
+            # Retries sit outside the rate limiter so every attempt waits for
+            # capacity and every 429 re-syncs the bucket.
+            transport = RetryTransport(transport, self.retry_policy or RetryPolicy())
+        if self.coalesce:
+            transport = SingleFlightTransport(transport)
+        if self.cache is not None:
+            transport = CacheTransport(transport, self.cache)
+        if self.metrics is not None:
+            # Outermost, so cache hits and coalesced calls are counted too.
+            transport = MetricsTransport(transport, self.metrics)
+        return transport
+
+    def build_client(self) -> httpx.AsyncClient:
+        """
+        Build a long-lived AsyncClient backed by this config's connection pool.
+
+        Returns:
+            httpx.AsyncClient: Client to share across requests
+        """
+        return httpx.AsyncClient(
+            transport=self.build_transport(),
+            timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout)
+        )
+
+
+# Client bound by `GoHighLevelClient` (or `use_client`) for the current task.
+_bound_client: contextvars.ContextVar[Optional[httpx.AsyncClient]] = contextvars.ContextVar(
+    "ghl_bound_client", default=None
+)
+
+# httpx connections belong to the event loop that opened them, so the implicit
+# default client is kept per loop.
+_default_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_default_config: Optional[PoolConfig] = None
+
+
+def configure_pool(config: PoolConfig) -> None:
+    """
+    Set the config used for the implicit default client.
+
+    Only clients created after this call pick up the new settings.
+
+    Args:
+        config: Pool settings to use
+    """
+    global _default_config
+    _default_config = config
+
+
+def get_pool_config() -> PoolConfig:
+    global _default_config
+    if _default_config is None:
+        _default_config = PoolConfig.from_env()
+    return _default_config
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled client for the current context.
+
+    Returns the client bound by an active `GoHighLevelClient`, otherwise the
+    default client for the running event loop, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Shared client; callers must not close it
+    """
+    client = _bound_client.get()
+    if client is not None and not client.is_closed:
+        return client
+
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get(loop)
+    if client is None or client.is_closed:
+        client = get_pool_config().build_client()
+        _default_clients[loop] = client
+    return client
+
+
+@contextlib.contextmanager
+def use_client(client: httpx.AsyncClient):
+    """
+    Route endpoint functions called inside this block through `client`.
+
+    Args:
+        client: Pooled client to bind for the current context
+    """
+    token = _bound_client.set(client)
+    try:
+        yield client
+    finally:
+        _bound_client.reset(token)
+
+
+async def close_default_client() -> None:
+    """Close the default client for the running event loop, if one was created."""
+    client = _default_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class PooledClient:
+    """
+    Non-closing view over the shared client with a per-call default timeout.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, timeout: Optional[float] = None):
+        self._client = client
+        self._timeout = timeout
+
+    def _with_timeout(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        return kwargs
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        return await self._client.request(method, url, **self._with_timeout(kwargs))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    def stream(self, method: str, url: str, **kwargs):
+        return self._client.stream(method, url, **self._with_timeout(kwargs))
+
+
+@contextlib.asynccontextmanager
+async def pooled_client(timeout: Optional[float] = None):
+    """
+    Drop-in replacement for `async with httpx.AsyncClient() as client`.
+
+    Yields a view over the shared pooled client. Leaving the block does not
+    close any connections, so the next call reuses them.
+
+    Args:
+        timeout: Default timeout in seconds for requests made through the view
+    """
+    yield PooledClient(get_http_client(), timeout)
@@ -0,0 +1,17 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create",
+        "delete",
+        "get",
+        "update",
+    ],
+    exports={
+        "create_trigger_link": "create",
+        "delete_trigger_link": "delete",
+        "get_links": "get",
+        "update_link": "update",
+    },
+)
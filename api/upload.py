@@ -0,0 +1,218 @@
+from typing import (
+    Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+)
+import asyncio
+import functools
+import logging
+import mimetypes
+import os
+import httpx
+
+from api.dispatch import dispatch
+from api.registry import Endpoint
+
+# Bytes, a file path, a binary file object, or an async iterable of chunks.
+UploadSource = Union[bytes, str, "os.PathLike[str]", BinaryIO, AsyncIterable[bytes]]
+
+# Called as progress(bytes_sent, total_bytes); the total is None when unknown.
+Progress = Callable[[int, Optional[int]], Any]
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadFile:
+    """
+    One file part of a multipart upload.
+
+    Args:
+        field: Form field name
+        source: Bytes, a file path, a binary file object, or an async iterable of chunks
+        filename: File name sent to the API; defaults to the path's or file object's name
+        content_type: MIME type; guessed from the file name if not given
+        size: Size in bytes, needed for async iterables to send a Content-Length
+    """
+    __slots__ = ("field", "source", "filename", "content_type", "size", "_start")
+
+    def __init__(
+        self,
+        field: str,
+        source: UploadSource,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None
+    ):
+        self.field = field
+        self.source = source
+        self._start = 0
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            size = len(source)
+        elif isinstance(source, (str, os.PathLike)):
+            filename = filename or os.path.basename(source)
+            size = os.path.getsize(source)
+        elif hasattr(source, "read"):
+            name = getattr(source, "name", None)
+            if filename is None and isinstance(name, str):
+                filename = os.path.basename(name)
+            if size is None and source.seekable():
+                self._start = source.tell()
+                size = source.seek(0, os.SEEK_END) - self._start
+                source.seek(self._start)
+        self.filename = filename or "upload"
+        self.content_type = content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        self.size = size
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the part can be sent again, e.g. when a 429 is retried."""
+        if hasattr(self.source, "read"):
+            return self.source.seekable()
+        return not hasattr(self.source, "__aiter__")
+
+    async def chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                while chunk := f.read(chunk_size):
+                    yield chunk
+        elif hasattr(source, "read"):
+            if source.seekable():
+                source.seek(self._start)
+            while chunk := source.read(chunk_size):
+                yield chunk
+        else:
+            async for chunk in source:
+                yield chunk
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartStream(httpx.AsyncByteStream):
+    """
+    multipart/form-data request body that reads each file in chunks as it is
+    sent, so memory use doesn't grow with the file size.
+
+    Pass it to `dispatch(..., stream=...)`. A Content-Length is sent when every
+    part's size is known, otherwise the body is sent chunked.
+
+    Args:
+        fields: Plain form fields, as a mapping or (name, value) pairs
+        files: The file parts
+        chunk_size: Bytes read per chunk
+        progress: Called after each chunk with the bytes sent so far and the total
+    """
+
+    def __init__(
+        self,
+        fields: Union[Mapping[str, Any], Iterable[Tuple[str, Any]], None] = None,
+        files: Sequence[UploadFile] = (),
+        chunk_size: int = CHUNK_SIZE,
+        progress: Optional[Progress] = None
+    ):
+        self.boundary = os.urandom(16).hex()
+        self.files = list(files)
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+        items = fields.items() if isinstance(fields, Mapping) else (fields or ())
+        self._fields = b"".join(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n{value}\r\n'.encode()
+            for name, value in items if value is not None
+        )
+        self._heads = [
+            (
+                f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{_quote(part.field)}\"; "
+                f"filename=\"{_quote(part.filename)}\"\r\nContent-Type: {part.content_type}\r\n\r\n"
+            ).encode()
+            for part in self.files
+        ]
+        self._tail = f"--{self.boundary}--\r\n".encode()
+
+        self.size: Optional[int] = None
+        if all(part.size is not None for part in self.files):
+            self.size = (
+                len(self._fields) + len(self._tail)
+                + sum(len(head) + part.size + 2 for head, part in zip(self._heads, self.files))
+            )
+
+    @property
+    def replayable(self) -> bool:
+        return all(part.replayable for part in self.files)
+
+    @property
+    def headers(self) -> List[Tuple[str, str]]:
+        length = ("Content-Length", str(self.size)) if self.size is not None else ("Transfer-Encoding", "chunked")
+        return [("Content-Type", f"multipart/form-data; boundary={self.boundary}"), length]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        sent = 0
+
+        def report(chunk: bytes) -> bytes:
+            nonlocal sent
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, self.size)
+            return chunk
+
+        if self._fields:
+            yield report(self._fields)
+        for head, part in zip(self._heads, self.files):
+            yield report(head)
+            async for chunk in part.chunks(self.chunk_size):
+                yield report(chunk)
+            yield report(b"\r\n")
+        yield report(self._tail)
+
+
+async def upload_all(
+    endpoint: Endpoint,
+    uploads: Iterable[Tuple[Optional[Mapping[str, Any]], Sequence[UploadFile]]],
+    headers: Optional[Mapping[str, str]] = None,
+    *,
+    token: Optional[str] = None,
+    path: Optional[Mapping[str, Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    concurrency: int = 4,
+    progress: Optional[Callable[[int, int, Optional[int]], Any]] = None
+) -> List[Any]:
+    """
+    Send many streamed multipart uploads to one endpoint with at most
+    `concurrency` in flight, so at most that many chunks are in memory.
+
+    One failed upload doesn't stop the others: its slot in the result holds
+    the exception instead of the response.
+
+    Args:
+        endpoint: The endpoint to call
+        uploads: (form fields, file parts) per request
+        headers: Caller headers, as for `dispatch`
+        token: Bearer token, as an alternative to `headers`
+        path: Values for the path template placeholders
+        params: Query parameters
+        concurrency: Maximum simultaneous uploads
+        progress: Called as progress(index, bytes_sent, total_bytes)
+
+    Returns:
+        List[Any]: Decoded response or exception per upload, in order
+    """
+    uploads = list(uploads)
+    results: List[Any] = [None] * len(uploads)
+    queue = iter(enumerate(uploads))
+
+    async def worker() -> None:
+        for index, (fields, files) in queue:
+            report = functools.partial(progress, index) if progress is not None else None
+            try:
+                stream = MultipartStream(fields, files, progress=report)
+                results[index] = await dispatch(endpoint, headers, token=token, path=path, params=params, stream=stream)
+            except Exception as e:
+                logging.error(f"{endpoint.name} upload {index} failed: {e!r}")
+                results[index] = e
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(uploads)))))
+    return results
@@ -0,0 +1,18 @@
+from api._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "create_user",
+        "delete",
+        "get",
+        "get_user_by_location",
+        "search",
+        "update",
+    ],
+    exports={
+        "delete_user": "delete",
+        "get_user": "get",
+        "update_user": "update",
+    },
+)
@@ -1,9 +1,9 @@
 from typing import Dict, Any
-import httpx
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("users.get")
 
 async def get_user(user_id: str, headers: Dict[str, str]) -> Dict[str, Any]:
     """
@@ -20,18 +20,6 @@ async def get_user(user_id: str, headers: Dict[str, str]) -> Dict[str, Any]:
         ValueError: If the Authorization header is missing or invalid.
         httpx.HTTPStatusError: If the API request fails.
     """
-    if not headers.get("Authorization") or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header. Must be in format: 'Bearer {token}'")
-
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-
     logging.info(f"Making request to get user details for user ID: {user_id}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{API_BASE_URL}/users/{user_id}", headers=request_headers)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, headers, path={"userId": user_id})
@@ -1,9 +1,9 @@
-from typing import Dict, Any, List
-import httpx
+from typing import Dict, Any
 import logging
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("users.get_user_by_location")
 
 async def get_user_by_location(headers: Dict[str, str], location_id: str) -> Dict[str, Any]:
     """
@@ -20,24 +20,10 @@ async def get_user_by_location(headers: Dict[str, str], location_id: str) -> Dic
         httpx.HTTPStatusError: If the API request fails.
         ValueError: If the required headers are missing.
     """
-    url = f"{API_BASE_URL}/users/"
-    
-    if "Authorization" not in headers or not headers["Authorization"].startswith("Bearer "):
-        raise ValueError("Missing or invalid Authorization header")
-    
-    request_headers = {
-        "Authorization": headers["Authorization"],
-        "Version": headers.get("Version", API_VERSION),
-        "Accept": "application/json"
-    }
-    
     params = {
         "locationId": location_id
     }
-    
+
     logging.info(f"Making request to get user for location: {location_id}")
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=request_headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+
+    return await dispatch(ENDPOINT, headers, params=params)
@@ -1,8 +1,8 @@
 from typing import Dict, Any, Optional, List
-import httpx
+from api.dispatch import dispatch
+from api.registry import get_endpoint
 
-API_BASE_URL = "https://services.leadconnectorhq.com"
-API_VERSION = "2021-07-28"
+ENDPOINT = get_endpoint("users.search.search")
 
 async def search_users(
     access_token: str,
@@ -18,14 +18,6 @@ async def search_users(
     sort_direction: Optional[str] = None,
     user_type: Optional[str] = None
 ) -> Dict[str, Any]:
-    url = f"{API_BASE_URL}/users/search"
-
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Version": API_VERSION,
-        "Accept": "application/json"
-    }
-
     params = {
         "companyId": company_id,
         "enabled2waySync": enabled_2way_sync,
@@ -42,7 +34,4 @@ async def search_users(
 
     params = {k: v for k, v in params.items() if v is not None}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    return await dispatch(ENDPOINT, token=access_token, params=params)
@@ -0,0 +1,81 @@
+"""
+Cold-start import budget check.
+
+Each scenario runs in a fresh interpreter, so the timings are what a
+serverless worker pays on scale-up. Exits non-zero if any scenario is over
+budget or imports more than it should.
+
+    python benchmarks/import_budget.py
+    python benchmarks/import_budget.py --runs 10 --scale 1.5
+"""
+from typing import Dict, List, Optional
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name: (statement to time, budget in ms, module prefixes that must not be loaded)
+SCENARIOS = {
+    "import ghl": ("import ghl", 25.0, ["httpx", "api.contacts", "api.transport", "webhooks."]),
+    "ghl.contacts.get_contact": (
+        "import ghl; ghl.contacts.get_contact",
+        200.0,
+        ["api.contacts.create", "api.contacts.update", "api.invoices", "api.client", "webhooks."],
+    ),
+    "ghl.invoices.list.list_invoices": (
+        "import ghl; ghl.invoices.list.list_invoices",
+        200.0,
+        ["api.invoices.create", "api.contacts", "webhooks."],
+    ),
+    "webhooks.contact.create": ("import webhooks.contact.create", 25.0, ["api.", "httpx"]),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def run_once(statement: str) -> Dict:
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per scenario")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. on slow CI hosts")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, (statement, budget, forbidden) in SCENARIOS.items():
+        results = [run_once(statement) for _ in range(args.runs)]
+        median = statistics.median(r["ms"] for r in results)
+        limit = budget * args.scale
+        leaked = sorted({
+            module for module in results[0]["modules"]
+            for prefix in forbidden if module == prefix.rstrip(".") or module.startswith(prefix)
+        })
+        status = "ok" if median <= limit and not leaked else "FAIL"
+        failed = failed or status == "FAIL"
+        print(f"{status:4} {name:36} {median:8.1f} ms  (budget {limit:.0f} ms)")
+        if leaked:
+            print(f"     unexpected imports: {', '.join(leaked)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
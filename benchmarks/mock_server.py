@@ -0,0 +1,257 @@
+"""
+Local mock of services.leadconnectorhq.com for benchmarks.
+
+A small HTTP/1.1 keep-alive server that answers the endpoints the
+benchmarks exercise with canned JSON, after a configurable delay. It can
+inject 429s and pad responses to a given size, and counts the connections
+it accepts so the client's pooling shows up in the results.
+
+Point the client at it with GHL_API_BASE_URL:
+
+    server = MockServer(MockConfig(latency=0.02, rate_429=0.01)).start()
+    os.environ["GHL_API_BASE_URL"] = server.base_url
+    ...
+    server.stop()
+
+Two extra routes serve the benchmark itself: GET /__stats returns the
+counters and POST /__reset zeroes them.
+"""
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import asyncio
+import json
+import multiprocessing
+import random
+import re
+import urllib.request
+
+
+class MockConfig:
+    """
+    Behaviour of the mock server.
+
+    Args:
+        latency: Seconds to wait before answering each request
+        jitter: Maximum random extra delay in seconds
+        rate_429: Fraction of requests answered with 429 Too Many Requests
+        retry_after: Retry-After value sent with injected 429s
+        item_bytes: Padding added to every item in list responses
+        total_invoices: Number of invoices each location reports for paging
+        burst: X-RateLimit-Max advertised to the client
+        recording_bytes: Size of the call recordings served, in bytes
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        jitter: float = 0.005,
+        rate_429: float = 0.0,
+        retry_after: float = 0.0,
+        item_bytes: int = 256,
+        total_invoices: int = 1000,
+        burst: int = 1_000_000,
+        recording_bytes: int = 256 * 1024
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.item_bytes = item_bytes
+        self.total_invoices = total_invoices
+        self.burst = burst
+        self.recording_bytes = recording_bytes
+
+
+class MockHandler:
+    """
+    Routes requests to canned responses and keeps the counters.
+    """
+
+    _FREE_SLOTS = re.compile(r"^/calendars/([^/]+)/free-slots$")
+    _TAGS = re.compile(r"^/contacts/([^/]+)/tags$")
+    _RECORDING = re.compile(r"^/conversations/messages/([^/]+)/locations/([^/]+)/recording$")
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.padding = "x" * config.item_bytes
+        self.recording = bytes(range(256)) * (config.recording_bytes // 256) + bytes(config.recording_bytes % 256)
+        self.reset()
+
+    def reset(self) -> None:
+        self.connections = 0
+        self.requests = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connections": self.connections,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "bytes_sent": self.bytes_sent,
+        }
+
+    def route(self, method: str, path: str, query: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        """Returns the status and a JSON-serializable payload, or bytes to send as-is."""
+        if path == "/contacts/upsert" and method == "POST":
+            payload = json.loads(body or b"{}")
+            return 200, {"new": True, "contact": {"id": f"c_{self.requests}", **payload, "pad": self.padding}}
+
+        if path in ("/invoices", "/invoices/") and method == "GET":
+            offset = int(query.get("offset", 0))
+            limit = int(query.get("limit", 10))
+            end = min(offset + limit, self.config.total_invoices)
+            invoices = [
+                {"_id": f"inv_{i}", "altId": query.get("altId"), "status": "paid", "total": i, "pad": self.padding}
+                for i in range(offset, end)
+            ]
+            return 200, {"invoices": invoices, "total": self.config.total_invoices}
+
+        match = self._FREE_SLOTS.match(path)
+        if match and method == "GET":
+            day = {"slots": [f"2024-01-01T{hour:02d}:00:00Z" for hour in range(9, 17)], "pad": self.padding}
+            return 200, {f"2024-01-{d:02d}": day for d in range(1, 8)}
+
+        match = self._TAGS.match(path)
+        if match and method in ("POST", "DELETE"):
+            return 200, {"tags": json.loads(body or b"{}").get("tags", [])}
+
+        if self._RECORDING.match(path) and method == "GET":
+            return 200, self.recording
+
+        return 200, {"success": True}
+
+    def response_headers(self, status: int) -> Dict[str, str]:
+        if status == 429:
+            return {"Retry-After": f"{self.config.retry_after:g}", "X-RateLimit-Remaining": "0"}
+        return {
+            "X-RateLimit-Remaining": str(self.config.burst),
+            "X-RateLimit-Max": str(self.config.burst),
+            "X-RateLimit-Interval-Milliseconds": "10000",
+        }
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                url = urlsplit(target)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                status, extra_headers, payload = self.dispatch(method, url.path, query, body)
+                content_type = "application/json"
+                if isinstance(payload, bytes):
+                    content_type = "application/octet-stream"
+                    extra_headers["Accept-Ranges"] = "bytes"
+                    start = int(re.match(r"bytes=(\d+)-", headers.get("range", "bytes=0-")).group(1))
+                    if start:
+                        status = 206
+                        extra_headers["Content-Range"] = f"bytes {start}-{len(payload) - 1}/{len(payload)}"
+                        payload = payload[start:]
+
+                if self.config.latency or self.config.jitter:
+                    await asyncio.sleep(self.config.latency + random.uniform(0, self.config.jitter))
+
+                data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                if not url.path.startswith("/__"):
+                    self.bytes_sent += len(data)
+                head = [f"HTTP/1.1 {status} {'OK' if status < 400 else 'Error'}",
+                        f"Content-Type: {content_type}", f"Content-Length: {len(data)}"]
+                head += [f"{name}: {value}" for name, value in extra_headers.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def dispatch(self, method: str, path: str, query: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], Any]:
+        if path == "/__stats":
+            # Don't count the benchmark's own bookkeeping connection.
+            self.connections -= 1
+            return 200, {}, self.stats()
+        if path == "/__reset":
+            self.reset()
+            return 200, {}, {}
+
+        self.requests += 1
+        if self.config.rate_429 and random.random() < self.config.rate_429:
+            self.throttled += 1
+            status, payload = 429, {"message": "Too Many Requests"}
+        else:
+            status, payload = self.route(method, path, query, body)
+        return status, self.response_headers(status), payload
+
+
+def _serve(config: MockConfig, port_queue: "multiprocessing.Queue") -> None:
+    async def main() -> None:
+        handler = MockHandler(config)
+        server = await asyncio.start_server(handler.handle, "127.0.0.1", 0, backlog=1024)
+        port_queue.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class MockServer:
+    """
+    Runs the mock server in a separate process, so its work doesn't compete
+    with the client being measured for the same event loop.
+
+    Args:
+        config: Server behaviour; defaults to MockConfig()
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "MockServer":
+        context = multiprocessing.get_context("spawn")
+        port_queue = context.Queue()
+        self._process = context.Process(target=_serve, args=(self.config, port_queue), daemon=True)
+        self._process.start()
+        self.port = port_queue.get(timeout=30)
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def _call(self, method: str, path: str) -> Dict[str, int]:
+        request = urllib.request.Request(f"{self.base_url}{path}", method=method, data=b"" if method == "POST" else None)
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def stats(self) -> Dict[str, int]:
+        return self._call("GET", "/__stats")
+
+    def reset(self) -> None:
+        self._call("POST", "/__reset")
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,281 @@
+"""
+Offline throughput benchmark for the request path.
+
+Starts the local mock server (benchmarks/mock_server.py), points the client
+at it with GHL_API_BASE_URL and runs representative workloads through the
+real endpoint functions, so pooling, rate limiting, retries, coalescing and
+dispatch are all measured together:
+
+    upsert      bursts of concurrent contact upserts
+    invoices    paging through every invoice of several locations
+    free_slots  concurrent free-slot lookups over a few calendars
+    tags        concurrent tag additions on many contacts
+    recordings  streaming call recordings to disk (--requests / 10 files)
+
+For each workload it reports requests/s, p50/p99 latency, the connections
+the server accepted and the process memory.
+
+    python benchmarks/throughput.py
+    python benchmarks/throughput.py --latency-ms 0 --save baseline.json
+    python benchmarks/throughput.py --latency-ms 0 --baseline baseline.json --tolerance 0.2
+    python benchmarks/throughput.py --rate-429 0.02 --workloads upsert tags
+    python benchmarks/throughput.py --workloads invoices --item-bytes 2048 --codec json
+
+With --baseline it exits non-zero if a workload's throughput drops, or its
+p99 grows, by more than the tolerance. Use --latency-ms 0 for regression
+checks so the numbers reflect the client's own overhead.
+"""
+from typing import Awaitable, Callable, Dict, List, Optional
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from mock_server import MockConfig, MockServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEADERS = {"Authorization": "Bearer benchmark-token", "Version": "2021-07-28"}
+
+Call = Callable[[], Awaitable[object]]
+
+
+def location(i: int, locations: int) -> str:
+    return f"loc_{i % locations}"
+
+
+async def upsert_workload(args: argparse.Namespace, timed: Callable[[Call], Awaitable[None]]) -> None:
+    from api.contacts.upsert import upsert_contact
+
+    async def one(i: int) -> None:
+        await timed(lambda: upsert_contact(
+            HEADERS,
+            location_id=location(i, args.locations),
+            first_name=f"Bench{i}",
+            email=f"bench{i}@example.com",
+            tags=["benchmark"]
+        ))
+
+    await run_concurrently(one, args.requests, args.concurrency)
+
+
+async def invoices_workload(args: argparse.Namespace, timed: Callable[[Call], Awaitable[None]]) -> None:
+    from api.invoices.list import list_invoices
+
+    pages = max(1, args.requests // args.locations)
+
+    async def page_through(i: int) -> None:
+        alt_id = location(i, args.locations)
+        for page in range(pages):
+            await timed(lambda: list_invoices(HEADERS, alt_id, limit=args.page_size, offset=page * args.page_size))
+
+    await run_concurrently(page_through, args.locations, args.concurrency)
+
+
+async def free_slots_workload(args: argparse.Namespace, timed: Callable[[Call], Awaitable[None]]) -> None:
+    from api.calendar.get_free_slots import get_free_slots
+
+    headers = dict(HEADERS, Version="2021-04-15")
+
+    async def one(i: int) -> None:
+        # A handful of calendars, so concurrent identical lookups coalesce.
+        await timed(lambda: get_free_slots(f"cal_{i % 8}", 1704067200000, 1704672000000, headers))
+
+    await run_concurrently(one, args.requests, args.concurrency)
+
+
+async def tags_workload(args: argparse.Namespace, timed: Callable[[Call], Awaitable[None]]) -> None:
+    from api.contacts.tags.add import add_tags_to_contact
+
+    tags = [f"tag-{n}" for n in range(5)]
+
+    async def one(i: int) -> None:
+        await timed(lambda: add_tags_to_contact(f"contact_{i}", tags, HEADERS))
+
+    await run_concurrently(one, args.requests, args.concurrency)
+
+
+async def recordings_workload(args: argparse.Namespace, timed: Callable[[Call], Awaitable[None]]) -> None:
+    from api.conversations.messages.get_recording import stream_recording
+
+    with tempfile.TemporaryDirectory() as directory:
+        async def one(i: int) -> None:
+            await timed(lambda: stream_recording(f"msg_{i}", location(i, args.locations), HEADERS,
+                                                 os.path.join(directory, f"msg_{i}.wav")))
+
+        await run_concurrently(one, max(1, args.requests // 10), args.concurrency)
+
+
+WORKLOADS = {
+    "upsert": upsert_workload,
+    "invoices": invoices_workload,
+    "free_slots": free_slots_workload,
+    "tags": tags_workload,
+    "recordings": recordings_workload,
+}
+
+
+async def run_concurrently(func: Callable[[int], Awaitable[None]], count: int, concurrency: int) -> None:
+    queue = iter(range(count))
+
+    async def worker() -> None:
+        for i in queue:
+            await func(i)
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, count))))
+
+
+def percentile(samples: List[float], q: int) -> float:
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method="inclusive")[q - 1]
+
+
+def rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run_workload(name: str, args: argparse.Namespace, server: MockServer) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+
+    async def timed(call: Call) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            await call()
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - start)
+
+    server.reset()
+    gc.collect()
+    if args.trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    await WORKLOADS[name](args, timed)
+    elapsed = time.perf_counter() - start
+    heap_peak = tracemalloc.get_traced_memory()[1] if args.trace_memory else 0
+    if args.trace_memory:
+        tracemalloc.stop()
+
+    stats = server.stats()
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "upstream_requests": stats["requests"],
+        "throttled": stats["throttled"],
+        "req_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "connections": stats["connections"],
+        "rss_mb": rss_mb(),
+        "heap_peak_kb": heap_peak / 1024,
+    }
+
+
+async def run_all(args: argparse.Namespace, server: MockServer) -> Dict[str, Dict[str, float]]:
+    from api.rate_limit import RateLimiter
+    from api.transport import PoolConfig, close_default_client, configure_pool
+
+    # The mock advertises a large limit; start the buckets there too so the
+    # first burst isn't throttled before any response has synced them.
+    configure_pool(PoolConfig(
+        max_connections=args.max_connections,
+        rate_limiter=RateLimiter(burst=10 ** 6, daily_limit=10 ** 9)
+    ))
+    results = {}
+    try:
+        for name in args.workloads:
+            results[name] = await run_workload(name, args, server)
+    finally:
+        await close_default_client()
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["req_s"] < before["req_s"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['req_s']:.0f} req/s, baseline {before['req_s']:.0f}")
+        if result["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {result['p99_ms']:.1f} ms, baseline {before['p99_ms']:.1f}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--requests", type=int, default=2000, help="calls per workload")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent callers")
+    parser.add_argument("--locations", type=int, default=10, help="distinct locations to spread calls over")
+    parser.add_argument("--page-size", type=int, default=100, help="invoices per page")
+    parser.add_argument("--max-connections", type=int, default=100, help="client pool size")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="server delay per request")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="random extra server delay")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--item-bytes", type=int, default=256, help="padding per item in responses")
+    parser.add_argument("--recording-kb", type=int, default=256, help="size of each call recording")
+    parser.add_argument("--codec", default="auto", help="JSON codec: auto, orjson, msgspec or json")
+    parser.add_argument("--trace-memory", action="store_true", help="also report the Python heap peak (slower)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--save", help="write results to this file, e.g. as a baseline")
+    parser.add_argument("--baseline", help="fail on regressions against this saved result file")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed regression against the baseline")
+    args = parser.parse_args(argv)
+    # Retry warnings for injected 429s would drown out the results.
+    logging.disable(logging.WARNING)
+
+    config = MockConfig(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        rate_429=args.rate_429,
+        item_bytes=args.item_bytes,
+        recording_bytes=args.recording_kb * 1024,
+        total_invoices=max(args.page_size, args.requests // args.locations * args.page_size)
+    )
+    with MockServer(config) as server:
+        # Must be set before api.registry is imported.
+        os.environ["GHL_API_BASE_URL"] = server.base_url
+        os.environ["GHL_JSON_CODEC"] = args.codec
+        sys.path.insert(0, ROOT)
+        results = asyncio.run(run_all(args, server))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'workload':12} {'calls':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} "
+              f"{'conns':>6} {'429s':>5} {'errors':>6} {'rss MB':>7}")
+        for name, r in results.items():
+            print(f"{name:12} {r['calls']:7d} {r['req_s']:9.0f} {r['p50_ms']:8.1f} {r['p99_ms']:8.1f} "
+                  f"{r['connections']:6d} {r['throttled']:5d} {r['errors']:6d} {r['rss_mb']:7.1f}")
+            if args.trace_memory:
+                print(f"{'':12} heap peak {r['heap_peak_kb']:.0f} KiB")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
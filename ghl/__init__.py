@@ -0,0 +1,32 @@
+"""
+Lazily loaded entry point for the Go High Level client.
+
+`import ghl` does no work up front; each attribute is resolved from the
+`api` package (or `webhooks`) the first time it is used:
+
+    import ghl
+    contact = await ghl.contacts.get_contact(contact_id, token)
+"""
+from typing import List
+import importlib
+
+import api
+
+
+def __getattr__(name: str) -> object:
+    if name == "webhooks":
+        value = importlib.import_module("webhooks")
+    else:
+        try:
+            value = getattr(api, name)
+        except AttributeError:
+            raise AttributeError(f"module 'ghl' has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(api.__all__ + ["webhooks"])
+
+
+__all__ = sorted(api.__all__ + ["webhooks"])
@@ -0,0 +1,60 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api.companies.get import get_company
+from api.dispatch import build_headers
+from api.registry import get_endpoint
+from api.sass.pause import pause_sub_account
+from api.transport import use_client
+
+# Wrappers that always sent their own Version header before the endpoint registry.
+PINNED = {
+    "sass.pause": "2021-04-15",
+    "sass.update": "2021-04-15",
+    "sass.get_location_stripe_id": "2021-04-15",
+    "companies.get": "2021-07-28",
+    "users.create_user": "2021-07-28",
+    "sub_accounts.search.search": "2021-07-28",
+    "payments.custom_provider.create": "2021-07-28",
+    "payments.custom_provider.create_config": "2021-07-28",
+    "payments.custom_provider.disconnect": "2021-07-28",
+    "payments.custom_provider.fetch": "2021-07-28",
+    "funnels.redirect.update": "2021-07-28",
+    "invoices.estimate.generate_estimate_number": "2021-07-28",
+    "social_planner.posts.edit": "2021-07-28",
+    "associations.get_associan_object_keys": "2021-07-28",
+}
+
+HEADERS = {"Authorization": "Bearer token", "Version": "1999-01-01"}
+
+
+@pytest.mark.parametrize("name, version", sorted(PINNED.items()))
+def test_pinned_endpoint_ignores_caller_version(name, version):
+    endpoint = get_endpoint(name)
+    assert endpoint.pinned
+    assert endpoint.version == version
+    assert dict(build_headers(endpoint, HEADERS))["Version"] == version
+    assert dict(build_headers(endpoint, HEADERS, version="1999-01-01"))["Version"] == version
+
+
+def test_unpinned_endpoint_uses_caller_version():
+    assert dict(build_headers(get_endpoint("contacts.get"), HEADERS))["Version"] == "1999-01-01"
+
+
+def test_pinned_version_is_sent():
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append((request.url.path, request.headers["Version"]))
+        return httpx.Response(200, json={})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with use_client(client):
+                await pause_sub_account("loc", HEADERS, True, "company")
+                await get_company("company", HEADERS)
+
+    asyncio.run(run())
+    assert [version for _, version in sent] == ["2021-04-15", "2021-07-28"]
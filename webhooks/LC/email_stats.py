@@ -72,57 +72,58 @@ def process_lc_email_stats(data: Dict) -> LCEmailStats:
     return LCEmailStats.parse_obj(data)
 
 # Example usage
-example_data = {
-    "type": "LCEmailStats",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "companyId": "ve9EPM428h8vShlRW1KT",
-    "webhookPayload": {
-        "event": "delivered",
-        "id": "ve9EPM428h8vShlRW1KT",
-        "timestamp": 1714032441,
-        "flags": {
-            "is-authenticated": True,
-            "is-routed": False,
-            "is-big": False,
-            "is-system-test": False,
-            "is-test-mode": False
-        },
-        "message": {
-            "attachments": [],
-            "headers": {
-                "message-id": "<message-id>",
-                "from": "Aaditya Chakravarty <dummy@example.com>",
-                "to": "test@example.com"
+if __name__ == "__main__":
+    example_data = {
+        "type": "LCEmailStats",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "companyId": "ve9EPM428h8vShlRW1KT",
+        "webhookPayload": {
+            "event": "delivered",
+            "id": "ve9EPM428h8vShlRW1KT",
+            "timestamp": 1714032441,
+            "flags": {
+                "is-authenticated": True,
+                "is-routed": False,
+                "is-big": False,
+                "is-system-test": False,
+                "is-test-mode": False
             },
-            "size": 1725
-        },
-        "log-level": "info",
-        "recipient": "test@example.com",
-        "recipient-domain": "example.com",
-        "tags": ["loc_ve9EPM428h8vShlRW1KT", "com_ve9EPM428h8vShlRW1KT", "et_other"],
-        "recipient-provider": "Other",
-        "campaigns": [],
-        "delivery-status": {
-            "attempt-no": 1,
-            "code": 250,
-            "message": "OK",
-            "description": "",
-            "session-seconds": 0.087,
-            "enhanced-code": "",
-            "mx-host": "mail.example.com",
-            "utf8": True,
-            "i-first-delivery-attempt-seconds": 0.047
-        },
-        "envelope": {
-            "sender": "<sender-id>",
-            "targets": "test@example.com",
-            "transport": "smtp",
-            "sending-ip": "127.0.0.1",
-            "i-ip-pool-id": "65cc66e77a4d4f63649d394c",
-            "i-ip-pool-name": "<pool-name>"
+            "message": {
+                "attachments": [],
+                "headers": {
+                    "message-id": "<message-id>",
+                    "from": "Aaditya Chakravarty <dummy@example.com>",
+                    "to": "test@example.com"
+                },
+                "size": 1725
+            },
+            "log-level": "info",
+            "recipient": "test@example.com",
+            "recipient-domain": "example.com",
+            "tags": ["loc_ve9EPM428h8vShlRW1KT", "com_ve9EPM428h8vShlRW1KT", "et_other"],
+            "recipient-provider": "Other",
+            "campaigns": [],
+            "delivery-status": {
+                "attempt-no": 1,
+                "code": 250,
+                "message": "OK",
+                "description": "",
+                "session-seconds": 0.087,
+                "enhanced-code": "",
+                "mx-host": "mail.example.com",
+                "utf8": True,
+                "i-first-delivery-attempt-seconds": 0.047
+            },
+            "envelope": {
+                "sender": "<sender-id>",
+                "targets": "test@example.com",
+                "transport": "smtp",
+                "sending-ip": "127.0.0.1",
+                "i-ip-pool-id": "65cc66e77a4d4f63649d394c",
+                "i-ip-pool-name": "<pool-name>"
+            }
         }
     }
-}
 
-lc_email_stats = process_lc_email_stats(example_data)
-print(lc_email_stats)
\ No newline at end of file
+    lc_email_stats = process_lc_email_stats(example_data)
+    print(lc_email_stats)
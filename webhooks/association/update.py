@@ -19,24 +19,25 @@ class AssociationUpdate(BaseModel):
         allow_population_by_field_name = True
 
 # Example usage
-example_data = {
-    "id": "67ade73d1119d2ac7ad0c475",
-    "associationType": "USER_DEFINED",
-    "firstObjectKey": "custom_objects.real_estate_buyer",
-    "firstObjectLabel": "Interested Buyer",
-    "firstObjectToSecondObjectCardinality": "MANY_TO_MANY",
-    "secondObjectKey": "custom_objects.property",
-    "secondObjectLabel": "Property",
-    "secondObjectToFirstObjectCardinality": "MANY_TO_MANY",
-    "key": "buyer_property_interest",
-    "locationId": "eHy2cOSZxMQzQ6Yyvl8P",
-    "timestamp": "2023-05-17T12:34:56.789Z"
-}
+if __name__ == "__main__":
+    example_data = {
+        "id": "67ade73d1119d2ac7ad0c475",
+        "associationType": "USER_DEFINED",
+        "firstObjectKey": "custom_objects.real_estate_buyer",
+        "firstObjectLabel": "Interested Buyer",
+        "firstObjectToSecondObjectCardinality": "MANY_TO_MANY",
+        "secondObjectKey": "custom_objects.property",
+        "secondObjectLabel": "Property",
+        "secondObjectToFirstObjectCardinality": "MANY_TO_MANY",
+        "key": "buyer_property_interest",
+        "locationId": "eHy2cOSZxMQzQ6Yyvl8P",
+        "timestamp": "2023-05-17T12:34:56.789Z"
+    }
 
-association_update = AssociationUpdate(**example_data)
-print(association_update)
+    association_update = AssociationUpdate(**example_data)
+    print(association_update)
 
-# Additional Notes:
-# 1. Ensure your webhook listener is set up to handle POST requests.
-# 2. The firstObjectKey and secondObjectKey define relationships between entities.
-# 3. Use the id field for debugging and logging purposes.
+    # Additional Notes:
+    # 1. Ensure your webhook listener is set up to handle POST requests.
+    # 2. The firstObjectKey and secondObjectKey define relationships between entities.
+    # 3. Use the id field for debugging and logging purposes.
@@ -36,44 +36,45 @@ class ContactDndUpdate:
         return f"ContactDndUpdate(id={self.id}, name={self.name}, dnd={self.dnd})"
 
 # Example usage:
-example_data = {
-    "type": "ContactDndUpdate",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "nmFmQEsNgz6AVpgLVUJ0",
-    "address1": "3535 1st St N",
-    "city": "ruDolomitebika",
-    "state": "AL",
-    "companyName": "Loram ipsum",
-    "country": "DE",
-    "source": "xyz form",
-    "dateAdded": "2021-11-26T12:41:02.193Z",
-    "dateOfBirth": "2000-01-05T00:00:00.000Z",
-    "dnd": True,
-    "dndSettings": {
-        "SMS": {"status": "inactive", "message": "Some message", "code": "101"},
-        "Call": {"status": "inactive", "message": "Some message", "code": "101"},
-        "Email": {"status": "active", "message": "Some message", "code": "101"},
-        "GMB": {"status": "active", "message": "Some message", "code": "101"},
-        "FB": {"status": "active", "message": "Some message", "code": "101"},
-        "WhatsApp": {"status": "active", "message": "Some message", "code": "101"}
-    },
-    "email": "JohnDeo@gmail.comm",
-    "name": "John Deo",
-    "firstName": "John",
-    "lastName": "Deo",
-    "phone": "+919509597501",
-    "postalCode": "452001",
-    "tags": ["id magna sed Lorem", "Duis dolor commodo aliqua"],
-    "website": "https://www.google.com/",
-    "attachments": [],
-    "assignedTo": "nmFmQEsNgz6AVpgLVUJ0",
-    "customFields": [
-        {
-            "id": "BcdmQEsNgz6AVpgLVUJ0",
-            "value": "XYZ Corp"
-        }
-    ]
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "ContactDndUpdate",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "nmFmQEsNgz6AVpgLVUJ0",
+        "address1": "3535 1st St N",
+        "city": "ruDolomitebika",
+        "state": "AL",
+        "companyName": "Loram ipsum",
+        "country": "DE",
+        "source": "xyz form",
+        "dateAdded": "2021-11-26T12:41:02.193Z",
+        "dateOfBirth": "2000-01-05T00:00:00.000Z",
+        "dnd": True,
+        "dndSettings": {
+            "SMS": {"status": "inactive", "message": "Some message", "code": "101"},
+            "Call": {"status": "inactive", "message": "Some message", "code": "101"},
+            "Email": {"status": "active", "message": "Some message", "code": "101"},
+            "GMB": {"status": "active", "message": "Some message", "code": "101"},
+            "FB": {"status": "active", "message": "Some message", "code": "101"},
+            "WhatsApp": {"status": "active", "message": "Some message", "code": "101"}
+        },
+        "email": "JohnDeo@gmail.comm",
+        "name": "John Deo",
+        "firstName": "John",
+        "lastName": "Deo",
+        "phone": "+919509597501",
+        "postalCode": "452001",
+        "tags": ["id magna sed Lorem", "Duis dolor commodo aliqua"],
+        "website": "https://www.google.com/",
+        "attachments": [],
+        "assignedTo": "nmFmQEsNgz6AVpgLVUJ0",
+        "customFields": [
+            {
+                "id": "BcdmQEsNgz6AVpgLVUJ0",
+                "value": "XYZ Corp"
+            }
+        ]
+    }
 
-contact_update = ContactDndUpdate(example_data)
-print(contact_update)
\ No newline at end of file
+    contact_update = ContactDndUpdate(example_data)
+    print(contact_update)
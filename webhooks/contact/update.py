@@ -33,35 +33,36 @@ class ContactUpdate:
         return cls(data)
 
 # Example usage
-example_data = {
-    "type": "ContactUpdate",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "nmFmQEsNgz6AVpgLVUJ0",
-    "address1": "3535 1st St N",
-    "city": "ruDolomitebika",
-    "state": "AL",
-    "companyName": "Loram ipsum",
-    "country": "DE",
-    "source": "xyz form",
-    "dateAdded": "2021-11-26T12:41:02.193Z",
-    "dateOfBirth": "2000-01-05T00:00:00.000Z",
-    "dnd": True,
-    "email": "JohnDeo@gmail.comm",
-    "name": "John Deo",
-    "firstName": "John",
-    "lastName": "Deo",
-    "phone": "+919509597501",
-    "postalCode": "452001",
-    "tags": ["id magna sed Lorem", "Duis dolor commodo aliqua"],
-    "website": "https://www.google.com/",
-    "attachments": [],
-    "assignedTo": "nmFmQEsNgz6AVpgLVUJ0",
-    "customFields": [
-        {
-            "id": "BcdmQEsNgz6AVpgLVUJ0",
-            "value": "XYZ Corp"
-        }
-    ]
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "ContactUpdate",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "nmFmQEsNgz6AVpgLVUJ0",
+        "address1": "3535 1st St N",
+        "city": "ruDolomitebika",
+        "state": "AL",
+        "companyName": "Loram ipsum",
+        "country": "DE",
+        "source": "xyz form",
+        "dateAdded": "2021-11-26T12:41:02.193Z",
+        "dateOfBirth": "2000-01-05T00:00:00.000Z",
+        "dnd": True,
+        "email": "JohnDeo@gmail.comm",
+        "name": "John Deo",
+        "firstName": "John",
+        "lastName": "Deo",
+        "phone": "+919509597501",
+        "postalCode": "452001",
+        "tags": ["id magna sed Lorem", "Duis dolor commodo aliqua"],
+        "website": "https://www.google.com/",
+        "attachments": [],
+        "assignedTo": "nmFmQEsNgz6AVpgLVUJ0",
+        "customFields": [
+            {
+                "id": "BcdmQEsNgz6AVpgLVUJ0",
+                "value": "XYZ Corp"
+            }
+        ]
+    }
 
-contact_update = ContactUpdate.from_dict(example_data)
\ No newline at end of file
+    contact_update = ContactUpdate.from_dict(example_data)
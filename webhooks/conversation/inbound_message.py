@@ -109,26 +109,27 @@ class InboundMessage:
         )
 
 # Example usage:
-sms_example = {
-    "type": "InboundMessage",
-    "locationId": "l1C08ntBrFjLS0elLIYU",
-    "attachments": [],
-    "body": "This is a test message",
-    "contactId": "cI08i1Bls3iTB9bKgFJh",
-    "contentType": "text/plain",
-    "conversationId": "fcanlLgpbQgQhderivVs",
-    "dateAdded": "2021-04-21T11:31:45.750Z",
-    "direction": "inbound",
-    "messageType": "SMS",
-    "status": "delivered",
-    "messageId": "someMessageId",
-    "conversationProviderId": "cI08i1Bls3iTB9bKgF01"
-}
+if __name__ == "__main__":
+    sms_example = {
+        "type": "InboundMessage",
+        "locationId": "l1C08ntBrFjLS0elLIYU",
+        "attachments": [],
+        "body": "This is a test message",
+        "contactId": "cI08i1Bls3iTB9bKgFJh",
+        "contentType": "text/plain",
+        "conversationId": "fcanlLgpbQgQhderivVs",
+        "dateAdded": "2021-04-21T11:31:45.750Z",
+        "direction": "inbound",
+        "messageType": "SMS",
+        "status": "delivered",
+        "messageId": "someMessageId",
+        "conversationProviderId": "cI08i1Bls3iTB9bKgF01"
+    }
 
-sms_message = InboundMessage.from_dict(sms_example)
+    sms_message = InboundMessage.from_dict(sms_example)
 
-# For listening to inbound messages, use the following webhook URL:
-# https://services.leadconnectorhq.com/conversations/providers/twilio/inbound_message
+    # For listening to inbound messages, use the following webhook URL:
+    # https://services.leadconnectorhq.com/conversations/providers/twilio/inbound_message
 
-# Old messaging webhook URL (for reference):
-# https://services.leadconnectorhq.com/appengine/twilio/incoming_message
\ No newline at end of file
+    # Old messaging webhook URL (for reference):
+    # https://services.leadconnectorhq.com/appengine/twilio/incoming_message
@@ -50,30 +50,31 @@ class ConversationProviderOutboundMessage:
         )
 
 # Example usage:
-sms_example = {
-    "contactId": "GKBhT6BfwY9mjzXAU3sq",
-    "locationId": "GKAWb4yu7A4LSc0skQ6g",
-    "messageId": "GKJxs4P5L8dWc5CFUITM",
-    "type": "SMS",
-    "phone": "+15864603685",
-    "message": "The text message to be sent to the contact",
-    "attachments": ["https://www.google.com/images/branding/googlelogo/1x/googlelogo_color_272x92dp.png"],
-    "userId": "GK56r6wdJDrkUPd0xsmx"
-}
+if __name__ == "__main__":
+    sms_example = {
+        "contactId": "GKBhT6BfwY9mjzXAU3sq",
+        "locationId": "GKAWb4yu7A4LSc0skQ6g",
+        "messageId": "GKJxs4P5L8dWc5CFUITM",
+        "type": "SMS",
+        "phone": "+15864603685",
+        "message": "The text message to be sent to the contact",
+        "attachments": ["https://www.google.com/images/branding/googlelogo/1x/googlelogo_color_272x92dp.png"],
+        "userId": "GK56r6wdJDrkUPd0xsmx"
+    }
 
-email_example = {
-    "contactId": "GKKFF0QB9gV8fGA6zEbr",
-    "locationId": "GKifVDyQeo7nwe27vMP0",
-    "messageId": "GK56r6wdJDrkUPd0xsmx",
-    "emailMessageId": "GK56r6wdJDrkUPd0xsmx",
-    "type": "Email",
-    "emailTo": ["abc@gmail.com"],
-    "emailFrom": "From Name <email@gmail.com>",
-    "attachments": ["https://www.google.com/images/branding/googlelogo/1x/googlelogo_color_272x92dp.png"],
-    "html": "<div style=\"font-family: verdana, geneva; font-size: 11pt;\"><p>Testing an outbound email from custom provider.</p></div>",
-    "subject": "Subject from Conversation Page",
-    "userId": "GK56r6wdJDrkUPd0xsmx"
-}
+    email_example = {
+        "contactId": "GKKFF0QB9gV8fGA6zEbr",
+        "locationId": "GKifVDyQeo7nwe27vMP0",
+        "messageId": "GK56r6wdJDrkUPd0xsmx",
+        "emailMessageId": "GK56r6wdJDrkUPd0xsmx",
+        "type": "Email",
+        "emailTo": ["abc@gmail.com"],
+        "emailFrom": "From Name <email@gmail.com>",
+        "attachments": ["https://www.google.com/images/branding/googlelogo/1x/googlelogo_color_272x92dp.png"],
+        "html": "<div style=\"font-family: verdana, geneva; font-size: 11pt;\"><p>Testing an outbound email from custom provider.</p></div>",
+        "subject": "Subject from Conversation Page",
+        "userId": "GK56r6wdJDrkUPd0xsmx"
+    }
 
-sms_message = ConversationProviderOutboundMessage.from_dict(sms_example)
-email_message = ConversationProviderOutboundMessage.from_dict(email_example)
\ No newline at end of file
+    sms_message = ConversationProviderOutboundMessage.from_dict(sms_example)
+    email_message = ConversationProviderOutboundMessage.from_dict(email_example)
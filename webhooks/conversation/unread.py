@@ -18,15 +18,16 @@ class ConversationUnreadUpdate:
         return cls(data)
 
 # Example usage
-example_data = {
-    "type": "ConversationUnreadUpdate",
-    "locationId": "ADVlSQnPsdq3hinusd6C3",
-    "id": "MzKIpg0rEIH2ZUGKf6BS",
-    "contactId": "zsYhPBOUsEHtrK508Wm9",
-    "deleted": False,
-    "inbox": False,
-    "starred": True,
-    "unreadCount": 0
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "ConversationUnreadUpdate",
+        "locationId": "ADVlSQnPsdq3hinusd6C3",
+        "id": "MzKIpg0rEIH2ZUGKf6BS",
+        "contactId": "zsYhPBOUsEHtrK508Wm9",
+        "deleted": False,
+        "inbox": False,
+        "starred": True,
+        "unreadCount": 0
+    }
 
-conversation_unread_update = ConversationUnreadUpdate.from_dict(example_data)
\ No newline at end of file
+    conversation_unread_update = ConversationUnreadUpdate.from_dict(example_data)
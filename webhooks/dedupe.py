@@ -0,0 +1,177 @@
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+import collections
+import hashlib
+import re
+import sqlite3
+import time
+
+from api.codec import get_codec
+
+_WEBHOOK_ID = re.compile(rb'"webhookId"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def body_key(body: bytes) -> bytes:
+    """
+    Identify a webhook delivery from its raw body, without decoding it: by
+    the body's webhookId, or, for bodies without one, by a hash of the whole
+    body (redeliveries repeat the same body). Returns a 16-byte digest, the
+    same `webhook_key` gives for the decoded payload with a webhookId.
+    """
+    match = _WEBHOOK_ID.search(body)
+    if match is None:
+        return hashlib.blake2b(body, digest_size=16).digest()
+    webhook_id = match.group(1)
+    if b"\\" in webhook_id:
+        webhook_id = get_codec().loads(b'"' + webhook_id + b'"').encode()
+    return hashlib.blake2b(webhook_id, digest_size=16).digest()
+
+
+def webhook_key(payload: Optional[Mapping[str, Any]] = None, body: Optional[bytes] = None) -> bytes:
+    """
+    Identify a webhook delivery: from its raw body if given (see `body_key`),
+    else by the payload's webhookId, else by a hash of the re-encoded payload.
+    Returns a 16-byte digest.
+    """
+    if body is not None:
+        return body_key(body)
+    webhook_id = payload.get("webhookId")
+    if webhook_id is None:
+        return hashlib.blake2b(get_codec().dumps(payload), digest_size=16).digest()
+    return hashlib.blake2b(str(webhook_id).encode(), digest_size=16).digest()
+
+
+class DedupeFilter:
+    """
+    Remembers recently seen webhook deliveries so redeliveries can be
+    skipped before any model is built or handler runs.
+
+    Keys are kept for `window` seconds in an LRU of at most `max_entries`
+    16-byte digests, so memory stays fixed however many webhooks arrive.
+    With `path`, keys are also written to a SQLite file, so deliveries seen
+    before a restart (or by another process on the same file) are still
+    recognised within the window. Writes are buffered and committed together
+    every `batch` keys or `flush_interval` seconds, so recording a delivery
+    rarely touches the disk; keys recorded since the last commit are lost on
+    a crash.
+
+        dedupe = DedupeFilter(window=3600)
+        if dedupe.check(body=body):
+            return  # already handled
+
+    Args:
+        window: Seconds a delivery is remembered
+        max_entries: Keys kept in memory; the least recently seen go first
+        path: SQLite file to persist keys to
+        batch: Keys buffered before they are written to `path`
+        flush_interval: Seconds buffered keys wait at most before being written
+    """
+
+    def __init__(
+        self,
+        window: float = 86400.0,
+        max_entries: int = 100_000,
+        path: Optional[str] = None,
+        batch: int = 256,
+        flush_interval: float = 1.0
+    ):
+        self.window = window
+        self.max_entries = max_entries
+        self.path = path
+        self.batch = batch
+        self.flush_interval = flush_interval
+        self.checked = 0
+        self.duplicates = 0
+        self._seen: "collections.OrderedDict[bytes, float]" = collections.OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple[bytes, float]] = []
+        self._flushed_at = time.monotonic()
+        self._writes = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS seen (key BLOB PRIMARY KEY, at REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS seen_at ON seen (at)")
+
+    def seen(self, key: Union[bytes, str], now: Optional[float] = None) -> bool:
+        """
+        Record a key and report whether it was already recorded within the window.
+        """
+        if isinstance(key, str):
+            key = key.encode()
+        now = time.time() if now is None else now
+        self.checked += 1
+
+        at = self._seen.get(key)
+        if at is not None and now - at < self.window:
+            self._seen.move_to_end(key)
+            self.duplicates += 1
+            return True
+
+        if self._db is not None and at is None:
+            row = self._db.execute("SELECT at FROM seen WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[0] < self.window:
+                self._remember(key, row[0])
+                self.duplicates += 1
+                return True
+
+        self._remember(key, now)
+        if self._db is not None:
+            self._pending.append((key, now))
+            if len(self._pending) >= self.batch or time.monotonic() - self._flushed_at >= self.flush_interval:
+                self.flush()
+        return False
+
+    def flush(self) -> None:
+        """Write buffered keys to the SQLite file in one transaction."""
+        self._flushed_at = time.monotonic()
+        if self._db is None or not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany("INSERT OR REPLACE INTO seen (key, at) VALUES (?, ?)", pending)
+            self._writes += len(pending)
+            if self._writes >= 1000:
+                self._writes = 0
+                self._db.execute("DELETE FROM seen WHERE at < ?", (pending[-1][1] - self.window,))
+
+    def _remember(self, key: bytes, at: float) -> None:
+        self._seen[key] = at
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+
+    def check(self, payload: Optional[Mapping[str, Any]] = None, body: Optional[bytes] = None) -> bool:
+        """
+        Record a webhook and report whether it is a redelivery. Pass the raw
+        body when at hand, so the payload needn't be decoded or re-encoded.
+        """
+        return self.seen(webhook_key(payload, body))
+
+    def discard(self, key: Union[bytes, str]) -> None:
+        """Drop a key recorded with `seen()`."""
+        if isinstance(key, str):
+            key = key.encode()
+        self._seen.pop(key, None)
+        if self._db is not None:
+            self._pending = [entry for entry in self._pending if entry[0] != key]
+            self._db.execute("DELETE FROM seen WHERE key = ?", (key,))
+
+    def forget(self, payload: Optional[Mapping[str, Any]] = None, body: Optional[bytes] = None) -> None:
+        """Drop a delivery, e.g. after its handler failed, so a redelivery is processed."""
+        self.discard(webhook_key(payload, body))
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "checked": self.checked,
+            "duplicates": self.duplicates,
+            "entries": len(self._seen),
+            "duplicate_rate": self.duplicates / self.checked if self.checked else 0.0,
+        }
+
+    def close(self) -> None:
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
@@ -0,0 +1,363 @@
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple, Type, Union
+import functools
+import keyword
+import re
+
+from api.codec import get_codec
+
+
+class WebhookValidationError(ValueError):
+    """Raised when a webhook body is not a JSON object or a required field is missing or of the wrong type."""
+
+
+@functools.lru_cache(maxsize=None)
+def _key(name: str) -> str:
+    # contact_id -> contactId; leading underscores (_id) are kept.
+    head, *rest = name.split("_") if not name.startswith("_") else (name,)
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return Block(value)
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        return [Block(item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+class Block:
+    """
+    Read-only attribute view over a decoded JSON object.
+
+    Attributes are looked up in the object by their camelCase key
+    (`block.contact_id` reads "contactId") or their exact key, and are None
+    when the key is absent. Nested objects and lists of objects are wrapped
+    in Blocks only when first accessed, so blocks a handler never reads
+    (customFields, contactSnapshot, ...) cost nothing beyond decoding.
+    """
+    __slots__ = ("_data", "_nested")
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._nested: Optional[Dict[str, Any]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name in Block.__slots__:
+            raise AttributeError(name)
+        data = self._data
+        key = _key(name)
+        if key not in data:
+            if name not in data:
+                return None
+            key = name
+        value = data[key]
+        if not isinstance(value, (dict, list)):
+            return value
+
+        nested = self._nested
+        if nested is None:
+            nested = self._nested = {}
+        if key not in nested:
+            nested[key] = _wrap(value)
+        return nested[key]
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The decoded JSON object itself."""
+        return self._data
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Block) and type(other) is type(self) and other._data == self._data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class WebhookEvent(Block):
+    """
+    A decoded webhook. Subclasses in EVENTS declare their type's fields as
+    slots: `event.contact_id` holds "contactId", or None if the payload left
+    it out, and a name the type doesn't declare raises AttributeError. Keys
+    beyond the declared fields stay readable with `event["key"]` or
+    `event.get("key")`.
+
+    A slot is filled from the payload the first time it is read, so fields a
+    handler never reads cost nothing beyond decoding.
+    """
+    __slots__ = ("type", "webhook_id", "timestamp")
+    type_name: ClassVar[str] = ""
+    required: ClassVar[Tuple[str, ...]] = ()
+    # Attribute -> payload key, for every slot.
+    fields: ClassVar[Dict[str, str]] = {"type": "type", "webhook_id": "webhookId", "timestamp": "timestamp"}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called while a slot is still empty, or for undeclared names.
+        key = self.fields.get(name)
+        if key is None:
+            raise AttributeError(f"{self.type_name or 'Webhook'} event has no field {name!r}")
+        value = _wrap(self._data.get(key))
+        setattr(self, name, value)
+        return value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WebhookEvent":
+        missing, wrong = [], []
+        for key in cls.required:
+            value = data.get(key)
+            expected = _REQUIRED_TYPES.get(key, str)
+            if value is None:
+                missing.append(key)
+            elif not isinstance(value, expected):
+                wrong.append(f"{key} must be {expected.__name__}, not {type(value).__name__}")
+        if missing or wrong:
+            problems = ([f"is missing {', '.join(missing)}"] if missing else []) + wrong
+            raise WebhookValidationError(f"{cls.type_name or 'Webhook'} payload {'; '.join(problems)}")
+        return cls(data)
+
+    @classmethod
+    def from_bytes(cls, body: Union[bytes, str]) -> "WebhookEvent":
+        return cls.from_dict(_object(body))
+
+
+# Webhook type -> fields every payload of that type must have.
+_REQUIRED: Dict[str, Tuple[str, ...]] = {
+    "AppointmentCreate": ("locationId", "appointment"),
+    "AppointmentDelete": ("locationId", "appointment"),
+    "AppointmentUpdate": ("locationId", "appointment"),
+    "AssociationCreate": ("id", "locationId"),
+    "AssociationDelete": ("id", "locationId"),
+    "AssociationUpdate": ("id", "locationId"),
+    "CampaignStatusUpdate": ("locationId", "id"),
+    "ContactCreate": ("locationId", "id"),
+    "ContactDelete": ("locationId", "id"),
+    "ContactDndUpdate": ("locationId", "id"),
+    "ContactTagUpdate": ("locationId", "id"),
+    "ContactUpdate": ("locationId", "id"),
+    "ConversationUnreadUpdate": ("locationId", "id"),
+    "INSTALL": ("appId",),
+    "InboundMessage": ("locationId", "contactId", "conversationId", "messageId"),
+    "InvoiceCreate": ("_id",),
+    "InvoiceDelete": ("_id",),
+    "InvoicePaid": ("_id",),
+    "InvoicePartiallyPaid": ("_id",),
+    "InvoiceSent": ("_id",),
+    "InvoiceUpdate": ("_id",),
+    "InvoiceVoid": ("_id",),
+    "LCEmailStats": ("locationId", "webhookPayload"),
+    "LocationCreate": ("id", "companyId"),
+    "LocationUpdate": ("id", "companyId"),
+    "NoteCreate": ("locationId", "id"),
+    "NoteDelete": ("locationId", "id"),
+    "NoteUpdate": ("locationId", "id"),
+    "ObjectSchemaCreate": ("id", "key", "locationId"),
+    "ObjectSchemaUpdate": ("id", "key", "locationId"),
+    "OpportunityAssignedToUpdate": ("locationId", "id"),
+    "OpportunityCreate": ("locationId", "id"),
+    "OpportunityDelete": ("locationId", "id"),
+    "OpportunityMonetaryValueUpdate": ("locationId", "id"),
+    "OpportunityStageUpdate": ("locationId", "id"),
+    "OpportunityStatusUpdate": ("locationId", "id"),
+    "OpportunityUpdate": ("locationId", "id"),
+    "OrderCreate": ("_id", "locationId"),
+    "OrderStatusUpdate": ("_id", "locationId"),
+    "OutboundMessage": ("locationId", "contactId", "conversationId", "messageId"),
+    "PLAN_CHANGE": ("appId", "companyId"),
+    "PriceCreate": ("locationId",),
+    "PriceDelete": ("locationId",),
+    "PriceUpdate": ("locationId",),
+    "ProductCreate": ("locationId",),
+    "ProductDelete": ("locationId",),
+    "ProductUpdate": ("locationId",),
+    "RecordCreate": ("id", "locationId"),
+    "RecordDelete": ("id", "locationId"),
+    "RecordUpdate": ("id", "locationId"),
+    "RelationCreate": ("id", "locationId"),
+    "RelationDelete": ("id", "locationId"),
+    "TaskComplete": ("locationId", "id"),
+    "TaskCreate": ("locationId", "id"),
+    "TaskDelete": ("locationId", "id"),
+    "UNINSTALL": ("appId",),
+    "UserCreate": ("id",),
+}
+
+# Required fields that aren't strings.
+_REQUIRED_TYPES: Dict[str, type] = {"appointment": dict, "webhookPayload": dict}
+
+# The other fields of each webhook type, from the per-module models.
+_CONTACT = (
+    "address1", "city", "state", "companyName", "country", "source", "dateAdded", "dateOfBirth", "dnd", "email",
+    "name", "firstName", "lastName", "phone", "postalCode", "tags", "website", "attachments", "assignedTo",
+    "customFields",
+)
+_MESSAGE = (
+    "attachments", "body", "contentType", "userId", "conversationProviderId", "callDuration", "callStatus",
+    "emailMessageId", "threadId", "provider", "to", "cc", "bcc", "from", "subject", "direction", "messageType",
+    "status", "dateAdded", "source",
+)
+_INVOICE = (
+    "status", "liveMode", "amountPaid", "altId", "altType", "name", "businessDetails", "invoiceNumber", "currency",
+    "contactDetails", "issueDate", "dueDate", "discount", "invoiceItems", "total", "title", "amountDue", "createdAt",
+    "updatedAt", "totalSummary",
+)
+_ASSOCIATION = (
+    "associationType", "key", "firstObjectKey", "firstObjectLabel", "firstObjectToSecondObjectCardinality",
+    "secondObjectKey", "secondObjectLabel", "secondObjectToFirstObjectCardinality",
+)
+_OBJECT_SCHEMA = (
+    "labels", "description", "searchableProperties", "primaryDisplayProperty", "createdBy", "updatedBy",
+    "objectType", "createdAt", "updatedAt",
+)
+_OPPORTUNITY = (
+    "assignedTo", "contactId", "monetaryValue", "name", "pipelineId", "pipelineStageId", "source", "status",
+    "dateAdded",
+)
+_ORDER = (
+    "altId", "altType", "status", "taxSummary", "fulfillmentStatus", "contactId", "currency", "amount", "liveMode",
+    "amountSummary", "source", "createdAt", "updatedAt", "contactSnapshot", "items",
+)
+_PRICE = (
+    "_id", "membershipOffers", "variantOptionIds", "product", "userId", "name", "priceType", "currency", "amount",
+    "recurring", "createdAt", "updatedAt", "compareAtPrice", "trackInventory", "availableQuantity",
+    "allowOutOfStockPurchases",
+)
+_PRODUCT = (
+    "_id", "description", "variants", "medias", "name", "productType", "availableInStore", "userId", "createdAt",
+    "updatedAt", "statementDescriptor", "image",
+)
+_LOCATION = ("name", "email", "stripeProductId")
+_NOTE = ("body", "contactId", "dateAdded")
+_RECORD = ("owners", "followers", "properties")
+_RELATION = ("firstObjectKey", "firstRecordId", "secondObjectKey", "secondRecordId", "associationId")
+_TASK = ("assignedTo", "body", "contactId", "title", "dateAdded", "dueDate")
+
+_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "AppointmentCreate": (),
+    "AppointmentDelete": (),
+    "AppointmentUpdate": (),
+    "AssociationCreate": _ASSOCIATION,
+    "AssociationDelete": _ASSOCIATION,
+    "AssociationUpdate": _ASSOCIATION,
+    "CampaignStatusUpdate": ("contactId", "status", "templateId", "replied", "dateAdded"),
+    "ContactCreate": _CONTACT,
+    "ContactDelete": _CONTACT,
+    "ContactDndUpdate": _CONTACT + ("dndSettings",),
+    "ContactTagUpdate": _CONTACT,
+    "ContactUpdate": _CONTACT,
+    "ConversationUnreadUpdate": ("contactId", "unreadCount", "inbox", "starred", "deleted"),
+    "INSTALL": (
+        "locationId", "companyId", "userId", "planId", "trial", "isWhitelabelCompany", "whitelabelDetails",
+        "companyName",
+    ),
+    "InboundMessage": _MESSAGE,
+    "InvoiceCreate": _INVOICE,
+    "InvoiceDelete": _INVOICE,
+    "InvoicePaid": _INVOICE,
+    "InvoicePartiallyPaid": _INVOICE,
+    "InvoiceSent": _INVOICE,
+    "InvoiceUpdate": _INVOICE,
+    "InvoiceVoid": _INVOICE,
+    "LCEmailStats": ("companyId",),
+    "LocationCreate": _LOCATION,
+    "LocationUpdate": _LOCATION,
+    "NoteCreate": _NOTE,
+    "NoteDelete": _NOTE,
+    "NoteUpdate": _NOTE,
+    "ObjectSchemaCreate": _OBJECT_SCHEMA,
+    "ObjectSchemaUpdate": _OBJECT_SCHEMA,
+    "OpportunityAssignedToUpdate": _OPPORTUNITY,
+    "OpportunityCreate": _OPPORTUNITY,
+    "OpportunityDelete": _OPPORTUNITY,
+    "OpportunityMonetaryValueUpdate": _OPPORTUNITY,
+    "OpportunityStageUpdate": _OPPORTUNITY,
+    "OpportunityStatusUpdate": _OPPORTUNITY,
+    "OpportunityUpdate": _OPPORTUNITY,
+    "OrderCreate": _ORDER,
+    "OrderStatusUpdate": _ORDER,
+    "OutboundMessage": _MESSAGE,
+    "PLAN_CHANGE": ("locationId", "userId", "currentPlanId", "newPlanId"),
+    "PriceCreate": _PRICE,
+    "PriceDelete": _PRICE,
+    "PriceUpdate": _PRICE,
+    "ProductCreate": _PRODUCT,
+    "ProductDelete": _PRODUCT,
+    "ProductUpdate": _PRODUCT,
+    "RecordCreate": _RECORD,
+    "RecordDelete": _RECORD,
+    "RecordUpdate": _RECORD,
+    "RelationCreate": _RELATION,
+    "RelationDelete": _RELATION,
+    "TaskComplete": _TASK,
+    "TaskCreate": _TASK,
+    "TaskDelete": _TASK,
+    "UNINSTALL": ("locationId", "companyId"),
+    "UserCreate": ("locationId", "companyId", "firstName", "lastName", "email", "phone", "extension", "role",
+                   "permissions", "locations"),
+}
+
+
+def _attribute(key: str) -> str:
+    # contactId -> contact_id, from -> from_
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", key).lower()
+    return name + "_" if keyword.iskeyword(name) else name
+
+
+def _event_class(type_name: str) -> Type[WebhookEvent]:
+    required = _REQUIRED[type_name]
+    keys = tuple(key for key in dict.fromkeys(required + _FIELDS[type_name]) if key != "type")
+    attrs = tuple(_attribute(key) for key in keys)
+    return type(type_name, (WebhookEvent,), {
+        "__slots__": attrs,
+        "type_name": type_name,
+        "required": required,
+        "fields": {**WebhookEvent.fields, **dict(zip(attrs, keys))},
+    })
+
+
+# Webhook type -> its WebhookEvent subclass.
+EVENTS: Dict[str, Type[WebhookEvent]] = {type_name: _event_class(type_name) for type_name in _REQUIRED}
+
+
+def _object(body: Union[bytes, str]) -> Dict[str, Any]:
+    try:
+        data = get_codec().loads(body)
+    except ValueError as e:
+        raise WebhookValidationError(f"Webhook body is not valid JSON: {e}") from None
+    if not isinstance(data, dict):
+        raise WebhookValidationError("Webhook body is not a JSON object")
+    return data
+
+
+def parse(data: Dict[str, Any]) -> WebhookEvent:
+    """
+    Wrap a decoded webhook payload in the event class for its type; unknown
+    types get a plain WebhookEvent.
+
+    Raises:
+        WebhookValidationError: If a required field is missing
+    """
+    return EVENTS.get(data.get("type"), WebhookEvent).from_dict(data)
+
+
+def decode(body: Union[bytes, str]) -> WebhookEvent:
+    """
+    Decode a raw webhook body into the event class for its type.
+
+        event = decode(request_body)
+        if event.type_name == "ContactCreate":
+            print(event.email, event.custom_fields[0].value)
+
+    Raises:
+        WebhookValidationError: If the body isn't a JSON object or a required field is missing
+    """
+    return parse(_object(body))
@@ -82,62 +82,63 @@ def handle_paid_invoice(invoice: Invoice):
     print(f"Customer: {invoice.contactDetails.name}")
 
 # Example usage
-example_invoice = Invoice(
-    _id="6578278e879ad2646715ba9c",
-    status="paid",
-    liveMode=False,
-    amountPaid=999,
-    altId="6578278e879ad2646715ba9c",
-    altType="location",
-    name="New Invoice",
-    businessDetails=BusinessDetails(
-        name="ABC Corp.",
-        address="9931 Beechwood, TX",
-        phoneNo="+1-214-559-6993",
-        website="wwww.example.com",
-        logoUrl="https://example.com/logo.png",
-        customValues=["string"]
-    ),
-    invoiceNumber="19",
-    currency="USD",
-    contactDetails=ContactDetails(
-        id="6578278e879ad2646715ba9c",
-        phoneNo="+1-214-559-6993",
-        email="alex@example.com",
-        customFields=["string"],
-        name="Alex",
-        address=Address(
-            countryCode="US",
-            addressLine1="9931 Beechwood",
-            addressLine2="Beechwood",
-            city="St. Houston",
-            state="TX",
-            postalCode="559-6993"
+if __name__ == "__main__":
+    example_invoice = Invoice(
+        _id="6578278e879ad2646715ba9c",
+        status="paid",
+        liveMode=False,
+        amountPaid=999,
+        altId="6578278e879ad2646715ba9c",
+        altType="location",
+        name="New Invoice",
+        businessDetails=BusinessDetails(
+            name="ABC Corp.",
+            address="9931 Beechwood, TX",
+            phoneNo="+1-214-559-6993",
+            website="wwww.example.com",
+            logoUrl="https://example.com/logo.png",
+            customValues=["string"]
         ),
-        additionalEmails=[AdditionalEmail(email="alex@example.com")],
-        companyName="ABC Corp."
-    ),
-    issueDate="2023-01-01",
-    dueDate="2023-01-01",
-    discount=Discount(type="percentage", value=10),
-    invoiceItems=[
-        InvoiceItem(
-            taxes=[],
-            _id="c6tZZU0rJBf30ZXx9Gli",
-            productId="c6tZZU0rJBf30ZXx9Gli",
-            priceId="c6tZZU0rJBf30ZXx9Gli",
-            currency="USD",
-            name="Macbook Pro",
-            qty=1,
-            amount=999
-        )
-    ],
-    total=999,
-    title="INVOICE",
-    amountDue=0,
-    createdAt=datetime.fromisoformat("2023-12-12T09:27:42.355Z"),
-    updatedAt=datetime.fromisoformat("2023-12-12T09:27:42.355Z"),
-    totalSummary=TotalSummary(subTotal=999, discount=0)
-)
+        invoiceNumber="19",
+        currency="USD",
+        contactDetails=ContactDetails(
+            id="6578278e879ad2646715ba9c",
+            phoneNo="+1-214-559-6993",
+            email="alex@example.com",
+            customFields=["string"],
+            name="Alex",
+            address=Address(
+                countryCode="US",
+                addressLine1="9931 Beechwood",
+                addressLine2="Beechwood",
+                city="St. Houston",
+                state="TX",
+                postalCode="559-6993"
+            ),
+            additionalEmails=[AdditionalEmail(email="alex@example.com")],
+            companyName="ABC Corp."
+        ),
+        issueDate="2023-01-01",
+        dueDate="2023-01-01",
+        discount=Discount(type="percentage", value=10),
+        invoiceItems=[
+            InvoiceItem(
+                taxes=[],
+                _id="c6tZZU0rJBf30ZXx9Gli",
+                productId="c6tZZU0rJBf30ZXx9Gli",
+                priceId="c6tZZU0rJBf30ZXx9Gli",
+                currency="USD",
+                name="Macbook Pro",
+                qty=1,
+                amount=999
+            )
+        ],
+        total=999,
+        title="INVOICE",
+        amountDue=0,
+        createdAt=datetime.fromisoformat("2023-12-12T09:27:42.355Z"),
+        updatedAt=datetime.fromisoformat("2023-12-12T09:27:42.355Z"),
+        totalSummary=TotalSummary(subTotal=999, discount=0)
+    )
 
-handle_paid_invoice(example_invoice)
\ No newline at end of file
+    handle_paid_invoice(example_invoice)
@@ -31,72 +31,73 @@ class Invoice:
         return cls(data)
 
 # Example usage
-example_data = {
-    "_id": "6578278e879ad2646715ba9c",
-    "status": "draft",
-    "liveMode": False,
-    "amountPaid": 0,
-    "altId": "6578278e879ad2646715ba9c",
-    "altType": "location",
-    "name": "New Invoice",
-    "businessDetails": {
-        "name": "ABC Corp.",
-        "address": "9931 Beechwood, TX",
-        "phoneNo": "+1-214-559-6993",
-        "website": "wwww.example.com",
-        "logoUrl": "https://example.com/logo.png",
-        "customValues": ["string"]
-    },
-    "invoiceNumber": "19",
-    "currency": "USD",
-    "contactDetails": {
-        "id": "6578278e879ad2646715ba9c",
-        "phoneNo": "+1-214-559-6993",
-        "email": "alex@example.com",
-        "customFields": ["string"],
-        "name": "Alex",
-        "address": {
-            "countryCode": "US",
-            "addressLine1": "9931 Beechwood",
-            "addressLine2": "Beechwood",
-            "city": "St. Houston",
-            "state": "TX",
-            "postalCode": "559-6993"
+if __name__ == "__main__":
+    example_data = {
+        "_id": "6578278e879ad2646715ba9c",
+        "status": "draft",
+        "liveMode": False,
+        "amountPaid": 0,
+        "altId": "6578278e879ad2646715ba9c",
+        "altType": "location",
+        "name": "New Invoice",
+        "businessDetails": {
+            "name": "ABC Corp.",
+            "address": "9931 Beechwood, TX",
+            "phoneNo": "+1-214-559-6993",
+            "website": "wwww.example.com",
+            "logoUrl": "https://example.com/logo.png",
+            "customValues": ["string"]
         },
-        "additionalEmails": [
+        "invoiceNumber": "19",
+        "currency": "USD",
+        "contactDetails": {
+            "id": "6578278e879ad2646715ba9c",
+            "phoneNo": "+1-214-559-6993",
+            "email": "alex@example.com",
+            "customFields": ["string"],
+            "name": "Alex",
+            "address": {
+                "countryCode": "US",
+                "addressLine1": "9931 Beechwood",
+                "addressLine2": "Beechwood",
+                "city": "St. Houston",
+                "state": "TX",
+                "postalCode": "559-6993"
+            },
+            "additionalEmails": [
+                {
+                    "email": "alex@example.com"
+                }
+            ],
+            "companyName": "ABC Corp."
+        },
+        "issueDate": "2023-01-01",
+        "dueDate": "2023-01-01",
+        "discount": {
+            "type": "percentage",
+            "value": 10
+        },
+        "invoiceItems": [
             {
-                "email": "alex@example.com"
+                "taxes": [],
+                "_id": "c6tZZU0rJBf30ZXx9Gli",
+                "productId": "c6tZZU0rJBf30ZXx9Gli",
+                "priceId": "c6tZZU0rJBf30ZXx9Gli",
+                "currency": "USD",
+                "name": "Macbook Pro",
+                "qty": 1,
+                "amount": 999
             }
         ],
-        "companyName": "ABC Corp."
-    },
-    "issueDate": "2023-01-01",
-    "dueDate": "2023-01-01",
-    "discount": {
-        "type": "percentage",
-        "value": 10
-    },
-    "invoiceItems": [
-        {
-            "taxes": [],
-            "_id": "c6tZZU0rJBf30ZXx9Gli",
-            "productId": "c6tZZU0rJBf30ZXx9Gli",
-            "priceId": "c6tZZU0rJBf30ZXx9Gli",
-            "currency": "USD",
-            "name": "Macbook Pro",
-            "qty": 1,
-            "amount": 999
+        "total": 999,
+        "title": "INVOICE",
+        "amountDue": 999,
+        "createdAt": "2023-12-12T09:27:42.355Z",
+        "updatedAt": "2023-12-12T09:27:42.355Z",
+        "totalSummary": {
+            "subTotal": 999,
+            "discount": 0
         }
-    ],
-    "total": 999,
-    "title": "INVOICE",
-    "amountDue": 999,
-    "createdAt": "2023-12-12T09:27:42.355Z",
-    "updatedAt": "2023-12-12T09:27:42.355Z",
-    "totalSummary": {
-        "subTotal": 999,
-        "discount": 0
     }
-}
 
-invoice = Invoice.from_dict(example_data)
\ No newline at end of file
+    invoice = Invoice.from_dict(example_data)
@@ -16,13 +16,14 @@ class LocationCreate(BaseModel):
     stripeProductId: Optional[str] = Field(None, description="Stripe Product ID")
 
 # Example usage
-example_data = {
-    "type": "LocationCreate",
-    "id": "ve9EPM428h8vShlRW1KT",
-    "companyId": "otg8dTQqGLh3Q6iQI55w",
-    "name": "Loram ipsum",
-    "email": "mailer@example.com",
-    "stripeProductId": "prod_xyz123abc"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "LocationCreate",
+        "id": "ve9EPM428h8vShlRW1KT",
+        "companyId": "otg8dTQqGLh3Q6iQI55w",
+        "name": "Loram ipsum",
+        "email": "mailer@example.com",
+        "stripeProductId": "prod_xyz123abc"
+    }
 
-location_create = LocationCreate(**example_data)
\ No newline at end of file
+    location_create = LocationCreate(**example_data)
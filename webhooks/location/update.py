@@ -13,13 +13,14 @@ class LocationUpdate(BaseModel):
         allow_population_by_field_name = True
 
 # Example usage
-example_data = {
-    "type": "LocationUpdate",
-    "id": "ve9EPM428h8vShlRW1KT",
-    "companyId": "otg8dTQqGLh3Q6iQI55w",
-    "name": "Loram ipsum",
-    "email": "mailer@example.com",
-    "stripeProductId": "prod_xyz123abc"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "LocationUpdate",
+        "id": "ve9EPM428h8vShlRW1KT",
+        "companyId": "otg8dTQqGLh3Q6iQI55w",
+        "name": "Loram ipsum",
+        "email": "mailer@example.com",
+        "stripeProductId": "prod_xyz123abc"
+    }
 
-location_update = LocationUpdate(**example_data)
\ No newline at end of file
+    location_update = LocationUpdate(**example_data)
@@ -14,14 +14,15 @@ class NoteCreate(BaseModel):
         allow_population_by_field_name = True
 
 # Example usage
-example_data = {
-    "type": "NoteCreate",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "otg8dTQqGLh3Q6iQI55w",
-    "body": "Loram ipsum",
-    "contactId": "CWBf1PR9LvvBkcYqiXlc",
-    "dateAdded": "2021-11-26T12:41:02.193Z"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "NoteCreate",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "otg8dTQqGLh3Q6iQI55w",
+        "body": "Loram ipsum",
+        "contactId": "CWBf1PR9LvvBkcYqiXlc",
+        "dateAdded": "2021-11-26T12:41:02.193Z"
+    }
 
-note_create = NoteCreate(**example_data)
-print(note_create)
\ No newline at end of file
+    note_create = NoteCreate(**example_data)
+    print(note_create)
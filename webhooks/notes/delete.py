@@ -20,14 +20,15 @@ class NoteDelete:
                 f"date_added={self.date_added})")
 
 # Example usage:
-example_data = {
-    "type": "NoteDelete",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "otg8dTQqGLh3Q6iQI55w",
-    "body": "Loram ipsum",
-    "contactId": "CWBf1PR9LvvBkcYqiXlc",
-    "dateAdded": "2021-11-26T12:41:02.193Z"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "NoteDelete",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "otg8dTQqGLh3Q6iQI55w",
+        "body": "Loram ipsum",
+        "contactId": "CWBf1PR9LvvBkcYqiXlc",
+        "dateAdded": "2021-11-26T12:41:02.193Z"
+    }
 
-note_delete = NoteDelete.from_dict(example_data)
-print(note_delete)
\ No newline at end of file
+    note_delete = NoteDelete.from_dict(example_data)
+    print(note_delete)
@@ -23,14 +23,15 @@ class NoteUpdate:
         )
 
 # Example usage
-example_data = {
-    "type": "NoteUpdate",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "otg8dTQqGLh3Q6iQI55w",
-    "body": "Loram ipsum",
-    "contactId": "CWBf1PR9LvvBkcYqiXlc",
-    "dateAdded": "2021-11-26T12:41:02.193Z"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "NoteUpdate",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "otg8dTQqGLh3Q6iQI55w",
+        "body": "Loram ipsum",
+        "contactId": "CWBf1PR9LvvBkcYqiXlc",
+        "dateAdded": "2021-11-26T12:41:02.193Z"
+    }
 
-note_update = NoteUpdate.from_dict(example_data)
-print(note_update)
\ No newline at end of file
+    note_update = NoteUpdate.from_dict(example_data)
+    print(note_update)
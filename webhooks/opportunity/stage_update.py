@@ -17,19 +17,20 @@ class OpportunityStageUpdate(BaseModel):
     dateAdded: datetime = Field(..., description="Date and time when the opportunity was added")
 
 # Example usage
-example_data = {
-    "type": "OpportunityStageUpdate",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "wWhVuzqpRuOA1ZVWi4FC",
-    "assignedTo": "bNl8QNGXhIQJLv8eeASQ",
-    "contactId": "cJAWDskpkJHbRbhAT7bs",
-    "monetaryValue": 40,
-    "name": "Loram ipsu",
-    "pipelineId": "VDm7RPYC2GLUvdpKmBfC",
-    "pipelineStageId": "e93ba61a-53b3-45e7-985a-c7732dbcdb69",
-    "source": "Loram ipsu",
-    "status": "open",
-    "dateAdded": "2021-11-26T12:41:02.193Z"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "OpportunityStageUpdate",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "wWhVuzqpRuOA1ZVWi4FC",
+        "assignedTo": "bNl8QNGXhIQJLv8eeASQ",
+        "contactId": "cJAWDskpkJHbRbhAT7bs",
+        "monetaryValue": 40,
+        "name": "Loram ipsu",
+        "pipelineId": "VDm7RPYC2GLUvdpKmBfC",
+        "pipelineStageId": "e93ba61a-53b3-45e7-985a-c7732dbcdb69",
+        "source": "Loram ipsu",
+        "status": "open",
+        "dateAdded": "2021-11-26T12:41:02.193Z"
+    }
 
-opportunity_stage_update = OpportunityStageUpdate(**example_data)
\ No newline at end of file
+    opportunity_stage_update = OpportunityStageUpdate(**example_data)
@@ -17,14 +17,15 @@ class PlanChangeWebhook(BaseModel):
         allow_population_by_field_name = True
 
 # Example usage
-example_data = {
-    "type": "PLAN_CHANGE",
-    "appId": "ve9EPM428h8vShlRW1KT",
-    "locationId": "otg8dTQqGLh3Q6iQI55w",
-    "companyId": "otg8dTQqGLh3Q6iQI55w",
-    "userId": "otg8dTQqGLh3Q6iQI55w",
-    "currentPlanId": "66a0419a0dffa47fb5f8b22f",
-    "newPlanId": "66a0419a0dffa47fb5f8b22f"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "PLAN_CHANGE",
+        "appId": "ve9EPM428h8vShlRW1KT",
+        "locationId": "otg8dTQqGLh3Q6iQI55w",
+        "companyId": "otg8dTQqGLh3Q6iQI55w",
+        "userId": "otg8dTQqGLh3Q6iQI55w",
+        "currentPlanId": "66a0419a0dffa47fb5f8b22f",
+        "newPlanId": "66a0419a0dffa47fb5f8b22f"
+    }
 
-plan_change_webhook = PlanChangeWebhook(**example_data)
\ No newline at end of file
+    plan_change_webhook = PlanChangeWebhook(**example_data)
@@ -36,37 +36,38 @@ def handle_price_create(price: Price):
     # Add your logic here
 
 # Example usage
-example_data = {
-    "_id": "655b33aa2209e60b6adb87a7",
-    "membershipOffers": [
-        {
-            "label": "top_50",
-            "value": "50",
-            "_id": "655b33aa2209e60b6adb87a7"
-        }
-    ],
-    "variantOptionIds": [
-        "h4z7u0im2q8",
-        "h3nst2ltsnn"
-    ],
-    "locationId": "3SwdhCsvxI8Au3KsPJt6",
-    "product": "655b33a82209e60b6adb87a5",
-    "userId": "6YAtzfzpmHAdj0e8GkKp",
-    "name": "Red / S",
-    "priceType": "one_time",
-    "currency": "INR",
-    "amount": 199999,
-    "recurring": {
-        "interval": "day",
-        "intervalCount": 1
-    },
-    "createdAt": "2023-11-20T10:23:38.645Z",
-    "updatedAt": "2024-01-23T09:57:04.852Z",
-    "compareAtPrice": 2000000,
-    "trackInventory": None,
-    "availableQuantity": 5,
-    "allowOutOfStockPurchases": True
-}
+if __name__ == "__main__":
+    example_data = {
+        "_id": "655b33aa2209e60b6adb87a7",
+        "membershipOffers": [
+            {
+                "label": "top_50",
+                "value": "50",
+                "_id": "655b33aa2209e60b6adb87a7"
+            }
+        ],
+        "variantOptionIds": [
+            "h4z7u0im2q8",
+            "h3nst2ltsnn"
+        ],
+        "locationId": "3SwdhCsvxI8Au3KsPJt6",
+        "product": "655b33a82209e60b6adb87a5",
+        "userId": "6YAtzfzpmHAdj0e8GkKp",
+        "name": "Red / S",
+        "priceType": "one_time",
+        "currency": "INR",
+        "amount": 199999,
+        "recurring": {
+            "interval": "day",
+            "intervalCount": 1
+        },
+        "createdAt": "2023-11-20T10:23:38.645Z",
+        "updatedAt": "2024-01-23T09:57:04.852Z",
+        "compareAtPrice": 2000000,
+        "trackInventory": None,
+        "availableQuantity": 5,
+        "allowOutOfStockPurchases": True
+    }
 
-price = Price(**example_data)
-handle_price_create(price)
\ No newline at end of file
+    price = Price(**example_data)
+    handle_price_create(price)
@@ -39,26 +39,27 @@ def handle_price_delete(price: Price):
     # You might want to update related records, notify systems, etc.
 
 # Example usage
-example_price = Price(
-    _id="655b33aa2209e60b6adb87a7",
-    membershipOffers=[
-        MembershipOffer(label="top_50", value="50", _id="655b33aa2209e60b6adb87a7")
-    ],
-    variantOptionIds=["h4z7u0im2q8", "h3nst2ltsnn"],
-    locationId="3SwdhCsvxI8Au3KsPJt6",
-    product="655b33a82209e60b6adb87a5",
-    userId="6YAtzfzpmHAdj0e8GkKp",
-    name="Red / S",
-    type="one_time",
-    currency="INR",
-    amount=199999,
-    recurring=Recurring(interval="day", intervalCount=1),
-    createdAt=datetime.fromisoformat("2023-11-20T10:23:38.645Z"),
-    updatedAt=datetime.fromisoformat("2024-01-23T09:57:04.852Z"),
-    compareAtPrice=2000000,
-    trackInventory=None,
-    availableQuantity=5,
-    allowOutOfStockPurchases=True
-)
+if __name__ == "__main__":
+    example_price = Price(
+        _id="655b33aa2209e60b6adb87a7",
+        membershipOffers=[
+            MembershipOffer(label="top_50", value="50", _id="655b33aa2209e60b6adb87a7")
+        ],
+        variantOptionIds=["h4z7u0im2q8", "h3nst2ltsnn"],
+        locationId="3SwdhCsvxI8Au3KsPJt6",
+        product="655b33a82209e60b6adb87a5",
+        userId="6YAtzfzpmHAdj0e8GkKp",
+        name="Red / S",
+        type="one_time",
+        currency="INR",
+        amount=199999,
+        recurring=Recurring(interval="day", intervalCount=1),
+        createdAt=datetime.fromisoformat("2023-11-20T10:23:38.645Z"),
+        updatedAt=datetime.fromisoformat("2024-01-23T09:57:04.852Z"),
+        compareAtPrice=2000000,
+        trackInventory=None,
+        availableQuantity=5,
+        allowOutOfStockPurchases=True
+    )
 
-handle_price_delete(example_price)
\ No newline at end of file
+    handle_price_delete(example_price)
@@ -33,47 +33,48 @@ class Product(BaseModel):
     statementDescriptor: Optional[str]
     image: Optional[str]
 
-# Example usage
-example_data = {
-    "_id": "655b33a82209e60b6adb87a5",
-    "description": "This is a really awesome product",
-    "variants": [
-        {
-            "id": "38s63qmxfr4",
-            "name": "Size",
-            "options": [
-                {
-                    "id": "h4z7u0im2q8",
-                    "name": "XL"
-                }
-            ]
-        }
-    ],
-    "medias": [
-        {
-            "id": "fzrgusiuu0m",
-            "title": "1dd7dcd0-e71d-4cf7-a06b-6d47723d6a29.png",
-            "url": "https://storage.googleapis.com/ghl-test/3SwdhCsvxI8Au3KsPJt6/media/sample.png",
-            "type": "image",
-            "isFeatured": True
-        }
-    ],
-    "locationId": "3SwdhCsvxI8Au3KsPJt6",
-    "name": "Awesome Product",
-    "productType": "PHYSICAL",
-    "availableInStore": True,
-    "userId": "6YAtzfzpmHAdj0e8GkKp",
-    "createdAt": "2023-11-20T10:23:36.515Z",
-    "updatedAt": "2024-01-23T09:57:04.846Z",
-    "statementDescriptor": "abcde",
-    "image": "https://storage.googleapis.com/ghl-test/3SwdhCsvxI8Au3KsPJt6/media/65af8d5df88bdb4b1022ee90.png"
-}
-
-product = Product(**example_data)
-
 def handle_product_delete(product: Product):
     """
     Called whenever a product is deleted
     """
     # Add your logic here to handle the product deletion
-    pass
\ No newline at end of file
+    pass
+
+# Example usage
+if __name__ == "__main__":
+    example_data = {
+        "_id": "655b33a82209e60b6adb87a5",
+        "description": "This is a really awesome product",
+        "variants": [
+            {
+                "id": "38s63qmxfr4",
+                "name": "Size",
+                "options": [
+                    {
+                        "id": "h4z7u0im2q8",
+                        "name": "XL"
+                    }
+                ]
+            }
+        ],
+        "medias": [
+            {
+                "id": "fzrgusiuu0m",
+                "title": "1dd7dcd0-e71d-4cf7-a06b-6d47723d6a29.png",
+                "url": "https://storage.googleapis.com/ghl-test/3SwdhCsvxI8Au3KsPJt6/media/sample.png",
+                "type": "image",
+                "isFeatured": True
+            }
+        ],
+        "locationId": "3SwdhCsvxI8Au3KsPJt6",
+        "name": "Awesome Product",
+        "productType": "PHYSICAL",
+        "availableInStore": True,
+        "userId": "6YAtzfzpmHAdj0e8GkKp",
+        "createdAt": "2023-11-20T10:23:36.515Z",
+        "updatedAt": "2024-01-23T09:57:04.846Z",
+        "statementDescriptor": "abcde",
+        "image": "https://storage.googleapis.com/ghl-test/3SwdhCsvxI8Au3KsPJt6/media/65af8d5df88bdb4b1022ee90.png"
+    }
+
+    product = Product(**example_data)
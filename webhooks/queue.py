@@ -0,0 +1,284 @@
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Mapping, Optional, Tuple, Union
+import asyncio
+import collections
+import concurrent.futures
+import logging
+import sqlite3
+
+from api.codec import get_codec
+
+Handler = Callable[[Dict[str, Any]], Union[Awaitable[Any], Any]]
+KeyFunction = Callable[[Dict[str, Any]], Optional[str]]
+
+
+def entity_key(payload: Dict[str, Any]) -> Optional[str]:
+    """Order payloads by the id of the record they are about (contact, opportunity, invoice, ...)."""
+    return payload.get("id") or payload.get("_id")
+
+
+class WorkQueue:
+    """
+    In-process queue between receiving webhooks and handling them.
+
+    `put()` only appends to a deque, so receiving stays fast however slow
+    the handlers are. `workers` tasks take payloads in arrival order and run
+    the handler on them, with at most `limits[type]` handlers of a webhook
+    type running at once; payloads of a type at its limit wait on the side
+    without holding up other types.
+
+    With `ordered_by`, payloads with the same key (e.g. `entity_key`, the
+    record id) are handled one at a time in arrival order, while payloads
+    with different keys run in parallel on the same workers. A payload whose
+    key is busy waits in that key's lane without occupying a worker; a lane
+    is dropped as soon as it is empty.
+
+    Workers are tasks on one event loop, so an async handler should be
+    I/O-bound: CPU work in it blocks every other lane. For CPU-bound work,
+    pass a plain function as `handler` and an `executor` (e.g. a
+    ProcessPoolExecutor); each payload then runs in the executor, still one
+    at a time per key and at most `workers` at once.
+
+    Once `high_water` payloads are waiting
+    in memory, new ones are appended to a SQLite file (`spill_path`) and read
+    back in order as the backlog drains. Payloads still on disk at shutdown
+    are picked up by the next WorkQueue on the same file.
+
+    Args:
+        handler: Async callable run on each payload, e.g. `WebhookRouter.dispatch`;
+            set later when passing the queue to a WebhookRouter
+        workers: Handlers running at once across all types
+        limits: Maximum handlers running at once per webhook type
+        high_water: Payloads held in memory before spilling to disk
+        spill_path: SQLite file for spilled payloads; in-memory (not crash-safe) if None
+        ordered_by: Returns the key payloads are ordered by, or None for no ordering
+        executor: Run a synchronous `handler` in this executor instead of on the loop
+    """
+
+    def __init__(
+        self,
+        handler: Optional[Handler] = None,
+        workers: int = 8,
+        limits: Optional[Mapping[str, int]] = None,
+        high_water: int = 10000,
+        spill_path: Optional[str] = None,
+        ordered_by: Optional[KeyFunction] = None,
+        executor: Optional[concurrent.futures.Executor] = None
+    ):
+        self.handler = handler
+        self.workers = workers
+        self.limits = dict(limits or {})
+        self.high_water = high_water
+        self.spill_path = spill_path
+        self.ordered_by = ordered_by
+        self.executor = executor
+        self.processed = 0
+        self.failed = 0
+        self.max_depth = 0
+        self._queue: Deque[Dict[str, Any]] = collections.deque()
+        self._held: Dict[str, Deque[Dict[str, Any]]] = collections.defaultdict(collections.deque)
+        self._running: Dict[str, int] = collections.defaultdict(int)
+        self._lanes: Dict[str, Deque[Dict[str, Any]]] = collections.defaultdict(collections.deque)
+        self._owners: Dict[str, int] = {}
+        # Payloads waiting in memory (queue, held and lanes), and in lanes alone.
+        self._waiting = 0
+        self._in_lanes = 0
+        self._ready: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._active: Dict[int, Dict[str, Any]] = {}
+        self._codec = get_codec()
+
+        self._db = sqlite3.connect(spill_path or ":memory:", isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS spill (id INTEGER PRIMARY KEY, body BLOB NOT NULL)")
+        self.spilled = self._db.execute("SELECT COUNT(*) FROM spill").fetchone()[0]
+
+    @property
+    def depth(self) -> int:
+        """Payloads waiting, in memory and on disk."""
+        return self._waiting + self.spilled
+
+    @property
+    def running(self) -> int:
+        return sum(self._running.values())
+
+    def put(self, payload: Dict[str, Any]) -> None:
+        """Queue a payload; never blocks."""
+        if self.spilled or self._waiting >= self.high_water:
+            self._db.execute("INSERT INTO spill (body) VALUES (?)", (self._codec.dumps(payload),))
+            self.spilled += 1
+        else:
+            self._queue.append(payload)
+            self._waiting += 1
+        depth = self._waiting + self.spilled
+        if depth > self.max_depth:
+            self.max_depth = depth
+        self._wake()
+
+    def _wake(self) -> None:
+        if not self._tasks:
+            self.start()
+        self._ready.set()
+        self._idle.clear()
+
+    def _refill(self) -> None:
+        # Read spilled payloads back once memory has drained to half the mark.
+        if not self.spilled or len(self._queue) > self.high_water // 2:
+            return
+        rows = self._db.execute(
+            "SELECT id, body FROM spill ORDER BY id LIMIT ?", (max(1, self.high_water // 2),)
+        ).fetchall()
+        if not rows:
+            self.spilled = 0
+            return
+        self._db.execute("DELETE FROM spill WHERE id <= ?", (rows[-1][0],))
+        self.spilled -= len(rows)
+        self._waiting += len(rows)
+        self._queue.extend(self._codec.loads(body) for _, body in rows)
+
+    def _next(self) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        while True:
+            self._refill()
+            if not self._queue:
+                return None, None
+            payload = self._queue.popleft()
+            key = self.ordered_by(payload) if self.ordered_by is not None else None
+            if key is not None:
+                owner = self._owners.setdefault(key, id(payload))
+                if owner != id(payload):
+                    self._lanes[key].append(payload)
+                    self._in_lanes += 1
+                    continue
+            type_name = payload.get("type")
+            limit = self.limits.get(type_name)
+            if limit is not None and self._running[type_name] >= limit:
+                self._held[type_name].append(payload)
+                continue
+            self._waiting -= 1
+            self._running[type_name] += 1
+            return payload, key
+
+    def _release(self, key: str) -> None:
+        lane = self._lanes.get(key)
+        if lane:
+            following = lane.popleft()
+            self._in_lanes -= 1
+            self._owners[key] = id(following)
+            self._queue.appendleft(following)
+            self._ready.set()
+        else:
+            self._lanes.pop(key, None)
+            del self._owners[key]
+
+    async def _worker(self) -> None:
+        while True:
+            payload, key = self._next()
+            if payload is None:
+                self._ready.clear()
+                if not self.running and not self.depth:
+                    self._idle.set()
+                await self._ready.wait()
+                continue
+
+            type_name = payload.get("type")
+            self._active[id(payload)] = payload
+            try:
+                if self.executor is not None:
+                    await asyncio.get_running_loop().run_in_executor(self.executor, self.handler, payload)
+                else:
+                    await self.handler(payload)
+                self.processed += 1
+            except asyncio.CancelledError:
+                # Left in _active, so close() saves it again.
+                raise
+            except Exception as e:
+                self.failed += 1
+                logging.error(f"{type_name} webhook handler failed: {e!r}")
+            finally:
+                self._running[type_name] -= 1
+                held = self._held.get(type_name)
+                if held:
+                    self._queue.appendleft(held.popleft())
+                    self._ready.set()
+                if key is not None:
+                    self._release(key)
+            del self._active[id(payload)]
+
+    def start(self) -> None:
+        """Start the workers; called on the first `put()` if not before."""
+        if self._tasks:
+            return
+        if self.handler is None:
+            raise RuntimeError("WorkQueue has no handler")
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+        if self.spilled:
+            self._ready.set()
+            self._idle.clear()
+
+    async def join(self) -> None:
+        """Wait until every queued payload, including spilled ones, has been handled."""
+        if self._tasks:
+            await self._idle.wait()
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait up to `timeout` seconds for the queue to drain, then stop the
+        workers. With a spill file, payloads not yet handled (including those
+        whose handler was interrupted, which will run again) are saved to it.
+        """
+        if self._tasks:
+            try:
+                await asyncio.wait_for(self.join(), timeout)
+            except asyncio.TimeoutError:
+                logging.warning(f"Stopping webhook queue with {self.depth} payloads left")
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+
+        # Per-key order: the payload owning a lane, then the lane, then later arrivals.
+        owners = set(self._owners.values())
+        left = list(self._active.values())
+        for held in self._held.values():
+            left.extend(held)
+        left.extend(payload for payload in self._queue if id(payload) in owners)
+        for lane in self._lanes.values():
+            left.extend(lane)
+        left.extend(payload for payload in self._queue if id(payload) not in owners)
+        self._active.clear()
+        self._queue.clear()
+        self._held.clear()
+        self._lanes.clear()
+        self._owners.clear()
+        self._waiting = self._in_lanes = 0
+        if left and self.spill_path:
+            # Keep them ahead of anything already spilled.
+            rows = self._db.execute("SELECT body FROM spill ORDER BY id").fetchall()
+            with self._db:
+                self._db.execute("BEGIN")
+                self._db.execute("DELETE FROM spill")
+                self._db.executemany(
+                    "INSERT INTO spill (body) VALUES (?)",
+                    [(self._codec.dumps(payload),) for payload in left] + rows,
+                )
+        self._db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters, e.g. for a health endpoint."""
+        return {
+            "depth": self.depth,
+            "in_memory": len(self._queue),
+            "spilled": self.spilled,
+            "held": {type_name: len(held) for type_name, held in self._held.items() if held},
+            "running": {type_name: count for type_name, count in self._running.items() if count},
+            "lanes": len(self._owners),
+            "in_lanes": self._in_lanes,
+            "processed": self.processed,
+            "failed": self.failed,
+            "max_depth": self.max_depth,
+            "workers": len(self._tasks),
+        }
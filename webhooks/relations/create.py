@@ -21,18 +21,19 @@ class RelationCreate(BaseModel):
     locationId: str = Field(..., description="Identifies the location associated with the created association.")
 
 # Example usage
-example_data = {
-    "id": "67ae0d741119d218c9d0c477",
-    "firstObjectKey": "custom_objects.mad",
-    "firstRecordId": "67a349a79b28947ec1f65bb5",
-    "secondObjectKey": "contact",
-    "secondRecordId": "emqfhnG3g9D9chy9inTz",
-    "associationId": "669e5795add2094075906c65",
-    "locationId": "eHy2cOSZxMQzQ6Yyvl8P"
-}
+if __name__ == "__main__":
+    example_data = {
+        "id": "67ae0d741119d218c9d0c477",
+        "firstObjectKey": "custom_objects.mad",
+        "firstRecordId": "67a349a79b28947ec1f65bb5",
+        "secondObjectKey": "contact",
+        "secondRecordId": "emqfhnG3g9D9chy9inTz",
+        "associationId": "669e5795add2094075906c65",
+        "locationId": "eHy2cOSZxMQzQ6Yyvl8P"
+    }
 
-relation_create = RelationCreate(**example_data)
+    relation_create = RelationCreate(**example_data)
 
-# Additional Notes:
-# - The firstObjectKey and secondObjectKey define the relationship between the created entities.
-# - Ensure your webhook listener is set up to handle POST requests for this event.
+    # Additional Notes:
+    # - The firstObjectKey and secondObjectKey define the relationship between the created entities.
+    # - Ensure your webhook listener is set up to handle POST requests for this event.
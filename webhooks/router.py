@@ -0,0 +1,332 @@
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+import asyncio
+import importlib
+import inspect
+import logging
+
+from api.codec import get_codec
+from webhooks.dedupe import DedupeFilter, body_key
+from webhooks.events import EVENTS
+from webhooks.queue import WorkQueue
+
+# Webhook type -> "module:Class" of its payload model, or None for types
+# without one (their handlers get the payload dict).
+WEBHOOK_TYPES: Dict[str, Optional[str]] = {
+    "AppointmentCreate": None,
+    "AppointmentDelete": None,
+    "AppointmentUpdate": None,
+    "AssociationCreate": "webhooks.association.create:AssociationCreate",
+    "AssociationDelete": "webhooks.association.delete:AssociationDeleted",
+    "AssociationUpdate": "webhooks.association.update:AssociationUpdate",
+    "CampaignStatusUpdate": None,
+    "ContactCreate": "webhooks.contact.create:Contact",
+    "ContactDelete": "webhooks.contact.delete:Contact",
+    "ContactDndUpdate": "webhooks.contact.dnd_update:ContactDndUpdate",
+    "ContactTagUpdate": "webhooks.contact.tag_update:ContactTagUpdate",
+    "ContactUpdate": "webhooks.contact.update:ContactUpdate",
+    "ConversationUnreadUpdate": "webhooks.conversation.unread:ConversationUnreadUpdate",
+    "INSTALL": None,
+    "InboundMessage": "webhooks.conversation.inbound_message:InboundMessage",
+    "InvoiceCreate": "webhooks.invoice.create:Invoice",
+    "InvoiceDelete": None,
+    "InvoicePaid": "webhooks.invoice.paid:Invoice",
+    "InvoicePartiallyPaid": "webhooks.invoice.partially_paid:PartiallyPaidInvoice",
+    "InvoiceSent": "webhooks.invoice.sent:InvoiceSentWebhook",
+    "InvoiceUpdate": "webhooks.invoice.update:Invoice",
+    "InvoiceVoid": "webhooks.invoice.void:Invoice",
+    "LCEmailStats": "webhooks.LC.email_stats:LCEmailStats",
+    "LocationCreate": "webhooks.location.create:LocationCreate",
+    "LocationUpdate": "webhooks.location.update:LocationUpdate",
+    "NoteCreate": "webhooks.notes.create:NoteCreate",
+    "NoteDelete": "webhooks.notes.delete:NoteDelete",
+    "NoteUpdate": "webhooks.notes.update:NoteUpdate",
+    "ObjectSchemaCreate": "webhooks.object.create:ObjectSchemaCreate",
+    "ObjectSchemaUpdate": "webhooks.object.update:ObjectSchemaUpdate",
+    "OpportunityAssignedToUpdate": "webhooks.opportunity.assign_to_upate:OpportunityAssignedToUpdate",
+    "OpportunityCreate": "webhooks.opportunity.create:OpportunityCreate",
+    "OpportunityDelete": "webhooks.opportunity.delete:OpportunityDelete",
+    "OpportunityMonetaryValueUpdate": "webhooks.opportunity.monetary_update:OpportunityMonetaryValueUpdate",
+    "OpportunityStageUpdate": "webhooks.opportunity.stage_update:OpportunityStageUpdate",
+    "OpportunityStatusUpdate": "webhooks.opportunity.status_update:OpportunityStatusUpdate",
+    "OpportunityUpdate": "webhooks.opportunity.update:OpportunityUpdate",
+    "OrderCreate": "webhooks.orders.create:Order",
+    "OrderStatusUpdate": "webhooks.orders.status:OrderStatusUpdate",
+    "OutboundMessage": "webhooks.orders.outbound_message:OutboundMessage",
+    "PLAN_CHANGE": "webhooks.plan.change:PlanChangeWebhook",
+    "PriceCreate": "webhooks.price.create:Price",
+    "PriceDelete": "webhooks.price.delete:Price",
+    "PriceUpdate": "webhooks.price.update:PriceUpdate",
+    "ProductCreate": "webhooks.products.create:Product",
+    "ProductDelete": "webhooks.products.delete:Product",
+    "ProductUpdate": "webhooks.products.update:Product",
+    "RecordCreate": "webhooks.records.create:RecordCreate",
+    "RecordDelete": "webhooks.records.delete:DeleteRecord",
+    "RecordUpdate": "webhooks.records.update:RecordUpdate",
+    "RelationCreate": "webhooks.relations.create:RelationCreate",
+    "RelationDelete": "webhooks.relations.delete:RelationDelete",
+    "TaskComplete": "webhooks.tasks.complete:TaskComplete",
+    "TaskCreate": "webhooks.tasks.create:TaskCreate",
+    "TaskDelete": "webhooks.tasks.delete:TaskDelete",
+    "UNINSTALL": None,
+    "UserCreate": "webhooks.user.create:UserCreate",
+}
+
+# Register a handler for this type to receive every webhook.
+ANY = "*"
+
+# Payload field carrying a delivery's dedupe key from receipt to dispatch;
+# removed before any handler runs.
+_DEDUPE_KEY = "__dedupeKey"
+
+Handler = Callable[[Any], Any]
+Verifier = Callable[[bytes, Mapping[str, str]], bool]
+
+
+def load_model(type_name: str) -> Optional[Callable[[Mapping[str, Any]], Any]]:
+    """
+    Import the payload model for a webhook type and return a function that
+    builds it from the payload dict, or None if the type has no model.
+    """
+    target = WEBHOOK_TYPES.get(type_name)
+    if target is None:
+        return None
+    module_name, _, class_name = target.partition(":")
+    model = getattr(importlib.import_module(module_name), class_name)
+    if hasattr(model, "from_dict"):
+        return model.from_dict
+    if hasattr(model, "model_validate"):
+        return model.model_validate
+    return lambda data: model(**data)
+
+
+class _Route:
+    __slots__ = ("model", "handlers", "raw_handlers")
+
+    def __init__(self, model, handlers: Tuple[Handler, ...], raw_handlers: Tuple[Handler, ...]):
+        self.model = model
+        self.handlers = handlers
+        self.raw_handlers = raw_handlers
+
+
+async def _call(handler: Handler, event: Any) -> None:
+    result = handler(event)
+    if inspect.isawaitable(result):
+        await result
+
+
+class WebhookRouter:
+    """
+    ASGI app that acknowledges each webhook POST as soon as it has read and
+    decoded the body, then runs the handlers registered for its `type` in the
+    background.
+
+    Handlers get the payload model from WEBHOOK_TYPES, or the payload dict if
+    registered with `raw=True` (or if the type has no model). Any number of
+    handlers can be registered per type, sync or async; handlers for ANY get
+    every webhook as a dict. A failing handler is logged and doesn't affect
+    the others. The type -> (model, handlers) table is rebuilt whenever a
+    handler is registered, so routing an event is one dict lookup.
+
+        router = WebhookRouter()
+
+        @router.on("ContactCreate")
+        async def new_contact(contact):
+            ...
+
+        router.on("ContactUpdate", mirror.apply, raw=True)
+
+    Serve it with any ASGI server, e.g. `uvicorn app:router`.
+
+    Args:
+        verify: Called as verify(body, headers); a False result answers 401
+        path: Only accept POSTs to this path; any path if None
+        compact: Give handlers the slotted events from `webhooks.events`
+            instead of the models in WEBHOOK_TYPES; every type has one
+        queue: Run handlers through this WorkQueue instead of one task per
+            webhook, for worker, per-type and memory limits
+        dedupe: Skip redeliveries this DedupeFilter has seen, keyed on the
+            raw body before it is decoded; deliveries whose model or
+            handlers fail are forgotten so their redelivery runs again
+    """
+
+    def __init__(
+        self,
+        verify: Optional[Verifier] = None,
+        path: Optional[str] = None,
+        compact: bool = False,
+        queue: Optional[WorkQueue] = None,
+        dedupe: Optional[DedupeFilter] = None
+    ):
+        self.verify = verify
+        self.path = path
+        self.compact = compact
+        self.queue = queue
+        if queue is not None and queue.handler is None:
+            queue.handler = self.dispatch
+        self.dedupe = dedupe
+        self.received = 0
+        self.duplicates = 0
+        self.failed = 0
+        self._handlers: Dict[str, List[Tuple[Handler, bool]]] = {}
+        self._models: Dict[str, Any] = {}
+        self._table: Dict[str, _Route] = {}
+        self._fallback = _Route(None, (), ())
+        self._tasks: Set[asyncio.Task] = set()
+        self._codec = get_codec()
+
+    def on(self, type_name: str, handler: Optional[Handler] = None, *, raw: bool = False):
+        """
+        Register a handler for a webhook type; usable as a decorator.
+
+        Raises:
+            ValueError: If the type is not in WEBHOOK_TYPES (or ANY)
+        """
+        if type_name != ANY and type_name not in WEBHOOK_TYPES:
+            raise ValueError(f"Unknown webhook type {type_name!r}")
+
+        def register(handler: Handler) -> Handler:
+            self._handlers.setdefault(type_name, []).append((handler, raw or type_name == ANY))
+            self._compile()
+            return handler
+
+        return register(handler) if handler is not None else register
+
+    def on_many(self, type_names: Iterable[str], handler: Handler, *, raw: bool = False) -> Handler:
+        for type_name in type_names:
+            self.on(type_name, handler, raw=raw)
+        return handler
+
+    def _compile(self) -> None:
+        catch_all = tuple(handler for handler, _ in self._handlers.get(ANY, ()))
+        table = {}
+        for type_name in WEBHOOK_TYPES:
+            registered = self._handlers.get(type_name, ())
+            if not registered and not catch_all:
+                continue
+            if registered and type_name not in self._models:
+                self._models[type_name] = EVENTS[type_name].from_dict if self.compact else load_model(type_name)
+            model = self._models.get(type_name)
+            handlers = tuple(handler for handler, raw in registered if not raw and model is not None)
+            raw_handlers = catch_all + tuple(handler for handler, raw in registered if raw or model is None)
+            table[type_name] = _Route(model if handlers else None, handlers, raw_handlers)
+        self._table = table
+        self._fallback = _Route(None, (), catch_all)
+
+    async def dispatch(self, payload: Mapping[str, Any]) -> None:
+        """
+        Run the handlers for one decoded webhook payload and wait for them.
+        If the model or a handler fails, the delivery is dropped from the
+        DedupeFilter so GHL's redelivery of it is handled again.
+        """
+        failed = 0
+        key = payload.pop(_DEDUPE_KEY, None) if self.dedupe is not None else None
+        route = self._table.get(payload.get("type"), self._fallback)
+        calls = [_call(handler, payload) for handler in route.raw_handlers]
+        if route.handlers:
+            try:
+                event = route.model(payload)
+            except Exception as e:
+                failed += 1
+                logging.error(f"Invalid {payload.get('type')} webhook: {e!r}")
+            else:
+                calls.extend(_call(handler, event) for handler in route.handlers)
+
+        if calls:
+            for result in await asyncio.gather(*calls, return_exceptions=True):
+                if isinstance(result, Exception):
+                    failed += 1
+                    logging.error(f"{payload.get('type')} webhook handler failed: {result!r}")
+        if failed:
+            self.failed += failed
+            if key is not None:
+                self.dedupe.discard(bytes.fromhex(key))
+            elif self.dedupe is not None:
+                self.dedupe.forget(payload)
+
+    def submit(self, payload: Mapping[str, Any]) -> None:
+        """Run a payload's handlers in the background."""
+        if self.queue is not None:
+            self.queue.put(payload)
+            return
+        task = asyncio.ensure_future(self.dispatch(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait for the handlers of every webhook received so far."""
+        if self.queue is not None:
+            await self.queue.join()
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[[], Awaitable[Dict]], send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if scope["method"] != "POST" or (self.path is not None and scope["path"] != self.path):
+            await _respond(send, 405 if scope["method"] != "POST" else 404)
+            return
+
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        body = b"".join(chunks)
+
+        if self.verify is not None:
+            headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+            if not self.verify(body, headers):
+                await _respond(send, 401)
+                return
+        key = None
+        if self.dedupe is not None:
+            # Redeliveries are answered before their body is decoded.
+            key = body_key(body)
+            if self.dedupe.seen(key):
+                self.received += 1
+                self.duplicates += 1
+                await _respond(send, 200)
+                return
+        try:
+            payload = self._codec.loads(body)
+            if not isinstance(payload, dict):
+                raise ValueError("webhook body is not a JSON object")
+        except ValueError as e:
+            if key is not None:
+                self.dedupe.discard(key)
+            logging.warning(f"Rejected webhook body: {e!r}")
+            await _respond(send, 400)
+            return
+
+        self.received += 1
+        await _respond(send, 200)
+        if key is not None:
+            # Travels with the payload, through the queue's spill file too,
+            # so dispatch() can forget exactly this key after a failure.
+            payload[_DEDUPE_KEY] = key.hex()
+        self.submit(payload)
+
+    async def _lifespan(self, receive: Callable[[], Awaitable[Dict]], send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if self.queue is not None:
+                    self.queue.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.drain()
+                if self.queue is not None:
+                    await self.queue.close()
+                if self.dedupe is not None:
+                    self.dedupe.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+async def _respond(send: Callable, status: int) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": [(b"content-length", b"0")]})
+    await send({"type": "http.response.body", "body": b""})
@@ -17,17 +17,18 @@ class TaskComplete(BaseModel):
         allow_population_by_field_name = True
 
 # Example usage
-example_data = {
-    "type": "TaskComplete",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "5HrB1IbmnKMBXloldFuP",
-    "assignedTo": "bNl8QNGXhIQJLv8eeASQ",
-    "body": "testing",
-    "contactId": "WFwVrSSjZ2CNHbZThQX2",
-    "dateAdded": "2021-11-29T13:37:28.304Z",
-    "dueDate": "2021-12-22T06:55:00.000Z",
-    "title": "test"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "TaskComplete",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "5HrB1IbmnKMBXloldFuP",
+        "assignedTo": "bNl8QNGXhIQJLv8eeASQ",
+        "body": "testing",
+        "contactId": "WFwVrSSjZ2CNHbZThQX2",
+        "dateAdded": "2021-11-29T13:37:28.304Z",
+        "dueDate": "2021-12-22T06:55:00.000Z",
+        "title": "test"
+    }
 
-task_complete = TaskComplete(**example_data)
-print(task_complete)
\ No newline at end of file
+    task_complete = TaskComplete(**example_data)
+    print(task_complete)
@@ -16,17 +16,18 @@ class TaskCreate(BaseModel):
         allow_population_by_field_name = True
 
 # Example usage
-example_data = {
-    "type": "TaskCreate",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "UlRWGLSXh0ji5qbiGu4i",
-    "assignedTo": "63e4qiWDsFJjOYAC8phG",
-    "body": "Loram ipsum",
-    "contactId": "CWBf1PR9LvvBkcYqiXlc",
-    "title": "Loram ipsum",
-    "dateAdded": "2021-11-26T12:41:02.193Z",
-    "dueDate": "2021-11-26T12:41:02.193Z"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "TaskCreate",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "UlRWGLSXh0ji5qbiGu4i",
+        "assignedTo": "63e4qiWDsFJjOYAC8phG",
+        "body": "Loram ipsum",
+        "contactId": "CWBf1PR9LvvBkcYqiXlc",
+        "title": "Loram ipsum",
+        "dateAdded": "2021-11-26T12:41:02.193Z",
+        "dueDate": "2021-11-26T12:41:02.193Z"
+    }
 
-task_create = TaskCreate(**example_data)
-print(task_create)
\ No newline at end of file
+    task_create = TaskCreate(**example_data)
+    print(task_create)
@@ -14,17 +14,18 @@ class TaskDelete(BaseModel):
     dueDate: datetime = Field(..., description="Due date of the task")
 
 # Example usage:
-example_data = {
-    "type": "TaskDelete",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "UlRWGLSXh0ji5qbiGu4i",
-    "assignedTo": "63e4qiWDsFJjOYAC8phG",
-    "body": "Loram ipsum",
-    "contactId": "CWBf1PR9LvvBkcYqiXlc",
-    "title": "Loram ipsum",
-    "dateAdded": "2021-11-26T12:41:02.193Z",
-    "dueDate": "2021-11-26T12:41:02.193Z"
-}
+if __name__ == "__main__":
+    example_data = {
+        "type": "TaskDelete",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "UlRWGLSXh0ji5qbiGu4i",
+        "assignedTo": "63e4qiWDsFJjOYAC8phG",
+        "body": "Loram ipsum",
+        "contactId": "CWBf1PR9LvvBkcYqiXlc",
+        "title": "Loram ipsum",
+        "dateAdded": "2021-11-26T12:41:02.193Z",
+        "dueDate": "2021-11-26T12:41:02.193Z"
+    }
 
-task_delete = TaskDelete(**example_data)
-print(task_delete)
\ No newline at end of file
+    task_delete = TaskDelete(**example_data)
+    print(task_delete)
@@ -58,44 +58,45 @@ class UserCreate(BaseModel):
         allow_population_by_field_name = True
 
 # Example usage for sub-account user
-sub_account_data = {
-    "type": "UserCreate",
-    "locationId": "ve9EPM428h8vShlRW1KT",
-    "id": "ve9EPM428h8vShlRW1KT",
-    "firstName": "John",
-    "lastName": "Doe",
-    "email": "john.doe+2@example.com",
-    "phone": "+13235559998",
-    "extension": "111",
-    "role": "user",
-    "permissions": {
-        "adwordsReportingEnabled": True,
-        "affiliateManagerEnabled": False,
-        "agentReportingEnabled": True,
-        # ... other permissions ...
+if __name__ == "__main__":
+    sub_account_data = {
+        "type": "UserCreate",
+        "locationId": "ve9EPM428h8vShlRW1KT",
+        "id": "ve9EPM428h8vShlRW1KT",
+        "firstName": "John",
+        "lastName": "Doe",
+        "email": "john.doe+2@example.com",
+        "phone": "+13235559998",
+        "extension": "111",
+        "role": "user",
+        "permissions": {
+            "adwordsReportingEnabled": True,
+            "affiliateManagerEnabled": False,
+            "agentReportingEnabled": True,
+            # ... other permissions ...
+        }
     }
-}
 
-sub_account_user = UserCreate(**sub_account_data)
+    sub_account_user = UserCreate(**sub_account_data)
 
-# Example usage for agency user
-agency_data = {
-    "type": "UserCreate",
-    "companyId": "ve9EPM428h8vShlRW1KT",
-    "id": "ve9EPM428h8vShlRW1KT",
-    "firstName": "John",
-    "lastName": "Doe",
-    "email": "john.doe+3@example.com",
-    "phone": "+13235559997",
-    "extension": "1112",
-    "role": "admin",
-    "permissions": {
-        "adwordsReportingEnabled": True,
-        "affiliateManagerEnabled": False,
-        "agentReportingEnabled": True,
-        # ... other permissions ...
-    },
-    "locations": ["ve9EPM428h8vShlRW1KT"]
-}
+    # Example usage for agency user
+    agency_data = {
+        "type": "UserCreate",
+        "companyId": "ve9EPM428h8vShlRW1KT",
+        "id": "ve9EPM428h8vShlRW1KT",
+        "firstName": "John",
+        "lastName": "Doe",
+        "email": "john.doe+3@example.com",
+        "phone": "+13235559997",
+        "extension": "1112",
+        "role": "admin",
+        "permissions": {
+            "adwordsReportingEnabled": True,
+            "affiliateManagerEnabled": False,
+            "agentReportingEnabled": True,
+            # ... other permissions ...
+        },
+        "locations": ["ve9EPM428h8vShlRW1KT"]
+    }
 
-agency_user = UserCreate(**agency_data)
\ No newline at end of file
+    agency_user = UserCreate(**agency_data)